@@ -4,8 +4,9 @@ Main Secretary Agent implementation using Google ADK.
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Optional
 
 from google.adk import Agent
 
@@ -13,7 +14,9 @@ from app.agents.prompts.secretary_core_prompt import SECRETARY_CORE_PROMPT
 from app.agents.prompts.secretary_skill_prompts import format_profile_skill_prompts
 from app.agents.runtime_router import build_secretary_runtime_routing
 from app.core.logger import logger
+from app.core.tracing import record_span
 from app.interfaces.agent_task_repository import IAgentTaskRepository
+from app.interfaces.chat_session_repository import IChatSessionRepository
 from app.interfaces.checkin_repository import ICheckinRepository
 from app.interfaces.llm_provider import ILLMProvider
 from app.interfaces.meeting_agenda_repository import IMeetingAgendaRepository
@@ -32,9 +35,7 @@ from app.interfaces.user_repository import IUserRepository
 from app.services.work_memory_service import (
     format_loaded_work_memories_for_prompt,
     format_work_memory_index_for_prompt,
-    get_work_memory_by_id,
-    get_work_memory_index,
-    select_relevant_work_memories,
+    load_work_memory_library,
 )
 from app.tools import (
     add_agenda_item_tool,
@@ -93,6 +94,7 @@ from app.tools import (
     update_recurring_task_tool,
     update_task_tool,
 )
+from app.tools.tool_output import compact_tool_outputs
 
 _TOOL_HELP: dict[str, str] = {
     "get_current_datetime": "日時基準が必要なとき",
@@ -267,15 +269,11 @@ async def build_system_prompt_with_work_memory(
     datetime_section = get_current_datetime_section()
     profile_skill_section = format_profile_skill_prompts(profiles)
 
-    work_memories = await get_work_memory_index(user_id, memory_repo, limit=30)
-    work_memory_index_section = format_work_memory_index_for_prompt(work_memories, max_items=8)
+    library = await load_work_memory_library(user_id, memory_repo)
+    work_memory_index_section = format_work_memory_index_for_prompt(library.items, max_items=8)
 
-    selected = select_relevant_work_memories(work_memories, user_message or "", limit=2)
-    loaded_work_memories = []
-    for item in selected:
-        full_memory = await get_work_memory_by_id(user_id, memory_repo, item.id)
-        if full_memory:
-            loaded_work_memories.append(full_memory)
+    selected = library.select_relevant(user_message or "", limit=2)
+    loaded_work_memories = [library.get(item.id) for item in selected]
     loaded_work_memory_section = format_loaded_work_memories_for_prompt(
         loaded_work_memories,
         max_chars_per_work_memory=600,
@@ -334,6 +332,7 @@ async def create_secretary_agent(
     user_repo: IUserRepository | None = None,
     user_message: str | None = None,
     routing_context: dict[str, Any] | None = None,
+    chat_repo: IChatSessionRepository | None = None,
 ) -> Agent:
     allow_browser, forced_profile = _resolve_runtime_routing_options(routing_context)
     routing = build_secretary_runtime_routing(
@@ -488,7 +487,6 @@ async def create_secretary_agent(
         ),
         apply_schedule_request_tool(
             task_repo,
-            task_assignment_repo,
             project_repo,
             user_id,
             proposal_repo=proposal_repo,
@@ -636,6 +634,7 @@ async def create_secretary_agent(
             project_repo,
             project_member_repo,
             user_id,
+            user_repo=user_repo,
         ),
         create_recurring_task_tool(recurring_task_repo, task_repo, user_id),
         list_recurring_tasks_tool(recurring_task_repo, user_id),
@@ -649,7 +648,12 @@ async def create_secretary_agent(
         ask_user_questions_tool(),
     ]
 
-    tools = _filter_tools_by_name(all_tools, routing.tool_names)
+    tools = compact_tool_outputs(
+        _filter_tools_by_name(all_tools, routing.tool_names),
+        user_id,
+        session_id,
+        chat_repo=chat_repo,
+    )
     enabled_tool_names = [getattr(tool, "name", "") for tool in tools if getattr(tool, "name", "")]
     system_prompt = await build_system_prompt_with_work_memory(
         user_id=user_id,
@@ -670,4 +674,50 @@ async def create_secretary_agent(
         model=model,
         instruction=system_prompt,
         tools=tools,
+        before_model_callback=_start_model_span,
+        after_model_callback=_end_model_span,
+        on_model_error_callback=_fail_model_span,
     )
+
+
+# Start time of the running model call, kept in the invocation's temp state
+# (never persisted, dropped with the invocation even if no end callback runs).
+_MODEL_CALL_STARTED_KEY = "temp:model_call_started_at"
+
+
+def _start_model_span(callback_context, llm_request):
+    callback_context.state[_MODEL_CALL_STARTED_KEY] = time.perf_counter()
+    return None
+
+
+def _take_model_call_start(callback_context) -> Optional[float]:
+    started = callback_context.state.get(_MODEL_CALL_STARTED_KEY)
+    if started is not None:
+        callback_context.state[_MODEL_CALL_STARTED_KEY] = None
+    return started
+
+
+def _end_model_span(callback_context, llm_response):
+    if getattr(llm_response, "partial", False):
+        return None
+    started = _take_model_call_start(callback_context)
+    if started is not None:
+        usage = getattr(llm_response, "usage_metadata", None)
+        record_span(
+            "llm.agent_model_call",
+            (time.perf_counter() - started) * 1000,
+            prompt_tokens=getattr(usage, "prompt_token_count", None),
+            output_tokens=getattr(usage, "candidates_token_count", None),
+        )
+    return None
+
+
+def _fail_model_span(callback_context, llm_request, error):
+    started = _take_model_call_start(callback_context)
+    if started is not None:
+        record_span(
+            "llm.agent_model_call",
+            (time.perf_counter() - started) * 1000,
+            error=type(error).__name__,
+        )
+    return None
@@ -15,6 +15,8 @@ from app.api.deps import (
     AchievementRepo,
     CurrentUser,
     LLMProvider,
+    PhaseRepo,
+    ProjectRepo,
     TaskRepo,
 )
 from app.core.exceptions import NotFoundError
@@ -132,6 +134,8 @@ async def create_achievement(
     llm_provider: LLMProvider,
     task_repo: TaskRepo,
     achievement_repo: AchievementRepo,
+    project_repo: ProjectRepo,
+    phase_repo: PhaseRepo,
 ):
     """
     Generate a new achievement summary for the specified period.
@@ -161,6 +165,8 @@ async def create_achievement(
             period_label=request.period_label,
             user_answers=request.user_answers,
             generation_type=GenerationType.MANUAL,
+            project_repo=project_repo,
+            phase_repo=phase_repo,
         )
     else:
         achievement = await generate_achievement(
@@ -172,6 +178,8 @@ async def create_achievement(
             period_end=request.period_end,
             period_label=request.period_label,
             generation_type=GenerationType.MANUAL,
+            project_repo=project_repo,
+            phase_repo=phase_repo,
         )
 
     return AchievementResponse.from_model(achievement)
@@ -349,6 +357,8 @@ async def auto_generate_achievement(
     llm_provider: LLMProvider,
     task_repo: TaskRepo,
     achievement_repo: AchievementRepo,
+    project_repo: ProjectRepo,
+    phase_repo: PhaseRepo,
 ):
     """
     Trigger automatic achievement generation if conditions are met.
@@ -364,6 +374,8 @@ async def auto_generate_achievement(
         task_repo=task_repo,
         achievement_repo=achievement_repo,
         user_id=user.id,
+        project_repo=project_repo,
+        phase_repo=phase_repo,
     )
 
     if not achievement:
@@ -30,9 +30,10 @@ from app.api.deps import (
     TaskAssignmentRepo,
     TaskRepo,
 )
+from app.core.config import get_settings
 from app.core.exceptions import NotFoundError
 from app.models.capture import Capture, CaptureCreate
-from app.services.agent_service import AgentService
+from app.utils.stream_utils import decode_base64_chunks
 
 router = APIRouter()
 
@@ -45,7 +46,6 @@ async def create_capture(
     storage: StorageProvider,
 ):
     """Create a new capture."""
-    import base64
     import mimetypes
     from pathlib import Path
     from uuid import uuid4
@@ -84,15 +84,17 @@ async def create_capture(
             return guessed
         return ".bin"
 
+    chunk_size = get_settings().STORAGE_CHUNK_SIZE
+
     # Process base64 image if provided.
     if capture.base64_image:
         try:
             image_mime_type, encoded = _split_data_url(capture.base64_image)
             if image_mime_type.startswith("image/") and encoded:
-                image_bytes = base64.b64decode(encoded)
+                image_chunks = decode_base64_chunks(encoded, chunk_size)
                 ext = _guess_extension(image_mime_type)
                 filename = f"captures/{uuid4()}{ext}"
-                await storage.upload(filename, image_bytes, content_type=image_mime_type)
+                await storage.upload_stream(filename, image_chunks, content_type=image_mime_type)
                 capture.content_url = storage.get_public_url(filename)
                 capture.file_content_type = image_mime_type
                 capture.base64_image = None
@@ -109,10 +111,10 @@ async def create_capture(
             if not file_mime_type:
                 file_mime_type = (capture.file_content_type or "application/octet-stream").strip().lower()
 
-            file_bytes = base64.b64decode(encoded)
+            file_chunks = decode_base64_chunks(encoded, chunk_size)
             ext = _guess_extension(file_mime_type, capture.file_name)
             filename = f"captures/{uuid4()}{ext}"
-            await storage.upload(filename, file_bytes, content_type=file_mime_type)
+            await storage.upload_stream(filename, file_chunks, content_type=file_mime_type)
             capture.content_url = storage.get_public_url(filename)
             capture.file_content_type = file_mime_type
             capture.base64_file = None
@@ -213,6 +215,8 @@ async def analyze_capture(
 
     Returns a TaskCreate-compatible JSON object.
     """
+    from app.services.agent_service import AgentService
+
     agent_service = AgentService(
         llm_provider=llm_provider,
         task_repo=task_repo,
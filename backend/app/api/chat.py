@@ -41,7 +41,6 @@ from app.models.chat import (
     ChatRequest,
     ChatResponse,
 )
-from app.services.agent_service import AgentService
 
 router = APIRouter()
 
@@ -181,6 +180,8 @@ async def chat(
         Chat response with assistant message and related tasks
     """
     # Create agent service
+    from app.services.agent_service import AgentService
+
     agent_service = AgentService(
         llm_provider=llm_provider,
         task_repo=task_repo,
@@ -256,6 +257,8 @@ async def chat_stream(
     Returns a stream of events showing tool calls and text generation in real-time.
     """
     # Create agent service
+    from app.services.agent_service import AgentService
+
     agent_service = AgentService(
         llm_provider=llm_provider,
         task_repo=task_repo,
@@ -330,6 +333,8 @@ async def list_sessions(
     user_repo: UserRepo,
 ):
     """List chat sessions for the current user."""
+    from app.services.agent_service import AgentService
+
     agent_service = AgentService(
         llm_provider=llm_provider,
         task_repo=task_repo,
@@ -377,6 +382,8 @@ async def get_history(
     user_repo: UserRepo,
 ):
     """Get message history for a specific session."""
+    from app.services.agent_service import AgentService
+
     agent_service = AgentService(
         llm_provider=llm_provider,
         task_repo=task_repo,
@@ -0,0 +1,185 @@
+"""
+Conditional GET (ETag / If-None-Match) for heavy read endpoints.
+
+The ETag of a view is derived from the request URL and the revisions of
+everything the view can read: the user's own data and, for each project the
+user belongs to, the project and its owner (project rows are written under
+the owner's user_id). Computing it costs the two access context queries
+(shared with the request's authorization checks through access_scope), so a
+matching If-None-Match is answered 304 before any view data is loaded, and
+the last computed body per user and URL is served again while its ETag holds.
+
+    @router.get("/schedule", response_model=SchedulePlanResponse)
+    async def get_schedule(..., conditional: ConditionalGetDep):
+        if cached := await conditional.check():
+            return cached
+        ...
+        return conditional.respond(result, SchedulePlanResponse)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Annotated, Any, Optional
+
+from fastapi import Depends, Request, Response, status
+from pydantic import TypeAdapter
+
+from app.api.deps import CurrentUser, ProjectMemberRepo, ProjectRepo
+from app.core.config import get_settings
+from app.core.revisions import data_revisions, revision_tracking_installed
+from app.services.project_permissions import load_access_context
+
+ETAG_HEADER = "ETag"
+_CACHE_CONTROL = "private, no-cache"
+_JSON = "application/json"
+_adapters: dict[Any, TypeAdapter] = {}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str
+    body: bytes
+
+
+class ResponseCache:
+    """Process-wide LRU of the last computed body per (user, URL)."""
+
+    def __init__(self, max_entries: Optional[int] = None) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.not_modified = 0
+        self.misses = 0
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return get_settings().RESPONSE_CACHE_SIZE
+
+    def get(self, key: tuple[str, str]) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: tuple[str, str], entry: CachedResponse) -> None:
+        max_entries = self.max_entries
+        if max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "not_modified": self.not_modified,
+                "misses": self.misses,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.not_modified = self.misses = 0
+
+
+response_cache = ResponseCache()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
+
+def _serialize(content: Any, response_model: Any) -> bytes:
+    adapter = _adapters.get(response_model)
+    if adapter is None:
+        adapter = _adapters[response_model] = TypeAdapter(response_model)
+    # FastAPI serializes response models by alias as well.
+    return adapter.dump_json(content, by_alias=True)
+
+
+class ConditionalGet:
+    """ETag handling of one GET request."""
+
+    def __init__(self, request: Request, user_id: str, project_repo, member_repo) -> None:
+        self._request = request
+        self._user_id = user_id
+        self._project_repo = project_repo
+        self._member_repo = member_repo
+        self._cache_key = (user_id, str(request.url))
+        self.etag: Optional[str] = None
+
+    async def _compute_etag(self) -> str:
+        access = await load_access_context(self._user_id, self._project_repo, self._member_repo)
+        users = {self._user_id, *(project.owner_id for project in access.projects.values())}
+        revision_key = data_revisions.key(users=users, projects=access.projects)
+        window_seconds = get_settings().CONDITIONAL_GET_WINDOW_SECONDS
+        window = int(time.time() // window_seconds) if window_seconds > 0 else 0
+        query = "&".join(sorted(f"{key}={value}" for key, value in self._request.query_params.multi_items()))
+        digest = hashlib.sha1(
+            f"{self._user_id}|{self._request.url.path}?{query}|{revision_key}|{window}".encode()
+        ).hexdigest()
+        return f'W/"{digest[:24]}"'
+
+    def _headers(self) -> dict[str, str]:
+        return {ETAG_HEADER: self.etag, "Cache-Control": _CACHE_CONTROL} if self.etag else {}
+
+    async def check(self) -> Optional[Response]:
+        """
+        Answer the request without computing it, when possible.
+
+        Returns:
+            304 when If-None-Match matches, the cached body when it is still
+            current, otherwise None (compute and pass the result to respond)
+        """
+        if not get_settings().CONDITIONAL_GET_ENABLED or not revision_tracking_installed():
+            return None
+        self.etag = await self._compute_etag()
+        if _etag_matches(self._request.headers.get("if-none-match"), self.etag):
+            response_cache.not_modified += 1
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self._headers())
+        cached = response_cache.get(self._cache_key)
+        if cached is not None and cached.etag == self.etag:
+            response_cache.hits += 1
+            return Response(content=cached.body, media_type=_JSON, headers=self._headers())
+        response_cache.misses += 1
+        return None
+
+    def respond(self, content: Any, response_model: Any) -> Response:
+        """Serialize a computed result, remembering it under the ETag."""
+        body = _serialize(content, response_model)
+        if self.etag:
+            response_cache.set(self._cache_key, CachedResponse(etag=self.etag, body=body))
+        return Response(content=body, media_type=_JSON, headers=self._headers())
+
+
+async def get_conditional_get(
+    request: Request,
+    user: CurrentUser,
+    project_repo: ProjectRepo,
+    member_repo: ProjectMemberRepo,
+) -> ConditionalGet:
+    return ConditionalGet(request, user.id, project_repo, member_repo)
+
+
+ConditionalGetDep = Annotated[ConditionalGet, Depends(get_conditional_get)]
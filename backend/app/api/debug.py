@@ -0,0 +1,49 @@
+"""
+Debug API endpoints.
+
+In-process performance metrics for developer accounts.
+"""
+
+from fastapi import APIRouter, HTTPException, Request, status
+
+from app.api.conditional import response_cache
+from app.api.deps import CurrentUser
+from app.core.config import get_settings
+from app.core.profiling import get_recent_profiles
+from app.core.tracing import get_trace_stats
+from app.services.chat_history_service import get_history_compaction_stats
+from app.services.daily_schedule_plan_service import get_replan_stats
+from app.services.llm_usage_service import llm_usage_ledger
+from app.services.realtime_service import realtime_change_feed, realtime_manager
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def get_metrics(request: Request, user: CurrentUser):
+    """
+    Summarize this process's span timings, slowest spans, request profiles,
+    startup phase timings and optimization counters (developer accounts only).
+    """
+    if not user.email or user.email.lower() not in get_settings().developer_emails:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only developer accounts can read debug metrics",
+        )
+    from app.tools.tool_output import get_tool_output_stats
+
+    trace_stats = get_trace_stats()
+    return {
+        "spans": trace_stats["spans"],
+        "slowest_spans": trace_stats["slowest"],
+        "profiles": get_recent_profiles(),
+        "startup": getattr(request.app.state, "startup_phases", {}),
+        "counters": {
+            "history_compaction": get_history_compaction_stats(),
+            "replan": get_replan_stats(),
+            "tool_output": get_tool_output_stats(),
+            "llm_usage": llm_usage_ledger.stats(),
+            "response_cache": response_cache.stats(),
+            "realtime": {**realtime_manager.stats(), **realtime_change_feed.stats()},
+        },
+    }
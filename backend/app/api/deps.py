@@ -11,6 +11,7 @@ from typing import Annotated
 from fastapi import Depends, Header, HTTPException, Request, status
 
 from app.core.config import get_settings
+from app.core.tracing import traced_repository
 from app.interfaces.achievement_repository import IAchievementRepository
 from app.interfaces.agent_task_repository import IAgentTaskRepository
 from app.interfaces.auth_provider import IAuthProvider, User
@@ -23,6 +24,7 @@ from app.interfaces.heartbeat_settings_repository import IHeartbeatSettingsRepos
 from app.interfaces.issue_comment_repository import IIssueCommentRepository
 from app.interfaces.issue_repository import IIssueRepository
 from app.interfaces.llm_provider import ILLMProvider
+from app.interfaces.llm_usage_repository import ILlmUsageRepository
 from app.interfaces.meeting_agenda_repository import IMeetingAgendaRepository
 from app.interfaces.meeting_session_repository import IMeetingSessionRepository
 from app.interfaces.memory_repository import IMemoryRepository
@@ -34,6 +36,7 @@ from app.interfaces.project_achievement_repository import IProjectAchievementRep
 from app.interfaces.project_invitation_repository import IProjectInvitationRepository
 from app.interfaces.project_member_repository import IProjectMemberRepository
 from app.interfaces.project_repository import IProjectRepository
+from app.interfaces.realtime_broker import IRealtimeBroker
 from app.interfaces.proposal_repository import IProposalRepository
 from app.interfaces.recurring_meeting_repository import IRecurringMeetingRepository
 from app.interfaces.recurring_task_repository import IRecurringTaskRepository
@@ -60,7 +63,7 @@ def get_task_repository() -> ITaskRepository:
         raise NotImplementedError("Firestore not implemented yet")
     else:
         from app.infrastructure.local.task_repository import SqliteTaskRepository
-        return SqliteTaskRepository()
+        return traced_repository(SqliteTaskRepository())
 
 
 @lru_cache()
@@ -71,7 +74,7 @@ def get_project_repository() -> IProjectRepository:
         raise NotImplementedError("Firestore not implemented yet")
     else:
         from app.infrastructure.local.project_repository import SqliteProjectRepository
-        return SqliteProjectRepository()
+        return traced_repository(SqliteProjectRepository())
 
 
 @lru_cache()
@@ -82,7 +85,7 @@ def get_phase_repository() -> IPhaseRepository:
         raise NotImplementedError("Firestore not implemented yet")
     else:
         from app.infrastructure.local.phase_repository import SqlitePhaseRepository
-        return SqlitePhaseRepository()
+        return traced_repository(SqlitePhaseRepository())
 
 
 @lru_cache()
@@ -93,7 +96,7 @@ def get_milestone_repository() -> IMilestoneRepository:
         raise NotImplementedError("Firestore not implemented yet")
     else:
         from app.infrastructure.local.milestone_repository import SqliteMilestoneRepository
-        return SqliteMilestoneRepository()
+        return traced_repository(SqliteMilestoneRepository())
 
 
 @lru_cache()
@@ -104,7 +107,7 @@ def get_agent_task_repository() -> IAgentTaskRepository:
         raise NotImplementedError("Firestore not implemented yet")
     else:
         from app.infrastructure.local.agent_task_repository import SqliteAgentTaskRepository
-        return SqliteAgentTaskRepository()
+        return traced_repository(SqliteAgentTaskRepository())
 
 
 @lru_cache()
@@ -115,7 +118,7 @@ def get_memory_repository() -> IMemoryRepository:
         raise NotImplementedError("Firestore not implemented yet")
     else:
         from app.infrastructure.local.memory_repository import SqliteMemoryRepository
-        return SqliteMemoryRepository()
+        return traced_repository(SqliteMemoryRepository())
 
 
 @lru_cache()
@@ -126,7 +129,7 @@ def get_capture_repository() -> ICaptureRepository:
         raise NotImplementedError("Firestore not implemented yet")
     else:
         from app.infrastructure.local.capture_repository import SqliteCaptureRepository
-        return SqliteCaptureRepository()
+        return traced_repository(SqliteCaptureRepository())
 
 
 @lru_cache()
@@ -137,7 +140,7 @@ def get_chat_session_repository() -> IChatSessionRepository:
         raise NotImplementedError("Chat session repository not implemented for GCP")
     else:
         from app.infrastructure.local.chat_session_repository import SqliteChatSessionRepository
-        return SqliteChatSessionRepository()
+        return traced_repository(SqliteChatSessionRepository())
 
 
 @lru_cache()
@@ -147,8 +150,8 @@ def get_proposal_repository() -> IProposalRepository:
     if settings.is_gcp:
         raise NotImplementedError("Proposal repository not implemented for GCP")
     else:
-        from app.infrastructure.local.proposal_repository import InMemoryProposalRepository
-        return InMemoryProposalRepository()
+        from app.infrastructure.local.proposal_repository import SqliteProposalRepository
+        return traced_repository(SqliteProposalRepository())
 
 
 @lru_cache()
@@ -159,7 +162,7 @@ def get_user_repository() -> IUserRepository:
         raise NotImplementedError("User repository not implemented for GCP")
     else:
         from app.infrastructure.local.user_repository import SqliteUserRepository
-        return SqliteUserRepository()
+        return traced_repository(SqliteUserRepository())
 
 
 @lru_cache()
@@ -170,7 +173,7 @@ def get_project_member_repository() -> IProjectMemberRepository:
         raise NotImplementedError("Project member repository not implemented for GCP")
     else:
         from app.infrastructure.local.project_member_repository import SqliteProjectMemberRepository
-        return SqliteProjectMemberRepository()
+        return traced_repository(SqliteProjectMemberRepository())
 
 
 @lru_cache()
@@ -183,7 +186,7 @@ def get_project_invitation_repository() -> IProjectInvitationRepository:
         from app.infrastructure.local.project_invitation_repository import (
             SqliteProjectInvitationRepository,
         )
-        return SqliteProjectInvitationRepository()
+        return traced_repository(SqliteProjectInvitationRepository())
 
 
 @lru_cache()
@@ -196,7 +199,7 @@ def get_task_assignment_repository() -> ITaskAssignmentRepository:
         from app.infrastructure.local.task_assignment_repository import (
             SqliteTaskAssignmentRepository,
         )
-        return SqliteTaskAssignmentRepository()
+        return traced_repository(SqliteTaskAssignmentRepository())
 
 
 @lru_cache()
@@ -207,7 +210,7 @@ def get_checkin_repository() -> ICheckinRepository:
         raise NotImplementedError("Check-in repository not implemented for GCP")
     else:
         from app.infrastructure.local.checkin_repository import SqliteCheckinRepository
-        return SqliteCheckinRepository()
+        return traced_repository(SqliteCheckinRepository())
 
 
 @lru_cache()
@@ -218,7 +221,7 @@ def get_blocker_repository() -> IBlockerRepository:
         raise NotImplementedError("Blocker repository not implemented for GCP")
     else:
         from app.infrastructure.local.blocker_repository import SqliteBlockerRepository
-        return SqliteBlockerRepository()
+        return traced_repository(SqliteBlockerRepository())
 
 
 @lru_cache()
@@ -229,7 +232,7 @@ def get_postpone_repository() -> IPostponeRepository:
         raise NotImplementedError("Postpone repository not implemented for GCP")
     else:
         from app.infrastructure.local.postpone_repository import SqlitePostponeRepository
-        return SqlitePostponeRepository()
+        return traced_repository(SqlitePostponeRepository())
 
 
 @lru_cache()
@@ -242,7 +245,7 @@ def get_recurring_meeting_repository() -> IRecurringMeetingRepository:
         from app.infrastructure.local.recurring_meeting_repository import (
             SqliteRecurringMeetingRepository,
         )
-        return SqliteRecurringMeetingRepository()
+        return traced_repository(SqliteRecurringMeetingRepository())
 
 
 @lru_cache()
@@ -253,7 +256,7 @@ def get_recurring_task_repository() -> IRecurringTaskRepository:
         raise NotImplementedError("Recurring task repository not implemented for GCP")
     else:
         from app.infrastructure.local.recurring_task_repository import SqliteRecurringTaskRepository
-        return SqliteRecurringTaskRepository()
+        return traced_repository(SqliteRecurringTaskRepository())
 
 
 @lru_cache()
@@ -266,7 +269,7 @@ def get_schedule_snapshot_repository() -> IScheduleSnapshotRepository:
         from app.infrastructure.local.schedule_snapshot_repository import (
             SqliteScheduleSnapshotRepository,
         )
-        return SqliteScheduleSnapshotRepository()
+        return traced_repository(SqliteScheduleSnapshotRepository())
 
 
 @lru_cache()
@@ -279,7 +282,7 @@ def get_schedule_settings_repository() -> IScheduleSettingsRepository:
         from app.infrastructure.local.schedule_settings_repository import (
             SqliteScheduleSettingsRepository,
         )
-        return SqliteScheduleSettingsRepository()
+        return traced_repository(SqliteScheduleSettingsRepository())
 
 
 @lru_cache()
@@ -292,7 +295,7 @@ def get_daily_schedule_plan_repository() -> IDailySchedulePlanRepository:
         from app.infrastructure.local.schedule_plan_repository import (
             SqliteDailySchedulePlanRepository,
         )
-        return SqliteDailySchedulePlanRepository()
+        return traced_repository(SqliteDailySchedulePlanRepository())
 
 
 @lru_cache()
@@ -303,7 +306,7 @@ def get_meeting_agenda_repository() -> IMeetingAgendaRepository:
         raise NotImplementedError("Meeting agenda repository not implemented for GCP")
     else:
         from app.infrastructure.local.meeting_agenda_repository import SqliteMeetingAgendaRepository
-        return SqliteMeetingAgendaRepository()
+        return traced_repository(SqliteMeetingAgendaRepository())
 
 
 @lru_cache()
@@ -316,7 +319,7 @@ def get_meeting_session_repository() -> IMeetingSessionRepository:
         from app.infrastructure.local.meeting_session_repository import (
             SqliteMeetingSessionRepository,
         )
-        return SqliteMeetingSessionRepository()
+        return traced_repository(SqliteMeetingSessionRepository())
 
 
 @lru_cache()
@@ -327,7 +330,7 @@ def get_issue_repository() -> IIssueRepository:
         raise NotImplementedError("Issue repository not implemented for GCP")
     else:
         from app.infrastructure.local.issue_repository import SqliteIssueRepository
-        return SqliteIssueRepository()
+        return traced_repository(SqliteIssueRepository())
 
 
 @lru_cache()
@@ -338,7 +341,7 @@ def get_achievement_repository() -> IAchievementRepository:
         raise NotImplementedError("Achievement repository not implemented for GCP")
     else:
         from app.infrastructure.local.achievement_repository import SqliteAchievementRepository
-        return SqliteAchievementRepository()
+        return traced_repository(SqliteAchievementRepository())
 
 
 @lru_cache()
@@ -351,7 +354,7 @@ def get_project_achievement_repository() -> IProjectAchievementRepository:
         from app.infrastructure.local.project_achievement_repository import (
             SqliteProjectAchievementRepository,
         )
-        return SqliteProjectAchievementRepository()
+        return traced_repository(SqliteProjectAchievementRepository())
 
 
 @lru_cache()
@@ -362,7 +365,7 @@ def get_issue_comment_repository() -> IIssueCommentRepository:
         raise NotImplementedError("Issue comment repository not implemented for GCP")
     else:
         from app.infrastructure.local.issue_comment_repository import SqliteIssueCommentRepository
-        return SqliteIssueCommentRepository()
+        return traced_repository(SqliteIssueCommentRepository())
 
 
 @lru_cache()
@@ -373,7 +376,7 @@ def get_notification_repository() -> INotificationRepository:
         raise NotImplementedError("Notification repository not implemented for GCP")
     else:
         from app.infrastructure.local.notification_repository import SqliteNotificationRepository
-        return SqliteNotificationRepository()
+        return traced_repository(SqliteNotificationRepository())
 
 
 @lru_cache()
@@ -384,7 +387,7 @@ def get_heartbeat_settings_repository() -> IHeartbeatSettingsRepository:
     from app.infrastructure.local.heartbeat_settings_repository import (
         SqliteHeartbeatSettingsRepository,
     )
-    return SqliteHeartbeatSettingsRepository()
+    return traced_repository(SqliteHeartbeatSettingsRepository())
 
 
 @lru_cache()
@@ -395,7 +398,17 @@ def get_heartbeat_event_repository() -> IHeartbeatEventRepository:
     from app.infrastructure.local.heartbeat_event_repository import (
         SqliteHeartbeatEventRepository,
     )
-    return SqliteHeartbeatEventRepository()
+    return traced_repository(SqliteHeartbeatEventRepository())
+
+
+@lru_cache()
+def get_llm_usage_repository() -> ILlmUsageRepository:
+    """Get LLM usage ledger repository instance."""
+    settings = get_settings()
+    if settings.is_gcp:
+        raise NotImplementedError("LLM usage repository not implemented for GCP")
+    from app.infrastructure.local.llm_usage_repository import SqliteLlmUsageRepository
+    return traced_repository(SqliteLlmUsageRepository())
 
 
 # ===========================================
@@ -497,6 +510,23 @@ def get_speech_provider() -> ISpeechToTextProvider:
     return WhisperProvider(settings.WHISPER_MODEL_SIZE)
 
 
+@lru_cache()
+def get_realtime_broker() -> IRealtimeBroker:
+    """Get realtime broker instance based on REALTIME_BROKER setting."""
+    settings = get_settings()
+    if settings.REALTIME_BROKER == "sqlite":
+        if settings.is_gcp:
+            raise NotImplementedError("SQLite realtime broker is not available on GCP")
+        from app.infrastructure.local.realtime_broker import SqliteRealtimeBroker
+
+        return SqliteRealtimeBroker()
+    if settings.REALTIME_BROKER != "memory":
+        raise ValueError(f"Unknown REALTIME_BROKER: {settings.REALTIME_BROKER}")
+    from app.infrastructure.local.realtime_broker import InProcessRealtimeBroker
+
+    return InProcessRealtimeBroker()
+
+
 # ===========================================
 # User Authentication
 # ===========================================
@@ -590,4 +620,5 @@ HeartbeatSettingsRepo = Annotated[
 HeartbeatEventRepo = Annotated[
     IHeartbeatEventRepository, Depends(get_heartbeat_event_repository)
 ]
+LlmUsageRepo = Annotated[ILlmUsageRepository, Depends(get_llm_usage_repository)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
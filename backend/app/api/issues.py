@@ -30,7 +30,6 @@ from app.models.issue_comment import (
     IssueCommentListResponse,
 )
 from app.services import notification_service as notify
-from app.services.issue_chat_service import IssueChatService
 
 router = APIRouter()
 
@@ -77,6 +76,8 @@ async def issue_chat_stream(
     This endpoint helps users articulate and submit feature requests,
     bug reports, and improvements through conversation.
     """
+    from app.services.issue_chat_service import IssueChatService
+
     service = IssueChatService(
         llm_provider=llm_provider,
         issue_repo=issue_repo,
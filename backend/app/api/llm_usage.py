@@ -0,0 +1,62 @@
+"""
+LLM usage API endpoints.
+
+Aggregated LLM latency and spend from the usage ledger, and today's spend
+against the background LLM budgets.
+"""
+
+from datetime import timedelta
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.api.deps import CurrentUser, LlmUsageRepo
+from app.core.config import get_settings
+from app.models.llm_usage import LlmBudgetStatus, LlmUsageGroupBy, LlmUsageSummary
+from app.services.llm_usage_service import llm_usage_ledger
+from app.utils.datetime_utils import now_utc
+
+router = APIRouter()
+
+
+@router.get("/summary", response_model=list[LlmUsageSummary])
+async def get_my_usage_summary(
+    user: CurrentUser,
+    repo: LlmUsageRepo,
+    days: int = Query(7, ge=1, le=90),
+    group_by: LlmUsageGroupBy = Query("feature"),
+):
+    """Summarize the current user's LLM calls per feature or model."""
+    if group_by == "user_id":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="group_by=user_id is only available on /summary/all",
+        )
+    await llm_usage_ledger.flush()
+    return await repo.summarize(
+        since=now_utc() - timedelta(days=days),
+        group_by=group_by,
+        user_id=user.id,
+    )
+
+
+@router.get("/summary/all", response_model=list[LlmUsageSummary])
+async def get_usage_summary(
+    user: CurrentUser,
+    repo: LlmUsageRepo,
+    days: int = Query(7, ge=1, le=90),
+    group_by: LlmUsageGroupBy = Query("feature"),
+):
+    """Summarize all LLM calls per feature, model or user (developer accounts only)."""
+    if not user.email or user.email.lower() not in get_settings().developer_emails:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only developer accounts can read usage across users",
+        )
+    await llm_usage_ledger.flush()
+    return await repo.summarize(since=now_utc() - timedelta(days=days), group_by=group_by)
+
+
+@router.get("/budget", response_model=LlmBudgetStatus)
+async def get_my_budget(user: CurrentUser):
+    """Today's (UTC) LLM spend of the current user against the background budgets."""
+    return await llm_usage_ledger.budget_status(user.id)
@@ -34,7 +34,7 @@ from app.models.meeting_summary import (
     MeetingSummary,
 )
 from app.models.task import TaskCreate, TaskUpdate
-from app.services.meeting_summary_service import MeetingSummaryService
+from app.services.llm_usage_service import llm_usage_scope
 from app.utils.datetime_utils import now_utc
 
 router = APIRouter(prefix="/meeting-sessions", tags=["meeting-sessions"])
@@ -426,13 +426,16 @@ async def analyze_transcript(
             pass
 
     # Analyze transcript
+    from app.services.meeting_summary_service import MeetingSummaryService
+
     service = MeetingSummaryService(llm_provider)
-    summary = await service.analyze_transcript(
-        session_id=session_id,
-        transcript=request.transcript,
-        agenda_items=agenda_items,
-        existing_tasks=existing_tasks,
-    )
+    with llm_usage_scope("meeting_summary", user_id=user.id):
+        summary = await service.analyze_transcript(
+            session_id=session_id,
+            transcript=request.transcript,
+            agenda_items=agenda_items,
+            existing_tasks=existing_tasks,
+        )
 
     # Save transcript and summary to session
     update_data = MeetingSessionUpdate(
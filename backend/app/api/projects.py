@@ -10,6 +10,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
 
+from app.api.conditional import ConditionalGetDep
 from app.api.deps import (
     BlockerRepo,
     CheckinRepo,
@@ -60,7 +61,9 @@ from app.models.project_kpi import ProjectKpiTemplate
 from app.services import notification_service as notify
 from app.services.kpi_calculator import apply_project_kpis
 from app.services.kpi_templates import get_kpi_templates
+from app.services.llm_usage_service import llm_usage_scope
 from app.services.llm_utils import generate_text, generate_text_with_status
+from app.services.project_context_service import resolve_member_display_names
 from app.services.project_permissions import ProjectAction
 from app.utils.datetime_utils import ensure_utc, now_utc
 
@@ -81,7 +84,7 @@ def _normalize_email(value: str) -> str:
     return value.strip().lower()
 
 
-def _summarize_checkin(llm_provider: LLMProvider, raw_text: str) -> str | None:
+def _summarize_checkin(llm_provider: LLMProvider, raw_text: str, user_id: str) -> str | None:
     compacted = _compact_text(raw_text)
     if not compacted:
         return None
@@ -91,12 +94,13 @@ def _summarize_checkin(llm_provider: LLMProvider, raw_text: str) -> str | None:
         "Keep it concise and action-focused.\n\n"
         f"{compacted}"
     )
-    summary_text = generate_text(
-        llm_provider,
-        prompt,
-        temperature=0.2,
-        max_output_tokens=200,
-    )
+    with llm_usage_scope("checkin_summary", user_id=user_id):
+        summary_text = generate_text(
+            llm_provider,
+            prompt,
+            temperature=0.2,
+            max_output_tokens=200,
+        )
     summary = _compact_text(summary_text or "")
     if summary:
         return _truncate_text(summary, 2000)
@@ -149,6 +153,7 @@ def _summarize_checkins(
     checkins: list[Checkin],
     start_date: Optional[date],
     end_date: Optional[date],
+    user_id: str,
     weekly_context: Optional[str] = None,
 ) -> tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]]:
     if not checkins:
@@ -171,12 +176,13 @@ def _summarize_checkins(
     if weekly_context:
         prompt_lines.extend(["", "Weekly snapshot:", _truncate_text(weekly_context, 1500)])
     prompt = "\n".join(prompt_lines)
-    summary, error_code, error_detail = generate_text_with_status(
-        llm_provider,
-        prompt,
-        temperature=0.2,
-        max_output_tokens=6000,
-    )
+    with llm_usage_scope("checkin_summary", user_id=user_id):
+        summary, error_code, error_detail = generate_text_with_status(
+            llm_provider,
+            prompt,
+            temperature=0.2,
+            max_output_tokens=6000,
+        )
     debug_prompt = _truncate_text(prompt, 800)
     debug_output = _truncate_text(summary, 800) if summary else None
     if summary and _looks_like_summary(summary):
@@ -206,12 +212,14 @@ def _summarize_checkins(
             *fallback_lines,
         ]
         strict_prompt = "\n".join(strict_prompt_lines)
-        summary, error_code, error_detail = generate_text_with_status(
-            llm_provider,
-            strict_prompt,
-            temperature=0.2,
-            max_output_tokens=6000,
-        )
+        with llm_usage_scope("checkin_summary", user_id=user_id) as usage:
+            usage.retries = 1
+            summary, error_code, error_detail = generate_text_with_status(
+                llm_provider,
+                strict_prompt,
+                temperature=0.2,
+                max_output_tokens=6000,
+            )
         debug_prompt = _truncate_text(strict_prompt, 800)
         debug_output = _truncate_text(summary, 800) if summary else None
         if summary and _looks_like_summary(summary):
@@ -229,6 +237,7 @@ def _build_checkin_summary_response(
     end_date: Optional[date],
     weekly_context: Optional[str],
     llm_provider: LLMProvider,
+    user_id: str,
 ) -> CheckinSummary:
     if not checkins:
         return CheckinSummary(
@@ -248,6 +257,7 @@ def _build_checkin_summary_response(
         checkins[:50],
         start_date,
         end_date,
+        user_id,
         weekly_context=weekly_context,
     )
     summary_text = summary_text.strip() or None
@@ -299,9 +309,7 @@ async def get_project(
     task_repo: TaskRepo,
 ):
     """Get a project by ID with task counts."""
-    # Use list_with_task_count to get task statistics
-    all_projects = await repo.list_with_task_count(user.id)
-    project = next((p for p in all_projects if p.id == project_id), None)
+    project = await repo.get_with_task_count(user.id, project_id)
 
     if not project:
         raise HTTPException(
@@ -318,11 +326,15 @@ async def list_projects(
     user: CurrentUser,
     repo: ProjectRepo,
     task_repo: TaskRepo,
+    conditional: ConditionalGetDep,
     status: Optional[str] = Query(None, description="Filter by status"),
 ):
     """List projects with task counts."""
+    if cached := await conditional.check():
+        return cached
     projects = await repo.list_with_task_count(user.id, status=status)
-    return [await apply_project_kpis(user.id, project, task_repo) for project in projects]
+    projects = [await apply_project_kpis(user.id, project, task_repo) for project in projects]
+    return conditional.respond(projects, list[ProjectWithTaskCount])
 
 
 @router.patch("/{project_id}", response_model=Project)
@@ -408,22 +420,14 @@ async def list_project_members(
             ProjectMemberCreate(member_user_id=user.id, role=ProjectRole.OWNER),
         )
         members = await member_repo.list(owner_id, project_id)
+    # 表示名の優先順: display_name(姓名から構築) → username
+    # email は使わない（プライバシー配慮）、フロントエンドで member_user_id がフォールバック
+    display_names = await resolve_member_display_names(
+        user_repo,
+        [member.member_user_id for member in members],
+    )
     for member in members:
-        user_account = None
-        try:
-            member_uuid = UUID(member.member_user_id)
-            user_account = await user_repo.get(member_uuid)
-        except Exception:
-            if "@" in member.member_user_id:
-                user_account = await user_repo.get_by_email(member.member_user_id)
-            if not user_account:
-                user_account = await user_repo.get_by_username(member.member_user_id)
-
-        # 表示名の優先順: display_name(姓名から構築) → username
-        # email は使わない（プライバシー配慮）、フロントエンドで member_user_id がフォールバック
-        display_name = None
-        if user_account:
-            display_name = user_account.display_name or user_account.username
+        display_name = display_names.get(member.member_user_id)
         if not display_name and member.member_user_id == user.id:
             display_name = user.display_name
         if display_name:
@@ -469,7 +473,8 @@ async def add_project_member(
             detail=f"User {member.member_user_id} not found",
         )
 
-    return await member_repo.create(owner_id, project_id, member)
+    created = await member_repo.create(owner_id, project_id, member)
+    return created
 
 
 @router.patch("/{project_id}/members/{member_id}", response_model=ProjectMember)
@@ -514,7 +519,8 @@ async def update_project_member(
                 detail=str(exc),
             ) from exc
 
-    return await member_repo.update(owner_id, member_id, update)
+    updated = await member_repo.update(owner_id, member_id, update)
+    return updated
 
 
 @router.delete("/{project_id}/members/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -851,6 +857,7 @@ async def summarize_project_checkins(
         end_date=end_date,
         weekly_context=None,
         llm_provider=llm_provider,
+        user_id=user.id,
     )
 
 
@@ -889,6 +896,7 @@ async def summarize_project_checkins_post(
         end_date=payload.end_date,
         weekly_context=payload.weekly_context,
         llm_provider=llm_provider,
+        user_id=user.id,
     )
 
 
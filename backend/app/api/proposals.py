@@ -22,11 +22,17 @@ from app.api.deps import (
     UserRepo,
 )
 from app.models.memory import MemoryCreate
-from app.models.proposal import ApprovalResult, ProposalStatus, RejectionResult
-from app.tools.memory_tools import CreateWorkMemoryInput
-from app.tools.phase_tools import apply_phase_plan
-from app.tools.project_tools import CreateProjectInput
-from app.tools.task_tools import AssignTaskInput, CreateTaskInput, assign_task
+from app.core.logger import logger
+from app.models.proposal import (
+    ApprovalResult,
+    BulkApprovalItem,
+    BulkApprovalResult,
+    BulkRejectionResult,
+    Proposal,
+    ProposalBulkRequest,
+    ProposalStatus,
+    RejectionResult,
+)
 
 router = APIRouter()
 
@@ -49,39 +55,12 @@ def _proposal_belongs_to_user(proposal, user_id: str) -> bool:
         return False
 
 
-@router.post("/{proposal_id}/approve")
-async def approve_proposal(
-    proposal_id: UUID,
-    user: CurrentUser,
-    proposal_repo: ProposalRepo,
-    task_repo: TaskRepo,
-    assignment_repo: TaskAssignmentRepo,
-    project_repo: ProjectRepo,
-    phase_repo: PhaseRepo,
-    milestone_repo: MilestoneRepo,
-    member_repo: ProjectMemberRepo,
-    invitation_repo: ProjectInvitationRepo,
-    memory_repo: MemoryRepo,
-    agent_task_repo: AgentTaskRepo,
-    meeting_agenda_repo: MeetingAgendaRepo,
-    recurring_meeting_repo: RecurringMeetingRepo,
-    llm_provider: LLMProvider,
-    user_repo: UserRepo,
-) -> ApprovalResult:
-    """Approve a proposal and create task/project.
-
-    Args:
-        proposal_id: The proposal ID
-        proposal_repo: Proposal repository
-        task_repo: Task repository
-        project_repo: Project repository
-        llm_provider: LLM provider (for project KPI selection)
-
-    Returns:
-        Approval result with created task_id or project_id
+async def _claim_proposal(proposal_id: UUID, user_id: str, proposal_repo) -> Proposal:
+    """Check a proposal and atomically move it from PENDING to EXECUTING.
 
     Raises:
-        HTTPException: If proposal not found or already processed
+        HTTPException: If the proposal is not found, not the user's or
+            already processed (also by a concurrent request)
     """
     proposal = await proposal_repo.get(proposal_id)
 
@@ -94,12 +73,63 @@ async def approve_proposal(
             detail=f"Proposal already {proposal.status.value}",
         )
 
-    if not _proposal_belongs_to_user(proposal, user.id):
+    if not _proposal_belongs_to_user(proposal, user_id):
         raise HTTPException(status_code=403, detail="Forbidden")
 
+    claimed = await proposal_repo.update_status(
+        proposal_id, ProposalStatus.EXECUTING, expected_status=ProposalStatus.PENDING
+    )
+    if not claimed:
+        raise HTTPException(status_code=409, detail="Proposal already processed")
+    return claimed
+
+
+async def _approve(proposal_id: UUID, user, proposal_repo, **repos) -> ApprovalResult:
+    """Claim a proposal, execute it and settle it as APPROVED or FAILED.
+
+    A failed execution may have partly run (e.g. some phases created), so the
+    proposal is never put back to PENDING where a second approval would run
+    it again. A proposal left EXECUTING by a crash is failed by the sweep.
+    """
+    proposal = await _claim_proposal(proposal_id, user.id, proposal_repo)
+    try:
+        result = await _execute_proposal(proposal, user, **repos)
+    except Exception:
+        await proposal_repo.update_status(
+            proposal_id, ProposalStatus.FAILED, expected_status=ProposalStatus.EXECUTING
+        )
+        raise
+    await proposal_repo.update_status(
+        proposal_id, ProposalStatus.APPROVED, expected_status=ProposalStatus.EXECUTING
+    )
+    return result
+
+
+async def _execute_proposal(
+    proposal: Proposal,
+    user,
+    *,
+    task_repo,
+    assignment_repo,
+    project_repo,
+    phase_repo,
+    milestone_repo,
+    member_repo,
+    invitation_repo,
+    memory_repo,
+    agent_task_repo,
+    meeting_agenda_repo,
+    recurring_meeting_repo,
+    llm_provider,
+    user_repo,
+) -> ApprovalResult:
+    """Execute the action of a claimed proposal."""
+
     # Import necessary tools
-    from app.tools.project_tools import create_project
-    from app.tools.task_tools import create_task
+    from app.tools.memory_tools import CreateWorkMemoryInput
+    from app.tools.phase_tools import apply_phase_plan
+    from app.tools.project_tools import CreateProjectInput, create_project
+    from app.tools.task_tools import AssignTaskInput, CreateTaskInput, assign_task, create_task
 
     result = ApprovalResult()
 
@@ -317,7 +347,6 @@ async def approve_proposal(
             tool_result = await apply_schedule_request(
                 user_id=user.id,
                 task_repo=task_repo,
-                assignment_repo=assignment_repo,
                 project_repo=project_repo,
                 input_data=ApplyScheduleRequestInput(**args),
                 user_repo=user_repo,
@@ -392,12 +421,116 @@ async def approve_proposal(
             tool_result = tool_result.model_dump(mode="json")
         result.result = tool_result if isinstance(tool_result, dict) else {"result": tool_result}
 
-    # Update proposal status
-    await proposal_repo.update_status(proposal_id, ProposalStatus.APPROVED)
-
     return result
 
 
+@router.post("/{proposal_id}/approve")
+async def approve_proposal(
+    proposal_id: UUID,
+    user: CurrentUser,
+    proposal_repo: ProposalRepo,
+    task_repo: TaskRepo,
+    assignment_repo: TaskAssignmentRepo,
+    project_repo: ProjectRepo,
+    phase_repo: PhaseRepo,
+    milestone_repo: MilestoneRepo,
+    member_repo: ProjectMemberRepo,
+    invitation_repo: ProjectInvitationRepo,
+    memory_repo: MemoryRepo,
+    agent_task_repo: AgentTaskRepo,
+    meeting_agenda_repo: MeetingAgendaRepo,
+    recurring_meeting_repo: RecurringMeetingRepo,
+    llm_provider: LLMProvider,
+    user_repo: UserRepo,
+) -> ApprovalResult:
+    """Approve a proposal and create task/project.
+
+    Args:
+        proposal_id: The proposal ID
+        proposal_repo: Proposal repository
+        task_repo: Task repository
+        project_repo: Project repository
+        llm_provider: LLM provider (for project KPI selection)
+
+    Returns:
+        Approval result with created task_id or project_id
+
+    Raises:
+        HTTPException: If proposal not found or already processed
+    """
+    return await _approve(
+        proposal_id,
+        user,
+        proposal_repo,
+        task_repo=task_repo,
+        assignment_repo=assignment_repo,
+        project_repo=project_repo,
+        phase_repo=phase_repo,
+        milestone_repo=milestone_repo,
+        member_repo=member_repo,
+        invitation_repo=invitation_repo,
+        memory_repo=memory_repo,
+        agent_task_repo=agent_task_repo,
+        meeting_agenda_repo=meeting_agenda_repo,
+        recurring_meeting_repo=recurring_meeting_repo,
+        llm_provider=llm_provider,
+        user_repo=user_repo,
+    )
+
+
+@router.post("/approve")
+async def approve_proposals(
+    request: ProposalBulkRequest,
+    user: CurrentUser,
+    proposal_repo: ProposalRepo,
+    task_repo: TaskRepo,
+    assignment_repo: TaskAssignmentRepo,
+    project_repo: ProjectRepo,
+    phase_repo: PhaseRepo,
+    milestone_repo: MilestoneRepo,
+    member_repo: ProjectMemberRepo,
+    invitation_repo: ProjectInvitationRepo,
+    memory_repo: MemoryRepo,
+    agent_task_repo: AgentTaskRepo,
+    meeting_agenda_repo: MeetingAgendaRepo,
+    recurring_meeting_repo: RecurringMeetingRepo,
+    llm_provider: LLMProvider,
+    user_repo: UserRepo,
+) -> BulkApprovalResult:
+    """Approve several proposals in order; each one succeeds or fails on its own.
+
+    Returns:
+        Per-proposal approval results, or the error of a failed proposal
+    """
+    repos = dict(
+        task_repo=task_repo,
+        assignment_repo=assignment_repo,
+        project_repo=project_repo,
+        phase_repo=phase_repo,
+        milestone_repo=milestone_repo,
+        member_repo=member_repo,
+        invitation_repo=invitation_repo,
+        memory_repo=memory_repo,
+        agent_task_repo=agent_task_repo,
+        meeting_agenda_repo=meeting_agenda_repo,
+        recurring_meeting_repo=recurring_meeting_repo,
+        llm_provider=llm_provider,
+        user_repo=user_repo,
+    )
+    items = []
+    for proposal_id in request.proposal_ids:
+        try:
+            result = await _approve(proposal_id, user, proposal_repo, **repos)
+        except HTTPException as exc:
+            items.append(BulkApprovalItem(proposal_id=str(proposal_id), status="failed", detail=str(exc.detail)))
+        except Exception as exc:
+            logger.error(f"Failed to approve proposal {proposal_id}: {exc}")
+            items.append(BulkApprovalItem(proposal_id=str(proposal_id), status="failed", detail=str(exc)))
+        else:
+            items.append(BulkApprovalItem(proposal_id=str(proposal_id), status="approved", result=result))
+    return BulkApprovalResult(results=items)
+
+
 @router.post("/{proposal_id}/reject")
 async def reject_proposal(
     proposal_id: UUID,
@@ -430,12 +563,35 @@ async def reject_proposal(
     if not _proposal_belongs_to_user(proposal, user.id):
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    # Update proposal status
-    await proposal_repo.update_status(proposal_id, ProposalStatus.REJECTED)
+    # Update proposal status (unless a concurrent request processed it)
+    rejected = await proposal_repo.update_status(
+        proposal_id, ProposalStatus.REJECTED, expected_status=ProposalStatus.PENDING
+    )
+    if not rejected:
+        raise HTTPException(status_code=409, detail="Proposal already processed")
 
     return RejectionResult()
 
 
+@router.post("/reject")
+async def reject_proposals(
+    request: ProposalBulkRequest,
+    user: CurrentUser,
+    proposal_repo: ProposalRepo,
+) -> BulkRejectionResult:
+    """Reject several proposals in one update.
+
+    Proposals that are not pending, expired or not the user's are skipped.
+
+    Returns:
+        IDs of the rejected proposals
+    """
+    rejected = await proposal_repo.update_status_many(
+        _proposal_user_uuid(user.id), request.proposal_ids, ProposalStatus.REJECTED
+    )
+    return BulkRejectionResult(rejected=[str(proposal_id) for proposal_id in rejected])
+
+
 @router.get("/pending")
 async def list_pending_proposals(
     user: CurrentUser,
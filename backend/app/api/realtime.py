@@ -1,10 +1,12 @@
-import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request
 from fastapi.responses import StreamingResponse
 
 from app.api.deps import CurrentUser
+from app.core.config import get_settings
+from app.models.realtime import RealtimeEvent
 from app.services.realtime_service import realtime_manager
 
 router = APIRouter()
@@ -14,22 +16,25 @@ router = APIRouter()
 async def stream_realtime(
     user: CurrentUser,
     request: Request,
+    kind: Optional[list[str]] = Query(None, description="Only these entity kinds"),
+    project_id: Optional[list[UUID]] = Query(None, description="Only these projects (plus personal events)"),
 ) -> StreamingResponse:
-    queue = await realtime_manager.connect(user.id)
+    """Server-sent change events for the data the user can see."""
+    subscription = await realtime_manager.connect(user.id, kinds=kind, project_ids=project_id)
+    keepalive_seconds = get_settings().REALTIME_KEEPALIVE_SECONDS
 
     async def event_generator() -> AsyncGenerator[str, None]:
         try:
-            yield 'data: {"type":"connected"}\n\n'
+            yield f"data: {RealtimeEvent(type='connected').to_json()}\n\n"
             while True:
                 if await request.is_disconnected():
                     break
-                try:
-                    data = await asyncio.wait_for(queue.get(), timeout=15)
-                except asyncio.TimeoutError:
+                event = await subscription.get(timeout=keepalive_seconds)
+                if event is None:
                     yield ": keep-alive\n\n"
                     continue
-                yield f"data: {data}\n\n"
+                yield f"data: {event.to_json()}\n\n"
         finally:
-            await realtime_manager.disconnect(user.id, queue)
+            await realtime_manager.disconnect(subscription)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
@@ -0,0 +1,89 @@
+"""
+Stored file endpoints (local storage).
+
+Serves the URLs returned by LocalStorageProvider.get_public_url as streamed
+responses with single-range support (HTTP Range / 206) for media seeking.
+"""
+
+import mimetypes
+import re
+from pathlib import PurePosixPath
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import StorageProvider
+from app.core.exceptions import NotFoundError
+
+router = APIRouter()
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _parse_range(range_header: str, size: int) -> Optional[tuple[int, int]]:
+    """
+    Parse a single-range Range header into an inclusive (start, end).
+
+    Returns None for headers this endpoint ignores (multiple ranges or
+    other units), in which case the whole file is served.
+
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied
+    """
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        start, end = max(0, size - int(last)), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+@router.api_route("/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def get_stored_file(
+    path: str,
+    request: Request,
+    storage: StorageProvider,
+    range_header: Optional[str] = Header(None, alias="Range"),
+):
+    """Stream a stored file (or the requested byte range)."""
+    # Dot-prefixed top-level entries hold content blobs, not stored files.
+    parts = PurePosixPath(path).parts
+    if not parts or parts[0] == "/" or parts[0].startswith(".") or ".." in parts:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    try:
+        size = await storage.size(path)
+    except NotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    headers = {"Accept-Ranges": "bytes"}
+    byte_range = _parse_range(range_header, size) if range_header and size else None
+    if byte_range:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    else:
+        start, end = 0, size - 1
+        status_code = status.HTTP_200_OK
+    headers["Content-Length"] = str(end - start + 1 if size else 0)
+
+    if request.method == "HEAD":
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+    return StreamingResponse(
+        storage.stream(path, start=start, end=end if size else None),
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+    )
@@ -8,8 +8,9 @@ from datetime import date
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
+from app.api.conditional import ConditionalGetDep
 from app.api.deps import (
     BlockerRepo,
     CurrentUser,
@@ -23,7 +24,7 @@ from app.api.deps import (
     TaskRepo,
     UserRepo,
 )
-from app.core.exceptions import BusinessLogicError, NotFoundError
+from app.core.exceptions import BusinessLogicError, NotFoundError, ValidationError
 from app.models.collaboration import (
     Blocker,
     BlockerCreate,
@@ -47,6 +48,8 @@ from app.utils.dependency_validator import DependencyValidator
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 async def _validate_assignees_are_project_members(
     assignee_ids: list[str],
@@ -239,7 +242,7 @@ async def list_tasks(
     user: CurrentUser,
     repo: TaskRepo,
     project_repo: ProjectRepo,
-    assignment_repo: TaskAssignmentRepo,
+    response: Response,
     project_id: Optional[UUID] = Query(None, description="Filter by project ID"),
     status: Optional[str] = Query(None, description="Filter by status"),
     include_done: bool = Query(False, description="Include completed tasks"),
@@ -247,112 +250,51 @@ async def list_tasks(
     exclude_meetings: bool = Query(False, description="会議を除外"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(
+        None, description="Next page cursor (X-Next-Cursor of the previous response)"
+    ),
 ):
-    """List tasks with optional filters."""
-
-    async def _fetch_scoped_tasks(
-        query_user_id: str,
-        query_project_id: Optional[UUID],
-    ) -> list[Task]:
-        batch_size = max(limit, 200)
-        scan_offset = 0
-        collected: list[Task] = []
-        while True:
-            batch = await repo.list(
-                query_user_id,
-                project_id=query_project_id,
-                status=status,
-                include_done=include_done,
-                limit=batch_size,
-                offset=scan_offset,
-            )
-            if not batch:
-                break
-            collected.extend(batch)
-            if len(batch) < batch_size:
-                break
-            scan_offset += batch_size
-        return collected
+    """
+    List tasks with optional filters.
 
-    def _apply_meeting_filters(items: list[Task]) -> list[Task]:
-        if only_meetings:
-            return [task for task in items if task.is_fixed_time]
-        if exclude_meetings:
-            return [task for task in items if not task.is_fixed_time]
-        return items
+    Pages are cut on parent tasks (newest first) and include their subtasks.
+    When more parents remain, the next page cursor is returned in the
+    X-Next-Cursor response header.
+    """
+    is_fixed_time = True if only_meetings else (False if exclude_meetings else None)
 
     # If project_id is specified, check membership and use project owner's user_id
     if project_id:
         project = await project_repo.get(user.id, project_id)
-        if project:
-            query_user_id = project.user_id  # Use project owner's ID
-        else:
-            query_user_id = user.id
-        tasks = await _fetch_scoped_tasks(query_user_id, project_id)
-        tasks = _apply_meeting_filters(tasks)
-        # Paginate by parent tasks only, then include their subtasks
-        parent_tasks = [t for t in tasks if not t.parent_id]
-        paginated_parents = parent_tasks[offset : offset + limit]
-        parent_ids = {t.id for t in paginated_parents}
-        subtasks = [t for t in tasks if t.parent_id and t.parent_id in parent_ids]
-        return paginated_parents + subtasks
+        query_user_id = project.user_id if project else user.id
+        page_kwargs = {"user_id": query_user_id, "project_id": project_id}
+    elif only_meetings:
+        # All of the user's own meetings across projects, not grouped by parent
+        page_kwargs = {"user_id": user.id, "group_subtasks": False}
     else:
-        # Special case: only_meetings - fetch all user's meetings across all projects
-        if only_meetings:
-            all_tasks = await _fetch_scoped_tasks(user.id, None)
-            tasks = _apply_meeting_filters(all_tasks)
-            return tasks[offset : offset + limit]
-        else:
-            # My Tasks mode (No project_id):
-            #   - Personal tasks (project_id NULL): all
-            #   - PRIVATE project tasks: all (single-user projects)
-            #   - TEAM project tasks: only assigned to me
-
-            # 1. Get all tasks owned by this user
-            all_user_tasks = await _fetch_scoped_tasks(user.id, None)
-
-            # 2. Get assignments for TEAM project filtering
-            assignments = await assignment_repo.list_for_assignee(user.id)
-            assigned_task_ids = {a.task_id for a in assignments}
-
-            # 3. Build TEAM project ID set
-            projects = await project_repo.list(user.id, limit=1000)
-            team_project_ids = {p.id for p in projects if p.visibility == ProjectVisibility.TEAM}
-
-            # 4. Filter: keep personal + PRIVATE project + assigned TEAM project
-            def should_include(task: Task) -> bool:
-                if not task.project_id:
-                    return True  # Personal task
-                if task.project_id not in team_project_ids:
-                    return True  # PRIVATE project task
-                # TEAM project: only if assigned to me
-                return task.id in assigned_task_ids
-
-            tasks = [t for t in all_user_tasks if should_include(t)]
-
-            # Also include TEAM project tasks assigned to me but owned by others
-            assigned_tasks = await repo.get_many(list(assigned_task_ids))
-            existing_ids = {t.id for t in tasks}
-            for t in assigned_tasks:
-                if t.id in existing_ids:
-                    continue
-                if status and t.status.value != status:
-                    continue
-                if not include_done and t.status == TaskStatus.DONE:
-                    continue
-                tasks.append(t)
-
-            tasks.sort(key=lambda t: t.created_at, reverse=True)
-            tasks = _apply_meeting_filters(tasks)
-
-            # Paginate by parent tasks only, then include their subtasks
-            parent_tasks = [t for t in tasks if not t.parent_id]
-            paginated_parents = parent_tasks[offset : offset + limit]
-            parent_ids = {t.id for t in paginated_parents}
-            subtasks = [t for t in tasks if t.parent_id and t.parent_id in parent_ids]
-            return paginated_parents + subtasks
-
-    return []
+        # My Tasks mode (No project_id):
+        #   - Personal tasks (project_id NULL): all
+        #   - PRIVATE project tasks: all (single-user projects)
+        #   - TEAM project tasks: only assigned to me (including tasks owned by others)
+        page_kwargs = {"user_id": user.id, "assigned_scope": True}
+
+    try:
+        page = await repo.list_page(
+            **page_kwargs,
+            status=status,
+            include_done=include_done,
+            is_fixed_time=is_fixed_time,
+            cursor=cursor,
+            offset=offset,
+            limit=limit,
+        )
+    except ValidationError as e:
+        # `status` is shadowed by the query parameter here.
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.tasks
 
 
 @router.get("/schedule", response_model=SchedulePlanResponse)
@@ -365,6 +307,7 @@ async def get_task_schedule(
     user_repo: UserRepo,
     settings_repo: ScheduleSettingsRepo,
     plan_repo: DailySchedulePlanRepo,
+    conditional: ConditionalGetDep,
     scheduler_service: SchedulerService = Depends(get_scheduler_service),
     start_date: Optional[date] = Query(None, description="Schedule start date"),
     capacity_hours: Optional[float] = Query(
@@ -380,6 +323,8 @@ async def get_task_schedule(
     apply_plan_constraints: bool = Query(True, description="Apply project plan windows"),
 ):
     """Build a multi-day schedule for tasks."""
+    if cached := await conditional.check():
+        return cached
     plan_service = DailySchedulePlanService(
         task_repo=repo,
         project_repo=project_repo,
@@ -390,13 +335,14 @@ async def get_task_schedule(
         plan_repo=plan_repo,
         scheduler_service=scheduler_service,
     )
-    return await plan_service.get_plan_or_forecast(
+    plan = await plan_service.get_plan_or_forecast(
         user_id=user.id,
         start_date=start_date,
         max_days=max_days,
         filter_by_assignee=filter_by_assignee,
         apply_plan_constraints=apply_plan_constraints,
     )
+    return conditional.respond(plan, SchedulePlanResponse)
 
 
 @router.post("/schedule/plan", response_model=SchedulePlanResponse)
@@ -415,6 +361,7 @@ async def recalculate_schedule_plan(
     from_now: bool = Query(False, description="Recalculate from current time for today"),
     filter_by_assignee: bool = Query(True, description="Only show tasks assigned to me"),
     apply_plan_constraints: bool = Query(True, description="Apply project plan windows"),
+    incremental: bool = Query(True, description="Keep stored plan days before the first affected day"),
 ):
     plan_service = DailySchedulePlanService(
         task_repo=repo,
@@ -433,6 +380,7 @@ async def recalculate_schedule_plan(
         from_now=from_now,
         filter_by_assignee=filter_by_assignee,
         apply_plan_constraints=apply_plan_constraints,
+        incremental=incremental,
     )
 
 
@@ -477,6 +425,7 @@ async def get_today_tasks(
     user_repo: UserRepo,
     settings_repo: ScheduleSettingsRepo,
     plan_repo: DailySchedulePlanRepo,
+    conditional: ConditionalGetDep,
     scheduler_service: SchedulerService = Depends(get_scheduler_service),
     target_date: Optional[date] = Query(None, description="Target date (default: today)"),
     capacity_hours: Optional[float] = Query(
@@ -492,6 +441,8 @@ async def get_today_tasks(
     apply_plan_constraints: bool = Query(True, description="Apply project plan windows"),
 ):
     """Get today's tasks derived from the schedule."""
+    if cached := await conditional.check():
+        return cached
     user_timezone = "Asia/Tokyo"
     try:
         user_account = await user_repo.get(UUID(user.id))
@@ -520,7 +471,7 @@ async def get_today_tasks(
     tasks = await repo.list(user.id, include_done=True, limit=1000)
     project_priorities = await load_project_priorities(project_repo, user.id)
     resolved_date = target_date or schedule_plan.start_date or get_user_today(user_timezone)
-    return scheduler_service.get_today_tasks(
+    today_tasks = scheduler_service.get_today_tasks(
         ScheduleResponse(
             start_date=schedule_plan.start_date,
             days=schedule_plan.days,
@@ -533,6 +484,7 @@ async def get_today_tasks(
         today=resolved_date,
         user_timezone=user_timezone,
     )
+    return conditional.respond(today_tasks, TodayTasksResponse)
 
 
 @router.get("/postpone-stats", response_model=PostponeStats)
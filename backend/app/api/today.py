@@ -10,6 +10,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
+from app.api.conditional import ConditionalGetDep
 from app.api.deps import CurrentUser, ProjectRepo, TaskAssignmentRepo, TaskRepo, UserRepo
 from app.models.task import Task
 from app.services.scheduler_service import SchedulerService
@@ -97,6 +98,7 @@ async def get_top3_tasks(
     task_repo: TaskRepo,
     project_repo: ProjectRepo,
     assignment_repo: TaskAssignmentRepo,
+    conditional: ConditionalGetDep,
     scheduler_service: SchedulerService = Depends(get_scheduler_service),
     capacity_hours: Optional[float] = Query(None, description="Daily capacity in hours (default: 8)"),
     buffer_hours: Optional[float] = Query(None, description="Daily buffer hours"),
@@ -123,6 +125,8 @@ async def get_top3_tasks(
     Returns:
         Top3Response: Top 3 tasks with capacity information
     """
+    if cached := await conditional.check():
+        return cached
     # Get user account to access timezone
     from uuid import UUID
     user_account = await user_repo.get(UUID(user.id))
@@ -191,8 +195,9 @@ async def get_top3_tasks(
             capacity_usage_percent=capacity_usage_percent,
         )
 
-    return Top3Response(
+    top3 = Top3Response(
         tasks=top3_tasks,
         capacity_info=capacity_info,
         overflow_suggestion="",
     )
+    return conditional.respond(top3, Top3Response)
@@ -5,12 +5,29 @@ Environment-based infrastructure switching is controlled by the ENVIRONMENT vari
 """
 
 from functools import lru_cache
-from typing import List, Literal
+from typing import List, Literal, Optional
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _parse_feature_budgets(value: str) -> dict[str, float]:
+    """Parse "feature=usd,..." budgets, rejecting malformed entries."""
+    budgets: dict[str, float] = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        name, _, amount = entry.partition("=")
+        try:
+            budget = float(amount)
+        except ValueError:
+            budget = None
+        if not name.strip() or budget is None or budget < 0:
+            raise ValueError(f"Invalid LLM_FEATURE_DAILY_BUDGETS_USD entry: {entry.strip()!r}")
+        budgets[name.strip()] = budget
+    return budgets
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -31,6 +48,9 @@ class Settings(BaseSettings):
     # Database
     # ===========================================
     DATABASE_URL: str = "sqlite+aiosqlite:///./secretary.db"
+    # Cross-check validation-free bulk row construction against full Pydantic
+    # validation (logs mismatches; slow, for debugging only).
+    TRUSTED_ROW_CHECK: bool = False
 
     # ===========================================
     # LLM Configuration
@@ -66,6 +86,144 @@ class Settings(BaseSettings):
     # Google API Key (for gemini-api provider)
     GOOGLE_API_KEY: str = ""
 
+    # ===========================================
+    # LLM Usage Ledger
+    # ===========================================
+    # Record model, feature, tokens, latency and cost of every LLM call.
+    LLM_USAGE_ENABLED: bool = True
+    # Buffered usage records are written in batches at this interval, or
+    # sooner once LLM_USAGE_BATCH_SIZE records are pending.
+    LLM_USAGE_FLUSH_INTERVAL_SECONDS: float = 5.0
+    LLM_USAGE_BATCH_SIZE: int = 100
+    # Max buffered records; the oldest are dropped if writes keep failing.
+    LLM_USAGE_BUFFER_LIMIT: int = 10000
+    # Daily spend limit per user (USD) for background LLM features
+    # (heartbeat, automatic achievements). Unset = unlimited.
+    LLM_USER_DAILY_BUDGET_USD: Optional[float] = None
+    # Daily spend limits per user for individual background features (USD),
+    # comma-separated. Example: "heartbeat=0.05,achievement=0.2"
+    LLM_FEATURE_DAILY_BUDGETS_USD: str = ""
+    # Seconds a stored daily spend total is reused by budget checks.
+    LLM_BUDGET_CACHE_SECONDS: float = 60.0
+
+    # ===========================================
+    # Chat History Compaction
+    # ===========================================
+    # Token budget for history replayed into a rebuilt agent session
+    # (rolling summary + most recent messages).
+    CHAT_HISTORY_TOKEN_BUDGET: int = 6000
+    # Max recent messages replayed verbatim; older ones are folded into the summary.
+    CHAT_HISTORY_RECENT_MESSAGES: int = 20
+    # Recent messages always kept verbatim even when they exceed the budget.
+    CHAT_HISTORY_MIN_RECENT_MESSAGES: int = 4
+    CHAT_HISTORY_SUMMARY_MAX_TOKENS: int = 800
+
+    # ===========================================
+    # Achievement Generation
+    # ===========================================
+    # Token budget for the completed-task section of achievement prompts.
+    ACHIEVEMENT_PROMPT_TOKEN_BUDGET: int = 12000
+    # Max concurrent first-pass summaries of overflow task groups.
+    ACHIEVEMENT_SUMMARY_CONCURRENCY: int = 4
+
+    # ===========================================
+    # Agent Tool Outputs
+    # ===========================================
+    # Token budget per compacted read-tool result (trailing list items dropped).
+    TOOL_OUTPUT_TOKEN_BUDGET: int = 3000
+    # Max characters kept per string field in compacted tool results.
+    TOOL_OUTPUT_TEXT_LIMIT: int = 300
+
+    # ===========================================
+    # Agent Proposals
+    # ===========================================
+    # Days an expired, approved or rejected proposal is kept (past its
+    # expiry) before the periodic sweep deletes it.
+    PROPOSAL_RETENTION_DAYS: int = 7
+    # Minutes after which an approval still executing (its worker died) is
+    # marked failed by the sweep.
+    PROPOSAL_EXECUTION_TIMEOUT_MINUTES: int = 15
+
+    # ===========================================
+    # Work Memory
+    # ===========================================
+    # Seconds a user's parsed work-memory library (index + BM25 ranking) is
+    # reused (0 disables caching). Memory writes invalidate it immediately.
+    WORK_MEMORY_CACHE_TTL_SECONDS: float = 300.0
+    # Max users whose libraries are cached (least recently used are evicted).
+    WORK_MEMORY_CACHE_MAX_ENTRIES: int = 1000
+
+    # ===========================================
+    # Access Control
+    # ===========================================
+    # Seconds a project context bundle (project info + member display names)
+    # is shared by the agent's meeting/check-in tools (0 disables caching).
+    # Project and membership changes invalidate it immediately.
+    PROJECT_CONTEXT_TTL_SECONDS: float = 60.0
+    # Max projects whose bundles are cached (least recently used are evicted).
+    PROJECT_CONTEXT_CACHE_MAX_ENTRIES: int = 1000
+
+    # ===========================================
+    # Conditional GET
+    # ===========================================
+    # ETags on heavy read endpoints (schedule, today, top3, project list),
+    # derived from per-user/per-project revisions that writes bump. A request
+    # whose If-None-Match matches is answered 304 before any data is loaded.
+    CONDITIONAL_GET_ENABLED: bool = True
+    # ETags also change every this many seconds, since the views depend on
+    # the current time (today's date, overdue tasks).
+    CONDITIONAL_GET_WINDOW_SECONDS: float = 300.0
+    # Last computed response bodies kept per user and URL (0 disables).
+    RESPONSE_CACHE_SIZE: int = 1000
+    # Scopes (users, projects) whose revisions are kept; evicting the least
+    # recently written one bumps the global epoch, invalidating every ETag.
+    DATA_REVISIONS_MAX_SCOPES: int = 100000
+
+    # ===========================================
+    # Realtime Events
+    # ===========================================
+    # Events buffered per SSE connection. Events for the same entity are
+    # coalesced; a connection falling further behind gets a single "resync"
+    # event instead of the backlog.
+    REALTIME_QUEUE_SIZE: int = 100
+    # Keep-alive comment interval of idle SSE streams.
+    REALTIME_KEEPALIVE_SECONDS: float = 15.0
+    # How events reach SSE connections of other processes:
+    # "memory" (single process) or "sqlite" (workers sharing DATABASE_URL).
+    REALTIME_BROKER: str = "memory"
+    # SQLite broker: poll interval for other workers' events and how long
+    # published events are kept for them.
+    REALTIME_BROKER_POLL_SECONDS: float = 0.25
+    REALTIME_BROKER_RETENTION_SECONDS: float = 60.0
+
+    # ===========================================
+    # Daily Plan Generation
+    # ===========================================
+    # Worker processes computing schedules for the hourly plan job, keeping
+    # the CPU work off the API process (0 computes in-process).
+    PLAN_GENERATION_PROCESSES: int = 2
+
+    # ===========================================
+    # Tracing / Profiling
+    # ===========================================
+    # Record timing spans for requests, services, repositories, LLM calls
+    # and tool invocations (summaries at /api/debug/metrics).
+    TRACING_ENABLED: bool = True
+    # Spans at least this slow are logged as structured JSON lines.
+    TRACE_SLOW_SPAN_MS: float = 1000.0
+    # Recent durations kept per span name for the percentile estimates.
+    TRACE_RESERVOIR_SIZE: int = 512
+    # Opt-in sampling profiler: requests sent with "X-Profile: 1" are
+    # profiled, plus this fraction of all other requests.
+    PROFILING_ENABLED: bool = False
+    PROFILE_SAMPLE_RATE: float = 0.0
+    # Stack sampling interval of the profiler.
+    PROFILE_INTERVAL_MS: float = 5.0
+    # Statement shapes repeated this often within one request/job are
+    # logged as likely N+1 queries. With DEBUG, responses carry the
+    # statement count in X-Query-Count.
+    QUERY_REPEAT_WARN_THRESHOLD: int = 10
+
     # ===========================================
     # Google Cloud
     # ===========================================
@@ -143,6 +301,8 @@ class Settings(BaseSettings):
     # Storage
     # ===========================================
     STORAGE_BASE_PATH: str = "./storage"
+    # Chunk size for streaming local storage reads/writes
+    STORAGE_CHUNK_SIZE: int = 256 * 1024
     # GCS bucket name (for GCP environment)
     GCS_BUCKET: str = ""
 
@@ -195,6 +355,18 @@ class Settings(BaseSettings):
             return set()
         return {e.strip().lower() for e in self.DEVELOPER_EMAILS.split(",") if e.strip()}
 
+    @field_validator("LLM_FEATURE_DAILY_BUDGETS_USD")
+    @classmethod
+    def _validate_feature_budgets(cls, value: str) -> str:
+        # Fail at startup instead of on the first budget check.
+        _parse_feature_budgets(value)
+        return value
+
+    @property
+    def llm_feature_daily_budgets(self) -> dict[str, float]:
+        """Get per-feature daily LLM budgets (USD) keyed by feature name."""
+        return _parse_feature_budgets(self.LLM_FEATURE_DAILY_BUDGETS_USD)
+
     @property
     def is_gcp(self) -> bool:
         """Check if running in GCP environment."""
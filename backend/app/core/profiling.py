@@ -0,0 +1,99 @@
+"""
+Opt-in sampling profiler for single requests.
+
+A profiled request starts a daemon thread that samples the stack of the
+thread serving it (the event loop thread) every PROFILE_INTERVAL_MS and
+counts collapsed stacks ("outer;...;inner" frames, the flame graph input
+format). Samples include every coroutine the loop runs meanwhile, so
+profiles are most meaningful on a quiet server.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Optional
+
+from app.core.config import get_settings
+from app.core.tracing import trace_logger
+
+PROFILE_HEADER = "X-Profile"
+
+_MAX_STACK_DEPTH = 40
+_TOP_STACKS = 30
+_recent_profiles: deque[dict[str, Any]] = deque(maxlen=20)
+
+
+def should_profile(header_value: Optional[str]) -> bool:
+    """Whether to profile a request (PROFILING_ENABLED must be set)."""
+    settings = get_settings()
+    if not settings.PROFILING_ENABLED:
+        return False
+    if header_value and header_value.strip().lower() in {"1", "true", "yes"}:
+        return True
+    return random.random() < settings.PROFILE_SAMPLE_RATE
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})"
+
+
+class SamplingProfiler:
+    """Sample the stack of one thread in the background."""
+
+    def __init__(self, name: str, thread_id: Optional[int] = None) -> None:
+        self.name = name
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = get_settings().PROFILE_INTERVAL_MS / 1000
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+
+    def start(self) -> "SamplingProfiler":
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+            labels = []
+            while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(labels))] += 1
+            self.samples += 1
+
+    def stop(self) -> dict[str, Any]:
+        """Stop sampling and store/log the profile summary."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        profile = {
+            "name": self.name,
+            "duration_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "interval_ms": round(self.interval * 1000, 3),
+            "samples": self.samples,
+            "stacks": [
+                {"stack": stack, "samples": count}
+                for stack, count in self.stacks.most_common(_TOP_STACKS)
+            ],
+        }
+        _recent_profiles.append(profile)
+        trace_logger.info(json.dumps({"event": "profile", **profile}))
+        return profile
+
+
+def get_recent_profiles() -> list[dict[str, Any]]:
+    """Return the most recent request profiles, newest first."""
+    return list(reversed(_recent_profiles))
@@ -0,0 +1,115 @@
+"""
+Per-request / per-job SQL statement counting and N+1 detection.
+
+A class-level ``before_cursor_execute`` listener on Engine counts every
+statement of every engine into the QueryStats of the current context:
+
+    with count_queries("GET /api/projects") as queries:
+        ...
+    queries.total, queries.repeated(threshold)
+
+Statements are grouped by shape (the SQL text with expanded IN lists
+collapsed), so one statement shape executed once per item shows up as a
+repeated shape. Scopes nest: an inner scope's statements also count
+towards the enclosing scope.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+from app.core.logger import logger
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+
+_IN_LIST_PATTERN = re.compile(r"\?(?:\s*,\s*\?)+")
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+_installed = False
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within one counting scope."""
+
+    name: str
+    parent: Optional["QueryStats"] = None
+    shapes: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return sum(self.shapes.values())
+
+    def add(self, statement: str) -> None:
+        shape = _IN_LIST_PATTERN.sub("?...", " ".join(statement.split()))
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            stats.shapes[shape] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed at least ``threshold`` times."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add(statement)
+
+
+def install_query_counter() -> None:
+    """Register the statement listener for all engines (idempotent)."""
+    global _installed
+    if not _installed:
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        _installed = True
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+class count_queries:
+    """
+    Count the statements executed in a block (``with`` or ``async with``).
+
+    On exit, statement shapes repeated at least QUERY_REPEAT_WARN_THRESHOLD
+    times are logged as likely N+1 patterns.
+    """
+
+    def __init__(self, name: str, warn: bool = True) -> None:
+        install_query_counter()
+        self.stats = QueryStats(name=name, parent=_current_stats.get())
+        self.warn = warn
+        self._token = None
+
+    def __enter__(self) -> QueryStats:
+        self._token = _current_stats.set(self.stats)
+        return self.stats
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            _current_stats.reset(self._token)
+        except ValueError:
+            _current_stats.set(self.stats.parent)
+        if self.warn:
+            threshold = get_settings().QUERY_REPEAT_WARN_THRESHOLD
+            for shape, count in self.stats.repeated(threshold):
+                logger.warning(
+                    f"Repeated query in {self.stats.name}: {count}x {shape[:200]}"
+                )
+        return False
+
+    async def __aenter__(self) -> QueryStats:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return self.__exit__(exc_type, exc, tb)
@@ -0,0 +1,346 @@
+"""
+Per-user / per-project data revisions, bumped by committed writes.
+
+Class-level Session listeners map every flushed row to the scopes it
+belongs to (``user_id``, ``member_user_id`` and ``assignee_id`` columns name
+users, ``project_id`` names a project) and bump those scopes' revision
+counters once the transaction commits. Bulk statements are mapped through
+their parameters or equality criteria on the same columns; statements
+naming no scope bump the global epoch, which every revision key includes.
+
+    revision_key = data_revisions.key(users=[user_id], projects=project_ids)
+
+A view whose revision key is unchanged has not seen a write since, which
+makes the keys usable as ETags (see app.api.conditional). Revisions live in
+process memory, like the realtime connections and the response cache, and
+start from a per-process boot token so keys never repeat across restarts.
+
+The same listeners describe each committed write as a DataChange (table,
+operation, row ID, project, users, changed columns) and hand the batch of a
+transaction to the registered commit listeners; the realtime service turns
+them into events (see add_commit_listener). The scopes each commit bumps go
+to the revision listeners, which relay them to the other workers (see
+add_revision_listener).
+
+The table keeps the DATA_REVISIONS_MAX_SCOPES most recently written scopes.
+Evicting a scope would restart its counter at 0 and could repeat a key
+already handed out, so every eviction bumps the global epoch instead.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Callable, Iterable, Optional
+from uuid import uuid4
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter
+from sqlalchemy.sql.schema import Column
+
+from app.core.config import get_settings
+from app.core.logger import logger
+
+GLOBAL_SCOPE = ("global", "")
+
+_USER_COLUMNS = ("user_id", "member_user_id", "assignee_id")
+_PROJECT_COLUMNS = ("project_id",)
+# Tables none of the conditional views read (logs, chat, feedback, indexes).
+UNTRACKED_TABLES = frozenset(
+    {
+        "search_terms",
+        "memories",
+        "captures",
+        "chat_sessions",
+        "chat_messages",
+        "chat_history_summaries",
+        "issues",
+        "issue_likes",
+        "issue_comments",
+        "achievements",
+        "project_achievements",
+        "notifications",
+        "heartbeat_events",
+        "llm_usage",
+        "realtime_events",
+        "proposals",
+    }
+)
+_PENDING_KEY = "pending_revision_scopes"
+_CHANGES_KEY = "pending_data_changes"
+# Columns every write touches; not reported as changed fields.
+_BOOKKEEPING_COLUMNS = frozenset({"updated_at"})
+_installed = False
+
+Scope = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class DataChange:
+    """One committed write (a row, or a bulk statement without row IDs)."""
+
+    table: str
+    op: str  # created / updated / deleted
+    entity_id: Optional[str] = None
+    project_id: Optional[str] = None
+    user_ids: frozenset[str] = frozenset()
+    # Changed columns of an update (empty for creates, deletes, bulk writes).
+    fields: tuple[str, ...] = ()
+    # Task / recurring meeting a row belongs to (assignments, blockers, agenda items).
+    task_id: Optional[str] = None
+    meeting_id: Optional[str] = None
+
+
+CommitListener = Callable[[list[DataChange]], None]
+_commit_listeners: list[CommitListener] = []
+RevisionListener = Callable[[set[Scope]], None]
+_revision_listeners: list[RevisionListener] = []
+
+
+class DataRevisions:
+    """Process-wide revision counters per scope (bounded, least recently written evicted)."""
+
+    def __init__(self, max_scopes: Optional[int] = None) -> None:
+        self._lock = threading.Lock()
+        self._revisions: OrderedDict[Scope, int] = OrderedDict()
+        self._max_scopes = max_scopes
+        self.boot = uuid4().hex[:8]
+
+    @property
+    def max_scopes(self) -> int:
+        if self._max_scopes is not None:
+            return self._max_scopes
+        return get_settings().DATA_REVISIONS_MAX_SCOPES
+
+    def bump(self, scopes: Iterable[Scope]) -> None:
+        with self._lock:
+            for scope in scopes:
+                self._revisions[scope] = self._revisions.get(scope, 0) + 1
+                self._revisions.move_to_end(scope)
+            limit = max(2, self.max_scopes)
+            if len(self._revisions) > limit:
+                # The global epoch is never evicted; it counts the evictions.
+                self._revisions.setdefault(GLOBAL_SCOPE, 0)
+                while len(self._revisions) > limit:
+                    oldest = next(scope for scope in self._revisions if scope != GLOBAL_SCOPE)
+                    del self._revisions[oldest]
+                self._revisions[GLOBAL_SCOPE] += 1
+
+    def get(self, scope: Scope) -> int:
+        return self._revisions.get(scope, 0)
+
+    def __len__(self) -> int:
+        return len(self._revisions)
+
+    def key(self, users: Iterable[str] = (), projects: Iterable[Any] = ()) -> str:
+        """Revision key of a view reading the given users' and projects' data."""
+        with self._lock:
+            parts = [f"{self.boot}.{self._revisions.get(GLOBAL_SCOPE, 0)}"]
+            parts += [
+                f"u{self._revisions.get(('user', str(user_id)), 0)}"
+                for user_id in sorted({str(user_id) for user_id in users})
+            ]
+            parts += [
+                f"p{self._revisions.get(('project', str(project_id)), 0)}"
+                for project_id in sorted({str(project_id) for project_id in projects})
+            ]
+        return "-".join(parts)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._revisions.clear()
+
+
+data_revisions = DataRevisions()
+
+
+def _scopes_from_values(values: dict[str, Any]) -> set[Scope]:
+    scopes: set[Scope] = set()
+    for column in _USER_COLUMNS:
+        if values.get(column):
+            scopes.add(("user", str(values[column])))
+    for column in _PROJECT_COLUMNS:
+        if values.get(column):
+            scopes.add(("project", str(values[column])))
+    return scopes
+
+
+def _row_scopes(obj: Any, table: str) -> set[Scope]:
+    """Scopes of a flushed row, including the values it had before the flush."""
+    state = inspect(obj)
+    scopes: set[Scope] = set()
+    identity_column = {"users": "user", "projects": "project"}.get(table)
+    if identity_column:
+        scopes.add((identity_column, str(obj.id)))
+    for column in _USER_COLUMNS + _PROJECT_COLUMNS:
+        if column not in state.attrs:
+            continue
+        history = state.attrs[column].history
+        kind = "project" if column in _PROJECT_COLUMNS else "user"
+        for value in chain(history.added, history.unchanged, history.deleted):
+            if value:
+                scopes.add((kind, str(value)))
+    return scopes or {GLOBAL_SCOPE}
+
+
+def _criteria_scopes(whereclause: Any) -> set[Scope]:
+    """Scopes named by ``column == value`` / ``column IN (...)`` criteria."""
+    scopes: set[Scope] = set()
+    if whereclause is None:
+        return scopes
+    for element in visitors.iterate(whereclause):
+        if not isinstance(element, BinaryExpression):
+            continue
+        if element.operator not in (operators.eq, operators.in_op):
+            continue
+        column, bind = element.left, element.right
+        if not isinstance(column, Column) or not isinstance(bind, BindParameter):
+            continue
+        values = bind.value if isinstance(bind.value, (list, tuple, set)) else [bind.value]
+        for value in values:
+            scopes |= _scopes_from_values({column.name: value})
+    return scopes
+
+
+def _row_change(obj: Any, table: str, op: str) -> DataChange:
+    state = inspect(obj)
+    identity = state.identity or state.mapper.primary_key_from_instance(obj)
+    fields: tuple[str, ...] = ()
+    if op == "updated":
+        fields = tuple(
+            attr.key
+            for attr in state.attrs
+            if attr.key not in _BOOKKEEPING_COLUMNS and attr.history.has_changes()
+        )
+    values = state.dict
+    project_id = values.get("id") if table == "projects" else values.get("project_id")
+    user_ids = {str(values[column]) for column in _USER_COLUMNS if values.get(column)}
+    if table == "users" and values.get("id"):
+        user_ids.add(str(values["id"]))
+    return DataChange(
+        table=table,
+        op=op,
+        entity_id=str(identity[0]) if identity and identity[0] is not None else None,
+        project_id=str(project_id) if project_id else None,
+        user_ids=frozenset(user_ids),
+        fields=fields,
+        task_id=str(values["task_id"]) if values.get("task_id") else None,
+        meeting_id=str(values["meeting_id"]) if values.get("meeting_id") else None,
+    )
+
+
+def _statement_changes(table: str, op: str, scopes: set[Scope]) -> list[DataChange]:
+    users = frozenset(value for kind, value in scopes if kind == "user")
+    projects = [value for kind, value in scopes if kind == "project"]
+    if not projects:
+        return [DataChange(table=table, op=op, user_ids=users)]
+    return [DataChange(table=table, op=op, project_id=project, user_ids=users) for project in projects]
+
+
+def _pending(session: Session) -> set[Scope]:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+def _pending_changes(session: Session) -> list[DataChange]:
+    return session.info.setdefault(_CHANGES_KEY, [])
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    pending = _pending(session)
+    changes = _pending_changes(session) if _commit_listeners else None
+    for op, objects in (("created", session.new), ("updated", session.dirty), ("deleted", session.deleted)):
+        for obj in objects:
+            table = getattr(obj, "__tablename__", None)
+            if table is None:
+                continue
+            if op == "updated" and not session.is_modified(obj):
+                continue
+            if table not in UNTRACKED_TABLES:
+                pending |= _row_scopes(obj, table)
+            if changes is not None:
+                changes.append(_row_change(obj, table, op))
+
+
+def _do_orm_execute(state) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table = getattr(getattr(state.statement, "table", None), "name", None)
+    if table is None:
+        return
+    scopes: set[Scope] = set()
+    parameters = state.parameters
+    if isinstance(parameters, dict):
+        parameters = [parameters]
+    for values in parameters or ():
+        scopes |= _scopes_from_values(values)
+    if state.is_update or state.is_delete:
+        scopes |= _criteria_scopes(state.statement.whereclause)
+    if table not in UNTRACKED_TABLES:
+        _pending(state.session).update(scopes or {GLOBAL_SCOPE})
+    if _commit_listeners:
+        op = "created" if state.is_insert else "updated" if state.is_update else "deleted"
+        _pending_changes(state.session).extend(_statement_changes(table, op, scopes))
+
+
+def _after_commit(session: Session) -> None:
+    pending: Optional[set[Scope]] = session.info.pop(_PENDING_KEY, None)
+    changes: Optional[list[DataChange]] = session.info.pop(_CHANGES_KEY, None)
+    if pending:
+        data_revisions.bump(pending)
+        for revision_listener in list(_revision_listeners):
+            try:
+                revision_listener(set(pending))
+            except Exception as exc:
+                logger.warning(f"Revision listener failed: {exc}")
+    if changes:
+        for listener in list(_commit_listeners):
+            try:
+                listener(changes)
+            except Exception as exc:
+                logger.warning(f"Data change listener failed: {exc}")
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_CHANGES_KEY, None)
+
+
+def add_commit_listener(listener: CommitListener) -> None:
+    """Call ``listener`` with the DataChanges of every committed transaction."""
+    if listener not in _commit_listeners:
+        _commit_listeners.append(listener)
+
+
+def remove_commit_listener(listener: CommitListener) -> None:
+    if listener in _commit_listeners:
+        _commit_listeners.remove(listener)
+
+
+def add_revision_listener(listener: RevisionListener) -> None:
+    """Call ``listener`` with the scopes every committed transaction bumped."""
+    if listener not in _revision_listeners:
+        _revision_listeners.append(listener)
+
+
+def remove_revision_listener(listener: RevisionListener) -> None:
+    if listener in _revision_listeners:
+        _revision_listeners.remove(listener)
+
+
+def install_revision_tracking() -> None:
+    """Register the write listeners for all sessions (idempotent)."""
+    global _installed
+    if not _installed:
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "do_orm_execute", _do_orm_execute)
+        event.listen(Session, "after_commit", _after_commit)
+        event.listen(Session, "after_rollback", _after_rollback)
+        _installed = True
+
+
+def revision_tracking_installed() -> bool:
+    return _installed
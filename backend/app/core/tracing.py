@@ -0,0 +1,307 @@
+"""
+Lightweight in-process tracing.
+
+Spans form a tree through a context variable, so nesting follows the await
+chain of a request or background job without passing anything around:
+
+    with span("scheduler.build_schedule", tasks=len(tasks)):
+        ...
+
+    @traced("plan.build_plan")
+    async def build_plan(...): ...
+
+Finished spans are aggregated per name (count, errors, p50/p95/p99 over a
+bounded reservoir of recent durations) and the slowest spans are kept for
+``get_trace_stats()`` (served by /api/debug/metrics). Spans slower than
+TRACE_SLOW_SPAN_MS are also written as structured JSON log lines.
+"""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import inspect
+import itertools
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+from uuid import uuid4
+
+from app.core.config import get_settings
+
+trace_logger = logging.getLogger("secretary.trace")
+
+_SLOWEST_SPANS = 20
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+_span_ids = itertools.count(1)
+
+
+@dataclass
+class Span:
+    """One timed operation."""
+
+    name: str
+    trace_id: str
+    span_id: int
+    parent_id: Optional[int]
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start: float = field(default_factory=time.perf_counter)
+    duration_ms: float = 0.0
+    error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "duration_ms": round(self.duration_ms, 3),
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class _SpanStats:
+    """Aggregated timings of one span name."""
+
+    def __init__(self, reservoir_size: int) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent: deque[float] = deque(maxlen=reservoir_size)
+
+    def add(self, duration_ms: float, failed: bool) -> None:
+        self.count += 1
+        self.errors += int(failed)
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.recent.append(duration_ms)
+
+    def summary(self) -> dict[str, Any]:
+        ordered = sorted(self.recent)
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": _percentile(ordered, 50),
+            "p95_ms": _percentile(ordered, 95),
+            "p99_ms": _percentile(ordered, 99),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered) + 0.5) - 1))
+    return round(ordered[index], 3)
+
+
+class SpanRecorder:
+    """Thread-safe process-wide span aggregation."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, _SpanStats] = {}
+        self._slowest: list[tuple[float, int, dict[str, Any]]] = []
+        self._sequence = itertools.count()
+
+    def record(self, finished: Span) -> None:
+        settings = get_settings()
+        with self._lock:
+            stats = self._stats.get(finished.name)
+            if stats is None:
+                stats = self._stats[finished.name] = _SpanStats(settings.TRACE_RESERVOIR_SIZE)
+            stats.add(finished.duration_ms, finished.error is not None)
+            entry = (finished.duration_ms, next(self._sequence), finished.to_dict())
+            if len(self._slowest) < _SLOWEST_SPANS:
+                heapq.heappush(self._slowest, entry)
+            elif entry[0] > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+        if finished.duration_ms >= settings.TRACE_SLOW_SPAN_MS:
+            trace_logger.info(json.dumps({"event": "slow_span", **finished.to_dict()}, default=str))
+        elif trace_logger.isEnabledFor(logging.DEBUG) and finished.parent_id is None:
+            trace_logger.debug(json.dumps({"event": "span", **finished.to_dict()}, default=str))
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            spans = {name: stats.summary() for name, stats in sorted(self._stats.items())}
+            slowest = [entry[2] for entry in sorted(self._slowest, reverse=True)]
+        return {"spans": spans, "slowest": slowest}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._slowest.clear()
+
+
+recorder = SpanRecorder()
+
+
+def get_trace_stats() -> dict[str, Any]:
+    """Return per-span-name timing summaries and the slowest recent spans."""
+    return recorder.snapshot()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def record_span(
+    name: str,
+    duration_ms: float,
+    error: Optional[str] = None,
+    **attributes: Any,
+) -> None:
+    """
+    Record an already-timed operation as a child of the current span.
+
+    For operations whose start and end happen in separate callbacks, where a
+    ``with span(...)`` block cannot enclose them.
+    """
+    if not get_settings().TRACING_ENABLED:
+        return
+    parent = _current_span.get()
+    recorder.record(
+        Span(
+            name=name,
+            trace_id=parent.trace_id if parent else uuid4().hex,
+            span_id=next(_span_ids),
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes,
+            duration_ms=duration_ms,
+            error=error,
+        )
+    )
+
+
+class span:
+    """
+    Context manager timing a block as a child of the current span.
+
+    Usable with ``with`` and ``async with``. When tracing is disabled the
+    span is still yielded (so ``.set()`` works) but nothing is recorded.
+    """
+
+    def __init__(self, name: str, **attributes: Any) -> None:
+        self.name = name
+        self.attributes = attributes
+        self._span: Optional[Span] = None
+        self._parent: Optional[Span] = None
+        self._token = None
+
+    def __enter__(self) -> Span:
+        parent = self._parent = _current_span.get()
+        self._span = Span(
+            name=self.name,
+            trace_id=parent.trace_id if parent else uuid4().hex,
+            span_id=next(_span_ids),
+            parent_id=parent.span_id if parent else None,
+            attributes=dict(self.attributes),
+        )
+        if get_settings().TRACING_ENABLED:
+            self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        finished = self._span
+        finished.duration_ms = (time.perf_counter() - finished.start) * 1000
+        if exc_type is not None:
+            finished.error = exc_type.__name__
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Exited from another context (e.g. an async generator closed
+                # by a different task); restore the parent explicitly.
+                _current_span.set(self._parent)
+            recorder.record(finished)
+        return False
+
+    async def __aenter__(self) -> Span:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return self.__exit__(exc_type, exc, tb)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorate a function, coroutine function or async generator with a span.
+
+    Args:
+        name: Span name (defaults to ``<qualname>``)
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def _asyncgen_wrapper(*args, **kwargs):
+                with span(span_name):
+                    async for item in func(*args, **kwargs):
+                        yield item
+
+            return _asyncgen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def _async_wrapper(*args, **kwargs):
+                with span(span_name):
+                    return await func(*args, **kwargs)
+
+            return _async_wrapper
+
+        @functools.wraps(func)
+        def _sync_wrapper(*args, **kwargs):
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return _sync_wrapper
+
+    return decorator
+
+
+def instrument_class(cls: type, prefix: str) -> type:
+    """
+    Trace every public coroutine method of a class (idempotent).
+
+    Used for repositories: spans are named ``<prefix>.<method>``.
+    """
+    if cls.__dict__.get("_tracing_instrumented"):
+        return cls
+    for klass in reversed(cls.__mro__[:-1]):
+        for attr, value in list(klass.__dict__.items()):
+            if attr.startswith("_") or not inspect.iscoroutinefunction(value):
+                continue
+            method = getattr(cls, attr)
+            if getattr(method, "_traced", False):
+                continue
+            wrapper = traced(f"{prefix}.{attr}")(method)
+            wrapper._traced = True
+            setattr(cls, attr, wrapper)
+    cls._tracing_instrumented = True
+    return cls
+
+
+def traced_repository(repository):
+    """Instrument a repository instance's class and return the instance."""
+    cls = type(repository)
+    instrument_class(cls, cls.__name__.removeprefix("Sqlite"))
+    return repository
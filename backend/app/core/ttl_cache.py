@@ -0,0 +1,85 @@
+"""
+Bounded process-local caches with a TTL.
+
+Entries expire after ``ttl_seconds`` and the least recently used entries are
+evicted beyond ``max_entries``. Both limits may be given as callables so they
+follow settings changes (a TTL of 0 disables caching). Every cache registers
+itself, so tests can reset them all with clear_all_caches().
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar, Union
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_Limit = Union[float, Callable[[], float]]
+
+_caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+def _resolve(limit: _Limit) -> float:
+    return limit() if callable(limit) else limit
+
+
+class TTLCache(Generic[K, V]):
+    """LRU cache whose entries also expire after a TTL."""
+
+    def __init__(self, ttl_seconds: _Limit, max_entries: _Limit):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        _caches.add(self)
+
+    @property
+    def ttl_seconds(self) -> float:
+        return _resolve(self._ttl_seconds)
+
+    @property
+    def max_entries(self) -> int:
+        return int(_resolve(self._max_entries))
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(1, self.max_entries):
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *keys: K) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def clear_all_caches() -> None:
+    """Empty every TTLCache of the process (tests)."""
+    for cache in list(_caches):
+        cache.clear()
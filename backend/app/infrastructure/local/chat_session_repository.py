@@ -8,11 +8,18 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects.sqlite import insert
 
-from app.infrastructure.local.database import ChatMessageORM, ChatSessionORM, get_session_factory
+from app.infrastructure.local.database import (
+    ChatHistorySummaryORM,
+    ChatIdAliasORM,
+    ChatMessageORM,
+    ChatSessionORM,
+    get_session_factory,
+)
 from app.interfaces.chat_session_repository import IChatSessionRepository
-from app.models.chat_session import ChatMessage, ChatSession
+from app.models.chat_session import ChatHistorySummary, ChatMessage, ChatSession
 
 
 class SqliteChatSessionRepository(IChatSessionRepository):
@@ -42,6 +49,21 @@ class SqliteChatSessionRepository(IChatSessionRepository):
             created_at=orm.created_at,
         )
 
+    def _summary_orm_to_model(self, orm: ChatHistorySummaryORM) -> ChatHistorySummary:
+        """Convert history summary ORM object to Pydantic model."""
+        return ChatHistorySummary(
+            session_id=orm.session_id,
+            user_id=orm.user_id,
+            summary=orm.summary or "",
+            summarized_until=orm.summarized_until,
+            summarized_until_id=UUID(orm.summarized_until_id) if orm.summarized_until_id else None,
+            summarized_message_count=orm.summarized_message_count or 0,
+            source_tokens=orm.source_tokens or 0,
+            summary_tokens=orm.summary_tokens or 0,
+            created_at=orm.created_at,
+            updated_at=orm.updated_at,
+        )
+
     async def touch_session(
         self,
         user_id: str,
@@ -160,3 +182,192 @@ class SqliteChatSessionRepository(IChatSessionRepository):
             )
             result = await session.execute(query)
             return [self._message_orm_to_model(orm) for orm in result.scalars().all()]
+
+    @staticmethod
+    def _message_conditions(
+        user_id: str,
+        session_id: str,
+        after: Optional[datetime],
+        after_id: Optional[UUID],
+    ) -> list:
+        conditions = [
+            ChatMessageORM.session_id == session_id,
+            ChatMessageORM.user_id == user_id,
+        ]
+        if after is not None:
+            if after_id is None:
+                conditions.append(ChatMessageORM.created_at > after)
+            else:
+                # Keyset cursor: messages sharing the timestamp are ordered by id.
+                conditions.append(
+                    or_(
+                        ChatMessageORM.created_at > after,
+                        and_(ChatMessageORM.created_at == after, ChatMessageORM.id > str(after_id)),
+                    )
+                )
+        return conditions
+
+    async def list_recent_messages(
+        self,
+        user_id: str,
+        session_id: str,
+        limit: int = 50,
+        after: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+    ) -> list[ChatMessage]:
+        """List the most recent messages for a session in chronological order."""
+        async with self._session_factory() as session:
+            query = (
+                select(ChatMessageORM)
+                .where(and_(*self._message_conditions(user_id, session_id, after, after_id)))
+                .order_by(ChatMessageORM.created_at.desc(), ChatMessageORM.id.desc())
+                .limit(limit)
+            )
+            result = await session.execute(query)
+            orms = list(result.scalars().all())
+            orms.reverse()
+            return [self._message_orm_to_model(orm) for orm in orms]
+
+    async def list_messages_after(
+        self,
+        user_id: str,
+        session_id: str,
+        after: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+        limit: int = 200,
+    ) -> list[ChatMessage]:
+        """List the oldest messages after a (created_at, id) cursor."""
+        async with self._session_factory() as session:
+            query = (
+                select(ChatMessageORM)
+                .where(and_(*self._message_conditions(user_id, session_id, after, after_id)))
+                .order_by(ChatMessageORM.created_at.asc(), ChatMessageORM.id.asc())
+                .limit(limit)
+            )
+            result = await session.execute(query)
+            return [self._message_orm_to_model(orm) for orm in result.scalars().all()]
+
+    async def get_history_summary(
+        self,
+        user_id: str,
+        session_id: str,
+    ) -> Optional[ChatHistorySummary]:
+        """Get the rolling history summary for a session."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ChatHistorySummaryORM).where(
+                    and_(
+                        ChatHistorySummaryORM.session_id == session_id,
+                        ChatHistorySummaryORM.user_id == user_id,
+                    )
+                )
+            )
+            orm = result.scalar_one_or_none()
+            return self._summary_orm_to_model(orm) if orm else None
+
+    async def save_history_summary(
+        self,
+        user_id: str,
+        session_id: str,
+        summary: str,
+        summarized_until: datetime,
+        summarized_message_count: int,
+        source_tokens: int,
+        summary_tokens: int,
+        summarized_until_id: Optional[UUID] = None,
+        previous: Optional[ChatHistorySummary] = None,
+    ) -> Optional[ChatHistorySummary]:
+        """Create or replace the rolling history summary if its cursor is still ``previous``'s."""
+        values = {
+            "summary": summary,
+            "summarized_until": summarized_until,
+            "summarized_until_id": str(summarized_until_id) if summarized_until_id else None,
+            "summarized_message_count": summarized_message_count,
+            "source_tokens": source_tokens,
+            "summary_tokens": summary_tokens,
+            "updated_at": datetime.utcnow(),
+        }
+        async with self._session_factory() as session:
+            if previous is None:
+                statement = (
+                    insert(ChatHistorySummaryORM)
+                    .values(session_id=session_id, user_id=user_id, **values)
+                    .on_conflict_do_nothing()
+                )
+            else:
+                previous_id = (
+                    ChatHistorySummaryORM.summarized_until_id == str(previous.summarized_until_id)
+                    if previous.summarized_until_id
+                    else ChatHistorySummaryORM.summarized_until_id.is_(None)
+                )
+                statement = (
+                    update(ChatHistorySummaryORM)
+                    .where(
+                        ChatHistorySummaryORM.session_id == session_id,
+                        ChatHistorySummaryORM.user_id == user_id,
+                        ChatHistorySummaryORM.summarized_until == previous.summarized_until,
+                        previous_id,
+                    )
+                    .values(**values)
+                )
+            result = await session.execute(statement)
+            await session.commit()
+            if result.rowcount != 1:
+                return None
+        return await self.get_history_summary(user_id, session_id)
+
+    async def get_id_aliases(
+        self,
+        user_id: str,
+        session_id: str,
+    ) -> dict[str, str]:
+        """Get the short ID aliases of a session."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ChatIdAliasORM.alias, ChatIdAliasORM.entity_id).where(
+                    and_(
+                        ChatIdAliasORM.session_id == session_id,
+                        ChatIdAliasORM.user_id == user_id,
+                    )
+                )
+            )
+            return {alias: entity_id for alias, entity_id in result.all()}
+
+    async def save_id_aliases(
+        self,
+        user_id: str,
+        session_id: str,
+        aliases: dict[str, str],
+    ) -> dict[str, str]:
+        """Store new short ID aliases of a session (existing aliases are kept)."""
+        if not aliases:
+            return {}
+        async with self._session_factory() as session:
+            await session.execute(
+                insert(ChatIdAliasORM)
+                .values(
+                    [
+                        {
+                            "session_id": session_id,
+                            "user_id": user_id,
+                            "alias": alias,
+                            "entity_id": entity_id,
+                            "created_at": datetime.utcnow(),
+                        }
+                        for alias, entity_id in aliases.items()
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+            result = await session.execute(
+                select(ChatIdAliasORM.alias, ChatIdAliasORM.entity_id).where(
+                    and_(
+                        ChatIdAliasORM.session_id == session_id,
+                        ChatIdAliasORM.user_id == user_id,
+                        ChatIdAliasORM.alias.in_(list(aliases)),
+                    )
+                )
+            )
+            stored = {alias: entity_id for alias, entity_id in result.all()}
+            await session.commit()
+            return stored
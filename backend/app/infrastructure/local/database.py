@@ -4,6 +4,7 @@ SQLite database configuration and ORM models.
 This module defines the SQLAlchemy ORM models and database initialization.
 """
 
+from typing import Optional
 from uuid import uuid4
 
 from sqlalchemy import (
@@ -14,15 +15,17 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKeyConstraint,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
 )
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.orm import DeclarativeBase, deferred, sessionmaker
 
 from app.core.config import get_settings
+from app.core.revisions import install_revision_tracking
 from app.utils.datetime_utils import now_utc
 
 
@@ -117,6 +120,20 @@ class ProjectORM(Base):
     updated_at = Column(DateTime, default=now_utc, onupdate=now_utc)
 
 
+class SearchTermORM(Base):
+    """Inverted keyword index over task text and project names."""
+
+    __tablename__ = "search_terms"
+    __table_args__ = (
+        # Searches seek the owner's own terms; other users' postings are never read.
+        Index("idx_search_terms_user_term", "user_id", "term"),
+    )
+
+    term = Column(String(64), primary_key=True)
+    entity_id = Column(String(36), primary_key=True, index=True)  # Task or project ID
+    user_id = Column(String(255), nullable=True)  # Owner of the task or project
+
+
 class PhaseORM(Base):
     """Phase ORM model."""
 
@@ -463,6 +480,49 @@ class ChatMessageORM(Base):
     created_at = Column(DateTime, default=now_utc, index=True)
 
 
+class ChatHistorySummaryORM(Base):
+    """Rolling summary of older chat messages used to compact session history."""
+
+    __tablename__ = "chat_history_summaries"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["session_id", "user_id"],
+            ["chat_sessions.session_id", "chat_sessions.user_id"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    session_id = Column(String(100), primary_key=True)
+    user_id = Column(String(255), primary_key=True, index=True)
+    summary = Column(Text, nullable=False, default="")
+    summarized_until = Column(DateTime, nullable=False)  # created_at of the last summarized message
+    summarized_until_id = Column(String(36), nullable=True)  # id of the last summarized message
+    summarized_message_count = Column(Integer, default=0, nullable=False)
+    source_tokens = Column(Integer, default=0, nullable=False)
+    summary_tokens = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=now_utc)
+    updated_at = Column(DateTime, default=now_utc, onupdate=now_utc)
+
+
+class ChatIdAliasORM(Base):
+    """Short ID alias shown to the agent in a chat session (expanded in tool arguments)."""
+
+    __tablename__ = "chat_id_aliases"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["session_id", "user_id"],
+            ["chat_sessions.session_id", "chat_sessions.user_id"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    session_id = Column(String(100), primary_key=True)
+    user_id = Column(String(255), primary_key=True)
+    alias = Column(String(32), primary_key=True)
+    entity_id = Column(String(36), nullable=False)
+    created_at = Column(DateTime, default=now_utc)
+
+
 class IssueORM(Base):
     """Issue ORM model - shared across all users."""
 
@@ -518,9 +578,20 @@ class ScheduleSnapshotORM(Base):
     name = Column(String(200), nullable=False)
     is_active = Column(Boolean, default=False, index=True)
     start_date = Column(Date, nullable=False)
-    tasks_json = Column(JSON, nullable=False, default=list)  # List of SnapshotTaskScheduleInfo
-    days_json = Column(JSON, nullable=False, default=list)  # List of SnapshotDayAllocation
-    phase_buffers_json = Column(JSON, nullable=True, default=list)  # List of PhaseBufferInfo
+    end_date = Column(Date, nullable=True)
+    # Heavy payload columns are deferred so summary/listing queries never decode them.
+    tasks_json = deferred(
+        Column(JSON, nullable=False, default=list), group="payload"
+    )  # List of SnapshotTaskScheduleInfo
+    days_json = deferred(
+        Column(JSON, nullable=False, default=list), group="payload"
+    )  # List of SnapshotDayAllocation
+    phase_buffers_json = deferred(
+        Column(JSON, nullable=True, default=list), group="payload"
+    )  # List of PhaseBufferInfo
+    # Summary columns computed at creation time
+    task_count = Column(Integer, default=0, nullable=False)
+    total_task_minutes = Column(Integer, default=0, nullable=False)
     total_buffer_minutes = Column(Integer, default=0)
     consumed_buffer_minutes = Column(Integer, default=0)
     capacity_hours = Column(Float, default=8.0)
@@ -708,33 +779,108 @@ class HeartbeatEventORM(Base):
     created_at = Column(DateTime, default=now_utc, index=True)
 
 
+class LlmUsageORM(Base):
+    __tablename__ = "llm_usage"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    user_id = Column(String(255), nullable=True, index=True)
+    feature = Column(String(100), nullable=False, index=True)
+    model = Column(String(255), nullable=False)
+    input_tokens = Column(Integer, default=0, nullable=False)
+    output_tokens = Column(Integer, default=0, nullable=False)
+    latency_ms = Column(Float, default=0.0, nullable=False)
+    retries = Column(Integer, default=0, nullable=False)
+    success = Column(Boolean, default=True, nullable=False)
+    cost_usd = Column(Float, nullable=True)
+    created_at = Column(DateTime, default=now_utc, index=True)
+
+
+class ProposalORM(Base):
+    """Agent proposal awaiting user approval."""
+
+    __tablename__ = "proposals"
+    __table_args__ = (
+        # Pending proposals of a user, newest first.
+        Index("idx_proposals_user_status_created", "user_id", "status", "created_at"),
+        # Expiry sweep.
+        Index("idx_proposals_status_expires", "status", "expires_at"),
+    )
+
+    id = Column(String(36), primary_key=True)
+    user_id = Column(String(36), nullable=False)  # UUID (hashed for non-UUID user IDs)
+    user_id_raw = Column(String(255), nullable=True)
+    session_id = Column(String(100), nullable=False, index=True)
+    proposal_type = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    payload = Column(JSON, nullable=False, default=dict)
+    description = Column(Text, nullable=False, default="")
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=True)  # Last status change
+
+
+class RealtimeEventORM(Base):
+    """Realtime events relayed between worker processes (SQLite broker)."""
+
+    __tablename__ = "realtime_events"
+    # Never reuse IDs of pruned rows: pollers track the last ID they saw.
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    origin = Column(String(32), nullable=False)
+    # JSON list of recipient user IDs; NULL for every connection.
+    user_ids = Column(Text, nullable=True)
+    payload = Column(Text, nullable=False)
+    published_at = Column(Float, nullable=False, index=True)
+
+
 # ===========================================
 # Database Session Management
 # ===========================================
 
 
-def get_engine():
-    """Get async engine instance."""
+def get_engine(echo: Optional[bool] = None):
+    """Get async engine instance (SQL echo follows DEBUG unless given)."""
     settings = get_settings()
-    return create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+    return create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG if echo is None else echo)
 
 
-def get_session_factory():
+def get_session_factory(echo: Optional[bool] = None):
     """Get async session factory."""
-    engine = get_engine()
+    install_revision_tracking()
+    engine = get_engine(echo)
     return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
-async def init_db():
-    """Initialize database tables and run migrations."""
+async def init_db() -> bool:
+    """
+    Initialize database tables and run migrations.
+
+    Skipped when the database is stamped with the current schema fingerprint
+    (see migrations.schema_fingerprint).
+
+    Returns:
+        True if tables/migrations were applied, False if already up to date
+    """
+    from app.infrastructure.local.migrations import (
+        is_schema_current,
+        run_migrations,
+        stamp_schema_version,
+    )
+
     engine = get_engine()
     async with engine.begin() as conn:
+        if await is_schema_current(conn):
+            return False
         await conn.run_sync(Base.metadata.create_all)
 
     # Run migrations to add any missing columns
-    from app.infrastructure.local.migrations import run_migrations
     await run_migrations()
 
+    async with engine.begin() as conn:
+        await stamp_schema_version(conn)
+    return True
+
 
 async def get_db_session() -> AsyncSession:
     """Get database session (for dependency injection)."""
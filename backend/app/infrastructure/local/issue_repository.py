@@ -43,42 +43,56 @@ class SqliteIssueRepository(IIssueRepository):
         current_user_id: Optional[str] = None,
     ) -> Issue:
         """Convert ORM object to Pydantic model."""
-        # Get display name
-        display_name = None
-        user_result = await session.execute(
-            select(UserORM.display_name).where(UserORM.id == orm.user_id)
-        )
-        user_row = user_result.first()
-        if user_row:
-            display_name = user_row[0]
+        return (await self._orms_to_models(session, [orm], current_user_id))[0]
+
+    async def _orms_to_models(
+        self,
+        session: AsyncSession,
+        orms: list[IssueORM],
+        current_user_id: Optional[str] = None,
+    ) -> list[Issue]:
+        """Convert ORM objects to Pydantic models (one query per lookup kind)."""
+        display_names = await self._display_names(session, {orm.user_id for orm in orms})
 
-        # Check if current user liked
-        liked_by_me = False
-        if current_user_id:
+        # Issues the current user liked
+        liked_ids: set[str] = set()
+        if current_user_id and orms:
             like_result = await session.execute(
-                select(IssueLikeORM).where(
+                select(IssueLikeORM.issue_id).where(
                     and_(
-                        IssueLikeORM.issue_id == orm.id,
+                        IssueLikeORM.issue_id.in_([orm.id for orm in orms]),
                         IssueLikeORM.user_id == current_user_id,
                     )
                 )
             )
-            liked_by_me = like_result.scalar_one_or_none() is not None
-
-        return Issue(
-            id=UUID(orm.id),
-            user_id=orm.user_id,
-            display_name=display_name,
-            title=orm.title,
-            content=orm.content,
-            category=IssueCategory(orm.category),
-            status=IssueStatus(orm.status),
-            like_count=orm.like_count,
-            liked_by_me=liked_by_me,
-            admin_response=orm.admin_response,
-            created_at=orm.created_at,
-            updated_at=orm.updated_at,
+            liked_ids = set(like_result.scalars().all())
+
+        return [
+            Issue(
+                id=UUID(orm.id),
+                user_id=orm.user_id,
+                display_name=display_names.get(orm.user_id),
+                title=orm.title,
+                content=orm.content,
+                category=IssueCategory(orm.category),
+                status=IssueStatus(orm.status),
+                like_count=orm.like_count,
+                liked_by_me=orm.id in liked_ids,
+                admin_response=orm.admin_response,
+                created_at=orm.created_at,
+                updated_at=orm.updated_at,
+            )
+            for orm in orms
+        ]
+
+    @staticmethod
+    async def _display_names(session: AsyncSession, user_ids: set[str]) -> dict[str, Optional[str]]:
+        if not user_ids:
+            return {}
+        result = await session.execute(
+            select(UserORM.id, UserORM.display_name).where(UserORM.id.in_(user_ids))
         )
+        return {user_id: display_name for user_id, display_name in result.all()}
 
     async def create(self, user_id: str, issue: IssueCreate) -> Issue:
         """Create a new issue."""
@@ -149,10 +163,7 @@ class SqliteIssueRepository(IIssueRepository):
             query = query.limit(limit).offset(offset)
 
             result = await session.execute(query)
-            issues = []
-            for orm in result.scalars().all():
-                issue = await self._orm_to_model(session, orm, current_user_id)
-                issues.append(issue)
+            issues = await self._orms_to_models(session, result.scalars().all(), current_user_id)
 
             return issues, total
 
@@ -325,33 +336,31 @@ class SqliteIssueRepository(IIssueRepository):
                 .order_by(IssueORM.like_count.desc())
                 .limit(limit)
             )
-            issues = []
-            for orm in result.scalars().all():
-                issue = await self._orm_to_model(session, orm, current_user_id)
-                issues.append(issue)
-            return issues
+            return await self._orms_to_models(session, result.scalars().all(), current_user_id)
 
     async def _comment_orm_to_model(
         self, session: AsyncSession, orm: IssueCommentORM
     ) -> IssueComment:
         """Convert comment ORM to Pydantic model."""
-        display_name = None
-        user_result = await session.execute(
-            select(UserORM.display_name).where(UserORM.id == orm.user_id)
-        )
-        user_row = user_result.first()
-        if user_row:
-            display_name = user_row[0]
-
-        return IssueComment(
-            id=UUID(orm.id),
-            issue_id=UUID(orm.issue_id),
-            user_id=orm.user_id,
-            display_name=display_name,
-            content=orm.content,
-            created_at=orm.created_at,
-            updated_at=orm.updated_at,
-        )
+        return (await self._comment_orms_to_models(session, [orm]))[0]
+
+    async def _comment_orms_to_models(
+        self, session: AsyncSession, orms: list[IssueCommentORM]
+    ) -> list[IssueComment]:
+        """Convert comment ORMs to Pydantic models (one display name query)."""
+        display_names = await self._display_names(session, {orm.user_id for orm in orms})
+        return [
+            IssueComment(
+                id=UUID(orm.id),
+                issue_id=UUID(orm.issue_id),
+                user_id=orm.user_id,
+                display_name=display_names.get(orm.user_id),
+                content=orm.content,
+                created_at=orm.created_at,
+                updated_at=orm.updated_at,
+            )
+            for orm in orms
+        ]
 
     async def create_comment(
         self, issue_id: UUID, user_id: str, comment: IssueCommentCreate
@@ -384,11 +393,7 @@ class SqliteIssueRepository(IIssueRepository):
                 .where(IssueCommentORM.issue_id == str(issue_id))
                 .order_by(IssueCommentORM.created_at.asc())
             )
-            comments = []
-            for orm in result.scalars().all():
-                comment = await self._comment_orm_to_model(session, orm)
-                comments.append(comment)
-            return comments
+            return await self._comment_orms_to_models(session, result.scalars().all())
 
     async def delete_comment(self, comment_id: UUID, user_id: str) -> bool:
         """Delete a comment (by author only)."""
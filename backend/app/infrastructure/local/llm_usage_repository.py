@@ -0,0 +1,112 @@
+"""
+SQLite implementation of the LLM usage ledger repository.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import case, func, insert, select
+
+from app.infrastructure.local.database import LlmUsageORM, get_session_factory
+from app.interfaces.llm_usage_repository import ILlmUsageRepository
+from app.models.llm_usage import LlmUsageGroupBy, LlmUsageRecord, LlmUsageSummary
+
+
+class SqliteLlmUsageRepository(ILlmUsageRepository):
+    """SQLite implementation of the LLM usage ledger."""
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or get_session_factory()
+
+    async def add_many(self, records: list[LlmUsageRecord]) -> int:
+        if not records:
+            return 0
+        rows = [
+            {
+                "id": str(record.id),
+                "user_id": record.user_id,
+                "feature": record.feature,
+                "model": record.model,
+                "input_tokens": record.input_tokens,
+                "output_tokens": record.output_tokens,
+                "latency_ms": record.latency_ms,
+                "retries": record.retries,
+                "success": record.success,
+                "cost_usd": record.cost_usd,
+                "created_at": record.created_at,
+            }
+            for record in records
+        ]
+        async with self._session_factory() as session:
+            await session.execute(insert(LlmUsageORM), rows)
+            await session.commit()
+        return len(rows)
+
+    async def summarize(
+        self,
+        since: datetime,
+        until: Optional[datetime] = None,
+        group_by: LlmUsageGroupBy = "feature",
+        user_id: Optional[str] = None,
+    ) -> list[LlmUsageSummary]:
+        key = getattr(LlmUsageORM, group_by)
+        cost = func.coalesce(func.sum(LlmUsageORM.cost_usd), 0.0)
+        query = (
+            select(
+                key,
+                func.count(),
+                func.sum(case((LlmUsageORM.success.is_(False), 1), else_=0)),
+                func.sum(LlmUsageORM.retries),
+                func.sum(LlmUsageORM.input_tokens),
+                func.sum(LlmUsageORM.output_tokens),
+                cost,
+                func.avg(LlmUsageORM.latency_ms),
+                func.max(LlmUsageORM.latency_ms),
+            )
+            .where(LlmUsageORM.created_at >= since)
+            .group_by(key)
+            .order_by(cost.desc(), func.count().desc())
+        )
+        if until is not None:
+            query = query.where(LlmUsageORM.created_at < until)
+        if user_id is not None:
+            query = query.where(LlmUsageORM.user_id == user_id)
+
+        async with self._session_factory() as session:
+            result = await session.execute(query)
+            return [
+                LlmUsageSummary(
+                    key=group,
+                    calls=calls,
+                    errors=errors or 0,
+                    retries=retries or 0,
+                    input_tokens=input_tokens or 0,
+                    output_tokens=output_tokens or 0,
+                    cost_usd=round(total_cost or 0.0, 6),
+                    avg_latency_ms=round(avg_latency or 0.0, 1),
+                    max_latency_ms=round(max_latency or 0.0, 1),
+                )
+                for (
+                    group,
+                    calls,
+                    errors,
+                    retries,
+                    input_tokens,
+                    output_tokens,
+                    total_cost,
+                    avg_latency,
+                    max_latency,
+                ) in result.all()
+            ]
+
+    async def spend_by_feature(self, user_id: str, since: datetime) -> dict[str, float]:
+        query = (
+            select(LlmUsageORM.feature, func.coalesce(func.sum(LlmUsageORM.cost_usd), 0.0))
+            .where(LlmUsageORM.user_id == user_id, LlmUsageORM.created_at >= since)
+            .group_by(LlmUsageORM.feature)
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(query)
+            return {name: float(total) for name, total in result.all()}
@@ -4,11 +4,112 @@ Database schema migration helpers.
 This module provides utilities for managing SQLite database schema migrations.
 """
 
+import hashlib
+import json
 import re
 
 from sqlalchemy import text
 
-from app.infrastructure.local.database import get_engine
+from app.infrastructure.local.database import Base, SearchTermORM, get_engine
+from app.infrastructure.local.search_index import backfill_search_terms
+
+# Bump whenever run_migrations() gains a step, so databases stamped with an
+# older schema fingerprint run the migrations again on the next start.
+MIGRATIONS_REVISION = 4
+
+# Composite indexes backing the hot repository queries, grouped by version.
+# Released versions are immutable: add or replace indexes in a new version.
+# Each entry is (index name, table, column list).
+COMPOSITE_INDEX_VERSION = 3
+COMPOSITE_INDEXES: dict[int, tuple[tuple[str, str, str], ...]] = {
+    1: (
+        ("idx_tasks_user_status", "tasks", "user_id, status"),
+        ("idx_tasks_project_status", "tasks", "project_id, status"),
+        ("idx_tasks_user_completed_at", "tasks", "user_id, completed_at"),
+        (
+            "idx_daily_schedule_plans_user_date_generated",
+            "daily_schedule_plans",
+            "user_id, plan_date, generated_at",
+        ),
+        (
+            "idx_chat_messages_session_user_created",
+            "chat_messages",
+            "session_id, user_id, created_at",
+        ),
+        ("idx_heartbeat_events_user_created", "heartbeat_events", "user_id, created_at"),
+        ("idx_notifications_user_created", "notifications", "user_id, created_at"),
+        ("idx_schedule_snapshots_project_active", "schedule_snapshots", "project_id, is_active"),
+    ),
+    # Keyset pagination of top-level tasks (GET /api/tasks).
+    2: (
+        ("idx_tasks_user_parent_created", "tasks", "user_id, parent_id, created_at, id"),
+        ("idx_tasks_project_parent_created", "tasks", "project_id, parent_id, created_at, id"),
+    ),
+    # (created_at, id) cursor over chat messages (history compaction).
+    3: (
+        (
+            "idx_chat_messages_session_user_created_id",
+            "chat_messages",
+            "session_id, user_id, created_at, id",
+        ),
+    ),
+}
+
+
+def schema_fingerprint() -> str:
+    """
+    Fingerprint of the expected schema.
+
+    Covers the ORM tables/columns/indexes, the migration revision and the
+    composite index version, so any schema change invalidates it.
+    """
+    tables = [
+        {
+            "name": table.name,
+            "columns": [
+                [column.name, str(column.type), column.nullable, column.primary_key]
+                for column in table.columns
+            ],
+            "indexes": sorted(index.name for index in table.indexes),
+        }
+        for table in sorted(Base.metadata.tables.values(), key=lambda table: table.name)
+    ]
+    payload = json.dumps(
+        [MIGRATIONS_REVISION, COMPOSITE_INDEX_VERSION, tables], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def is_schema_current(conn) -> bool:
+    """Whether the database is stamped with the current schema fingerprint."""
+    exists = await conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type='table' AND name='schema_version'")
+    )
+    if not exists.scalar():
+        return False
+    result = await conn.execute(text("SELECT fingerprint FROM schema_version WHERE id = 1"))
+    return result.scalar() == schema_fingerprint()
+
+
+async def stamp_schema_version(conn) -> None:
+    """Record the current schema fingerprint after a successful migration."""
+    await conn.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS schema_version ("
+            "id INTEGER PRIMARY KEY CHECK (id = 1), "
+            "fingerprint VARCHAR(64) NOT NULL, "
+            "applied_at DATETIME NOT NULL)"
+        )
+    )
+    await conn.execute(
+        text(
+            "INSERT INTO schema_version (id, fingerprint, applied_at) "
+            "VALUES (1, :fingerprint, CURRENT_TIMESTAMP) "
+            "ON CONFLICT(id) DO UPDATE SET "
+            "fingerprint = excluded.fingerprint, applied_at = excluded.applied_at"
+        ),
+        {"fingerprint": schema_fingerprint()},
+    )
 
 
 async def run_migrations():
@@ -152,6 +253,7 @@ async def run_migrations():
             await conn.execute(
                 text("ALTER TABLE schedule_snapshots ADD COLUMN plan_utilization_ratio FLOAT DEFAULT 1.0")
             )
+        await _ensure_schedule_snapshot_summary_columns(conn, snapshot_columns)
 
         # Create checkin_items table if missing
         checkin_items_result = await conn.execute(
@@ -308,6 +410,19 @@ async def run_migrations():
         await _ensure_schedule_settings(conn)
         await _ensure_daily_schedule_plans(conn)
         await _ensure_heartbeat_tables(conn)
+        await _ensure_chat_history_summaries(conn)
+
+        # History summaries keep a (created_at, id) cursor of the last summarized message.
+        summary_result = await conn.execute(text("PRAGMA table_info(chat_history_summaries)"))
+        if "summarized_until_id" not in {row[1] for row in summary_result}:
+            await conn.execute(
+                text("ALTER TABLE chat_history_summaries ADD COLUMN summarized_until_id VARCHAR(36)")
+            )
+
+        # Proposals record their last status change (stuck executions are failed).
+        proposal_result = await conn.execute(text("PRAGMA table_info(proposals)"))
+        if "updated_at" not in {row[1] for row in proposal_result}:
+            await conn.execute(text("ALTER TABLE proposals ADD COLUMN updated_at DATETIME"))
 
         # Create meeting_sessions table if missing
         session_result = await conn.execute(
@@ -588,6 +703,24 @@ async def run_migrations():
                 text("CREATE INDEX idx_issue_comments_user_id ON issue_comments(user_id)")
             )
 
+        # Composite indexes run last so every table they target exists.
+        await ensure_composite_indexes(conn)
+        # search_terms is derived data: an index without the owner column is
+        # dropped and rebuilt below.
+        await _ensure_search_terms_owner(conn)
+        # Index pre-existing tasks/projects for keyword search (or reindex a
+        # stale index).
+        await backfill_search_terms(conn)
+
+
+async def _ensure_search_terms_owner(conn):
+    """Recreate search_terms with its user_id column and (user_id, term) index."""
+    columns = {row[1] for row in await conn.execute(text("PRAGMA table_info(search_terms)"))}
+    if "user_id" in columns:
+        return
+    await conn.execute(text("DROP TABLE IF EXISTS search_terms"))
+    await conn.run_sync(SearchTermORM.__table__.create)
+
 
 async def _ensure_chat_sessions_composite_pk(conn):
     """
@@ -1057,3 +1190,115 @@ async def _ensure_heartbeat_tables(conn):
             )
         if "read_at" not in events_columns:
             await conn.execute(text("ALTER TABLE heartbeat_events ADD COLUMN read_at DATETIME"))
+
+
+async def _ensure_schedule_snapshot_summary_columns(conn, snapshot_columns: set[str]):
+    """
+    Ensure schedule_snapshots stores its summary columns.
+
+    Snapshot listings used to decode the full tasks/days JSON just to show a
+    task count. Older rows are backfilled from their JSON payload once.
+    """
+    added = False
+    if "end_date" not in snapshot_columns:
+        await conn.execute(text("ALTER TABLE schedule_snapshots ADD COLUMN end_date DATE"))
+        added = True
+    if "task_count" not in snapshot_columns:
+        await conn.execute(
+            text("ALTER TABLE schedule_snapshots ADD COLUMN task_count INTEGER DEFAULT 0 NOT NULL")
+        )
+        added = True
+    if "total_task_minutes" not in snapshot_columns:
+        await conn.execute(
+            text(
+                "ALTER TABLE schedule_snapshots "
+                "ADD COLUMN total_task_minutes INTEGER DEFAULT 0 NOT NULL"
+            )
+        )
+        added = True
+    if not added:
+        return
+
+    await conn.execute(
+        text(
+            """
+            UPDATE schedule_snapshots
+            SET task_count = COALESCE(json_array_length(tasks_json), 0),
+                total_task_minutes = COALESCE((
+                    SELECT SUM(json_extract(value, '$.total_minutes'))
+                    FROM json_each(schedule_snapshots.tasks_json)
+                ), 0),
+                end_date = (
+                    SELECT MAX(json_extract(value, '$.date'))
+                    FROM json_each(schedule_snapshots.days_json)
+                )
+            """
+        )
+    )
+
+
+async def _ensure_chat_history_summaries(conn):
+    result = await conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type='table' AND name='chat_history_summaries'")
+    )
+    if result.scalar():
+        return
+
+    await conn.execute(
+        text(
+            """
+            CREATE TABLE chat_history_summaries (
+                session_id VARCHAR(100) NOT NULL,
+                user_id VARCHAR(255) NOT NULL,
+                summary TEXT NOT NULL DEFAULT '',
+                summarized_until DATETIME NOT NULL,
+                summarized_message_count INTEGER NOT NULL DEFAULT 0,
+                source_tokens INTEGER NOT NULL DEFAULT 0,
+                summary_tokens INTEGER NOT NULL DEFAULT 0,
+                created_at DATETIME,
+                updated_at DATETIME,
+                PRIMARY KEY (session_id, user_id),
+                FOREIGN KEY (session_id, user_id)
+                    REFERENCES chat_sessions(session_id, user_id)
+                    ON DELETE CASCADE
+            )
+            """
+        )
+    )
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_chat_history_summaries_user_id "
+            "ON chat_history_summaries(user_id)"
+        )
+    )
+
+
+async def ensure_composite_indexes(conn, up_to_version: int = COMPOSITE_INDEX_VERSION) -> list[str]:
+    """
+    Create the versioned composite indexes that are missing.
+
+    Args:
+        conn: Async connection inside a transaction
+        up_to_version: Highest index set version to apply
+
+    Returns:
+        Names of the indexes that were created
+    """
+    result = await conn.execute(
+        text("SELECT name, tbl_name, type FROM sqlite_master WHERE type IN ('table', 'index')")
+    )
+    tables = set()
+    indexes = set()
+    for name, _table, kind in result:
+        (tables if kind == "table" else indexes).add(name)
+
+    created = []
+    for version in sorted(COMPOSITE_INDEXES):
+        if version > up_to_version:
+            break
+        for name, table, columns in COMPOSITE_INDEXES[version]:
+            if name in indexes or table not in tables:
+                continue
+            await conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})"))
+            created.append(name)
+    return created
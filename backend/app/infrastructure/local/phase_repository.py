@@ -78,6 +78,16 @@ class SqlitePhaseRepository(IPhaseRepository):
             orm = result.scalar_one_or_none()
             return self._orm_to_model(orm) if orm else None
 
+    async def get_many(self, phase_ids: list[UUID]) -> list[Phase]:
+        """Get several phases by ID without user check."""
+        if not phase_ids:
+            return []
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(PhaseORM).where(PhaseORM.id.in_([str(pid) for pid in dict.fromkeys(phase_ids)]))
+            )
+            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+
     async def get_project_id(self, phase_id: UUID) -> UUID | None:
         """Get project ID for a phase."""
         async with self._session_factory() as session:
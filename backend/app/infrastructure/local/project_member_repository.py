@@ -85,6 +85,16 @@ class SqliteProjectMemberRepository(IProjectMemberRepository):
             )
             return [self._orm_to_model(orm) for orm in result.scalars().all()]
 
+    async def list_by_member_user_id(self, member_user_id: str) -> list[ProjectMember]:
+        """List memberships of a user across all projects."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ProjectMemberORM).where(
+                    ProjectMemberORM.member_user_id == member_user_id
+                )
+            )
+            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+
     async def get_by_project_and_member_user_id(
         self, project_id: UUID, member_user_id: str
     ) -> Optional[ProjectMember]:
@@ -8,7 +8,8 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, case, func, select, union
+from sqlalchemy.orm import aliased
 
 from app.core.exceptions import NotFoundError
 from app.infrastructure.local.database import (
@@ -18,6 +19,7 @@ from app.infrastructure.local.database import (
     TaskORM,
     get_session_factory,
 )
+from app.infrastructure.local.search_index import delete_search_terms, replace_search_terms
 from app.interfaces.project_repository import IProjectRepository
 from app.models.enums import ProjectStatus, ProjectVisibility, TaskStatus
 from app.models.project import Project, ProjectCreate, ProjectUpdate, ProjectWithTaskCount
@@ -29,6 +31,22 @@ class SqliteProjectRepository(IProjectRepository):
     def __init__(self, session_factory=None):
         self._session_factory = session_factory or get_session_factory()
 
+    @staticmethod
+    def _accessible_by(user_id: str):
+        """
+        Owner-or-member filter that stays index-backed (no join + DISTINCT).
+
+        The accessible IDs are collected by two index searches (owner and
+        membership) and the projects are then looked up by primary key; an
+        ``user_id = ? OR id IN (...)`` filter lets SQLite scan the table.
+        """
+        owned = aliased(ProjectORM)
+        accessible_ids = union(
+            select(owned.id).where(owned.user_id == user_id),
+            select(ProjectMemberORM.project_id).where(ProjectMemberORM.member_user_id == user_id),
+        )
+        return ProjectORM.id.in_(accessible_ids)
+
     def _orm_to_model(self, orm: ProjectORM) -> Project:
         """Convert ORM object to Pydantic model."""
         return Project(
@@ -66,6 +84,7 @@ class SqliteProjectRepository(IProjectRepository):
                 kpi_config=kpi_config,
             )
             session.add(orm)
+            await replace_search_terms(session, orm.id, orm.user_id, [orm.name])
             await session.commit()
             await session.refresh(orm)
             return self._orm_to_model(orm)
@@ -75,21 +94,12 @@ class SqliteProjectRepository(IProjectRepository):
         async with self._session_factory() as session:
             # Check if user is owner or member of this project
             result = await session.execute(
-                select(ProjectORM)
-                .outerjoin(
-                    ProjectMemberORM,
-                    ProjectORM.id == ProjectMemberORM.project_id
-                )
-                .where(
+                select(ProjectORM).where(
                     and_(
                         ProjectORM.id == str(project_id),
-                        or_(
-                            ProjectORM.user_id == user_id,
-                            ProjectMemberORM.member_user_id == user_id,
-                        ),
+                        self._accessible_by(user_id),
                     )
                 )
-                .distinct()
             )
             orm = result.scalars().first()
             return self._orm_to_model(orm) if orm else None
@@ -103,6 +113,16 @@ class SqliteProjectRepository(IProjectRepository):
             orm = result.scalars().first()
             return self._orm_to_model(orm) if orm else None
 
+    async def get_many(self, project_ids: list[UUID]) -> list[Project]:
+        """Get several projects by ID without user check."""
+        if not project_ids:
+            return []
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(ProjectORM).where(ProjectORM.id.in_([str(pid) for pid in dict.fromkeys(project_ids)]))
+            )
+            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+
     async def list(
         self,
         user_id: str,
@@ -113,20 +133,7 @@ class SqliteProjectRepository(IProjectRepository):
         """List projects with optional filters (includes projects where user is owner or member)."""
         async with self._session_factory() as session:
             # Select projects where user is owner OR member
-            query = (
-                select(ProjectORM)
-                .outerjoin(
-                    ProjectMemberORM,
-                    ProjectORM.id == ProjectMemberORM.project_id
-                )
-                .where(
-                    or_(
-                        ProjectORM.user_id == user_id,
-                        ProjectMemberORM.member_user_id == user_id,
-                    )
-                )
-                .distinct()
-            )
+            query = select(ProjectORM).where(self._accessible_by(user_id))
 
             if status:
                 query = query.where(ProjectORM.status == status)
@@ -144,60 +151,56 @@ class SqliteProjectRepository(IProjectRepository):
     ) -> list[ProjectWithTaskCount]:
         """List projects with task statistics."""
         projects = await self.list(user_id, status)
-        result = []
+        return await self._with_task_counts(projects)
 
+    async def get_with_task_count(
+        self,
+        user_id: str,
+        project_id: UUID,
+    ) -> Optional[ProjectWithTaskCount]:
+        """Get a single accessible project with task statistics."""
+        project = await self.get(user_id, project_id)
+        if not project:
+            return None
+        counted = await self._with_task_counts([project])
+        return counted[0]
+
+    async def _with_task_counts(self, projects: list[Project]) -> list[ProjectWithTaskCount]:
+        if not projects:
+            return []
+
+        # Unassigned tasks (non-DONE tasks without any assignment)
+        assigned = (
+            select(TaskAssignmentORM.task_id)
+            .where(TaskAssignmentORM.task_id == TaskORM.id)
+            .correlate(TaskORM)
+            .exists()
+        )
+        not_done = TaskORM.status != TaskStatus.DONE.value
+        query = (
+            select(
+                TaskORM.project_id,
+                func.count(TaskORM.id),
+                func.count(case((TaskORM.status == TaskStatus.DONE.value, 1))),
+                func.count(case((TaskORM.status == TaskStatus.IN_PROGRESS.value, 1))),
+                func.count(case((and_(not_done, ~assigned), 1))),
+            )
+            .where(TaskORM.project_id.in_([str(project.id) for project in projects]))
+            .group_by(TaskORM.project_id)
+        )
         async with self._session_factory() as session:
-            for project in projects:
-                # Total tasks
-                total = await session.execute(
-                    select(func.count(TaskORM.id)).where(
-                        TaskORM.project_id == str(project.id)
-                    )
-                )
-                # Completed tasks
-                completed = await session.execute(
-                    select(func.count(TaskORM.id)).where(
-                        and_(
-                            TaskORM.project_id == str(project.id),
-                            TaskORM.status == TaskStatus.DONE.value,
-                        )
-                    )
-                )
-                # In progress tasks
-                in_progress = await session.execute(
-                    select(func.count(TaskORM.id)).where(
-                        and_(
-                            TaskORM.project_id == str(project.id),
-                            TaskORM.status == TaskStatus.IN_PROGRESS.value,
-                        )
-                    )
-                )
-
-                # Unassigned tasks (non-DONE tasks without any assignment)
-                unassigned_subquery = (
-                    select(TaskAssignmentORM.task_id)
-                    .where(TaskAssignmentORM.task_id == TaskORM.id)
-                    .correlate(TaskORM)
-                    .exists()
-                )
-                unassigned = await session.execute(
-                    select(func.count(TaskORM.id)).where(
-                        and_(
-                            TaskORM.project_id == str(project.id),
-                            TaskORM.status != TaskStatus.DONE.value,
-                            ~unassigned_subquery,
-                        )
-                    )
-                )
-
-                result.append(ProjectWithTaskCount(
-                    **project.model_dump(),
-                    total_tasks=total.scalar() or 0,
-                    completed_tasks=completed.scalar() or 0,
-                    in_progress_tasks=in_progress.scalar() or 0,
-                    unassigned_tasks=unassigned.scalar() or 0,
-                ))
+            counts = {row[0]: row[1:] for row in (await session.execute(query)).all()}
 
+        result = []
+        for project in projects:
+            total, completed, in_progress, unassigned = counts.get(str(project.id), (0, 0, 0, 0))
+            result.append(ProjectWithTaskCount(
+                **project.model_dump(),
+                total_tasks=total,
+                completed_tasks=completed,
+                in_progress_tasks=in_progress,
+                unassigned_tasks=unassigned,
+            ))
         return result
 
     async def update(
@@ -225,6 +228,8 @@ class SqliteProjectRepository(IProjectRepository):
                     setattr(orm, field, value)
 
             orm.updated_at = datetime.utcnow()
+            if update_data.get("name") is not None:
+                await replace_search_terms(session, orm.id, orm.user_id, [orm.name])
             await session.commit()
             await session.refresh(orm)
             return self._orm_to_model(orm)
@@ -243,5 +248,6 @@ class SqliteProjectRepository(IProjectRepository):
                 return False
 
             await session.delete(orm)
+            await delete_search_terms(session, orm.id)
             await session.commit()
             return True
@@ -1,18 +1,203 @@
-"""In-memory proposal repository implementation."""
+"""Proposal repository implementations (SQLite and in-memory)."""
 
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import delete, select, update
+
+from app.infrastructure.local.database import ProposalORM, get_session_factory
 from app.interfaces.proposal_repository import IProposalRepository
-from app.models.proposal import Proposal, ProposalStatus
+from app.models.proposal import Proposal, ProposalStatus, ProposalType
+
+
+class SqliteProposalRepository(IProposalRepository):
+    """SQLite implementation of proposal repository.
+
+    Proposals survive restarts and are shared by every worker, so an approval
+    can land on a different process than the chat turn that proposed it.
+    Pending proposals past their expiry read as EXPIRED; expire_stale stores
+    that status, fail_stale_executions settles approvals abandoned mid-run
+    and purge deletes old proposals (see the background scheduler).
+    """
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or get_session_factory()
+
+    def _orm_to_model(self, orm: ProposalORM, now: Optional[datetime] = None) -> Proposal:
+        status = ProposalStatus(orm.status)
+        if status == ProposalStatus.PENDING and orm.expires_at < (now or datetime.now()):
+            status = ProposalStatus.EXPIRED
+        return Proposal(
+            id=UUID(orm.id),
+            user_id=UUID(orm.user_id),
+            user_id_raw=orm.user_id_raw,
+            session_id=orm.session_id,
+            proposal_type=ProposalType(orm.proposal_type),
+            status=status,
+            payload=orm.payload or {},
+            description=orm.description,
+            created_at=orm.created_at,
+            expires_at=orm.expires_at,
+            updated_at=orm.updated_at,
+        )
+
+    async def create(self, proposal: Proposal) -> Proposal:
+        """Create a new proposal."""
+        async with self._session_factory() as session:
+            session.add(
+                ProposalORM(
+                    id=str(proposal.id),
+                    user_id=str(proposal.user_id),
+                    user_id_raw=proposal.user_id_raw,
+                    session_id=proposal.session_id,
+                    proposal_type=proposal.proposal_type.value,
+                    status=proposal.status.value,
+                    payload=proposal.model_dump(mode="json", include={"payload"})["payload"],
+                    description=proposal.description,
+                    created_at=proposal.created_at,
+                    expires_at=proposal.expires_at,
+                    updated_at=proposal.updated_at,
+                )
+            )
+            await session.commit()
+        return proposal
+
+    async def get(self, proposal_id: UUID) -> Optional[Proposal]:
+        """Get a proposal by ID."""
+        async with self._session_factory() as session:
+            orm = await session.get(ProposalORM, str(proposal_id))
+            return self._orm_to_model(orm) if orm else None
+
+    async def list_pending(self, user_id: UUID, session_id: Optional[str] = None) -> list[Proposal]:
+        """List unexpired pending proposals for a user, newest first."""
+        now = datetime.now()
+        query = (
+            select(ProposalORM)
+            .where(
+                ProposalORM.user_id == str(user_id),
+                ProposalORM.status == ProposalStatus.PENDING.value,
+                ProposalORM.expires_at >= now,
+            )
+            .order_by(ProposalORM.created_at.desc())
+        )
+        if session_id:
+            query = query.where(ProposalORM.session_id == session_id)
+        async with self._session_factory() as session:
+            result = await session.execute(query)
+            return [self._orm_to_model(orm, now) for orm in result.scalars().all()]
+
+    async def update_status(
+        self,
+        proposal_id: UUID,
+        status: ProposalStatus,
+        expected_status: Optional[ProposalStatus] = None,
+    ) -> Optional[Proposal]:
+        """Update the status of a proposal (atomically checking expected_status)."""
+        statement = update(ProposalORM).where(ProposalORM.id == str(proposal_id))
+        if expected_status is not None:
+            statement = statement.where(ProposalORM.status == expected_status.value)
+            if expected_status == ProposalStatus.PENDING:
+                statement = statement.where(ProposalORM.expires_at >= datetime.now())
+        async with self._session_factory() as session:
+            result = await session.execute(
+                statement.values(status=status.value, updated_at=datetime.now())
+            )
+            await session.commit()
+            if result.rowcount == 0:
+                return None
+            orm = await session.get(ProposalORM, str(proposal_id), populate_existing=True)
+            return self._orm_to_model(orm) if orm else None
+
+    async def update_status_many(
+        self,
+        user_id: UUID,
+        proposal_ids: list[UUID],
+        status: ProposalStatus,
+    ) -> list[UUID]:
+        """Move a user's unexpired pending proposals to a new status."""
+        if not proposal_ids:
+            return []
+        async with self._session_factory() as session:
+            result = await session.execute(
+                update(ProposalORM)
+                .where(
+                    ProposalORM.id.in_([str(proposal_id) for proposal_id in proposal_ids]),
+                    ProposalORM.user_id == str(user_id),
+                    ProposalORM.status == ProposalStatus.PENDING.value,
+                    ProposalORM.expires_at >= datetime.now(),
+                )
+                .values(status=status.value, updated_at=datetime.now())
+                .returning(ProposalORM.id)
+            )
+            updated = [UUID(row_id) for row_id in result.scalars().all()]
+            await session.commit()
+        return updated
+
+    async def delete_expired(self, user_id: UUID) -> int:
+        """Delete expired proposals for a user."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                delete(ProposalORM).where(
+                    ProposalORM.user_id == str(user_id),
+                    ProposalORM.expires_at < datetime.now(),
+                )
+            )
+            await session.commit()
+            return result.rowcount
+
+    async def expire_stale(self, now: Optional[datetime] = None) -> int:
+        """Mark pending proposals past their expiry as EXPIRED."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                update(ProposalORM)
+                .where(
+                    ProposalORM.status == ProposalStatus.PENDING.value,
+                    ProposalORM.expires_at < (now or datetime.now()),
+                )
+                .values(status=ProposalStatus.EXPIRED.value, updated_at=now or datetime.now())
+            )
+            await session.commit()
+            return result.rowcount
+
+    async def fail_stale_executions(self, started_before: datetime) -> int:
+        """Mark proposals EXECUTING since before a point in time as FAILED."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                update(ProposalORM)
+                .where(
+                    ProposalORM.status == ProposalStatus.EXECUTING.value,
+                    ProposalORM.updated_at < started_before,
+                )
+                .values(status=ProposalStatus.FAILED.value, updated_at=datetime.now())
+            )
+            await session.commit()
+            return result.rowcount
+
+    async def purge(self, expired_before: datetime) -> int:
+        """Delete proposals that expired before a point in time."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                delete(ProposalORM).where(ProposalORM.expires_at < expired_before)
+            )
+            await session.commit()
+            return result.rowcount
+
+    async def delete(self, proposal_id: UUID) -> bool:
+        """Delete a proposal."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                delete(ProposalORM).where(ProposalORM.id == str(proposal_id))
+            )
+            await session.commit()
+            return result.rowcount > 0
 
 
 class InMemoryProposalRepository(IProposalRepository):
     """In-memory implementation of proposal repository.
 
-    Stores proposals in a dictionary. Suitable for development and testing.
-    In production with multiple instances, consider using Redis or database.
+    Stores proposals in a process-local dictionary. Suitable for testing;
+    the application uses SqliteProposalRepository.
     """
 
     def __init__(self):
@@ -50,14 +235,40 @@ class InMemoryProposalRepository(IProposalRepository):
 
         return proposals
 
-    async def update_status(self, proposal_id: UUID, status: ProposalStatus) -> Optional[Proposal]:
+    async def update_status(
+        self,
+        proposal_id: UUID,
+        status: ProposalStatus,
+        expected_status: Optional[ProposalStatus] = None,
+    ) -> Optional[Proposal]:
         """Update the status of a proposal."""
         proposal = self._proposals.get(proposal_id)
+        if proposal and expected_status is not None:
+            if proposal.status != expected_status:
+                return None
+            if expected_status == ProposalStatus.PENDING and proposal.expires_at < datetime.now():
+                return None
         if proposal:
             proposal.status = status
+            proposal.updated_at = datetime.now()
             self._proposals[proposal_id] = proposal
         return proposal
 
+    async def update_status_many(
+        self,
+        user_id: UUID,
+        proposal_ids: list[UUID],
+        status: ProposalStatus,
+    ) -> list[UUID]:
+        """Move a user's unexpired pending proposals to a new status."""
+        updated = []
+        for proposal_id in proposal_ids:
+            proposal = self._proposals.get(proposal_id)
+            if proposal and proposal.user_id == user_id:
+                if await self.update_status(proposal_id, status, expected_status=ProposalStatus.PENDING):
+                    updated.append(proposal_id)
+        return updated
+
     async def delete_expired(self, user_id: UUID) -> int:
         """Delete expired proposals for a user."""
         now = datetime.now()
@@ -71,6 +282,38 @@ class InMemoryProposalRepository(IProposalRepository):
 
         return len(to_delete)
 
+    async def expire_stale(self, now: Optional[datetime] = None) -> int:
+        """Mark pending proposals past their expiry as EXPIRED."""
+        now = now or datetime.now()
+        expired = 0
+        for proposal in self._proposals.values():
+            if proposal.status == ProposalStatus.PENDING and proposal.expires_at < now:
+                proposal.status = ProposalStatus.EXPIRED
+                proposal.updated_at = now
+                expired += 1
+        return expired
+
+    async def fail_stale_executions(self, started_before: datetime) -> int:
+        """Mark proposals EXECUTING since before a point in time as FAILED."""
+        failed = 0
+        for proposal in self._proposals.values():
+            if (
+                proposal.status == ProposalStatus.EXECUTING
+                and proposal.updated_at is not None
+                and proposal.updated_at < started_before
+            ):
+                proposal.status = ProposalStatus.FAILED
+                proposal.updated_at = datetime.now()
+                failed += 1
+        return failed
+
+    async def purge(self, expired_before: datetime) -> int:
+        """Delete proposals that expired before a point in time."""
+        to_delete = [p.id for p in self._proposals.values() if p.expires_at < expired_before]
+        for proposal_id in to_delete:
+            del self._proposals[proposal_id]
+        return len(to_delete)
+
     async def delete(self, proposal_id: UUID) -> bool:
         """Delete a proposal."""
         if proposal_id in self._proposals:
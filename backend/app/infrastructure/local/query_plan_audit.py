@@ -0,0 +1,195 @@
+"""
+EXPLAIN QUERY PLAN audit for the SQLite repositories.
+
+The catalog below calls the hot repository methods themselves. Every SELECT
+they issue is captured (SQL text and bound parameters) while they run
+against the audited database and then run through ``EXPLAIN QUERY PLAN``, so
+the audit always checks the SQL the repositories actually send. Any full
+table scan is reported, so new queries (or dropped indexes) that fall back to
+scanning a growing table are caught before they reach production data sizes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.infrastructure.local.chat_session_repository import SqliteChatSessionRepository
+from app.infrastructure.local.heartbeat_event_repository import SqliteHeartbeatEventRepository
+from app.infrastructure.local.notification_repository import SqliteNotificationRepository
+from app.infrastructure.local.project_member_repository import SqliteProjectMemberRepository
+from app.infrastructure.local.project_repository import SqliteProjectRepository
+from app.infrastructure.local.schedule_plan_repository import SqliteDailySchedulePlanRepository
+from app.infrastructure.local.schedule_snapshot_repository import SqliteScheduleSnapshotRepository
+from app.infrastructure.local.task_assignment_repository import SqliteTaskAssignmentRepository
+from app.infrastructure.local.task_repository import SqliteTaskRepository
+
+_USER = "user-0"
+_PROJECT = UUID("00000000-0000-0000-0000-000000000001")
+_TASK = UUID("00000000-0000-0000-0000-000000000002")
+_SESSION = "session-0"
+_SINCE = datetime(2026, 1, 1)
+_UNTIL = datetime(2026, 2, 1)
+_DAY = date(2026, 1, 15)
+
+
+@dataclass(frozen=True)
+class AuditRepositories:
+    """Repositories bound to the audited database."""
+
+    tasks: SqliteTaskRepository
+    projects: SqliteProjectRepository
+    members: SqliteProjectMemberRepository
+    assignments: SqliteTaskAssignmentRepository
+    plans: SqliteDailySchedulePlanRepository
+    chats: SqliteChatSessionRepository
+    heartbeats: SqliteHeartbeatEventRepository
+    notifications: SqliteNotificationRepository
+    snapshots: SqliteScheduleSnapshotRepository
+
+    @classmethod
+    def create(cls, session_factory) -> "AuditRepositories":
+        return cls(
+            tasks=SqliteTaskRepository(session_factory=session_factory),
+            projects=SqliteProjectRepository(session_factory=session_factory),
+            members=SqliteProjectMemberRepository(session_factory=session_factory),
+            assignments=SqliteTaskAssignmentRepository(session_factory=session_factory),
+            plans=SqliteDailySchedulePlanRepository(session_factory=session_factory),
+            chats=SqliteChatSessionRepository(session_factory=session_factory),
+            heartbeats=SqliteHeartbeatEventRepository(session_factory=session_factory),
+            notifications=SqliteNotificationRepository(session_factory=session_factory),
+            snapshots=SqliteScheduleSnapshotRepository(session_factory=session_factory),
+        )
+
+
+async def _task_pages(repos: AuditRepositories) -> None:
+    # The first page, then the keyset-paginated next one.
+    page = await repos.tasks.list_page(_USER, limit=1)
+    if page.next_cursor:
+        await repos.tasks.list_page(_USER, cursor=page.next_cursor, limit=100)
+
+
+QUERY_CATALOG: dict[str, Callable[[AuditRepositories], Awaitable[Any]]] = {
+    "tasks.list": lambda repos: repos.tasks.list(_USER),
+    "tasks.list_by_status": lambda repos: repos.tasks.list(_USER, status="TODO"),
+    "tasks.list_page": _task_pages,
+    "tasks.list_page_by_project": lambda repos: repos.tasks.list_page(_USER, project_id=_PROJECT),
+    "tasks.count_by_project_status": lambda repos: repos.tasks.count(
+        _USER, project_id=_PROJECT, status="DONE"
+    ),
+    "tasks.list_completed_in_period": lambda repos: repos.tasks.list_completed_in_period(
+        _USER, _SINCE, _UNTIL
+    ),
+    "tasks.get_owner_info": lambda repos: repos.tasks.get_owner_info(_TASK),
+    "tasks.get_subtasks": lambda repos: repos.tasks.get_subtasks(_USER, _TASK),
+    "tasks.search_by_keywords": lambda repos: repos.tasks.search_by_keywords(
+        _USER, ["design", "レビュー"], leaf_only=True
+    ),
+    "projects.list_accessible": lambda repos: repos.projects.list(_USER),
+    "projects.get": lambda repos: repos.projects.get(_USER, _PROJECT),
+    "project_members.list_by_member_user_id": lambda repos: repos.members.list_by_member_user_id(_USER),
+    "task_assignments.list_for_assignee": lambda repos: repos.assignments.list_for_assignee(_USER),
+    "daily_schedule_plans.get_by_date": lambda repos: repos.plans.get_by_date(_USER, _DAY),
+    "chat_messages.list_recent": lambda repos: repos.chats.list_recent_messages(
+        _USER, _SESSION, after=_SINCE, after_id=_TASK
+    ),
+    "chat_messages.list_after": lambda repos: repos.chats.list_messages_after(
+        _USER, _SESSION, after=_SINCE, after_id=_TASK
+    ),
+    "heartbeat_events.list_recent": lambda repos: repos.heartbeats.list_by_user_since(
+        _USER, _SINCE, limit=50
+    ),
+    "notifications.list": lambda repos: repos.notifications.list(_USER),
+    "schedule_snapshots.get_active": lambda repos: repos.snapshots.get_active(_USER, _PROJECT),
+}
+
+
+@dataclass
+class QueryPlanReport:
+    """EXPLAIN QUERY PLAN result for the statements of one catalog entry."""
+
+    name: str
+    statements: list[str] = field(default_factory=list)
+    plan: list[str] = field(default_factory=list)
+    full_scans: list[str] = field(default_factory=list)
+    temp_sorts: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.full_scans
+
+
+def find_full_scans(plan: list[str]) -> list[str]:
+    """
+    Return plan lines that walk a whole table.
+
+    ``SEARCH`` lines are index-constrained; every ``SCAN`` of a table is a full
+    pass, even when it walks an index to avoid a sort.
+    """
+    scans = []
+    for detail in plan:
+        if not detail.startswith("SCAN "):
+            continue
+        # Scans of subquery results and constant rows are not table scans.
+        if detail.startswith("SCAN CONSTANT ROW") or "(subquery-" in detail:
+            continue
+        scans.append(detail)
+    return scans
+
+
+class _StatementCapture:
+    """Collects the SELECT statements an engine executes while active."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine.sync_engine
+        self.statements: list[tuple[str, Any]] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if executemany or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return
+        if (statement, parameters) not in self.statements:
+            self.statements.append((statement, parameters))
+
+    def __enter__(self) -> "_StatementCapture":
+        event.listen(self._engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._record)
+
+
+async def audit_query_plans(
+    engine: AsyncEngine,
+    catalog: dict[str, Callable[[AuditRepositories], Awaitable[Any]]] | None = None,
+) -> list[QueryPlanReport]:
+    """
+    Run the catalog's repository calls and EXPLAIN every SELECT they issue.
+
+    Args:
+        engine: Engine of a database with the current schema
+        catalog: Repository calls to audit (defaults to QUERY_CATALOG)
+
+    Returns:
+        One report per catalog entry, in catalog order
+    """
+    repos = AuditRepositories.create(async_sessionmaker(engine, expire_on_commit=False))
+    reports = []
+    for name, call in (catalog or QUERY_CATALOG).items():
+        with _StatementCapture(engine) as capture:
+            await call(repos)
+
+        report = QueryPlanReport(name=name)
+        async with engine.connect() as conn:
+            for statement, parameters in capture.statements:
+                result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                report.statements.append(statement)
+                report.plan.extend(row[-1] for row in result.fetchall())
+        report.full_scans = find_full_scans(report.plan)
+        report.temp_sorts = [line for line in report.plan if line.startswith("USE TEMP B-TREE")]
+        reports.append(report)
+    return reports
@@ -0,0 +1,183 @@
+"""
+Realtime brokers: in-process, and SQLite polling for several workers.
+
+The SQLite broker delivers an event to the publishing process's own
+connections immediately and appends it to the realtime_events table; every
+other worker polls the table for rows it did not publish. Any process that
+can reach the same database file can serve SSE connections, so uvicorn can
+run with several workers. Rows older than REALTIME_BROKER_RETENTION_SECONDS
+are pruned by the polling loops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from typing import Any, Iterable, Optional
+from uuid import uuid4
+
+from sqlalchemy import delete, func, insert, select
+
+from app.core.config import get_settings
+from app.core.logger import logger
+from app.infrastructure.local.database import RealtimeEventORM, get_session_factory
+from app.interfaces.realtime_broker import BrokerHandler, IRealtimeBroker
+from app.models.realtime import RealtimeEvent
+
+# Recent delivery lags kept for the stats.
+_LAG_SAMPLES = 1000
+_POLL_BATCH = 500
+
+
+class _BrokerBase(IRealtimeBroker):
+    """Handler registration and delivery metrics shared by the brokers."""
+
+    def __init__(self) -> None:
+        self._handlers: list[BrokerHandler] = []
+        self._lags_ms: deque[float] = deque(maxlen=_LAG_SAMPLES)
+        self.published = 0
+        self.received = 0
+
+    def subscribe(self, handler: BrokerHandler) -> None:
+        if handler not in self._handlers:
+            self._handlers.append(handler)
+
+    def _deliver(
+        self,
+        user_ids: Optional[frozenset[str]],
+        event: RealtimeEvent,
+        published_at: float,
+        remote: bool = False,
+    ) -> None:
+        for handler in self._handlers:
+            try:
+                handler(user_ids, event, published_at, remote)
+            except Exception as exc:
+                logger.warning(f"Realtime delivery failed: {exc}")
+
+    def stats(self) -> dict[str, Any]:
+        lags = sorted(self._lags_ms)
+        return {
+            "broker": self.name,
+            "published": self.published,
+            "received": self.received,
+            # Publish-to-delivery lag of events received from other processes.
+            "lag_ms_avg": round(sum(lags) / len(lags), 1) if lags else 0.0,
+            "lag_ms_p95": round(lags[min(len(lags) - 1, int(len(lags) * 0.95))], 1) if lags else 0.0,
+            "lag_ms_max": round(lags[-1], 1) if lags else 0.0,
+        }
+
+
+class InProcessRealtimeBroker(_BrokerBase):
+    """Delivers to this process's connections only (single worker)."""
+
+    name = "memory"
+
+    async def publish(self, user_ids: Optional[Iterable[str]], event: RealtimeEvent) -> None:
+        self.published += 1
+        self._deliver(frozenset(user_ids) if user_ids is not None else None, event, time.time())
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class SqliteRealtimeBroker(_BrokerBase):
+    """Relays events between workers through the realtime_events table."""
+
+    name = "sqlite"
+
+    def __init__(self, session_factory=None) -> None:
+        super().__init__()
+        self._session_factory = session_factory or get_session_factory()
+        self.origin = f"{os.getpid()}-{uuid4().hex[:8]}"
+        self._last_id = 0
+        self._task: Optional[asyncio.Task] = None
+        self._last_prune = 0.0
+        self.poll_errors = 0
+
+    async def publish(self, user_ids: Optional[Iterable[str]], event: RealtimeEvent) -> None:
+        recipients = frozenset(user_ids) if user_ids is not None else None
+        published_at = time.time()
+        self.published += 1
+        self._deliver(recipients, event, published_at)
+        try:
+            async with self._session_factory() as session:
+                await session.execute(
+                    insert(RealtimeEventORM).values(
+                        origin=self.origin,
+                        user_ids=json.dumps(sorted(recipients)) if recipients is not None else None,
+                        payload=event.to_json(),
+                        published_at=published_at,
+                    )
+                )
+                await session.commit()
+        except Exception as exc:
+            logger.warning(f"Realtime broker publish failed: {exc}")
+
+    async def poll(self) -> int:
+        """Deliver events other processes published since the last poll."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(RealtimeEventORM)
+                .where(RealtimeEventORM.id > self._last_id, RealtimeEventORM.origin != self.origin)
+                .order_by(RealtimeEventORM.id)
+                .limit(_POLL_BATCH)
+            )
+            rows = result.scalars().all()
+        for row in rows:
+            self._last_id = max(self._last_id, row.id)
+            recipients = frozenset(json.loads(row.user_ids)) if row.user_ids is not None else None
+            self.received += 1
+            self._lags_ms.append(max(0.0, (time.time() - row.published_at) * 1000))
+            self._deliver(recipients, RealtimeEvent.model_validate_json(row.payload), row.published_at, remote=True)
+        return len(rows)
+
+    async def prune(self) -> None:
+        cutoff = time.time() - get_settings().REALTIME_BROKER_RETENTION_SECONDS
+        async with self._session_factory() as session:
+            await session.execute(delete(RealtimeEventORM).where(RealtimeEventORM.published_at < cutoff))
+            await session.commit()
+        self._last_prune = time.time()
+
+    async def _poll_loop(self) -> None:
+        settings = get_settings()
+        while True:
+            try:
+                # Drain a backlog without waiting between full batches.
+                if await self.poll() < _POLL_BATCH:
+                    await asyncio.sleep(settings.REALTIME_BROKER_POLL_SECONDS)
+                if time.time() - self._last_prune > settings.REALTIME_BROKER_RETENTION_SECONDS:
+                    await self.prune()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.poll_errors += 1
+                logger.warning(f"Realtime broker poll failed: {exc}")
+                await asyncio.sleep(settings.REALTIME_BROKER_POLL_SECONDS)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        # Only events published from now on are relayed.
+        async with self._session_factory() as session:
+            self._last_id = (await session.execute(select(func.max(RealtimeEventORM.id)))).scalar() or 0
+        self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), "origin": self.origin, "poll_errors": self.poll_errors}
@@ -0,0 +1,173 @@
+"""
+Validation-free model construction for trusted database rows.
+
+Rows read back from our own tables were validated when they were written,
+so bulk reads do not need Pydantic's full validation per row. A
+TrustedModelBuilder derives one converter per model field up front (UUID
+parsing, enum lookup, nested models, defaults for NULL columns) and builds
+instances directly from ORM objects or column rows.
+
+With TRUSTED_ROW_CHECK enabled every row is also built through the
+validated path; mismatches are logged and the validated model is returned.
+"""
+
+from __future__ import annotations
+
+import logging
+import types
+from enum import Enum
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar, Union, get_args, get_origin
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+_object_setattr = object.__setattr__
+
+
+def _converter_for(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Converter from a stored column value to a field value (None = as-is)."""
+    if annotation is UUID:
+        return UUID
+    if annotation is bool:
+        return bool
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation) or (Any,)
+        if item is UUID:
+            return lambda values: [UUID(value) for value in values]
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return lambda values: [item.model_validate(value) for value in values]
+        return list
+    return None
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1 and len(get_args(annotation)) == 2:
+            return args[0], True
+    return annotation, False
+
+
+class TrustedModelBuilder(Generic[M]):
+    """
+    Build models of one class from trusted rows without validation.
+
+    Column rows are read by position (resolved once per batch), other
+    objects by attribute name; a missing column or a NULL in
+    a non-optional field falls back to the field default, like the
+    hand-written ``_orm_to_model`` converters do.
+
+    Args:
+        model_cls: Pydantic model class
+        post_init: Optional hook normalizing a built instance (e.g. the
+            effects of an ``after`` model validator); returns the instance
+    """
+
+    def __init__(
+        self,
+        model_cls: type[M],
+        post_init: Optional[Callable[[M], M]] = None,
+    ) -> None:
+        self.model_cls = model_cls
+        self.post_init = post_init
+        self._fields: list[tuple[str, Optional[Callable], bool, Callable[[], Any]]] = []
+        for name, info in model_cls.model_fields.items():
+            annotation, optional = _unwrap_optional(info.annotation)
+            if info.default_factory is not None:
+                default = info.default_factory
+            else:
+                default = lambda value=None if info.is_required() else info.default: value  # noqa: E731
+            self._fields.append((name, _converter_for(annotation), optional, default))
+        self._field_names = frozenset(model_cls.model_fields)
+        # Private attributes need Pydantic's own initialisation.
+        self._direct = not model_cls.__private_attributes__
+
+    def build(self, row: Any) -> M:
+        """Build a model from an object exposing the fields as attributes."""
+        values: dict[str, Any] = {}
+        for name, convert, optional, default in self._fields:
+            value = getattr(row, name, None)
+            if value is None:
+                value = None if optional else default()
+            elif convert is not None:
+                value = convert(value)
+            values[name] = value
+        return self._instantiate(values)
+
+    def _column_plan(self, columns: tuple[str, ...]) -> list[tuple]:
+        positions = {name: index for index, name in enumerate(columns)}
+        return [
+            (name, positions.get(name), convert, optional, default)
+            for name, convert, optional, default in self._fields
+        ]
+
+    def _build_positional(self, row: Any, plan: list[tuple]) -> M:
+        values: dict[str, Any] = {}
+        for name, position, convert, optional, default in plan:
+            value = None if position is None else row[position]
+            if value is None:
+                value = None if optional else default()
+            elif convert is not None:
+                value = convert(value)
+            values[name] = value
+        return self._instantiate(values)
+
+    def _instantiate(self, values: dict[str, Any]) -> M:
+        if self._direct:
+            instance = self.model_cls.__new__(self.model_cls)
+            _object_setattr(instance, "__dict__", values)
+            _object_setattr(instance, "__pydantic_fields_set__", set(self._field_names))
+            _object_setattr(instance, "__pydantic_extra__", None)
+            _object_setattr(instance, "__pydantic_private__", None)
+        else:
+            instance = self.model_cls.model_construct(_fields_set=set(self._field_names), **values)
+        if self.post_init is not None:
+            instance = self.post_init(instance)
+        return instance
+
+    def build_many(
+        self,
+        rows: Iterable[Any],
+        validated: Optional[Callable[[Any], M]] = None,
+    ) -> list[M]:
+        """
+        Build models for rows.
+
+        Args:
+            rows: ORM objects or column rows (all of the same shape)
+            validated: Validated construction used for TRUSTED_ROW_CHECK
+        """
+        rows = list(rows)
+        if validated is not None and get_settings().TRUSTED_ROW_CHECK:
+            return [self.checked(row, validated) for row in rows]
+        if not rows:
+            return []
+        columns = getattr(rows[0], "_fields", None)
+        if columns is None:
+            return [self.build(row) for row in rows]
+        # Column rows (sqlalchemy Row): read values by position.
+        plan = self._column_plan(columns)
+        return [self._build_positional(row, plan) for row in rows]
+
+    def checked(self, row: Any, validated: Callable[[Any], M]) -> M:
+        """Build a row both ways and report fields that differ."""
+        expected = validated(row)
+        expected_data, built_data = expected.model_dump(), self.build(row).model_dump()
+        if built_data != expected_data:
+            differing = sorted(
+                name for name in expected_data if expected_data[name] != built_data.get(name)
+            )
+            logger.warning(
+                "Trusted %s construction differs from validation in fields: %s",
+                self.model_cls.__name__,
+                ", ".join(differing),
+            )
+        return expected
@@ -23,6 +23,9 @@ from app.utils.datetime_utils import now_utc
 
 
 class SqliteDailySchedulePlanRepository(IDailySchedulePlanRepository):
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or get_session_factory()
+
     def _orm_to_model(self, orm: DailySchedulePlanORM) -> DailySchedulePlan:
         schedule_day = ScheduleDay(**orm.schedule_day_json)
         tasks = [TaskScheduleInfo(**entry) for entry in (orm.tasks_json or [])]
@@ -53,8 +56,7 @@ class SqliteDailySchedulePlanRepository(IDailySchedulePlanRepository):
         user_id: str,
         plans: list[DailySchedulePlanCreate],
     ) -> list[DailySchedulePlan]:
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             created: list[DailySchedulePlan] = []
             for plan in plans:
                 orm = DailySchedulePlanORM(
@@ -86,8 +88,7 @@ class SqliteDailySchedulePlanRepository(IDailySchedulePlanRepository):
         user_id: str,
         plan_date: date,
     ) -> Optional[DailySchedulePlan]:
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             result = await session.execute(
                 select(DailySchedulePlanORM)
                 .where(
@@ -105,8 +106,7 @@ class SqliteDailySchedulePlanRepository(IDailySchedulePlanRepository):
         start_date: date,
         end_date: date,
     ) -> list[DailySchedulePlan]:
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             result = await session.execute(
                 select(DailySchedulePlanORM)
                 .where(
@@ -195,8 +195,7 @@ class SqliteDailySchedulePlanRepository(IDailySchedulePlanRepository):
         new_start: datetime,
         new_end: datetime,
     ) -> Optional[ScheduleTimeBlock]:
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             orm = await self._get_latest_orm(session, user_id, plan_date)
             if not orm:
                 return None
@@ -219,9 +218,8 @@ class SqliteDailySchedulePlanRepository(IDailySchedulePlanRepository):
         new_start: datetime,
         new_end: datetime,
     ) -> Optional[ScheduleTimeBlock]:
-        session_factory = get_session_factory()
         task_id_str = str(task_id)
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             source_orm = await self._get_latest_orm(session, user_id, source_date)
             if not source_orm:
                 return None
@@ -287,8 +285,7 @@ class SqliteDailySchedulePlanRepository(IDailySchedulePlanRepository):
         plan_group_id: UUID,
         snapshot: TaskPlanSnapshot,
     ) -> None:
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             result = await session.execute(
                 select(DailySchedulePlanORM).where(
                     and_(
@@ -8,7 +8,8 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import select, update
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import undefer_group
 
 from app.infrastructure.local.database import ScheduleSnapshotORM, get_session_factory
 from app.interfaces.schedule_snapshot_repository import IScheduleSnapshotRepository
@@ -22,9 +23,39 @@ from app.models.schedule_snapshot import (
 )
 
 
+# Columns needed to build a ScheduleSnapshotSummary without touching the JSON payload.
+_SUMMARY_COLUMNS = (
+    ScheduleSnapshotORM.id,
+    ScheduleSnapshotORM.project_id,
+    ScheduleSnapshotORM.name,
+    ScheduleSnapshotORM.is_active,
+    ScheduleSnapshotORM.start_date,
+    ScheduleSnapshotORM.end_date,
+    ScheduleSnapshotORM.task_count,
+    ScheduleSnapshotORM.total_task_minutes,
+    ScheduleSnapshotORM.total_buffer_minutes,
+    ScheduleSnapshotORM.consumed_buffer_minutes,
+    ScheduleSnapshotORM.created_at,
+)
+
+
 class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
     """SQLite implementation of schedule snapshot repository."""
 
+    def __init__(self, session_factory=None):
+        """
+        Initialize repository.
+
+        Args:
+            session_factory: Optional session factory (for testing)
+        """
+        self._session_factory = session_factory or get_session_factory()
+
+    @staticmethod
+    def _select_full():
+        """Select snapshots including the deferred JSON payload columns."""
+        return select(ScheduleSnapshotORM).options(undefer_group("payload"))
+
     def _orm_to_model(self, orm: ScheduleSnapshotORM) -> ScheduleSnapshot:
         """Convert ORM model to Pydantic model."""
         tasks = [
@@ -57,10 +88,10 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
             updated_at=orm.updated_at,
         )
 
-    def _orm_to_summary(self, orm: ScheduleSnapshotORM) -> ScheduleSnapshotSummary:
-        """Convert ORM model to summary model."""
-        total_buffer = orm.total_buffer_minutes or 0
-        consumed_buffer = orm.consumed_buffer_minutes or 0
+    def _row_to_summary(self, row) -> ScheduleSnapshotSummary:
+        """Convert a summary column row to summary model."""
+        total_buffer = row.total_buffer_minutes or 0
+        consumed_buffer = row.consumed_buffer_minutes or 0
         buffer_pct = (
             ((total_buffer - consumed_buffer) / total_buffer * 100)
             if total_buffer > 0
@@ -68,16 +99,18 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
         )
 
         return ScheduleSnapshotSummary(
-            id=UUID(orm.id),
-            project_id=UUID(orm.project_id),
-            name=orm.name,
-            is_active=orm.is_active,
-            start_date=orm.start_date,
-            task_count=len(orm.tasks_json or []),
+            id=UUID(row.id),
+            project_id=UUID(row.project_id),
+            name=row.name,
+            is_active=bool(row.is_active),
+            start_date=row.start_date,
+            end_date=row.end_date,
+            task_count=row.task_count or 0,
+            total_task_minutes=row.total_task_minutes or 0,
             total_buffer_minutes=total_buffer,
             consumed_buffer_minutes=consumed_buffer,
             buffer_percentage=buffer_pct,
-            created_at=orm.created_at,
+            created_at=row.created_at,
         )
 
     async def create(
@@ -88,8 +121,7 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
         schedule_data: dict,
     ) -> ScheduleSnapshot:
         """Create a new schedule snapshot."""
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             # Generate name if not provided
             name = snapshot.name or f"Baseline {datetime.utcnow().strftime('%Y/%m/%d %H:%M')}"
 
@@ -97,6 +129,7 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
             tasks_json = [t.model_dump(mode="json") for t in schedule_data.get("tasks", [])]
             days_json = [d.model_dump(mode="json") for d in schedule_data.get("days", [])]
             phase_buffers_json = [p.model_dump(mode="json") for p in schedule_data.get("phase_buffers", [])]
+            day_dates = [d.date for d in schedule_data.get("days", [])]
 
             orm = ScheduleSnapshotORM(
                 id=str(uuid4()),
@@ -105,9 +138,12 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
                 name=name,
                 is_active=True,  # Auto-activate on creation
                 start_date=schedule_data.get("start_date"),
+                end_date=max(day_dates) if day_dates else None,
                 tasks_json=tasks_json,
                 days_json=days_json,
                 phase_buffers_json=phase_buffers_json,
+                task_count=len(tasks_json),
+                total_task_minutes=sum(t.get("total_minutes") or 0 for t in tasks_json),
                 total_buffer_minutes=schedule_data.get("total_buffer_minutes", 0),
                 consumed_buffer_minutes=0,
                 capacity_hours=snapshot.capacity_hours,
@@ -129,16 +165,14 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
 
             session.add(orm)
             await session.commit()
-            await session.refresh(orm)
 
             return self._orm_to_model(orm)
 
     async def get(self, user_id: str, snapshot_id: UUID) -> Optional[ScheduleSnapshot]:
         """Get a snapshot by ID."""
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             result = await session.execute(
-                select(ScheduleSnapshotORM).where(
+                self._select_full().where(
                     ScheduleSnapshotORM.id == str(snapshot_id),
                     ScheduleSnapshotORM.user_id == user_id,
                 )
@@ -154,10 +188,9 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
         offset: int = 0,
     ) -> list[ScheduleSnapshotSummary]:
         """List snapshots for a project."""
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             result = await session.execute(
-                select(ScheduleSnapshotORM)
+                select(*_SUMMARY_COLUMNS)
                 .where(
                     ScheduleSnapshotORM.user_id == user_id,
                     ScheduleSnapshotORM.project_id == str(project_id),
@@ -166,15 +199,13 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
                 .limit(limit)
                 .offset(offset)
             )
-            orms = result.scalars().all()
-            return [self._orm_to_summary(orm) for orm in orms]
+            return [self._row_to_summary(row) for row in result.all()]
 
     async def get_active(self, user_id: str, project_id: UUID) -> Optional[ScheduleSnapshot]:
         """Get the currently active snapshot for a project."""
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             result = await session.execute(
-                select(ScheduleSnapshotORM).where(
+                self._select_full().where(
                     ScheduleSnapshotORM.user_id == user_id,
                     ScheduleSnapshotORM.project_id == str(project_id),
                     ScheduleSnapshotORM.is_active.is_(True),
@@ -185,11 +216,10 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
 
     async def activate(self, user_id: str, snapshot_id: UUID) -> ScheduleSnapshot:
         """Activate a snapshot (deactivates any previously active one)."""
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             # Get the snapshot to activate
             result = await session.execute(
-                select(ScheduleSnapshotORM).where(
+                self._select_full().where(
                     ScheduleSnapshotORM.id == str(snapshot_id),
                     ScheduleSnapshotORM.user_id == user_id,
                 )
@@ -213,27 +243,20 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
             orm.is_active = True
             orm.updated_at = datetime.utcnow()
             await session.commit()
-            await session.refresh(orm)
 
             return self._orm_to_model(orm)
 
     async def delete(self, user_id: str, snapshot_id: UUID) -> bool:
         """Delete a snapshot."""
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             result = await session.execute(
-                select(ScheduleSnapshotORM).where(
+                delete(ScheduleSnapshotORM).where(
                     ScheduleSnapshotORM.id == str(snapshot_id),
                     ScheduleSnapshotORM.user_id == user_id,
                 )
             )
-            orm = result.scalar_one_or_none()
-            if not orm:
-                return False
-
-            await session.delete(orm)
             await session.commit()
-            return True
+            return result.rowcount > 0
 
     async def update_consumed_buffer(
         self,
@@ -242,10 +265,9 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
         consumed_buffer_minutes: int,
     ) -> ScheduleSnapshot:
         """Update the consumed buffer for a snapshot."""
-        session_factory = get_session_factory()
-        async with session_factory() as session:
+        async with self._session_factory() as session:
             result = await session.execute(
-                select(ScheduleSnapshotORM).where(
+                self._select_full().where(
                     ScheduleSnapshotORM.id == str(snapshot_id),
                     ScheduleSnapshotORM.user_id == user_id,
                 )
@@ -257,6 +279,5 @@ class SqliteScheduleSnapshotRepository(IScheduleSnapshotRepository):
             orm.consumed_buffer_minutes = consumed_buffer_minutes
             orm.updated_at = datetime.utcnow()
             await session.commit()
-            await session.refresh(orm)
 
             return self._orm_to_model(orm)
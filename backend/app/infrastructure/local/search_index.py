@@ -0,0 +1,100 @@
+"""
+Maintenance of the keyword search index (search_terms table).
+
+Tasks are indexed by title, description and purpose; projects by name. Each
+row carries the entity's owner, so searches seek (user_id, term) and never
+read other users' postings. The repositories refresh an entity's terms in
+the same session that writes it.
+Rows of deleted entities are harmless (searches join the live tables) but
+are removed where the repositories delete entities one by one.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, insert, select, text
+
+from app.infrastructure.local.database import ProjectORM, SearchTermORM, TaskORM
+from app.utils.search_terms import extract_document_terms
+
+_BACKFILL_BATCH_SIZE = 500
+
+
+def task_search_texts(orm: TaskORM) -> tuple[Optional[str], ...]:
+    return (orm.title, orm.description, orm.purpose)
+
+
+async def replace_search_terms(
+    session, entity_id: str, user_id: str, texts: Iterable[Optional[str]]
+) -> None:
+    """Replace the indexed terms of one task or project owned by ``user_id``."""
+    await session.execute(delete(SearchTermORM).where(SearchTermORM.entity_id == entity_id))
+    terms = extract_document_terms(texts)
+    if terms:
+        await session.execute(
+            insert(SearchTermORM),
+            [{"term": term, "entity_id": entity_id, "user_id": user_id} for term in terms],
+        )
+
+
+async def delete_search_terms(session, entity_id: str) -> None:
+    await session.execute(delete(SearchTermORM).where(SearchTermORM.entity_id == entity_id))
+
+
+async def _index_is_current(conn) -> bool:
+    """Whether the index exists and was built with the current term extraction."""
+    sample = (await conn.execute(text("SELECT entity_id FROM search_terms LIMIT 1"))).first()
+    if sample is None:
+        return False
+    entity_id = sample[0]
+    texts = (
+        await conn.execute(
+            select(TaskORM.title, TaskORM.description, TaskORM.purpose).where(TaskORM.id == entity_id)
+        )
+    ).first() or (await conn.execute(select(ProjectORM.name).where(ProjectORM.id == entity_id))).first()
+    if texts is None:
+        # Rows of deleted entities say nothing about the format; keep the index.
+        return True
+    stored = await conn.execute(
+        select(SearchTermORM.term).where(SearchTermORM.entity_id == entity_id)
+    )
+    return set(stored.scalars()) == extract_document_terms(texts)
+
+
+async def backfill_search_terms(conn) -> int:
+    """
+    Index every task and project when the index is empty or stale.
+
+    The index is rebuilt when a sampled entity's stored terms differ from
+    what the current term extraction produces (e.g. after it changed).
+
+    Args:
+        conn: Async connection inside a transaction
+
+    Returns:
+        Number of indexed entities (0 if the index was already current)
+    """
+    if await _index_is_current(conn):
+        return 0
+    await conn.execute(delete(SearchTermORM))
+
+    indexed = 0
+    sources = (
+        select(TaskORM.id, TaskORM.user_id, TaskORM.title, TaskORM.description, TaskORM.purpose),
+        select(ProjectORM.id, ProjectORM.user_id, ProjectORM.name),
+    )
+    for query in sources:
+        batch: list[dict] = []
+        for entity_id, user_id, *texts in (await conn.execute(query)).all():
+            batch.extend(
+                {"term": term, "entity_id": entity_id, "user_id": user_id}
+                for term in extract_document_terms(texts)
+            )
+            indexed += 1
+            if len(batch) >= _BACKFILL_BATCH_SIZE:
+                await conn.execute(insert(SearchTermORM), batch)
+                batch = []
+        if batch:
+            await conn.execute(insert(SearchTermORM), batch)
+    return indexed
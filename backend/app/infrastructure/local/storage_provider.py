@@ -1,14 +1,39 @@
 """
 Local file system storage provider.
+
+Files are content-addressed: each distinct content is written once as a
+blob under ``.blobs/<sha256[:2]>/<sha256>`` and every stored path is a hard
+link to its blob. Identical uploads share one copy on disk, a blob's link
+count is its reference count, and a blob is removed once the last path
+referencing it is deleted or overwritten. Stored paths remain ordinary
+files, so code that reads them directly keeps working. Where hard links are
+unsupported, paths fall back to plain copies (no deduplication).
+
+The in-process lock only orders this process's bookkeeping. Another process
+sharing the directory may drop a blob at any time, so the written content is
+kept until the path is linked and a vanished blob is written again.
+
+File I/O runs in worker threads and is chunked (STORAGE_CHUNK_SIZE).
 """
 
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import shutil
+import threading
 from pathlib import Path
-from typing import Optional
+from stat import S_ISREG
+from typing import AsyncIterator, Optional
+from uuid import uuid4
 
 from app.core.config import get_settings
 from app.core.exceptions import InfrastructureError, NotFoundError
 from app.interfaces.storage_provider import IStorageProvider
 
+BLOB_DIR = ".blobs"
+
 
 class LocalStorageProvider(IStorageProvider):
     """
@@ -17,15 +42,20 @@ class LocalStorageProvider(IStorageProvider):
     Stores files in a local directory structure.
     """
 
-    def __init__(self, base_path: Optional[str] = None):
+    def __init__(self, base_path: Optional[str] = None, chunk_size: Optional[int] = None):
         """
         Initialize local storage provider.
 
         Args:
             base_path: Base directory for file storage (default: ./storage)
+            chunk_size: Streaming chunk size in bytes (default: STORAGE_CHUNK_SIZE)
         """
         self.base_path = Path(base_path or "./storage")
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.blob_path = self.base_path / BLOB_DIR
+        self.chunk_size = chunk_size or get_settings().STORAGE_CHUNK_SIZE
+        # Serializes blob/link bookkeeping; content writes happen outside it.
+        self._lock = threading.Lock()
 
     async def upload(
         self,
@@ -35,45 +65,90 @@ class LocalStorageProvider(IStorageProvider):
     ) -> str:
         """Upload a file to local storage."""
         try:
-            file_path = self.base_path / path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            return await asyncio.to_thread(self._store_bytes, path, data)
+        except Exception as e:
+            raise InfrastructureError(f"Failed to upload file: {e}")
 
-            with open(file_path, "wb") as f:
-                f.write(data)
+    async def upload_stream(
+        self,
+        path: str,
+        chunks: AsyncIterator[bytes],
+        content_type: Optional[str] = None,
+    ) -> str:
+        """Upload a file to local storage chunk by chunk."""
+        temp_path = self._temp_path()
+        digest = hashlib.sha256()
 
-            # Return local file path
-            return str(file_path.absolute())
+        def _write(handle, chunk: bytes) -> None:
+            digest.update(chunk)
+            handle.write(chunk)
 
+        try:
+            handle = await asyncio.to_thread(open, temp_path, "wb")
+            try:
+                async for chunk in chunks:
+                    await asyncio.to_thread(_write, handle, chunk)
+            finally:
+                handle.close()
+            return await asyncio.to_thread(self._commit, temp_path, digest.hexdigest(), path)
         except Exception as e:
             raise InfrastructureError(f"Failed to upload file: {e}")
+        finally:
+            temp_path.unlink(missing_ok=True)
 
     async def download(self, path: str) -> bytes:
         """Download a file from local storage."""
         try:
             file_path = self._resolve_path(path)
-
-            if not file_path.exists():
-                raise NotFoundError(f"File not found: {path}")
-
-            with open(file_path, "rb") as f:
-                return f.read()
-
-        except NotFoundError:
-            raise
+            return await asyncio.to_thread(file_path.read_bytes)
+        except FileNotFoundError:
+            raise NotFoundError(f"File not found: {path}")
         except Exception as e:
             raise InfrastructureError(f"Failed to download file: {e}")
 
-    async def delete(self, path: str) -> bool:
-        """Delete a file from local storage."""
+    async def stream(
+        self,
+        path: str,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """Read a file (or an inclusive byte range) from local storage in chunks."""
+        file_path = self._resolve_path(path)
         try:
-            file_path = self._resolve_path(path)
+            handle = await asyncio.to_thread(open, file_path, "rb")
+        except FileNotFoundError:
+            raise NotFoundError(f"File not found: {path}")
 
-            if not file_path.exists():
-                return False
+        try:
+            if start:
+                await asyncio.to_thread(handle.seek, start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+                chunk = await asyncio.to_thread(handle.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            handle.close()
 
-            file_path.unlink()
-            return True
+    async def size(self, path: str) -> int:
+        """Get the size of a file in local storage."""
+        file_path = self._resolve_path(path)
+        try:
+            stat = await asyncio.to_thread(file_path.stat)
+        except FileNotFoundError:
+            raise NotFoundError(f"File not found: {path}")
+        if not S_ISREG(stat.st_mode):
+            raise NotFoundError(f"File not found: {path}")
+        return stat.st_size
 
+    async def delete(self, path: str) -> bool:
+        """Delete a file from local storage (and its blob if unreferenced)."""
+        try:
+            return await asyncio.to_thread(self._delete, self._resolve_path(path))
         except Exception as e:
             raise InfrastructureError(f"Failed to delete file: {e}")
 
@@ -98,3 +173,102 @@ class LocalStorageProvider(IStorageProvider):
             return Path(path)
         # Otherwise, resolve relative to base_path
         return self.base_path / path
+
+    # ------------------------------------------------------------------
+    # Content addressing (worker-thread helpers)
+    # ------------------------------------------------------------------
+
+    def _temp_path(self) -> Path:
+        temp_dir = self.blob_path / "tmp"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        return temp_dir / uuid4().hex
+
+    def _blob_for(self, digest: str) -> Path:
+        return self.blob_path / digest[:2] / digest
+
+    def _hash_file(self, file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as handle:
+            while chunk := handle.read(self.chunk_size):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _store_bytes(self, path: str, data: bytes) -> str:
+        temp_path = self._temp_path()
+        try:
+            with open(temp_path, "wb") as handle:
+                handle.write(data)
+            return self._commit(temp_path, hashlib.sha256(data).hexdigest(), path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def _commit(self, temp_path: Path, digest: str, path: str) -> str:
+        """Link the path to the blob of the written content (the caller removes temp_path)."""
+        file_path = self._resolve_path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        blob = self._blob_for(digest)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            try:
+                if os.path.samefile(file_path, blob):
+                    return str(file_path.absolute())
+            except FileNotFoundError:
+                pass
+
+            link_path = file_path.with_name(f".{file_path.name}.{uuid4().hex}.tmp")
+            try:
+                self._link_blob(blob, temp_path, link_path)
+            except OSError:
+                shutil.copyfile(temp_path, link_path)
+            temp_path.unlink(missing_ok=True)
+            replaced_blob = self._linked_blob(file_path) if file_path.exists() else None
+            os.replace(link_path, file_path)
+            self._drop_if_unreferenced(replaced_blob)
+            # A copy fallback leaves the blob itself unreferenced.
+            self._drop_if_unreferenced(blob)
+        return str(file_path.absolute())
+
+    @staticmethod
+    def _link_blob(blob: Path, temp_path: Path, link_path: Path) -> None:
+        """Hard-link link_path to the blob, (re)writing the blob when it is missing."""
+        try:
+            os.link(blob, link_path)
+            return
+        except FileNotFoundError:
+            # Never written, or dropped by another process since it was seen.
+            pass
+        os.link(temp_path, link_path)
+        try:
+            os.link(link_path, blob)
+        except FileExistsError:
+            # Another process published the same content meanwhile; this path
+            # keeps its own copy instead of sharing that blob.
+            pass
+
+    def _delete(self, file_path: Path) -> bool:
+        with self._lock:
+            if not file_path.exists():
+                return False
+            blob = self._linked_blob(file_path)
+            file_path.unlink()
+            self._drop_if_unreferenced(blob)
+        return True
+
+    def _linked_blob(self, file_path: Path) -> Optional[Path]:
+        """
+        The blob a path links to, when that path is its last reference.
+
+        Only then (link count 2: the path and the blob) does removing the
+        path orphan the blob, so other files are never hashed.
+        """
+        if file_path.stat().st_nlink != 2:
+            return None
+        blob = self._blob_for(self._hash_file(file_path))
+        if blob.exists() and os.path.samefile(blob, file_path):
+            return blob
+        return None
+
+    @staticmethod
+    def _drop_if_unreferenced(blob: Optional[Path]) -> None:
+        if blob is not None and blob.exists() and blob.stat().st_nlink == 1:
+            blob.unlink()
@@ -4,20 +4,72 @@ SQLite implementation of Task repository.
 
 from __future__ import annotations
 
+import base64
+import binascii
 from datetime import datetime
 from difflib import SequenceMatcher
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, exists, func, or_, select, union_all
 from sqlalchemy import delete as sa_delete
-
-from app.core.exceptions import NotFoundError
-from app.infrastructure.local.database import TaskORM, get_session_factory
+from sqlalchemy.orm import aliased
+
+from app.core.exceptions import NotFoundError, ValidationError
+from app.infrastructure.local.database import (
+    ProjectORM,
+    SearchTermORM,
+    TaskAssignmentORM,
+    TaskORM,
+    get_session_factory,
+)
+from app.infrastructure.local.row_models import TrustedModelBuilder
+from app.infrastructure.local.search_index import (
+    delete_search_terms,
+    replace_search_terms,
+    task_search_texts,
+)
 from app.interfaces.task_repository import ITaskRepository
-from app.models.enums import TaskStatus
-from app.models.task import SimilarTask, Task, TaskCreate, TaskUpdate
+from app.models.enums import ProjectVisibility, TaskStatus
+from app.models.task import SimilarTask, Task, TaskCreate, TaskPage, TaskUpdate
 from app.utils.datetime_utils import now_utc
+from app.utils.search_terms import extract_search_terms
+
+_SEARCH_TEXT_FIELDS = ("title", "description", "purpose")
+# Sorts after every string starting with a given prefix.
+_TERM_RANGE_END = "\U0010ffff"
+
+# Bulk reads select plain column rows (no ORM identity map or instance
+# state) and build Task models from them without validation.
+_TASK_COLUMNS = tuple(TaskORM.__table__.columns)
+
+
+def _normalize_task(task: Task) -> Task:
+    """Apply TaskBase's fixed-time/touchpoint normalization to a built task."""
+    if task.is_all_day or task.is_fixed_time or task.touchpoint_steps:
+        return Task.validate_fixed_time(task)
+    return task
+
+
+_task_builder = TrustedModelBuilder(Task, post_init=_normalize_task)
+
+
+def _select_task_rows():
+    return select(*_TASK_COLUMNS)
+
+
+def _encode_cursor(row) -> str:
+    key = f"{row.created_at.isoformat()}|{row.id}"
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, task_id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), str(UUID(task_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValidationError(f"Invalid cursor: {cursor}") from exc
 
 
 class SqliteTaskRepository(ITaskRepository):
@@ -32,6 +84,28 @@ class SqliteTaskRepository(ITaskRepository):
         """
         self._session_factory = session_factory or get_session_factory()
 
+    @staticmethod
+    def _schedule_scope(user_id: str):
+        """Tasks assigned to the user, plus owned tasks outside TEAM projects."""
+        assigned_ids = select(TaskAssignmentORM.task_id).where(
+            TaskAssignmentORM.assignee_id == user_id
+        )
+        # Correlated on the task's project so it stays a primary key lookup.
+        in_team_project = exists().where(
+            and_(
+                ProjectORM.id == TaskORM.project_id,
+                ProjectORM.visibility == ProjectVisibility.TEAM.value,
+            )
+        )
+        return or_(
+            TaskORM.id.in_(assigned_ids),
+            and_(TaskORM.user_id == user_id, ~in_team_project),
+        )
+
+    def _rows_to_models(self, rows) -> list[Task]:
+        """Convert trusted task rows (bulk reads) to models without validation."""
+        return _task_builder.build_many(rows, validated=self._orm_to_model)
+
     def _orm_to_model(self, orm: TaskORM) -> Task:
         """Convert ORM object to Pydantic model."""
         return Task(
@@ -49,6 +123,7 @@ class SqliteTaskRepository(ITaskRepository):
             estimated_minutes=orm.estimated_minutes,
             due_date=orm.due_date,
             start_not_before=orm.start_not_before,
+            pinned_date=orm.pinned_date,
             parent_id=UUID(orm.parent_id) if orm.parent_id else None,
             order_in_parent=orm.order_in_parent,
             dependency_ids=[UUID(dep_id) for dep_id in (orm.dependency_ids or [])],
@@ -127,6 +202,7 @@ class SqliteTaskRepository(ITaskRepository):
                 requires_all_completion=task.requires_all_completion,
             )
             session.add(orm)
+            await replace_search_terms(session, orm.id, orm.user_id, task_search_texts(orm))
             await session.commit()
             await session.refresh(orm)
             return self._orm_to_model(orm)
@@ -171,6 +247,17 @@ class SqliteTaskRepository(ITaskRepository):
             orm = result.scalar_one_or_none()
             return self._orm_to_model(orm) if orm else None
 
+    async def get_owner_info(self, task_id: UUID) -> Optional[tuple[Optional[UUID], str]]:
+        """Get (project_id, owner user_id) for a task without loading the row."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(TaskORM.project_id, TaskORM.user_id).where(TaskORM.id == str(task_id))
+            )
+            row = result.first()
+            if not row:
+                return None
+            return (UUID(row.project_id) if row.project_id else None, row.user_id)
+
     async def list(
         self,
         user_id: str,
@@ -185,10 +272,10 @@ class SqliteTaskRepository(ITaskRepository):
         async with self._session_factory() as session:
             if project_id is not None:
                 # Project-based access: filter by project_id only
-                query = select(TaskORM).where(TaskORM.project_id == str(project_id))
+                query = _select_task_rows().where(TaskORM.project_id == str(project_id))
             else:
                 # Personal access (Inbox/schedule): filter by user_id
-                query = select(TaskORM).where(TaskORM.user_id == user_id)
+                query = _select_task_rows().where(TaskORM.user_id == user_id)
 
             if status:
                 query = query.where(TaskORM.status == status)
@@ -202,7 +289,72 @@ class SqliteTaskRepository(ITaskRepository):
             query = query.limit(limit).offset(offset)
 
             result = await session.execute(query)
-            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+            return self._rows_to_models(result.all())
+
+    async def list_page(
+        self,
+        user_id: str,
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        include_done: bool = False,
+        is_fixed_time: Optional[bool] = None,
+        assigned_scope: bool = False,
+        group_subtasks: bool = True,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> TaskPage:
+        """List one page of tasks ordered by (created_at, id) descending."""
+        if project_id is not None:
+            conditions = [TaskORM.project_id == str(project_id)]
+        elif assigned_scope:
+            conditions = [self._schedule_scope(user_id)]
+        else:
+            conditions = [TaskORM.user_id == user_id]
+
+        if status:
+            conditions.append(TaskORM.status == status)
+        elif not include_done:
+            conditions.append(TaskORM.status != TaskStatus.DONE.value)
+
+        if is_fixed_time:
+            conditions.append(TaskORM.is_fixed_time.is_(True))
+        elif is_fixed_time is not None:
+            conditions.append(or_(TaskORM.is_fixed_time.is_(False), TaskORM.is_fixed_time.is_(None)))
+
+        query = _select_task_rows().where(*conditions)
+        if group_subtasks:
+            query = query.where(TaskORM.parent_id.is_(None))
+        if cursor:
+            after_created_at, after_id = _decode_cursor(cursor)
+            query = query.where(
+                or_(
+                    TaskORM.created_at < after_created_at,
+                    and_(TaskORM.created_at == after_created_at, TaskORM.id < after_id),
+                )
+            )
+        elif offset:
+            query = query.offset(offset)
+        query = query.order_by(TaskORM.created_at.desc(), TaskORM.id.desc()).limit(limit + 1)
+
+        async with self._session_factory() as session:
+            rows = list((await session.execute(query)).all())
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+
+            subtasks = []
+            if group_subtasks and rows:
+                subtask_result = await session.execute(
+                    _select_task_rows()
+                    .where(TaskORM.parent_id.in_([row.id for row in rows]), *conditions)
+                    .order_by(TaskORM.created_at.desc(), TaskORM.id.desc())
+                )
+                subtasks = list(subtask_result.all())
+
+        return TaskPage(
+            tasks=self._rows_to_models(rows + subtasks),
+            next_cursor=_encode_cursor(rows[-1]) if has_more else None,
+        )
 
     async def update(self, user_id: str, task_id: UUID, update: TaskUpdate, project_id: Optional[UUID] = None) -> Task:
         """Update an existing task. If project_id given, uses project-based access."""
@@ -254,6 +406,8 @@ class SqliteTaskRepository(ITaskRepository):
                     setattr(orm, field, value)
 
             orm.updated_at = now_utc()
+            if any(field in update_data for field in _SEARCH_TEXT_FIELDS):
+                await replace_search_terms(session, orm.id, orm.user_id, task_search_texts(orm))
 
             # Auto-set completed_at/completed_by when status changes to DONE
             if status_value == TaskStatus.DONE.value and orm.completed_at is None:
@@ -314,6 +468,7 @@ class SqliteTaskRepository(ITaskRepository):
                 return False
 
             await session.delete(orm)
+            await delete_search_terms(session, orm.id)
             await session.commit()
             return True
 
@@ -351,18 +506,94 @@ class SqliteTaskRepository(ITaskRepository):
             similar.sort(key=lambda x: x.similarity_score, reverse=True)
             return similar[:limit]
 
+    async def search_by_keywords(
+        self,
+        user_id: str,
+        keywords: list[str],
+        project_id: Optional[UUID] = None,
+        include_done: bool = False,
+        leaf_only: bool = False,
+        limit: Optional[int] = 50,
+    ) -> list[UUID]:
+        """Search the user's schedulable tasks through the search_terms index."""
+        keyword_terms = [terms for terms in map(extract_search_terms, keywords) if terms]
+        all_terms = set().union(*keyword_terms)
+        if not all_terms:
+            return []
+
+        conditions = [self._schedule_scope(user_id)]
+        if project_id is not None:
+            conditions.append(TaskORM.project_id == str(project_id))
+        if not include_done:
+            conditions.append(TaskORM.status != TaskStatus.DONE.value)
+        if leaf_only:
+            child = aliased(TaskORM)
+            conditions.append(~exists().where(child.parent_id == TaskORM.id))
+
+        # A query term matches the indexed terms it is a prefix of (see
+        # app.utils.search_terms): a range seek on a term index.
+        ranges = [
+            and_(SearchTermORM.term >= term, SearchTermORM.term < term + _TERM_RANGE_END)
+            for term in sorted(all_terms)
+        ]
+        # Every drive starts from this user's data, so short keywords never
+        # walk other users' postings: own terms by (user_id, term) (one seek
+        # per term), assigned tasks and the projects of scoped tasks by
+        # entity_id.
+        assigned_ids = select(TaskAssignmentORM.task_id).where(TaskAssignmentORM.assignee_id == user_id)
+        scoped = aliased(TaskORM)
+        scoped_projects = union_all(
+            select(scoped.project_id).where(scoped.user_id == user_id, scoped.project_id.is_not(None)),
+            select(scoped.project_id).where(scoped.id.in_(assigned_ids), scoped.project_id.is_not(None)),
+        )
+        drives = [(TaskORM.id, and_(SearchTermORM.user_id == user_id, term_range)) for term_range in ranges]
+        drives += [
+            (TaskORM.id, and_(SearchTermORM.entity_id.in_(assigned_ids), or_(*ranges))),
+            (TaskORM.project_id, and_(SearchTermORM.entity_id.in_(scoped_projects), or_(*ranges))),
+        ]
+        query = union_all(
+            *(
+                select(SearchTermORM.term, TaskORM.id, TaskORM.due_date, TaskORM.created_at)
+                .join(TaskORM, entity_column == SearchTermORM.entity_id)
+                .where(drive_condition, *conditions)
+                for entity_column, drive_condition in drives
+            )
+        )
+        async with self._session_factory() as session:
+            rows = (await session.execute(query)).all()
+
+        terms_by_task: dict[str, set[str]] = {}
+        sort_info: dict[str, tuple] = {}
+        for indexed_term, task_id, due_date, created_at in rows:
+            terms_by_task.setdefault(task_id, set()).update(
+                term for term in all_terms if indexed_term.startswith(term)
+            )
+            sort_info[task_id] = (
+                due_date is None,
+                due_date or datetime.max,
+                created_at or datetime.max,
+            )
+
+        ranked = []
+        for task_id, terms in terms_by_task.items():
+            score = sum(1 for required in keyword_terms if required <= terms)
+            if score:
+                ranked.append((-score, *sort_info[task_id], task_id))
+        ranked.sort()
+        return [UUID(entry[-1]) for entry in ranked[:limit]]
+
     async def get_by_capture_id(self, user_id: str, capture_id: UUID) -> list[Task]:
         """Get tasks created from a specific capture."""
         async with self._session_factory() as session:
             result = await session.execute(
-                select(TaskORM).where(
+                _select_task_rows().where(
                     and_(
                         TaskORM.user_id == user_id,
                         TaskORM.source_capture_id == str(capture_id),
                     )
                 )
             )
-            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+            return self._rows_to_models(result.all())
 
     async def get_subtasks(self, user_id: str, parent_id: UUID, project_id: Optional[UUID] = None) -> list[Task]:
         """Get all subtasks of a parent task."""
@@ -374,9 +605,9 @@ class SqliteTaskRepository(ITaskRepository):
             return []
         async with self._session_factory() as session:
             result = await session.execute(
-                select(TaskORM).where(TaskORM.id.in_([str(tid) for tid in task_ids]))
+                _select_task_rows().where(TaskORM.id.in_([str(tid) for tid in task_ids]))
             )
-            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+            return self._rows_to_models(result.all())
 
     async def list_personal_tasks(
         self,
@@ -384,10 +615,11 @@ class SqliteTaskRepository(ITaskRepository):
         status: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        include_done: bool = True,
     ) -> list[Task]:
         """List personal tasks (Inbox/Memo) - excluding project tasks."""
         async with self._session_factory() as session:
-            query = select(TaskORM).where(
+            query = _select_task_rows().where(
                 and_(
                     TaskORM.user_id == user_id,
                     TaskORM.project_id.is_(None)
@@ -396,20 +628,14 @@ class SqliteTaskRepository(ITaskRepository):
 
             if status:
                 query = query.where(TaskORM.status == status)
-            else:
-                # Default behavior: exclude DONE unless specified?
-                # Replicating list() default behavior logic or just basic filtering?
-                # list() implementation: if not include_done: query = query.where(status != DONE)
-                # But here we stick to the args. If status is None, we return all statuses unless caller filters.
-                # Actually, list() has include_done.
-                # Let's add include_done to signature to match list().
-                pass
+            elif not include_done:
+                query = query.where(TaskORM.status != TaskStatus.DONE.value)
 
             query = query.order_by(TaskORM.created_at.desc())
             query = query.limit(limit).offset(offset)
 
             result = await session.execute(query)
-            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+            return self._rows_to_models(result.all())
 
     async def count(
         self,
@@ -439,7 +665,7 @@ class SqliteTaskRepository(ITaskRepository):
     ) -> list["Task"]:
         """List tasks generated from a recurring meeting."""
         async with self._session_factory() as session:
-            query = select(TaskORM).where(
+            query = _select_task_rows().where(
                 and_(
                     TaskORM.user_id == user_id,
                     TaskORM.recurring_meeting_id == str(recurring_meeting_id),
@@ -454,7 +680,7 @@ class SqliteTaskRepository(ITaskRepository):
             query = query.order_by(TaskORM.start_time.asc())
 
             result = await session.execute(query)
-            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+            return self._rows_to_models(result.all())
 
     async def list_by_recurring_task(
         self,
@@ -465,7 +691,7 @@ class SqliteTaskRepository(ITaskRepository):
     ) -> list["Task"]:
         """List tasks generated from a recurring task definition."""
         async with self._session_factory() as session:
-            query = select(TaskORM).where(
+            query = _select_task_rows().where(
                 and_(
                     TaskORM.user_id == user_id,
                     TaskORM.recurring_task_id == str(recurring_task_id),
@@ -480,7 +706,7 @@ class SqliteTaskRepository(ITaskRepository):
             query = query.order_by(TaskORM.due_date.asc())
 
             result = await session.execute(query)
-            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+            return self._rows_to_models(result.all())
 
     async def delete_by_recurring_task(
         self,
@@ -547,8 +773,8 @@ class SqliteTaskRepository(ITaskRepository):
                 )
             )
 
-            query = select(TaskORM).where(and_(*conditions))
+            query = _select_task_rows().where(and_(*conditions))
             query = query.order_by(TaskORM.completed_at.desc().nullslast(), TaskORM.updated_at.desc())
 
             result = await session.execute(query)
-            return [self._orm_to_model(orm) for orm in result.scalars().all()]
+            return self._rows_to_models(result.all())
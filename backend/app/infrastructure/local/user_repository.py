@@ -72,6 +72,44 @@ class SqliteUserRepository(IUserRepository):
             orm = result.scalar_one_or_none()
             return self._orm_to_model(orm) if orm else None
 
+    async def get_many(self, identifiers: list[str]) -> dict[str, UserAccount]:
+        unique = list(dict.fromkeys(identifiers))
+        if not unique:
+            return {}
+        user_ids: list[str] = []
+        for identifier in unique:
+            try:
+                user_ids.append(str(UUID(identifier)))
+            except (ValueError, TypeError):
+                continue
+        emails = [identifier for identifier in unique if "@" in identifier]
+        conditions = [UserORM.username.in_(unique)]
+        if user_ids:
+            conditions.append(UserORM.id.in_(user_ids))
+        if emails:
+            conditions.append(UserORM.email.in_(emails))
+        async with self._session_factory() as session:
+            result = await session.execute(select(UserORM).where(or_(*conditions)))
+            users = [self._orm_to_model(orm) for orm in result.scalars().all()]
+
+        by_id = {str(user.id): user for user in users}
+        by_email = {user.email: user for user in users if user.email}
+        by_username = {user.username: user for user in users if user.username}
+        resolved: dict[str, UserAccount] = {}
+        for identifier in unique:
+            user = None
+            try:
+                user = by_id.get(str(UUID(identifier)))
+            except (ValueError, TypeError):
+                pass
+            if not user and "@" in identifier:
+                user = by_email.get(identifier)
+            if not user:
+                user = by_username.get(identifier)
+            if user:
+                resolved[identifier] = user
+        return resolved
+
     async def create(self, data: UserCreate) -> UserAccount:
         async with self._session_factory() as session:
             orm = UserORM(
@@ -7,9 +7,11 @@ Defines the contract for chat history persistence.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
+from uuid import UUID
 
-from app.models.chat_session import ChatMessage, ChatSession
+from app.models.chat_session import ChatHistorySummary, ChatMessage, ChatSession
 
 
 class IChatSessionRepository(ABC):
@@ -100,3 +102,145 @@ class IChatSessionRepository(ABC):
             List of chat messages
         """
         pass
+
+    @abstractmethod
+    async def list_recent_messages(
+        self,
+        user_id: str,
+        session_id: str,
+        limit: int = 50,
+        after: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+    ) -> list[ChatMessage]:
+        """
+        List the most recent messages for a session.
+
+        Args:
+            user_id: Owner user ID
+            session_id: Session ID
+            limit: Max messages (newest are kept)
+            after: Only include messages after this created_at
+            after_id: Cursor tie-break; messages created exactly at ``after``
+                are included when their ID sorts after it
+
+        Returns:
+            List of chat messages in chronological order
+        """
+        pass
+
+    @abstractmethod
+    async def list_messages_after(
+        self,
+        user_id: str,
+        session_id: str,
+        after: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+        limit: int = 200,
+    ) -> list[ChatMessage]:
+        """
+        List the oldest messages after a (created_at, id) cursor.
+
+        Args:
+            user_id: Owner user ID
+            session_id: Session ID
+            after: Cursor created_at (None starts at the first message)
+            after_id: Cursor message ID (tie-break for equal created_at)
+            limit: Max messages (oldest are kept)
+
+        Returns:
+            List of chat messages in chronological order
+        """
+        pass
+
+    @abstractmethod
+    async def get_history_summary(
+        self,
+        user_id: str,
+        session_id: str,
+    ) -> Optional[ChatHistorySummary]:
+        """
+        Get the rolling history summary for a session.
+
+        Args:
+            user_id: Owner user ID
+            session_id: Session ID
+
+        Returns:
+            ChatHistorySummary if the session has been compacted, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def save_history_summary(
+        self,
+        user_id: str,
+        session_id: str,
+        summary: str,
+        summarized_until: datetime,
+        summarized_message_count: int,
+        source_tokens: int,
+        summary_tokens: int,
+        summarized_until_id: Optional[UUID] = None,
+        previous: Optional[ChatHistorySummary] = None,
+    ) -> Optional[ChatHistorySummary]:
+        """
+        Create or replace the rolling history summary for a session.
+
+        The write is a compare-and-set on the summary cursor: it only applies
+        while the stored (summarized_until, summarized_until_id) still equals
+        ``previous``'s, or while no summary exists when ``previous`` is None.
+
+        Args:
+            user_id: Owner user ID
+            session_id: Session ID
+            summary: Summary text
+            summarized_until: created_at of the last summarized message
+            summarized_message_count: Total messages folded into the summary
+            source_tokens: Estimated tokens of all summarized messages
+            summary_tokens: Estimated tokens of the summary text
+            summarized_until_id: ID of the last summarized message
+            previous: Summary the new one was built on (None = first summary)
+
+        Returns:
+            Saved ChatHistorySummary, or None if another write moved the cursor first
+        """
+        pass
+
+    @abstractmethod
+    async def get_id_aliases(
+        self,
+        user_id: str,
+        session_id: str,
+    ) -> dict[str, str]:
+        """
+        Get the short ID aliases of a session.
+
+        Args:
+            user_id: Owner user ID
+            session_id: Session ID
+
+        Returns:
+            Mapping of alias to full entity ID
+        """
+        pass
+
+    @abstractmethod
+    async def save_id_aliases(
+        self,
+        user_id: str,
+        session_id: str,
+        aliases: dict[str, str],
+    ) -> dict[str, str]:
+        """
+        Store new short ID aliases of a session (existing aliases are kept).
+
+        Args:
+            user_id: Owner user ID
+            session_id: Session ID
+            aliases: Mapping of alias to full entity ID
+
+        Returns:
+            The stored entity ID of each given alias; differs from the given
+            one when the alias was already stored for another entity
+        """
+        pass
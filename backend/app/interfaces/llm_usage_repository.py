@@ -0,0 +1,36 @@
+"""
+LLM usage ledger repository interface.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from app.models.llm_usage import LlmUsageGroupBy, LlmUsageRecord, LlmUsageSummary
+
+
+class ILlmUsageRepository(ABC):
+    """Append-only store of LLM usage records."""
+
+    @abstractmethod
+    async def add_many(self, records: list[LlmUsageRecord]) -> int:
+        """Insert a batch of usage records; returns the number written."""
+        pass
+
+    @abstractmethod
+    async def summarize(
+        self,
+        since: datetime,
+        until: Optional[datetime] = None,
+        group_by: LlmUsageGroupBy = "feature",
+        user_id: Optional[str] = None,
+    ) -> list[LlmUsageSummary]:
+        """Aggregate calls, tokens, latency and cost per group, costliest first."""
+        pass
+
+    @abstractmethod
+    async def spend_by_feature(self, user_id: str, since: datetime) -> dict[str, float]:
+        """Total cost per feature of a user's calls since a point in time."""
+        pass
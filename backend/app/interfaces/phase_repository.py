@@ -23,6 +23,11 @@ class IPhaseRepository(ABC):
         """Get a phase by ID. If project_id is given, uses project-based access."""
         pass
 
+    @abstractmethod
+    async def get_many(self, phase_ids: list[UUID]) -> list[Phase]:
+        """Get several phases by ID without user check (one query; missing IDs are skipped)."""
+        pass
+
     @abstractmethod
     async def get_project_id(self, phase_id: UUID) -> UUID | None:
         """Get project ID for a phase."""
@@ -36,6 +36,11 @@ class IProjectMemberRepository(ABC):
         """List members for a project without user check (for system/background processes)."""
         pass
 
+    @abstractmethod
+    async def list_by_member_user_id(self, member_user_id: str) -> list[ProjectMember]:
+        """List memberships of a user across all projects."""
+        pass
+
     @abstractmethod
     async def get_by_project_and_member_user_id(
         self, project_id: UUID, member_user_id: str
@@ -57,6 +57,19 @@ class IProjectRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_many(self, project_ids: list[UUID]) -> list[Project]:
+        """
+        Get several projects by ID without user check (one query).
+
+        Args:
+            project_ids: Project IDs
+
+        Returns:
+            Found projects (missing IDs are skipped)
+        """
+        pass
+
     @abstractmethod
     async def list(
         self,
@@ -97,6 +110,24 @@ class IProjectRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_with_task_count(
+        self,
+        user_id: str,
+        project_id: UUID,
+    ) -> Optional[ProjectWithTaskCount]:
+        """
+        Get a single accessible project with task statistics.
+
+        Args:
+            user_id: User ID (owner or member)
+            project_id: Project ID
+
+        Returns:
+            Project with task counts, or None if not accessible
+        """
+        pass
+
     @abstractmethod
     async def update(
         self, user_id: str, project_id: UUID, update: ProjectUpdate
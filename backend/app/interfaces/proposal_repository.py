@@ -1,6 +1,7 @@
 """Interface for proposal repository."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -48,15 +49,42 @@ class IProposalRepository(ABC):
         pass
 
     @abstractmethod
-    async def update_status(self, proposal_id: UUID, status: ProposalStatus) -> Optional[Proposal]:
+    async def update_status(
+        self,
+        proposal_id: UUID,
+        status: ProposalStatus,
+        expected_status: Optional[ProposalStatus] = None,
+    ) -> Optional[Proposal]:
         """Update the status of a proposal.
 
         Args:
             proposal_id: The proposal ID
             status: The new status
+            expected_status: Only update a proposal currently in this status
+                (an unexpired one for PENDING); the check and the update are
+                atomic, so concurrent approvals cannot both succeed
 
         Returns:
-            The updated proposal if found, None otherwise
+            The updated proposal if found (and in the expected status), None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def update_status_many(
+        self,
+        user_id: UUID,
+        proposal_ids: list[UUID],
+        status: ProposalStatus,
+    ) -> list[UUID]:
+        """Move a user's unexpired pending proposals to a new status.
+
+        Args:
+            user_id: The user ID
+            proposal_ids: The proposal IDs
+            status: The new status
+
+        Returns:
+            IDs of the proposals that were updated
         """
         pass
 
@@ -72,6 +100,37 @@ class IProposalRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def expire_stale(self, now: Optional[datetime] = None) -> int:
+        """Mark pending proposals past their expiry as EXPIRED (all users).
+
+        Returns:
+            Number of proposals expired
+        """
+        pass
+
+    @abstractmethod
+    async def fail_stale_executions(self, started_before: datetime) -> int:
+        """Mark proposals EXECUTING since before a point in time as FAILED (all users).
+
+        An approval whose worker died mid-execution would otherwise stay
+        EXECUTING forever. Its action may have partly run, so it is never
+        retried automatically.
+
+        Returns:
+            Number of proposals failed
+        """
+        pass
+
+    @abstractmethod
+    async def purge(self, expired_before: datetime) -> int:
+        """Delete proposals that expired before a point in time (all users).
+
+        Returns:
+            Number of proposals deleted
+        """
+        pass
+
     @abstractmethod
     async def delete(self, proposal_id: UUID) -> bool:
         """Delete a proposal.
@@ -0,0 +1,53 @@
+"""
+Realtime broker interface.
+
+Carries realtime events from the process that published them to the SSE
+connections of every process.
+Implementations: in-process (single worker), SQLite polling (workers sharing
+one database)
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable, Optional
+
+from app.models.realtime import RealtimeEvent
+
+# handler(recipient user IDs or None for everyone, event, publish time.time(),
+#         published by another process)
+BrokerHandler = Callable[[Optional[frozenset[str]], RealtimeEvent, float, bool], None]
+
+
+class IRealtimeBroker(ABC):
+    """Fan-out of realtime events to all processes."""
+
+    @abstractmethod
+    def subscribe(self, handler: BrokerHandler) -> None:
+        """Register the local delivery handler of this process."""
+        pass
+
+    @abstractmethod
+    async def publish(self, user_ids: Optional[Iterable[str]], event: RealtimeEvent) -> None:
+        """
+        Publish an event to every process.
+
+        Args:
+            user_ids: Recipients, or None for every connection
+            event: Event to deliver
+        """
+        pass
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start receiving other processes' events (idempotent)."""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        """Published / received counts and delivery lag."""
+        pass
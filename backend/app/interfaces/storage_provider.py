@@ -6,7 +6,7 @@ Implementations: Local file system, Google Cloud Storage, S3
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 
 class IStorageProvider(ABC):
@@ -52,6 +52,65 @@ class IStorageProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    async def upload_stream(
+        self,
+        path: str,
+        chunks: AsyncIterator[bytes],
+        content_type: Optional[str] = None,
+    ) -> str:
+        """
+        Upload a file from a stream of chunks without buffering it whole.
+
+        Args:
+            path: Destination path
+            chunks: File content chunks
+            content_type: Optional MIME type
+
+        Returns:
+            URL or path to access the uploaded file
+
+        Raises:
+            InfrastructureError: If upload fails
+        """
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        path: str,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Read a file (or the byte range [start, end]) as chunks.
+
+        Args:
+            path: File path or URL
+            start: First byte offset
+            end: Last byte offset, inclusive (None = end of file)
+
+        Returns:
+            Async iterator of content chunks
+
+        Raises:
+            NotFoundError: If file not found (on first iteration)
+        """
+        pass
+
+    @abstractmethod
+    async def size(self, path: str) -> int:
+        """
+        Get the size of a file in bytes.
+
+        Args:
+            path: File path or URL
+
+        Raises:
+            NotFoundError: If file not found
+        """
+        pass
+
     @abstractmethod
     async def delete(self, path: str) -> bool:
         """
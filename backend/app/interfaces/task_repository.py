@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from app.models.task import SimilarTask, Task, TaskCreate, TaskUpdate
+from app.models.task import SimilarTask, Task, TaskCreate, TaskPage, TaskUpdate
 
 
 class ITaskRepository(ABC):
@@ -80,6 +80,71 @@ class ITaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_personal_tasks(
+        self,
+        user_id: str,
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        include_done: bool = True,
+    ) -> list[Task]:
+        """
+        List personal tasks (Inbox/Memo), excluding project tasks.
+
+        Args:
+            user_id: Owner user ID
+            status: Filter by status
+            limit: Maximum number of results
+            offset: Pagination offset
+            include_done: Include completed tasks (ignored when status is given)
+
+        Returns:
+            Personal tasks, newest first
+        """
+        pass
+
+    @abstractmethod
+    async def list_page(
+        self,
+        user_id: str,
+        project_id: Optional[UUID] = None,
+        status: Optional[str] = None,
+        include_done: bool = False,
+        is_fixed_time: Optional[bool] = None,
+        assigned_scope: bool = False,
+        group_subtasks: bool = True,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> TaskPage:
+        """
+        List one page of tasks, newest first, with keyset pagination.
+
+        With group_subtasks, pages are cut on parent (top-level) tasks and
+        the matching subtasks of the page's parents are appended.
+
+        Args:
+            user_id: User ID
+            project_id: Project scope (project-based access, no user_id filter)
+            status: Filter by status
+            include_done: Include DONE tasks (ignored when status is given)
+            is_fixed_time: Only meetings (True) or only non-meetings (False)
+            assigned_scope: Without project_id, list the user's own schedule
+                scope (see search_by_keywords) instead of owned tasks
+            group_subtasks: Paginate parents and append their subtasks
+            cursor: next_cursor of the previous page
+            offset: Offset for the first page (ignored with cursor)
+            limit: Maximum number of (parent) tasks per page
+
+        Returns:
+            The page and the cursor of the next page
+
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
+        pass
+
     @abstractmethod
     async def update(
         self,
@@ -149,6 +214,39 @@ class ITaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def search_by_keywords(
+        self,
+        user_id: str,
+        keywords: list[str],
+        project_id: UUID | None = None,
+        include_done: bool = False,
+        leaf_only: bool = False,
+        limit: Optional[int] = 50,
+    ) -> list[UUID]:
+        """
+        Search the tasks on a user's own schedule by keywords.
+
+        Scope: tasks assigned to the user, plus tasks the user owns outside
+        TEAM projects. Every task whose title, description, purpose or
+        project name contains a keyword (case-insensitive substring) is a
+        match. The index may also return tasks that only contain all of the
+        keyword's words or bigrams in different places; callers needing exact
+        substring matches re-check the loaded tasks.
+
+        Args:
+            user_id: User ID
+            keywords: Keywords (a task matching more keywords ranks higher)
+            project_id: Optional project scope
+            include_done: Include DONE tasks
+            leaf_only: Exclude tasks that have subtasks
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            Task IDs ranked by matched keywords, then due date and creation time
+        """
+        pass
+
     @abstractmethod
     async def get_by_capture_id(self, user_id: str, capture_id: UUID) -> list[Task]:
         """
@@ -303,3 +401,19 @@ class ITaskRepository(ABC):
             Task if found, None otherwise
         """
         pass
+
+    @abstractmethod
+    async def get_owner_info(self, task_id: UUID) -> Optional[tuple[Optional[UUID], str]]:
+        """
+        Get the project ID and owner user ID of a task without loading it.
+
+        Used by authorization paths to locate a task without scanning every
+        accessible project.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Tuple of (project_id, owner user_id), or None if the task does not exist
+        """
+        pass
@@ -34,6 +34,23 @@ class IUserRepository(ABC):
         """Get a user by username."""
         pass
 
+    @abstractmethod
+    async def get_many(self, identifiers: list[str]) -> dict[str, UserAccount]:
+        """
+        Resolve several users in one lookup.
+
+        Each identifier is matched like a project member ID: as a user ID,
+        then as an email (when it contains "@"), then as a username.
+
+        Args:
+            identifiers: User IDs, emails or usernames
+
+        Returns:
+            Mapping of each resolved identifier to its user (unresolved
+            identifiers are omitted)
+        """
+        pass
+
     @abstractmethod
     async def create(self, data: UserCreate) -> UserAccount:
         """Create a new user."""
@@ -5,6 +5,7 @@ These models persist chat history for session restore.
 """
 
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -45,3 +46,22 @@ class ChatMessage(ChatMessageBase):
     id: UUID
     user_id: str = Field(..., description="Owner user ID")
     created_at: datetime
+
+
+class ChatHistorySummary(BaseModel):
+    """Rolling summary of older messages in a chat session."""
+
+    session_id: str = Field(..., max_length=100, description="Chat session ID")
+    user_id: str = Field(..., description="Owner user ID")
+    summary: str = Field("", description="Summary of the compacted messages")
+    summarized_until: datetime = Field(
+        ..., description="created_at of the last message folded into the summary"
+    )
+    summarized_until_id: Optional[UUID] = Field(
+        None, description="ID of the last message folded into the summary (cursor tie-break)"
+    )
+    summarized_message_count: int = Field(0, ge=0, description="Number of compacted messages")
+    source_tokens: int = Field(0, ge=0, description="Estimated tokens of the compacted messages")
+    summary_tokens: int = Field(0, ge=0, description="Estimated tokens of the summary")
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,55 @@
+"""
+LLM usage ledger models.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field
+
+from app.utils.datetime_utils import now_utc
+
+LlmUsageGroupBy = Literal["feature", "model", "user_id"]
+
+
+class LlmUsageRecord(BaseModel):
+    """One LLM call (or one agent turn) as recorded in the usage ledger."""
+
+    id: UUID = Field(default_factory=uuid4)
+    user_id: Optional[str] = Field(None, description="User the call was made for")
+    feature: str = Field(..., description="Feature / call site (e.g. chat, heartbeat)")
+    model: str = Field(..., description="Model identifier")
+    input_tokens: int = Field(0, ge=0)
+    output_tokens: int = Field(0, ge=0)
+    latency_ms: float = Field(0.0, ge=0)
+    retries: int = Field(0, ge=0, description="Earlier attempts of the same request")
+    success: bool = True
+    cost_usd: Optional[float] = Field(None, description="Estimated cost in USD")
+    created_at: datetime = Field(default_factory=now_utc)
+
+
+class LlmUsageSummary(BaseModel):
+    """Aggregated usage of one group (feature, model or user)."""
+
+    key: Optional[str] = Field(None, description="Group value (None for calls without a user)")
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    avg_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+
+class LlmBudgetStatus(BaseModel):
+    """Today's spend of a user against the background LLM budgets."""
+
+    user_id: str
+    spent_today_usd: float
+    daily_budget_usd: Optional[float] = None
+    feature_spent_today_usd: dict[str, float] = Field(default_factory=dict)
+    feature_daily_budgets_usd: dict[str, float] = Field(default_factory=dict)
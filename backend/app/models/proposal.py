@@ -20,9 +20,16 @@ class ProposalType(str, Enum):
 
 
 class ProposalStatus(str, Enum):
-    """Status of a proposal."""
+    """Status of a proposal.
+
+    An approval claims the proposal (PENDING -> EXECUTING) before running its
+    action and settles it as APPROVED or FAILED afterwards. Proposals left
+    EXECUTING by a crashed worker are failed by the expiry sweep.
+    """
     PENDING = "pending"
+    EXECUTING = "executing"
     APPROVED = "approved"
+    FAILED = "failed"
     REJECTED = "rejected"
     EXPIRED = "expired"
 
@@ -46,6 +53,7 @@ class Proposal(BaseModel):
     expires_at: datetime = Field(
         default_factory=lambda: datetime.now() + timedelta(hours=24)
     )
+    updated_at: Optional[datetime] = None  # Last status change
 
     class Config:
         json_encoders = {
@@ -77,3 +85,27 @@ class ApprovalResult(BaseModel):
 class RejectionResult(BaseModel):
     """Result of rejecting a proposal."""
     status: str = "rejected"
+
+
+class ProposalBulkRequest(BaseModel):
+    """Proposals to approve or reject in one request."""
+    proposal_ids: list[UUID] = Field(..., min_length=1, max_length=100)
+
+
+class BulkApprovalItem(BaseModel):
+    """Outcome of one proposal in a bulk approval."""
+    proposal_id: str
+    status: str  # approved / failed
+    result: Optional[ApprovalResult] = None
+    detail: Optional[str] = None
+
+
+class BulkApprovalResult(BaseModel):
+    """Result of approving several proposals."""
+    results: list[BulkApprovalItem]
+
+
+class BulkRejectionResult(BaseModel):
+    """Result of rejecting several proposals."""
+    status: str = "rejected"
+    rejected: list[str]
@@ -0,0 +1,54 @@
+"""
+Realtime (SSE) event models.
+"""
+
+from __future__ import annotations
+
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+RealtimeEventType = Literal["connected", "change", "resync", "revision"]
+RealtimeChangeOp = Literal["created", "updated", "deleted"]
+
+
+class RealtimeEvent(BaseModel):
+    """
+    One event on a realtime stream.
+
+    - connected: the stream is open
+    - change: an entity was created, updated or deleted
+    - resync: events were dropped (the connection fell behind); refetch
+    - revision: data revision scopes a commit bumped, relayed between
+      workers and never sent to clients
+    """
+
+    type: RealtimeEventType = "change"
+    kind: Optional[str] = Field(None, description="Entity kind (task, project, task_assignment, ...)")
+    op: Optional[RealtimeChangeOp] = None
+    id: Optional[str] = Field(None, description="Entity ID (None for bulk changes)")
+    project_id: Optional[str] = None
+    task_id: Optional[str] = Field(None, description="Task of a task-owned entity (assignment, blocker)")
+    fields: list[str] = Field(default_factory=list, description="Changed fields of an update")
+    scopes: Optional[list[str]] = Field(None, description="Bumped revision scopes (kind:value)")
+
+    @property
+    def coalesce_key(self) -> Optional[tuple[str, str]]:
+        """Events with the same key replace each other while queued."""
+        if self.type != "change" or not self.kind or not self.id:
+            return None
+        return self.kind, self.id
+
+    def merge(self, newer: "RealtimeEvent") -> "RealtimeEvent":
+        """Combine a queued event with a newer one for the same entity."""
+        if newer.op == "deleted" or self.op == "deleted":
+            op = newer.op
+        elif self.op == "created":
+            op = "created"
+        else:
+            op = newer.op
+        fields = [] if op != "updated" else sorted(set(self.fields) | set(newer.fields))
+        return newer.model_copy(update={"op": op, "fields": fields})
+
+    def to_json(self) -> str:
+        return self.model_dump_json(exclude_none=True)
@@ -68,6 +68,9 @@ class TaskPlanSnapshot(BaseModel):
     task_id: UUID
     title: str
     fingerprint: str
+    # Status/progress at plan time (not part of the stale check, used to
+    # find the first day affected when re-planning incrementally).
+    state: Optional[str] = None
 
 
 class PendingChange(BaseModel):
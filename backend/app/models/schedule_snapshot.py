@@ -111,7 +111,9 @@ class ScheduleSnapshotSummary(BaseModel):
     name: str
     is_active: bool
     start_date: date
+    end_date: Optional[date] = None
     task_count: int
+    total_task_minutes: int = 0
     total_buffer_minutes: int
     consumed_buffer_minutes: int
     buffer_percentage: float = Field(..., description="残りバッファ（%）")
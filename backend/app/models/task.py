@@ -227,6 +227,13 @@ class TaskWithSubtasks(Task):
     subtasks: list["Task"] = Field(default_factory=list)
 
 
+class TaskPage(BaseModel):
+    """One page of a task listing: parent tasks first, then their subtasks."""
+
+    tasks: list[Task] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page (None on the last page)")
+
+
 class SimilarTask(BaseModel):
     """Similar task result for duplicate detection."""
 
@@ -0,0 +1,202 @@
+"""
+Token-budgeted task section builder for achievement prompts.
+
+Completed tasks are rendered per group (project/phase for personal
+achievements, member for project achievements). When the detailed rendering
+exceeds the token budget, the largest groups are condensed by a first LLM pass
+(run concurrently) so that the final prompt stays within the budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from app.core.config import get_settings
+from app.core.logger import logger
+from app.interfaces.llm_provider import ILLMProvider
+from app.services import llm_utils
+from app.services.llm_usage_service import llm_usage_scope
+from app.utils.token_utils import estimate_tokens, truncate_to_tokens
+
+GROUP_SUMMARY_INSTRUCTION = (
+    "あなたは完了タスクの一覧を要約するアシスタントです。"
+    "成果・取り組んだ領域・特筆すべき工夫が分かるように、箇条書きで簡潔にまとめてください。"
+)
+# Tokens reserved for the group header and overflow marker lines.
+_GROUP_OVERHEAD_TOKENS = 20
+
+
+@dataclass
+class PromptTaskGroup:
+    """A group of rendered task entries (e.g. one project/phase or one member)."""
+
+    key: str
+    label: str
+    entries: list[str] = field(default_factory=list)
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.render())
+
+    def render(self) -> str:
+        lines = [f"### {self.label} ({len(self.entries)}タスク)"]
+        lines.extend(self.entries)
+        return "\n".join(lines)
+
+
+@dataclass
+class PromptBudgetUsage:
+    """Token budget accounting for one built task section."""
+
+    budget_tokens: int
+    used_tokens: int = 0
+    full_tokens: int = 0
+    task_count: int = 0
+    group_count: int = 0
+    detailed_groups: int = 0
+    summarized_groups: int = 0
+    fallback_groups: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+async def _summarize_group(
+    llm_provider: Optional[ILLMProvider],
+    group: PromptTaskGroup,
+    max_tokens: int,
+    input_tokens: int,
+    semaphore: asyncio.Semaphore,
+) -> Optional[str]:
+    if not llm_provider or max_tokens <= 0:
+        return None
+    source = truncate_to_tokens(group.render(), input_tokens)
+    prompt = (
+        f"{source}\n\n"
+        f"上記の完了タスク（{len(group.entries)}件）を{max_tokens}トークン以内で要約してください。"
+    )
+    async with semaphore:
+        try:
+            # Worker threads inherit the context, so the scope applies there.
+            with llm_usage_scope("achievement_group_summary"):
+                text = await asyncio.to_thread(
+                    llm_utils.generate_text,
+                    llm_provider=llm_provider,
+                    prompt=prompt,
+                    temperature=0.2,
+                    max_output_tokens=max_tokens,
+                    system_instruction=GROUP_SUMMARY_INSTRUCTION,
+                )
+        except Exception as exc:
+            logger.warning(f"Achievement group summary failed for {group.key}: {exc}")
+            return None
+    text = (text or "").strip()
+    return truncate_to_tokens(text, max_tokens) if text else None
+
+
+def _fallback_group_text(group: PromptTaskGroup, max_tokens: int) -> str:
+    """Keep as many leading entries as fit, then note how many were omitted."""
+    kept: list[str] = []
+    used = 0
+    for entry in group.entries:
+        first_line = entry.split("\n", 1)[0]
+        cost = estimate_tokens(first_line) + 1
+        if used + cost > max_tokens:
+            break
+        kept.append(first_line)
+        used += cost
+    omitted = len(group.entries) - len(kept)
+    if omitted:
+        kept.append(f"- ...他{omitted}タスク")
+    return "\n".join(kept)
+
+
+async def build_budgeted_task_section(
+    groups: list[PromptTaskGroup],
+    title: str,
+    llm_provider: Optional[ILLMProvider] = None,
+    budget_tokens: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+) -> tuple[str, PromptBudgetUsage]:
+    """
+    Render task groups into a prompt section that fits the token budget.
+
+    Groups are kept in detail smallest-first; the remaining (overflow) groups
+    are condensed by the LLM in parallel, or truncated to their leading entries
+    when the LLM is unavailable.
+
+    Args:
+        groups: Task groups in display order
+        title: Section heading (without leading '##')
+        llm_provider: LLM provider for the first-pass group summaries
+        budget_tokens: Token budget for the section (defaults to settings)
+        max_concurrency: Max concurrent summary calls (defaults to settings)
+
+    Returns:
+        Tuple of (section text, budget usage)
+    """
+    settings = get_settings()
+    budget = budget_tokens or settings.ACHIEVEMENT_PROMPT_TOKEN_BUDGET
+    concurrency = max_concurrency or settings.ACHIEVEMENT_SUMMARY_CONCURRENCY
+    header = f"## {title}"
+    usage = PromptBudgetUsage(
+        budget_tokens=budget,
+        task_count=sum(len(g.entries) for g in groups),
+        group_count=len(groups),
+    )
+
+    group_tokens = {g.key: g.tokens for g in groups}
+    full_text = "\n\n".join([header, *[g.render() for g in groups]])
+    usage.full_tokens = estimate_tokens(full_text)
+
+    if usage.full_tokens <= budget:
+        usage.used_tokens = usage.full_tokens
+        usage.detailed_groups = len(groups)
+        return full_text, usage
+
+    # Keep the smallest groups verbatim while leaving room for every overflow
+    # group to get at least a header and a short summary.
+    remaining = budget - estimate_tokens(header)
+    detailed: set[str] = set()
+    ordered = sorted(groups, key=lambda g: group_tokens[g.key])
+    for index, group in enumerate(ordered):
+        overflow_after = len(ordered) - index - 1
+        reserve = overflow_after * _GROUP_OVERHEAD_TOKENS * 3
+        if group_tokens[group.key] + reserve > remaining:
+            break
+        detailed.add(group.key)
+        remaining -= group_tokens[group.key]
+
+    overflow = [g for g in groups if g.key not in detailed]
+    per_group = max(0, remaining // max(1, len(overflow)) - _GROUP_OVERHEAD_TOKENS)
+    # Cap what each first-pass call reads so summary cost stays bounded too.
+    input_cap = max(per_group * 4, budget // 2)
+    semaphore = asyncio.Semaphore(concurrency)
+    summaries = await asyncio.gather(
+        *[
+            _summarize_group(llm_provider, g, per_group, input_cap, semaphore)
+            for g in overflow
+        ]
+    )
+    summary_by_key = {g.key: s for g, s in zip(overflow, summaries)}
+
+    blocks = [header]
+    for group in groups:
+        if group.key in detailed:
+            blocks.append(group.render())
+            usage.detailed_groups += 1
+            continue
+        summary = summary_by_key.get(group.key)
+        if summary:
+            usage.summarized_groups += 1
+            body = f"（要約）\n{summary}"
+        else:
+            usage.fallback_groups += 1
+            body = _fallback_group_text(group, per_group)
+        blocks.append(f"### {group.label} ({len(group.entries)}タスク)\n{body}")
+
+    text = "\n\n".join(blocks)
+    usage.used_tokens = estimate_tokens(text)
+    return text, usage
@@ -9,11 +9,13 @@ from __future__ import annotations
 import json
 from datetime import datetime
 from typing import Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from app.core.logger import logger
 from app.interfaces.achievement_repository import IAchievementRepository
 from app.interfaces.llm_provider import ILLMProvider
+from app.interfaces.phase_repository import IPhaseRepository
+from app.interfaces.project_repository import IProjectRepository
 from app.interfaces.task_repository import ITaskRepository
 from app.models.achievement import (
     SKILL_CATEGORIES,
@@ -24,6 +26,12 @@ from app.models.achievement import (
 )
 from app.models.enums import GenerationType
 from app.models.task import Task
+from app.services.achievement_prompt_builder import (
+    PromptBudgetUsage,
+    PromptTaskGroup,
+    build_budgeted_task_section,
+)
+from app.services.llm_usage_service import llm_usage_scope
 from app.services.llm_utils import generate_text
 
 # JSON schema for AI response
@@ -126,6 +134,18 @@ def _build_skill_categories_prompt() -> str:
     return "\n".join(lines)
 
 
+def _render_task_entry(task: Task) -> str:
+    """Render one completed task for the prompt (title line first)."""
+    lines = [f"- タイトル: {task.title}"]
+    if task.description:
+        lines.append(f"  - 説明: {task.description[:500]}")
+    if task.purpose:
+        lines.append(f"  - 目的: {task.purpose}")
+    if task.completion_note:
+        lines.append(f"  - メモ: {task.completion_note}")
+    return "\n".join(lines)
+
+
 def _build_tasks_prompt(tasks: list[Task]) -> str:
     """Build task list section for the prompt."""
     lines = ["## 完了タスク一覧", ""]
@@ -144,6 +164,64 @@ def _build_tasks_prompt(tasks: list[Task]) -> str:
     return "\n".join(lines)
 
 
+def _group_tasks_for_prompt(
+    tasks: list[Task],
+    project_names: dict[str, str],
+    phase_names: Optional[dict[str, str]] = None,
+) -> list[PromptTaskGroup]:
+    """Group completed tasks by project and phase, preserving first-seen order."""
+    phase_names = phase_names or {}
+    groups: dict[str, PromptTaskGroup] = {}
+    for task in tasks:
+        project_key = str(task.project_id) if task.project_id else ""
+        phase_key = str(task.phase_id) if task.phase_id else ""
+        key = f"{project_key}:{phase_key}"
+        group = groups.get(key)
+        if group is None:
+            if project_key:
+                label = project_names.get(project_key, "プロジェクト")
+            else:
+                label = "個人タスク"
+            if phase_key:
+                label = f"{label} / {phase_names.get(phase_key, 'フェーズ')}"
+            group = PromptTaskGroup(key=key, label=label)
+            groups[key] = group
+        group.entries.append(_render_task_entry(task))
+    return list(groups.values())
+
+
+async def _load_names(
+    repo: Optional[IProjectRepository | IPhaseRepository], ids: list[UUID], kind: str
+) -> dict[str, str]:
+    """Names of projects / phases by ID, loaded in one query."""
+    if not repo or not ids:
+        return {}
+    try:
+        return {str(item.id): item.name for item in await repo.get_many(ids)}
+    except Exception as exc:
+        logger.debug(f"Failed to resolve {kind} names for achievement prompt: {exc}")
+        return {}
+
+
+async def _build_budgeted_tasks_prompt(
+    llm_provider: ILLMProvider,
+    tasks: list[Task],
+    project_repo: Optional[IProjectRepository] = None,
+    phase_repo: Optional[IPhaseRepository] = None,
+) -> tuple[str, PromptBudgetUsage]:
+    """Build the completed task section grouped by project/phase within the token budget."""
+    project_ids = list(dict.fromkeys(task.project_id for task in tasks if task.project_id))
+    phase_ids = list(dict.fromkeys(task.phase_id for task in tasks if task.phase_id))
+    project_names = await _load_names(project_repo, project_ids, "project")
+    phase_names = await _load_names(phase_repo, phase_ids, "phase")
+
+    return await build_budgeted_task_section(
+        _group_tasks_for_prompt(tasks, project_names, phase_names),
+        title="完了タスク一覧",
+        llm_provider=llm_provider,
+    )
+
+
 def _build_task_snapshots_prompt(tasks: list[TaskSnapshot]) -> str:
     """Build task snapshot list section for the prompt."""
     lines = ["## 完了タスク一覧", ""]
@@ -185,6 +263,7 @@ def _generate_achievement_prompt(
     period_start: datetime,
     period_end: datetime,
     period_label: Optional[str] = None,
+    tasks_section: Optional[str] = None,
 ) -> str:
     """Generate the prompt for achievement generation."""
     period_str = period_label or f"{period_start.strftime('%Y/%m/%d')} - {period_end.strftime('%Y/%m/%d')}"
@@ -197,7 +276,7 @@ def _generate_achievement_prompt(
 ## 完了タスク数
 {len(tasks)}件
 
-{_build_tasks_prompt(tasks)}
+{tasks_section or _build_tasks_prompt(tasks)}
 
 {_build_skill_categories_prompt()}
 
@@ -342,6 +421,8 @@ async def generate_achievement(
     period_end: datetime,
     period_label: Optional[str] = None,
     generation_type: GenerationType = GenerationType.MANUAL,
+    project_repo: Optional[IProjectRepository] = None,
+    phase_repo: Optional[IPhaseRepository] = None,
 ) -> Achievement:
     """
     Generate an achievement summary for a given period.
@@ -355,6 +436,8 @@ async def generate_achievement(
         period_end: Period end datetime
         period_label: Optional human-readable period label
         generation_type: AUTO or MANUAL
+        project_repo: Project repository (for project names in the prompt)
+        phase_repo: Phase repository (for phase names in the prompt)
 
     Returns:
         Generated and saved Achievement
@@ -378,20 +461,26 @@ async def generate_achievement(
         )
 
     # Generate AI analysis
+    tasks_section, budget_usage = await _build_budgeted_tasks_prompt(
+        llm_provider, completed_tasks, project_repo, phase_repo
+    )
+    _log_budget_usage(user_id, budget_usage)
     prompt = _generate_achievement_prompt(
         tasks=completed_tasks,
         period_start=period_start,
         period_end=period_end,
         period_label=period_label,
+        tasks_section=tasks_section,
     )
 
-    response_text = generate_text(
-        llm_provider=llm_provider,
-        prompt=prompt,
-        temperature=0.3,
-        max_output_tokens=2000,
-        response_mime_type="application/json",
-    )
+    with llm_usage_scope("achievement", user_id=user_id):
+        response_text = generate_text(
+            llm_provider=llm_provider,
+            prompt=prompt,
+            temperature=0.3,
+            max_output_tokens=2000,
+            response_mime_type="application/json",
+        )
 
     # Parse AI response
     ai_result = _parse_ai_response(response_text)
@@ -434,6 +523,14 @@ async def generate_achievement(
     return saved
 
 
+def _log_budget_usage(user_id: str, usage: PromptBudgetUsage) -> None:
+    logger.info(
+        f"Achievement prompt budget for {user_id}: {usage.used_tokens}/{usage.budget_tokens} "
+        f"tokens (full {usage.full_tokens}), {usage.task_count} tasks in {usage.group_count} "
+        f"groups, summarized={usage.summarized_groups}, truncated={usage.fallback_groups}"
+    )
+
+
 def _parse_ai_response(response_text: Optional[str]) -> dict:
     """Parse AI response JSON."""
     if not response_text:
@@ -662,6 +759,7 @@ def _generate_achievement_prompt_with_answers(
     period_end: datetime,
     period_label: Optional[str] = None,
     user_answers: Optional[dict] = None,
+    tasks_section: Optional[str] = None,
 ) -> str:
     """Generate the prompt for achievement generation with user answers."""
     base_prompt = _generate_achievement_prompt(
@@ -669,6 +767,7 @@ def _generate_achievement_prompt_with_answers(
         period_start=period_start,
         period_end=period_end,
         period_label=period_label,
+        tasks_section=tasks_section,
     )
 
     if not user_answers:
@@ -724,6 +823,8 @@ async def generate_achievement_with_answers(
     period_label: Optional[str] = None,
     user_answers: Optional[dict] = None,
     generation_type: GenerationType = GenerationType.MANUAL,
+    project_repo: Optional[IProjectRepository] = None,
+    phase_repo: Optional[IPhaseRepository] = None,
 ) -> Achievement:
     """
     Generate an achievement summary with user-provided answers.
@@ -738,6 +839,8 @@ async def generate_achievement_with_answers(
         period_label: Optional human-readable period label
         user_answers: Dictionary of user answers to review questions
         generation_type: AUTO or MANUAL
+        project_repo: Project repository (for project names in the prompt)
+        phase_repo: Phase repository (for phase names in the prompt)
 
     Returns:
         Generated and saved Achievement
@@ -760,21 +863,27 @@ async def generate_achievement_with_answers(
         )
 
     # Generate AI analysis with user answers
+    tasks_section, budget_usage = await _build_budgeted_tasks_prompt(
+        llm_provider, completed_tasks, project_repo, phase_repo
+    )
+    _log_budget_usage(user_id, budget_usage)
     prompt = _generate_achievement_prompt_with_answers(
         tasks=completed_tasks,
         period_start=period_start,
         period_end=period_end,
         period_label=period_label,
         user_answers=user_answers,
+        tasks_section=tasks_section,
     )
 
-    response_text = generate_text(
-        llm_provider=llm_provider,
-        prompt=prompt,
-        temperature=0.3,
-        max_output_tokens=2000,
-        response_mime_type="application/json",
-    )
+    with llm_usage_scope("achievement", user_id=user_id):
+        response_text = generate_text(
+            llm_provider=llm_provider,
+            prompt=prompt,
+            temperature=0.3,
+            max_output_tokens=2000,
+            response_mime_type="application/json",
+        )
 
     # Parse AI response
     ai_result = _parse_ai_response(response_text)
@@ -825,13 +934,14 @@ async def summarize_achievement_with_edits(
     """Summarize an achievement using current edits and append notes."""
     prompt = _generate_achievement_prompt_with_edits(achievement)
 
-    response_text = generate_text(
-        llm_provider=llm_provider,
-        prompt=prompt,
-        temperature=0.3,
-        max_output_tokens=2000,
-        response_mime_type="application/json",
-    )
+    with llm_usage_scope("achievement", user_id=achievement.user_id):
+        response_text = generate_text(
+            llm_provider=llm_provider,
+            prompt=prompt,
+            temperature=0.3,
+            max_output_tokens=2000,
+            response_mime_type="application/json",
+        )
 
     ai_result = _parse_ai_response(response_text)
 
@@ -873,6 +983,8 @@ async def check_and_auto_generate(
     task_repo: ITaskRepository,
     achievement_repo: IAchievementRepository,
     user_id: str,
+    project_repo: Optional[IProjectRepository] = None,
+    phase_repo: Optional[IPhaseRepository] = None,
 ) -> Optional[Achievement]:
     """
     Check if auto-generation is needed and generate if so.
@@ -886,6 +998,8 @@ async def check_and_auto_generate(
         task_repo: Task repository
         achievement_repo: Achievement repository
         user_id: User ID
+        project_repo: Project repository (for project names in the prompt)
+        phase_repo: Phase repository (for phase names in the prompt)
 
     Returns:
         Generated Achievement if created, None otherwise
@@ -938,4 +1052,6 @@ async def check_and_auto_generate(
         period_end=period_end,
         period_label=f"週次振り返り ({period_start.strftime('%m/%d')} - {period_end.strftime('%m/%d')})",
         generation_type=GenerationType.AUTO,
+        project_repo=project_repo,
+        phase_repo=phase_repo,
     )
@@ -7,7 +7,9 @@ This service handles agent execution, tool calling, and response generation.
 from __future__ import annotations
 
 import ast
+import asyncio
 import json
+import time
 from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,6 +22,7 @@ from google.genai.types import Content, Part
 from app.agents.secretary_agent import create_secretary_agent
 from app.core.config import get_settings
 from app.core.logger import logger
+from app.core.tracing import traced
 from app.interfaces.agent_task_repository import IAgentTaskRepository
 from app.interfaces.capture_repository import ICaptureRepository
 from app.interfaces.chat_session_repository import IChatSessionRepository
@@ -42,6 +45,9 @@ from app.interfaces.user_repository import IUserRepository
 from app.models.capture import CaptureCreate
 from app.models.chat import ChatRequest, ChatResponse, PendingQuestion, PendingQuestions
 from app.models.enums import ContentType, ToolApprovalMode
+from app.services.chat_history_service import ChatHistoryCompactionService
+from app.services.llm_usage_service import llm_usage_ledger, llm_usage_scope
+from app.services.project_permissions import access_scope
 from app.utils.datetime_utils import ensure_utc
 
 # Global cache for runners (keyed by user_id + session_id + model + routing_mode)
@@ -122,6 +128,7 @@ class AgentService:
         self._recurring_task_repo = recurring_task_repo
         self._speech_provider = speech_provider
         self._user_repo = user_repo
+        self._history_service = ChatHistoryCompactionService(chat_repo, llm_provider)
 
     def _resolve_llm_provider(self, model_id: str | None) -> ILLMProvider:
         """Resolve the effective LLM provider, optionally overriding the model."""
@@ -185,6 +192,7 @@ class AgentService:
             user_repo=self._user_repo,
             user_message=routing_message,
             routing_context=routing_context,
+            chat_repo=self._chat_repo,
         )
 
         runner = InMemoryRunner(agent=agent, app_name=self.APP_NAME)
@@ -262,7 +270,7 @@ class AgentService:
         user_id: str,
         session_id: str,
     ) -> None:
-        """Seed ADK session history from persisted chat messages after restart."""
+        """Seed ADK session history (rolling summary + recent turns) after restart."""
         if not self._chat_repo:
             return
 
@@ -283,30 +291,36 @@ class AgentService:
                     session_id=session_id,
                 )
 
-            stored_messages = await self._chat_repo.list_messages(
+            seed = await self._history_service.build_seed(
                 user_id=user_id,
                 session_id=session_id,
-                limit=self.HISTORY_SEED_LIMIT,
+                max_messages=self.HISTORY_SEED_LIMIT,
             )
-            if not stored_messages:
+            if not seed.summary and not seed.messages:
                 return
 
             from google.adk.events.event import Event
             from google.genai.types import Content, Part
 
+            if seed.summary:
+                summary_text = f"[これまでの会話の要約]\n{seed.summary}"
+                await runner.session_service.append_event(
+                    session,
+                    Event(
+                        author="user",
+                        invocation_id=f"history:{session_id}:summary",
+                        content=Content(role="user", parts=[Part(text=summary_text)]),
+                    ),
+                )
+
             agent_name = getattr(getattr(runner, "agent", None), "name", None) or "assistant"
-            for idx, msg in enumerate(stored_messages):
-                if msg.role not in {"user", "assistant"}:
-                    continue
-                content_text = msg.content or ""
-                if not content_text.strip():
-                    continue
+            for idx, msg in enumerate(seed.messages):
                 author = "user" if msg.role == "user" else agent_name
                 role = "user" if msg.role == "user" else "model"
                 event = Event(
                     author=author,
                     invocation_id=f"history:{session_id}:{idx}",
-                    content=Content(role=role, parts=[Part(text=content_text)]),
+                    content=Content(role=role, parts=[Part(text=msg.content)]),
                 )
                 await runner.session_service.append_event(session, event)
         except Exception as exc:
@@ -566,7 +580,7 @@ class AgentService:
             try:
                 if not file_path.exists():
                     return None, None, f"File not found: {file_path}"
-                file_bytes = file_path.read_bytes()
+                file_bytes = await asyncio.to_thread(file_path.read_bytes)
                 mime_type, _ = mimetypes.guess_type(str(file_path))
                 return file_bytes, mime_type or "application/octet-stream", None
             except Exception as e:
@@ -947,7 +961,7 @@ class AgentService:
             if image_path:
                 try:
                     if image_path.exists():
-                        image_bytes = image_path.read_bytes()
+                        image_bytes = await asyncio.to_thread(image_path.read_bytes)
                         import mimetypes
                         mime_type, _ = mimetypes.guess_type(str(image_path))
                         mime_type = mime_type or "image/jpeg"
@@ -1258,6 +1272,7 @@ class AgentService:
         context = context_raw.strip() if isinstance(context_raw, str) and context_raw.strip() else None
         return PendingQuestions(questions=questions, context=context)
 
+    @traced("agent.process_chat")
     async def process_chat(
         self,
         user_id: str,
@@ -1316,6 +1331,9 @@ class AgentService:
         )
 
         # Run agent with user message
+        total_input_tokens = 0
+        total_output_tokens = 0
+        started = time.perf_counter()
         try:
             await self._ensure_session(runner, user_id, session_id)
             await self._hydrate_session_history(runner, user_id, session_id)
@@ -1335,13 +1353,7 @@ class AgentService:
 
             assistant_message_parts: list[str] = []
             pending_questions: PendingQuestions | None = None
-            total_input_tokens = 0
-            total_output_tokens = 0
-            async for event in runner.run_async(
-                user_id=user_id,
-                session_id=session_id,
-                new_message=new_message,
-            ):
+            async for event in self._run_agent(runner, user_id, session_id, new_message):
                 if hasattr(event, "usage_metadata") and event.usage_metadata:
                     total_input_tokens += event.usage_metadata.prompt_token_count or 0
                     total_output_tokens += event.usage_metadata.candidates_token_count or 0
@@ -1382,6 +1394,9 @@ class AgentService:
                 from app.services.cost_utils import calculate_cost
 
                 model_id = self._resolve_llm_provider(request.model).get_model_id()
+                self._record_chat_usage(
+                    user_id, model_id, started, total_input_tokens, total_output_tokens
+                )
                 usage = TokenUsage(
                     input_tokens=total_input_tokens,
                     output_tokens=total_output_tokens,
@@ -1402,6 +1417,14 @@ class AgentService:
 
         except Exception as e:
             logger.error(f"Agent execution failed: {e}", exc_info=True)
+            self._record_chat_usage(
+                user_id,
+                self._resolve_llm_provider(request.model).get_model_id(),
+                started,
+                total_input_tokens,
+                total_output_tokens,
+                success=False,
+            )
             await self._record_message(
                 user_id=user_id,
                 session_id=session_id,
@@ -1416,6 +1439,38 @@ class AgentService:
                 capture_id=capture_id,
             )
 
+    @staticmethod
+    async def _run_agent(runner, user_id: str, session_id: str, new_message):
+        """Run one agent turn, attributing LLM calls made by its tools to the chat."""
+        with llm_usage_scope("chat", user_id=user_id), access_scope():
+            async for event in runner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=new_message,
+            ):
+                yield event
+
+    @staticmethod
+    def _record_chat_usage(
+        user_id: str,
+        model_id: str,
+        started: float,
+        input_tokens: int,
+        output_tokens: int,
+        success: bool = True,
+    ) -> None:
+        """Record one agent turn (all model calls of the run) in the usage ledger."""
+        llm_usage_ledger.record(
+            model=model_id,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            success=success,
+            feature="chat",
+            user_id=user_id,
+        )
+
+    @traced("agent.process_chat_stream")
     async def process_chat_stream(
         self,
         user_id: str,
@@ -1463,6 +1518,9 @@ class AgentService:
             routing_context=request.context,
         )
 
+        total_input_tokens = 0
+        total_output_tokens = 0
+        started = time.perf_counter()
         try:
             await self._ensure_session(runner, user_id, session_id_str)
             await self._hydrate_session_history(runner, user_id, session_id_str)
@@ -1482,15 +1540,9 @@ class AgentService:
 
             # Stream agent execution
             assistant_message_parts: list[str] = []
-            total_input_tokens = 0
-            total_output_tokens = 0
             # FIFO queue per tool name to correlate tool_start with tool_end
             _pending_tool_ids: dict[str, list[str]] = {}
-            async for event in runner.run_async(
-                user_id=user_id,
-                session_id=session_id_str,
-                new_message=new_message,
-            ):
+            async for event in self._run_agent(runner, user_id, session_id_str, new_message):
                 # Accumulate token usage from each event
                 if hasattr(event, "usage_metadata") and event.usage_metadata:
                     total_input_tokens += event.usage_metadata.prompt_token_count or 0
@@ -1626,6 +1678,9 @@ class AgentService:
                 from app.services.cost_utils import calculate_cost
 
                 model_id = self._resolve_llm_provider(request.model).get_model_id()
+                self._record_chat_usage(
+                    user_id, model_id, started, total_input_tokens, total_output_tokens
+                )
                 usage_data = {
                     "input_tokens": total_input_tokens,
                     "output_tokens": total_output_tokens,
@@ -1644,6 +1699,14 @@ class AgentService:
 
         except Exception as e:
             logger.error(f"Agent streaming failed: {e}", exc_info=True)
+            self._record_chat_usage(
+                user_id,
+                self._resolve_llm_provider(request.model).get_model_id(),
+                started,
+                total_input_tokens,
+                total_output_tokens,
+                success=False,
+            )
             await self._record_message(
                 user_id=user_id,
                 session_id=session_id_str,
@@ -1723,7 +1786,7 @@ class AgentService:
             if image_path:
                 try:
                     if image_path.exists():
-                        image_bytes = image_path.read_bytes()
+                        image_bytes = await asyncio.to_thread(image_path.read_bytes)
                         mime_type = mimetypes.guess_type(str(image_path))[0] or "image/jpeg"
                     else:
                         text_payload = f"Image URL: {capture.content_url} (File not found)"
@@ -8,7 +8,10 @@ Uses APScheduler for in-process scheduling without external dependencies.
 from __future__ import annotations
 
 import asyncio
+import functools
+import multiprocessing
 import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -17,15 +20,19 @@ from apscheduler.triggers.cron import CronTrigger
 
 from app.core.config import get_settings
 from app.core.logger import logger
+from app.core.query_counter import count_queries
+from app.core.tracing import span
 from app.interfaces.achievement_repository import IAchievementRepository
 from app.interfaces.chat_session_repository import IChatSessionRepository
 from app.interfaces.heartbeat_event_repository import IHeartbeatEventRepository
 from app.interfaces.heartbeat_settings_repository import IHeartbeatSettingsRepository
 from app.interfaces.llm_provider import ILLMProvider
 from app.interfaces.notification_repository import INotificationRepository
+from app.interfaces.phase_repository import IPhaseRepository
 from app.interfaces.project_achievement_repository import IProjectAchievementRepository
 from app.interfaces.project_member_repository import IProjectMemberRepository
 from app.interfaces.project_repository import IProjectRepository
+from app.interfaces.proposal_repository import IProposalRepository
 from app.interfaces.schedule_plan_repository import IDailySchedulePlanRepository
 from app.interfaces.schedule_settings_repository import IScheduleSettingsRepository
 from app.interfaces.schedule_snapshot_repository import IScheduleSnapshotRepository
@@ -35,12 +42,28 @@ from app.interfaces.user_repository import IUserRepository
 from app.models.enums import GenerationType
 from app.services.achievement_service import generate_achievement
 from app.services.daily_schedule_plan_service import DEFAULT_PLAN_DAYS, DailySchedulePlanService
+from app.services.llm_usage_service import llm_usage_scope
 from app.services.project_achievement_service import generate_project_achievement
 from app.services.task_heartbeat_service import TaskHeartbeatService
 from app.services.weekly_meeting_reminder_service import ensure_weekly_meeting_reminders
 from app.utils.datetime_utils import get_user_today
 
 
+def _counted_job(job):
+    """Run a periodic job in its own root span and query counting scope."""
+
+    @functools.wraps(job)
+    async def _run(*args, **kwargs):
+        name = f"job.{job.__name__.lstrip('_')}"
+        with span(name) as job_span, count_queries(name) as queries:
+            try:
+                return await job(*args, **kwargs)
+            finally:
+                job_span.set(queries=queries.total)
+
+    return _run
+
+
 class BackgroundScheduler:
     """
     Background scheduler for periodic jobs.
@@ -49,6 +72,7 @@ class BackgroundScheduler:
     - Weekly achievement auto-generation (Friday 00:00)
     - Weekly project achievement auto-generation
     - Weekly meeting registration reminder tasks (Monday 00:00)
+    - Proposal expiry sweep (every 15 minutes)
     - Startup check for missed runs (achievements + meeting reminders)
     - Staggered processing to avoid load spikes
     """
@@ -70,6 +94,8 @@ class BackgroundScheduler:
         heartbeat_settings_repo: IHeartbeatSettingsRepository,
         heartbeat_event_repo: IHeartbeatEventRepository,
         task_assignment_repo: Optional[ITaskAssignmentRepository] = None,
+        proposal_repo: Optional[IProposalRepository] = None,
+        phase_repo: Optional[IPhaseRepository] = None,
     ):
         self._user_repo = user_repo
         self._task_repo = task_repo
@@ -86,7 +112,10 @@ class BackgroundScheduler:
         self._heartbeat_settings_repo = heartbeat_settings_repo
         self._heartbeat_event_repo = heartbeat_event_repo
         self._task_assignment_repo = task_assignment_repo
+        self._proposal_repo = proposal_repo
+        self._phase_repo = phase_repo
         self._scheduler: Optional[AsyncIOScheduler] = None
+        self._plan_executor: Optional[ProcessPoolExecutor] = None
         self._last_run: Optional[datetime] = None
         self._task_heartbeat_service = TaskHeartbeatService(
             task_repo=self._task_repo,
@@ -129,7 +158,7 @@ class BackgroundScheduler:
 
         # Schedule weekly achievement generation for Friday at 00:00
         self._scheduler.add_job(
-            self._run_weekly_achievement_generation,
+            _counted_job(self._run_weekly_achievement_generation),
             CronTrigger(day_of_week="fri", hour=0, minute=0),
             id="weekly_achievement_generation",
             name="Weekly Achievement Generation",
@@ -138,7 +167,7 @@ class BackgroundScheduler:
 
         # Schedule weekly meeting reminder task creation for Monday at 00:00
         self._scheduler.add_job(
-            self._run_weekly_meeting_reminder_generation,
+            _counted_job(self._run_weekly_meeting_reminder_generation),
             CronTrigger(day_of_week="mon", hour=0, minute=0),
             id="weekly_meeting_reminder_generation",
             name="Weekly Meeting Reminder Task Generation",
@@ -146,7 +175,7 @@ class BackgroundScheduler:
         )
 
         self._scheduler.add_job(
-            self._run_daily_plan_generation,
+            _counted_job(self._run_daily_plan_generation),
             CronTrigger(minute=5),
             id="daily_schedule_plan_generation",
             name="Daily Schedule Plan Generation",
@@ -154,20 +183,30 @@ class BackgroundScheduler:
         )
 
         self._scheduler.add_job(
-            self._run_task_heartbeat_checks,
+            _counted_job(self._run_task_heartbeat_checks),
             CronTrigger(minute="*/30"),
             id="task_heartbeat_checks",
             name="Task Heartbeat Checks",
             replace_existing=True,
         )
 
+        if self._proposal_repo is not None:
+            self._scheduler.add_job(
+                _counted_job(self._run_proposal_expiry_sweep),
+                CronTrigger(minute="*/15"),
+                id="proposal_expiry_sweep",
+                name="Proposal Expiry Sweep",
+                replace_existing=True,
+            )
+
         self._scheduler.start()
         logger.info(
             "Background scheduler started:\n"
             "  - Weekly achievement generation: Friday 00:00\n"
             "  - Weekly meeting reminder tasks: Monday 00:00\n"
             "  - Daily schedule plan generation: every hour\n"
-            "  - Task heartbeat checks: every 30 minutes"
+            "  - Task heartbeat checks: every 30 minutes\n"
+            "  - Proposal expiry sweep: every 15 minutes"
         )
 
         # Check for missed runs in background (non-blocking)
@@ -178,6 +217,9 @@ class BackgroundScheduler:
         if self._scheduler:
             self._scheduler.shutdown(wait=False)
             logger.info("Background scheduler stopped")
+        if self._plan_executor:
+            self._plan_executor.shutdown(wait=False, cancel_futures=True)
+            self._plan_executor = None
 
     async def _check_and_run_missed_background(self):
         """Background wrapper for checking missed runs with error handling."""
@@ -452,6 +494,19 @@ class BackgroundScheduler:
         except Exception as e:
             logger.error(f"Weekly meeting reminder task generation failed: {e}")
 
+    def _get_plan_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Worker pool for plan computation (None = compute in this process)."""
+        workers = get_settings().PLAN_GENERATION_PROCESSES
+        if workers <= 0:
+            return None
+        if self._plan_executor is None:
+            # spawn: workers must not inherit the event loop, DB engine or threads.
+            self._plan_executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._plan_executor
+
     async def _run_daily_plan_generation(self):
         logger.info("Starting daily schedule plan generation...")
         users = await self._user_repo.list_all()
@@ -465,24 +520,23 @@ class BackgroundScheduler:
             plan_repo=self._schedule_plan_repo,
         )
 
+        pending_user_ids: list[str] = []
         for user in users:
             timezone = user.timezone or "Asia/Tokyo"
             today = get_user_today(timezone)
             existing = await self._schedule_plan_repo.get_by_date(str(user.id), today)
             if existing:
                 continue
-            try:
-                await plan_service.build_plan(
-                    user_id=str(user.id),
-                    start_date=today,
-                    max_days=DEFAULT_PLAN_DAYS,
-                    from_now=False,
-                    filter_by_assignee=True,
-                    apply_plan_constraints=True,
-                )
-            except Exception as exc:
-                logger.error(f"Failed to generate daily plan for user {user.id}: {exc}")
-            await asyncio.sleep(random.uniform(0.2, 0.8))
+            pending_user_ids.append(str(user.id))
+
+        # One compute job per user, spread over the plan process pool.
+        if pending_user_ids:
+            plans = await plan_service.build_plans(
+                pending_user_ids,
+                max_days=DEFAULT_PLAN_DAYS,
+                executor=self._get_plan_executor(),
+            )
+            logger.info(f"Generated daily plans for {len(plans)}/{len(pending_user_ids)} users")
         logger.info("Daily schedule plan generation completed")
 
     async def _run_task_heartbeat_checks(self):
@@ -494,12 +548,29 @@ class BackgroundScheduler:
 
         for user in users:
             try:
-                await self._task_heartbeat_service.run(str(user.id))
+                async with llm_usage_scope("heartbeat", user_id=str(user.id), background=True):
+                    await self._task_heartbeat_service.run(str(user.id))
             except Exception as exc:
                 logger.error(f"Failed to run task heartbeat for user {user.id}: {exc}")
             await asyncio.sleep(random.uniform(0.2, 0.8))
 
         logger.info("Task heartbeat checks completed")
+
+    async def _run_proposal_expiry_sweep(self):
+        """Expire stale pending proposals, fail abandoned approvals and delete old ones."""
+        settings = get_settings()
+        now = datetime.now()
+        expired = await self._proposal_repo.expire_stale(now)
+        failed = await self._proposal_repo.fail_stale_executions(
+            now - timedelta(minutes=settings.PROPOSAL_EXECUTION_TIMEOUT_MINUTES)
+        )
+        retention = timedelta(days=settings.PROPOSAL_RETENTION_DAYS)
+        purged = await self._proposal_repo.purge(now - retention)
+        if expired or failed or purged:
+            logger.info(
+                f"Proposal expiry sweep: {expired} expired, {failed} failed, {purged} deleted"
+            )
+
     async def _generate_weekly_for_user(self, user_id: str, last_friday: datetime) -> bool:
         """
         Generate weekly achievement for a single user.
@@ -537,16 +608,22 @@ class BackgroundScheduler:
             return False  # No new completions
 
         # Generate achievement
-        await generate_achievement(
-            llm_provider=self._llm_provider,
-            task_repo=self._task_repo,
-            achievement_repo=self._achievement_repo,
-            user_id=user_id,
-            period_start=period_start,
-            period_end=period_end,
-            period_label=f"週次振り返り ({period_start.strftime('%m/%d')} - {period_end.strftime('%m/%d')})",
-            generation_type=GenerationType.AUTO,
-        )
+        async with llm_usage_scope("achievement", user_id=user_id, background=True) as usage:
+            if usage.throttled:
+                logger.info(f"Skipping weekly achievement for user {user_id}: LLM budget reached")
+                return False
+            await generate_achievement(
+                llm_provider=self._llm_provider,
+                task_repo=self._task_repo,
+                achievement_repo=self._achievement_repo,
+                user_id=user_id,
+                period_start=period_start,
+                period_end=period_end,
+                period_label=f"週次振り返り ({period_start.strftime('%m/%d')} - {period_end.strftime('%m/%d')})",
+                generation_type=GenerationType.AUTO,
+                project_repo=self._project_repo,
+                phase_repo=self._phase_repo,
+            )
 
         return True
 
@@ -567,9 +644,11 @@ async def get_background_scheduler() -> BackgroundScheduler:
             get_heartbeat_settings_repository,
             get_llm_provider,
             get_notification_repository,
+            get_phase_repository,
             get_project_achievement_repository,
             get_project_member_repository,
             get_project_repository,
+            get_proposal_repository,
             get_schedule_settings_repository,
             get_schedule_snapshot_repository,
             get_task_assignment_repository,
@@ -593,6 +672,8 @@ async def get_background_scheduler() -> BackgroundScheduler:
             heartbeat_settings_repo=get_heartbeat_settings_repository(),
             heartbeat_event_repo=get_heartbeat_event_repository(),
             task_assignment_repo=get_task_assignment_repository(),
+            proposal_repo=get_proposal_repository(),
+            phase_repo=get_phase_repository(),
         )
     return _scheduler
 
@@ -6,6 +6,7 @@ Orchestrates Speech-to-Text, Vision, and Storage providers.
 
 from uuid import uuid4
 
+from app.core.config import get_settings
 from app.core.exceptions import InfrastructureError
 from app.interfaces.capture_repository import ICaptureRepository
 from app.interfaces.llm_provider import ILLMProvider
@@ -13,6 +14,7 @@ from app.interfaces.speech_provider import ISpeechToTextProvider
 from app.interfaces.storage_provider import IStorageProvider
 from app.models.capture import Capture, CaptureCreate
 from app.models.enums import ContentType
+from app.utils.stream_utils import iter_chunks
 
 
 class CaptureService:
@@ -79,9 +81,9 @@ class CaptureService:
         """
         # Upload to storage
         storage_path = f"captures/{user_id}/audio/{uuid4()}.wav"
-        content_url = await self.storage.upload(
+        content_url = await self.storage.upload_stream(
             path=storage_path,
-            data=audio_bytes,
+            chunks=iter_chunks(audio_bytes, get_settings().STORAGE_CHUNK_SIZE),
             content_type=content_type,
         )
 
@@ -134,9 +136,9 @@ class CaptureService:
         }
         ext = ext_map.get(content_type, ".jpg")
         storage_path = f"captures/{user_id}/images/{uuid4()}{ext}"
-        content_url = await self.storage.upload(
+        content_url = await self.storage.upload_stream(
             path=storage_path,
-            data=image_bytes,
+            chunks=iter_chunks(image_bytes, get_settings().STORAGE_CHUNK_SIZE),
             content_type=content_type,
         )
 
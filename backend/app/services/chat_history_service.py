@@ -0,0 +1,349 @@
+"""
+Chat history compaction for restarted agent sessions.
+
+When a runner is rebuilt (cache miss, restart), the persisted transcript is
+replayed into the new ADK session. Instead of replaying every stored message,
+older turns are folded into a rolling LLM summary that is persisted next to
+the messages, and only the most recent turns are replayed verbatim within a
+token budget.
+
+Hydration never waits on the LLM: turns that fell out of the recent window
+are seeded as an extractive summary, and the rolling summary is updated by a
+background compaction that walks every unsummarized message in
+(created_at, id) order up to the recent window. One compaction runs per
+session in a process, and each save is a compare-and-set on the summary
+cursor it started from, so a concurrent compaction (another worker) that
+loses the race drops its result instead of double-counting messages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.core.config import get_settings
+from app.core.logger import logger
+from app.interfaces.chat_session_repository import IChatSessionRepository
+from app.interfaces.llm_provider import ILLMProvider
+from app.models.chat_session import ChatHistorySummary, ChatMessage
+from app.services.llm_usage_service import llm_usage_scope
+from app.services.llm_utils import generate_text
+from app.utils.token_utils import estimate_tokens, truncate_to_tokens
+
+_SEEDABLE_ROLES = {"user", "assistant"}
+_FALLBACK_LINE_TOKENS = 80
+# Messages folded into the summary per LLM call while catching up.
+_COMPACTION_BATCH = 100
+
+SUMMARY_SYSTEM_INSTRUCTION = (
+    "あなたは秘書AIとユーザーの会話履歴を圧縮するアシスタントです。"
+    "後続の会話で必要になる事実・決定事項・依頼内容・未完了の約束・ユーザーの好みを残し、"
+    "挨拶や重複は省いてください。箇条書きで簡潔に出力してください。"
+)
+
+# Process-wide counters exposed for monitoring.
+_compaction_stats: dict[str, int] = {
+    "hydrations": 0,
+    "compactions": 0,
+    "compaction_failures": 0,
+    "compaction_conflicts": 0,
+    "full_history_tokens": 0,
+    "seeded_tokens": 0,
+    "tokens_saved": 0,
+}
+
+
+# In-flight background compactions by (user_id, session_id), shared by every
+# service instance of the process (one is built per request).
+_compactions: dict[tuple[str, str], asyncio.Task] = {}
+
+
+def get_history_compaction_stats() -> dict[str, int]:
+    """Return a snapshot of the process-wide history compaction counters."""
+    return dict(_compaction_stats)
+
+
+@dataclass
+class HistorySeed:
+    """History to replay into a rebuilt agent session."""
+
+    summary: Optional[str] = None
+    messages: list[ChatMessage] = field(default_factory=list)
+    full_history_tokens: int = 0
+    seeded_tokens: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.full_history_tokens - self.seeded_tokens)
+
+
+class ChatHistoryCompactionService:
+    """Builds compacted history seeds and maintains rolling summaries."""
+
+    def __init__(
+        self,
+        chat_repo: IChatSessionRepository,
+        llm_provider: Optional[ILLMProvider] = None,
+        token_budget: Optional[int] = None,
+        recent_message_limit: Optional[int] = None,
+        min_recent_messages: Optional[int] = None,
+        summary_max_tokens: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self._chat_repo = chat_repo
+        self._llm_provider = llm_provider
+        self._token_budget = token_budget or settings.CHAT_HISTORY_TOKEN_BUDGET
+        self._recent_message_limit = (
+            recent_message_limit or settings.CHAT_HISTORY_RECENT_MESSAGES
+        )
+        self._min_recent_messages = (
+            min_recent_messages
+            if min_recent_messages is not None
+            else settings.CHAT_HISTORY_MIN_RECENT_MESSAGES
+        )
+        self._summary_max_tokens = summary_max_tokens or settings.CHAT_HISTORY_SUMMARY_MAX_TOKENS
+
+    async def build_seed(
+        self,
+        user_id: str,
+        session_id: str,
+        max_messages: int = 200,
+    ) -> HistorySeed:
+        """
+        Build the history seed for a session, compacting older turns if needed.
+
+        Args:
+            user_id: Owner user ID
+            session_id: Chat session ID
+            max_messages: Max unsummarized messages loaded from storage
+
+        Returns:
+            HistorySeed with optional summary and recent messages
+        """
+        existing = await self._chat_repo.get_history_summary(user_id, session_id)
+        stored = await self._chat_repo.list_recent_messages(
+            user_id=user_id,
+            session_id=session_id,
+            limit=max_messages,
+            after=existing.summarized_until if existing else None,
+            after_id=existing.summarized_until_id if existing else None,
+        )
+        pending = [
+            msg for msg in stored
+            if msg.role in _SEEDABLE_ROLES and (msg.content or "").strip()
+        ]
+        if not pending and not existing:
+            return HistorySeed()
+
+        pending_tokens = [estimate_tokens(msg.content) for msg in pending]
+        summary_text = existing.summary if existing else None
+        summary_tokens = existing.summary_tokens if existing else 0
+        full_history_tokens = sum(pending_tokens) + (existing.source_tokens if existing else 0)
+
+        split = self._split_recent(pending, pending_tokens, summary_tokens)
+        older = pending[:split]
+        recent = pending[split:]
+
+        if older:
+            summary_text = self._fallback_summary(summary_text, older)
+            summary_tokens = estimate_tokens(summary_text)
+        # Messages before the loaded window (len == limit) are unsummarized too.
+        if recent and (older or len(stored) >= max_messages):
+            self._schedule_compaction(user_id, session_id, recent[0])
+
+        seed = HistorySeed(
+            summary=summary_text or None,
+            messages=recent,
+            full_history_tokens=full_history_tokens,
+            seeded_tokens=summary_tokens + sum(pending_tokens[split:]),
+        )
+        self._record_stats(session_id, seed)
+        return seed
+
+    def _split_recent(
+        self,
+        messages: list[ChatMessage],
+        token_counts: list[int],
+        summary_tokens: int,
+    ) -> int:
+        """Return the index where the verbatim recent window starts."""
+        budget = max(0, self._token_budget - summary_tokens)
+        used = 0
+        start = len(messages)
+        while start > 0:
+            kept = len(messages) - start
+            cost = token_counts[start - 1]
+            if kept >= self._recent_message_limit:
+                break
+            if kept >= self._min_recent_messages and used + cost > budget:
+                break
+            used += cost
+            start -= 1
+
+        # Start the replayed window on a user turn so roles keep alternating.
+        while 0 < start < len(messages) and messages[start].role != "user":
+            start += 1
+        return start
+
+    def _schedule_compaction(self, user_id: str, session_id: str, stop_before: ChatMessage) -> None:
+        """Start a background compaction unless one is running for the session."""
+        if not self._llm_provider:
+            return
+        key = (user_id, session_id)
+        running = _compactions.get(key)
+        if running and not running.done():
+            return
+        task = asyncio.create_task(self._compact_until(user_id, session_id, stop_before))
+        _compactions[key] = task
+        task.add_done_callback(lambda done: _compactions.pop(key, None) if _compactions.get(key) is done else None)
+
+    async def wait_for_compactions(self) -> None:
+        """Wait for the running background compactions (tests, shutdown)."""
+        if _compactions:
+            await asyncio.gather(*list(_compactions.values()), return_exceptions=True)
+
+    async def _compact_until(self, user_id: str, session_id: str, stop_before: ChatMessage) -> None:
+        """Fold every unsummarized message before ``stop_before`` into the summary."""
+        stop_key = (stop_before.created_at, str(stop_before.id))
+        try:
+            with llm_usage_scope("chat_compaction", user_id=user_id):
+                existing = await self._chat_repo.get_history_summary(user_id, session_id)
+                after = existing.summarized_until if existing else None
+                after_id = existing.summarized_until_id if existing else None
+                while True:
+                    loaded = await self._chat_repo.list_messages_after(
+                        user_id=user_id,
+                        session_id=session_id,
+                        after=after,
+                        after_id=after_id,
+                        limit=_COMPACTION_BATCH,
+                    )
+                    batch = [msg for msg in loaded if (msg.created_at, str(msg.id)) < stop_key]
+                    if not batch:
+                        return
+                    older = [
+                        msg for msg in batch
+                        if msg.role in _SEEDABLE_ROLES and (msg.content or "").strip()
+                    ]
+                    if older:
+                        compacted = await self._compact(user_id, session_id, existing, older, batch[-1])
+                        if compacted is None:
+                            return
+                        existing = compacted
+                    after, after_id = batch[-1].created_at, batch[-1].id
+                    if len(batch) < len(loaded) or len(loaded) < _COMPACTION_BATCH:
+                        return
+        except Exception as exc:
+            _compaction_stats["compaction_failures"] += 1
+            logger.warning(f"History compaction failed for {session_id}: {exc}")
+
+    async def _compact(
+        self,
+        user_id: str,
+        session_id: str,
+        existing: Optional[ChatHistorySummary],
+        older: list[ChatMessage],
+        last: ChatMessage,
+    ) -> Optional[ChatHistorySummary]:
+        """Fold older messages (up to ``last``) into the rolling summary and persist it."""
+        prompt = self._build_summary_prompt(existing.summary if existing else None, older)
+        try:
+            summary = await asyncio.to_thread(
+                generate_text,
+                self._llm_provider,
+                prompt,
+                temperature=0.1,
+                max_output_tokens=self._summary_max_tokens,
+                system_instruction=SUMMARY_SYSTEM_INSTRUCTION,
+            )
+        except Exception as exc:
+            logger.warning(f"History compaction failed for {session_id}: {exc}")
+            summary = None
+
+        summary = (summary or "").strip()
+        if not summary:
+            _compaction_stats["compaction_failures"] += 1
+            return None
+
+        summary = truncate_to_tokens(summary, self._summary_max_tokens)
+        source_tokens = sum(estimate_tokens(msg.content) for msg in older)
+        saved = await self._chat_repo.save_history_summary(
+            user_id=user_id,
+            session_id=session_id,
+            summary=summary,
+            summarized_until=last.created_at,
+            summarized_until_id=last.id,
+            summarized_message_count=(
+                (existing.summarized_message_count if existing else 0) + len(older)
+            ),
+            source_tokens=(existing.source_tokens if existing else 0) + source_tokens,
+            summary_tokens=estimate_tokens(summary),
+            previous=existing,
+        )
+        if saved is None:
+            # Another turn or worker summarized these messages first.
+            _compaction_stats["compaction_conflicts"] += 1
+            logger.info(f"History compaction for {session_id} lost to a concurrent one; dropped")
+            return None
+        _compaction_stats["compactions"] += 1
+        return saved
+
+    @staticmethod
+    def _format_transcript(messages: list[ChatMessage]) -> str:
+        lines = []
+        for msg in messages:
+            speaker = "ユーザー" if msg.role == "user" else "秘書"
+            lines.append(f"{speaker}: {msg.content.strip()}")
+        return "\n".join(lines)
+
+    def _build_summary_prompt(
+        self,
+        previous_summary: Optional[str],
+        messages: list[ChatMessage],
+    ) -> str:
+        parts = []
+        if previous_summary:
+            parts.append(f"## これまでの要約\n{previous_summary}")
+        parts.append(f"## 追加の会話\n{self._format_transcript(messages)}")
+        parts.append(
+            "上記をまとめ、これまでの要約を更新してください。"
+            f"{self._summary_max_tokens}トークン以内で出力してください。"
+        )
+        return "\n\n".join(parts)
+
+    def _fallback_summary(
+        self,
+        previous_summary: Optional[str],
+        messages: list[ChatMessage],
+    ) -> str:
+        """Extractive summary used when the LLM is unavailable (not persisted)."""
+        lines = [previous_summary] if previous_summary else []
+        for msg in messages:
+            speaker = "ユーザー" if msg.role == "user" else "秘書"
+            lines.append(f"- {speaker}: {truncate_to_tokens(msg.content.strip(), _FALLBACK_LINE_TOKENS)}")
+        text = "\n".join(lines)
+        if estimate_tokens(text) <= self._summary_max_tokens:
+            return text
+        # Keep the newest lines when the extract is too long.
+        kept: list[str] = []
+        used = 0
+        for line in reversed(lines):
+            cost = estimate_tokens(line) + 1
+            if used + cost > self._summary_max_tokens:
+                break
+            kept.append(line)
+            used += cost
+        return "\n".join(reversed(kept))
+
+    @staticmethod
+    def _record_stats(session_id: str, seed: HistorySeed) -> None:
+        _compaction_stats["hydrations"] += 1
+        _compaction_stats["full_history_tokens"] += seed.full_history_tokens
+        _compaction_stats["seeded_tokens"] += seed.seeded_tokens
+        _compaction_stats["tokens_saved"] += seed.tokens_saved
+        logger.info(
+            f"Hydrated chat history for {session_id}: {len(seed.messages)} messages, "
+            f"summary={bool(seed.summary)}, tokens {seed.full_history_tokens} -> "
+            f"{seed.seeded_tokens} (saved {seed.tokens_saved})"
+        )
@@ -4,13 +4,18 @@ Daily schedule plan generation service.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID, uuid4
 from zoneinfo import ZoneInfo
 
+from app.core.logger import logger
+from app.core.tracing import traced
 from app.interfaces.project_repository import IProjectRepository
 from app.interfaces.schedule_plan_repository import IDailySchedulePlanRepository
 from app.interfaces.schedule_settings_repository import IScheduleSettingsRepository
@@ -25,6 +30,7 @@ from app.models.schedule import (
     TaskAllocation,
 )
 from app.models.schedule_plan import (
+    DailySchedulePlan,
     DailySchedulePlanCreate,
     PendingChange,
     SchedulePlanResponse,
@@ -40,6 +46,27 @@ from app.services.scheduler_service import SchedulerService
 from app.utils.datetime_utils import get_user_today, now_utc
 
 DEFAULT_PLAN_DAYS = 30
+# plan_params key holding the scheduler input fingerprint; it only gates
+# incremental re-planning and is ignored by the stale check.
+INPUTS_FINGERPRINT_KEY = "inputs_fingerprint"
+
+# Process-wide counters exposed for monitoring.
+_replan_stats: dict[str, int] = {
+    "builds": 0,
+    "incremental_builds": 0,
+    "reused_days": 0,
+    "recomputed_days": 0,
+}
+
+
+def get_replan_stats() -> dict[str, int]:
+    """Return a snapshot of the process-wide (incremental) re-planning counters."""
+    return dict(_replan_stats)
+
+
+def _record_replan_fallback(reason: str) -> None:
+    key = f"fallback_{reason}"
+    _replan_stats[key] = _replan_stats.get(key, 0) + 1
 
 
 @dataclass
@@ -190,8 +217,46 @@ def _task_fingerprint(task: Task) -> str:
     return json.dumps(payload, ensure_ascii=True, sort_keys=True)
 
 
+def _task_state(task: Task) -> str:
+    status_value = task.status.value if hasattr(task.status, "value") else str(task.status)
+    return f"{status_value}:{task.progress or 0}:{int(bool(task.requires_all_completion))}"
+
+
 def _plan_params_fingerprint(params: dict) -> str:
-    return json.dumps(params, ensure_ascii=True, sort_keys=True)
+    compared = {key: value for key, value in params.items() if key != INPUTS_FINGERPRINT_KEY}
+    return json.dumps(compared, ensure_ascii=True, sort_keys=True)
+
+
+def _plan_inputs_fingerprint(
+    tasks: list[Task],
+    planned_task_ids: set[UUID],
+    project_priorities: dict[UUID, int],
+    assignments: Optional[list],
+    planned_windows: Optional[dict[UUID, tuple[Optional[date], Optional[date]]]],
+    team_project_ids: set[UUID],
+    reference_today: date,
+) -> str:
+    """Fingerprint scheduler inputs that are not covered by task snapshots."""
+    payload = {
+        "today": str(reference_today),
+        "project_priorities": sorted([str(pid), priority] for pid, priority in project_priorities.items()),
+        "assignments": None if assignments is None else sorted(
+            [str(a.task_id), a.assignee_id, str(a.status.value if hasattr(a.status, "value") else a.status)]
+            for a in assignments
+        ),
+        "planned_windows": sorted(
+            [str(tid), str(window[0]), str(window[1])] for tid, window in (planned_windows or {}).items()
+        ),
+        "team_project_ids": sorted(str(pid) for pid in team_project_ids),
+        # Tasks outside the user's plan still matter as parents and dependencies.
+        "other_tasks": sorted(
+            [str(task.id), _task_fingerprint(task), _task_state(task)]
+            for task in tasks
+            if task.id not in planned_task_ids
+        ),
+    }
+    encoded = json.dumps(payload, ensure_ascii=True, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
 
 
 def _is_done_task(task: Optional[Task]) -> bool:
@@ -203,7 +268,12 @@ def _is_done_task(task: Optional[Task]) -> bool:
 
 def _build_task_snapshots(tasks: list[Task]) -> list[TaskPlanSnapshot]:
     return [
-        TaskPlanSnapshot(task_id=task.id, title=task.title, fingerprint=_task_fingerprint(task))
+        TaskPlanSnapshot(
+            task_id=task.id,
+            title=task.title,
+            fingerprint=_task_fingerprint(task),
+            state=_task_state(task),
+        )
         for task in tasks
     ]
 
@@ -225,6 +295,91 @@ def _compute_pending_changes(tasks: list[Task], snapshots: list[TaskPlanSnapshot
     return pending
 
 
+def _find_replan_start(
+    plans: list[DailySchedulePlan],
+    tasks: list[Task],
+    snapshots: list[TaskPlanSnapshot],
+    effective_start_by_task: dict[UUID, date],
+    start_date: date,
+    timezone: str,
+) -> Optional[date]:
+    """
+    Return the first day of a stored plan group affected by task changes.
+
+    A task that is never picked cannot change which other task the scheduler
+    picks, so a changed task only affects days from the earlier of its first
+    allocation in the stored plan and the first day it can be scheduled now.
+    Parents, subtasks and dependents of changed tasks count as changed.
+    Returns None when no stored day is affected.
+    """
+    previous = {snapshot.task_id: snapshot for snapshot in plans[0].task_snapshots}
+    current = {snapshot.task_id: snapshot for snapshot in snapshots}
+    changed = {
+        task_id
+        for task_id, snapshot in current.items()
+        if task_id not in previous
+        or previous[task_id].fingerprint != snapshot.fingerprint
+        or previous[task_id].state != snapshot.state
+    }
+    changed |= set(previous) - set(current)
+    if not changed:
+        return None
+
+    task_map = {task.id: task for task in tasks}
+    previous_info = {info.task_id: info for info in plans[0].tasks}
+    for task_id in list(changed):
+        for parent_id in (
+            task_map[task_id].parent_id if task_id in task_map else None,
+            previous_info[task_id].parent_id if task_id in previous_info else None,
+        ):
+            if parent_id:
+                changed.add(parent_id)
+
+    followers: dict[UUID, list[UUID]] = {}
+    for task in tasks:
+        if task.parent_id:
+            followers.setdefault(task.parent_id, []).append(task.id)
+        for dep_id in task.dependency_ids or []:
+            followers.setdefault(dep_id, []).append(task.id)
+    stack = list(changed)
+    while stack:
+        for follower_id in followers.get(stack.pop(), []):
+            if follower_id not in changed:
+                changed.add(follower_id)
+                stack.append(follower_id)
+
+    first_allocated: dict[UUID, date] = {}
+    for plan in plans:
+        for allocation in plan.schedule_day.task_allocations:
+            first_allocated.setdefault(allocation.task_id, plan.plan_date)
+    for info in plans[0].tasks:
+        if info.planned_start and info.planned_start < first_allocated.get(info.task_id, date.max):
+            first_allocated[info.task_id] = info.planned_start
+
+    affected: list[date] = []
+    for task_id in changed:
+        if task_id in first_allocated:
+            affected.append(first_allocated[task_id])
+        task = task_map.get(task_id)
+        if task is None:
+            continue
+        if _is_done_task(task):
+            # Completed tasks are shown on their completion day.
+            if task.completed_at:
+                completed = task.completed_at
+                if completed.tzinfo is None:
+                    completed = completed.replace(tzinfo=ZoneInfo("UTC"))
+                affected.append(_to_local_datetime(completed, timezone).date())
+        elif task.is_fixed_time:
+            if task.start_time:
+                affected.append(_to_local_datetime(task.start_time, timezone).date())
+        else:
+            affected.append(effective_start_by_task.get(task_id, start_date))
+    if not affected:
+        return None
+    return max(start_date, min(affected))
+
+
 def _build_meeting_intervals(
     tasks: list[Task],
     target_date: date,
@@ -535,6 +690,277 @@ def _build_time_blocks(
     return time_blocks, updated_days, pinned_overflow
 
 
+@dataclass
+class PlanInputs:
+    """Scheduler inputs loaded for one user's plan (picklable)."""
+
+    user_id: str
+    timezone: str
+    start_date: date
+    settings: ScheduleSettings
+    capacity_by_weekday: list[float]
+    tasks: list[Task]
+    project_priorities: dict[UUID, int]
+    assignments: Optional[list]
+    planned_windows: Optional[dict[UUID, tuple[Optional[date], Optional[date]]]]
+    team_project_ids: set[UUID]
+    filter_by_assignee: bool = True
+    apply_plan_constraints: bool = True
+    from_now: bool = False
+
+
+@dataclass
+class PlanComputeJob:
+    """
+    CPU-only part of plan generation for one user.
+
+    Holds everything compute_plan_job needs, so it can be shipped to a worker
+    process; the result is written back by the caller.
+    """
+
+    inputs: PlanInputs
+    max_days: int
+
+
+@dataclass
+class ComputedPlan:
+    """A plan group ready to be stored for one user."""
+
+    user_id: str
+    plans: list[DailySchedulePlanCreate]
+    response: SchedulePlanResponse
+    reused_days: int = 0
+    recomputed_days: int = 0
+
+
+def _filter_plan_tasks(
+    tasks: list[Task],
+    assignments: Optional[list],
+    user_id: str,
+    filter_by_assignee: bool,
+    timezone: str,
+    team_project_ids: Optional[set[UUID]] = None,
+) -> list[Task]:
+    if not filter_by_assignee or assignments is None:
+        return tasks
+    assignees_by_task: dict[UUID, set[str]] = {}
+    for assignment in assignments:
+        assignees_by_task.setdefault(assignment.task_id, set()).add(assignment.assignee_id)
+
+    _team_ids = team_project_ids or set()
+
+    def is_my_task(task: Task) -> bool:
+        if not task.project_id:
+            return True  # Personal task
+        if task.project_id not in _team_ids:
+            return True  # PRIVATE project task - always include
+        # TEAM project: only if assigned to me
+        assignees = assignees_by_task.get(task.id)
+        if not assignees or user_id not in assignees:
+            return False
+        if task.requires_all_completion and task.status == TaskStatus.WAITING:
+            my_assignment = next(
+                (
+                    entry for entry in assignments
+                    if entry.task_id == task.id and entry.assignee_id == user_id
+                ),
+                None,
+            )
+            if my_assignment and my_assignment.status == TaskStatus.DONE:
+                return False
+        return True
+
+    today = get_user_today(timezone)
+    return [
+        task
+        for task in tasks
+        if task.is_fixed_time
+        or is_my_task(task)
+        or (task.pinned_date and task.pinned_date.date() >= today)
+    ]
+
+
+def _single_plan_params(inputs: PlanInputs, filtered_tasks: list[Task], max_days: int) -> dict:
+    return {
+        "start_date": str(inputs.start_date),
+        "max_days": max_days,
+        "filter_by_assignee": inputs.filter_by_assignee,
+        "apply_plan_constraints": inputs.apply_plan_constraints,
+        "capacity_by_weekday": inputs.capacity_by_weekday,
+        "buffer_hours": inputs.settings.buffer_hours,
+        "break_after_task_minutes": inputs.settings.break_after_task_minutes,
+        INPUTS_FINGERPRINT_KEY: _plan_inputs_fingerprint(
+            inputs.tasks,
+            {task.id for task in filtered_tasks},
+            inputs.project_priorities,
+            inputs.assignments,
+            inputs.planned_windows,
+            inputs.team_project_ids,
+            get_user_today(inputs.timezone),
+        ),
+    }
+
+
+def _schedule_single(
+    scheduler_service: SchedulerService,
+    inputs: PlanInputs,
+    max_days: int,
+    prefix_days: Optional[list[ScheduleDay]] = None,
+) -> ScheduleResponse:
+    return scheduler_service.build_schedule(
+        inputs.tasks,
+        project_priorities=inputs.project_priorities,
+        start_date=inputs.start_date,
+        capacity_by_weekday=inputs.capacity_by_weekday,
+        max_days=max_days,
+        current_user_id=inputs.user_id,
+        assignments=inputs.assignments,
+        filter_by_assignee=inputs.filter_by_assignee,
+        planned_window_by_task=inputs.planned_windows,
+        user_timezone=inputs.timezone,
+        team_project_ids=inputs.team_project_ids,
+        prefix_days=prefix_days,
+    )
+
+
+def _assemble_plan(
+    inputs: PlanInputs,
+    schedule: ScheduleResponse,
+    filtered_tasks: list[Task],
+    snapshots: list[TaskPlanSnapshot],
+    plan_params: dict,
+    reused_plans: Optional[list[DailySchedulePlan]] = None,
+) -> ComputedPlan:
+    """Lay out time blocks for a schedule and build the plan rows to store."""
+    user_id = inputs.user_id
+    timezone = inputs.timezone
+    # Reused days keep their stored blocks; only the rest is laid out again.
+    reused_plans = (reused_plans or [])[:len(schedule.days)]
+    replanned = schedule.model_copy(update={"days": schedule.days[len(reused_plans):]})
+    time_blocks, updated_days, pinned_overflow = _build_time_blocks(
+        replanned,
+        filtered_tasks,
+        inputs.settings,
+        timezone,
+        inputs.from_now,
+        inputs.start_date,
+    )
+    # Pinned overflow ids are stored group-wide; keep those of reused days.
+    reused_dates = {plan.plan_date for plan in reused_plans}
+    pinned_dates = {
+        task.id: task.pinned_date.date() for task in filtered_tasks if task.pinned_date
+    }
+    reused_blocks: list[ScheduleTimeBlock] = []
+    reused_pinned: list[UUID] = []
+    for plan in reused_plans:
+        reused_blocks.extend(plan.time_blocks)
+        for task_id in plan.pinned_overflow_task_ids:
+            if pinned_dates.get(task_id) in reused_dates and task_id not in reused_pinned:
+                reused_pinned.append(task_id)
+    time_blocks = reused_blocks + time_blocks
+    pinned_overflow = reused_pinned + [
+        task_id for task_id in pinned_overflow if task_id not in reused_pinned
+    ]
+
+    updated_schedule = ScheduleResponse(
+        start_date=schedule.start_date,
+        days=[updated_days.get(day.date, day) for day in schedule.days],
+        tasks=list(schedule.tasks),
+        unscheduled_task_ids=schedule.unscheduled_task_ids,
+        excluded_tasks=schedule.excluded_tasks,
+    )
+
+    pending_changes: list[PendingChange] = []
+    plan_group_id = uuid4()
+    generated_at = now_utc()
+
+    plans: list[DailySchedulePlanCreate] = []
+    for day in updated_schedule.days:
+        plans.append(
+            DailySchedulePlanCreate(
+                user_id=user_id,
+                plan_date=day.date,
+                timezone=timezone,
+                plan_group_id=plan_group_id,
+                schedule_day=day,
+                tasks=updated_schedule.tasks,
+                unscheduled_task_ids=updated_schedule.unscheduled_task_ids,
+                excluded_tasks=updated_schedule.excluded_tasks,
+                time_blocks=[block for block in time_blocks if block.start.astimezone(ZoneInfo(timezone)).date() == day.date],
+                task_snapshots=snapshots,
+                pinned_overflow_task_ids=pinned_overflow,
+                plan_params=plan_params,
+                generated_at=generated_at,
+            )
+        )
+
+    response = SchedulePlanResponse(
+        start_date=updated_schedule.start_date,
+        days=updated_schedule.days,
+        tasks=updated_schedule.tasks,
+        unscheduled_task_ids=updated_schedule.unscheduled_task_ids,
+        excluded_tasks=updated_schedule.excluded_tasks,
+        plan_state="planned",
+        plan_group_id=plan_group_id,
+        plan_generated_at=generated_at,
+        pending_changes=pending_changes,
+        time_blocks=time_blocks,
+        pinned_overflow_task_ids=pinned_overflow,
+    )
+    return ComputedPlan(
+        user_id=user_id,
+        plans=plans,
+        response=response,
+        reused_days=len(reused_plans),
+        recomputed_days=len(replanned.days),
+    )
+
+
+def _compute_single_plan(scheduler_service: SchedulerService, inputs: PlanInputs, max_days: int) -> ComputedPlan:
+    filtered_tasks = _filter_plan_tasks(
+        inputs.tasks,
+        inputs.assignments,
+        inputs.user_id,
+        inputs.filter_by_assignee,
+        inputs.timezone,
+        team_project_ids=inputs.team_project_ids,
+    )
+    schedule = _schedule_single(scheduler_service, inputs, max_days)
+    return _assemble_plan(
+        inputs,
+        schedule,
+        filtered_tasks,
+        _build_task_snapshots(filtered_tasks),
+        _single_plan_params(inputs, filtered_tasks, max_days),
+    )
+
+
+def compute_plan_job(
+    job: PlanComputeJob,
+    scheduler_service: Optional[SchedulerService] = None,
+) -> ComputedPlan:
+    """
+    Run the scheduling and time-block layout of a job without any I/O.
+
+    The user goes through the same scheduling path as build_plan, so a stored
+    plan is exactly what POST /schedule/plan would build. Module-level so that
+    it can run in a ProcessPoolExecutor worker.
+    """
+    return _compute_single_plan(scheduler_service or SchedulerService(), job.inputs, job.max_days)
+
+
+def _record_plan_stats(computed: ComputedPlan) -> None:
+    _replan_stats["builds"] += 1
+    _replan_stats["reused_days"] += computed.reused_days
+    _replan_stats["recomputed_days"] += computed.recomputed_days
+    if computed.reused_days:
+        _replan_stats["incremental_builds"] += 1
+        logger.info(
+            f"Incremental plan for {computed.user_id}: reused {computed.reused_days} days, "
+            f"recomputed {computed.recomputed_days}"
+        )
+
+
 class DailySchedulePlanService:
     def __init__(
         self,
@@ -565,43 +991,14 @@ class DailySchedulePlanService:
         timezone: str,
         team_project_ids: Optional[set[UUID]] = None,
     ) -> list[Task]:
-        if not filter_by_assignee or assignments is None:
-            return tasks
-        assignees_by_task: dict[UUID, set[str]] = {}
-        for assignment in assignments:
-            assignees_by_task.setdefault(assignment.task_id, set()).add(assignment.assignee_id)
-
-        _team_ids = team_project_ids or set()
-
-        def is_my_task(task: Task) -> bool:
-            if not task.project_id:
-                return True  # Personal task
-            if task.project_id not in _team_ids:
-                return True  # PRIVATE project task - always include
-            # TEAM project: only if assigned to me
-            assignees = assignees_by_task.get(task.id)
-            if not assignees or user_id not in assignees:
-                return False
-            if task.requires_all_completion and task.status == TaskStatus.WAITING:
-                my_assignment = next(
-                    (
-                        entry for entry in assignments
-                        if entry.task_id == task.id and entry.assignee_id == user_id
-                    ),
-                    None,
-                )
-                if my_assignment and my_assignment.status == TaskStatus.DONE:
-                    return False
-            return True
-
-        today = get_user_today(timezone)
-        return [
-            task
-            for task in tasks
-            if task.is_fixed_time
-            or is_my_task(task)
-            or (task.pinned_date and task.pinned_date.date() >= today)
-        ]
+        return _filter_plan_tasks(
+            tasks,
+            assignments,
+            user_id,
+            filter_by_assignee,
+            timezone,
+            team_project_ids=team_project_ids,
+        )
 
     async def _load_settings(self, user_id: str) -> ScheduleSettings:
         settings = await self._settings_repo.get(user_id)
@@ -654,15 +1051,15 @@ class DailySchedulePlanService:
                     )
         return planned_windows
 
-    async def build_plan(
+    async def _load_plan_inputs(
         self,
         user_id: str,
         start_date: Optional[date] = None,
-        max_days: int = DEFAULT_PLAN_DAYS,
         from_now: bool = False,
         filter_by_assignee: bool = True,
         apply_plan_constraints: bool = True,
-    ) -> SchedulePlanResponse:
+    ) -> PlanInputs:
+        """Load everything the scheduler needs for one user's plan."""
         timezone = await self._load_user_timezone(user_id)
         resolved_start = start_date or get_user_today(timezone)
         settings = await self._load_settings(user_id)
@@ -709,99 +1106,199 @@ class DailySchedulePlanService:
             if p.visibility == ProjectVisibility.TEAM
         }
 
-        schedule = self._scheduler_service.build_schedule(
-            tasks,
-            project_priorities=project_priorities,
+        return PlanInputs(
+            user_id=user_id,
+            timezone=timezone,
             start_date=resolved_start,
+            settings=settings,
             capacity_by_weekday=capacity_by_weekday,
-            max_days=max_days,
-            current_user_id=user_id,
+            tasks=tasks,
+            project_priorities=project_priorities,
             assignments=assignments,
-            filter_by_assignee=filter_by_assignee,
-            planned_window_by_task=planned_windows,
-            user_timezone=timezone,
+            planned_windows=planned_windows,
             team_project_ids=team_project_ids,
+            filter_by_assignee=filter_by_assignee,
+            apply_plan_constraints=apply_plan_constraints,
+            from_now=from_now,
         )
 
+    @traced("daily_plan.build_plan")
+    async def build_plan(
+        self,
+        user_id: str,
+        start_date: Optional[date] = None,
+        max_days: int = DEFAULT_PLAN_DAYS,
+        from_now: bool = False,
+        filter_by_assignee: bool = True,
+        apply_plan_constraints: bool = True,
+        incremental: bool = True,
+    ) -> SchedulePlanResponse:
+        """
+        Build and store a plan group for max_days days from start_date.
+
+        With incremental=True the stored plan group for the same parameters is
+        reused up to the first day affected by task changes, and scheduling
+        resumes from that day (see _find_replan_start). Any parameter or input
+        change falls back to a full rebuild.
+        """
+        inputs = await self._load_plan_inputs(
+            user_id,
+            start_date,
+            from_now=from_now,
+            filter_by_assignee=filter_by_assignee,
+            apply_plan_constraints=apply_plan_constraints,
+        )
         filtered_tasks = self._filter_tasks_for_plan(
-            tasks,
-            assignments,
+            inputs.tasks,
+            inputs.assignments,
             user_id,
             filter_by_assignee,
-            timezone,
-            team_project_ids=team_project_ids,
+            inputs.timezone,
+            team_project_ids=inputs.team_project_ids,
         )
+        snapshots = _build_task_snapshots(filtered_tasks)
+        plan_params = _single_plan_params(inputs, filtered_tasks, max_days)
 
-        time_blocks, updated_days, pinned_overflow = _build_time_blocks(
+        reused_plans: list[DailySchedulePlan] = []
+        if incremental:
+            if from_now:
+                _record_replan_fallback("from_now")
+            else:
+                reused_plans = await self._load_reusable_prefix(
+                    user_id,
+                    inputs.start_date,
+                    max_days,
+                    plan_params,
+                    inputs.tasks,
+                    snapshots,
+                    inputs.planned_windows,
+                    inputs.timezone,
+                )
+
+        schedule = _schedule_single(
+            self._scheduler_service,
+            inputs,
+            max_days,
+            prefix_days=[plan.schedule_day for plan in reused_plans] or None,
+        )
+        computed = _assemble_plan(
+            inputs,
             schedule,
             filtered_tasks,
-            settings,
-            timezone,
-            from_now,
-            resolved_start,
+            snapshots,
+            plan_params,
+            reused_plans=reused_plans,
         )
+        await self._save_computed_plans([computed])
+        return computed.response
 
-        updated_tasks = []
-        for task in schedule.tasks:
-            updated_tasks.append(task)
+    @traced("daily_plan.build_plans")
+    async def build_plans(
+        self,
+        user_ids: list[str],
+        max_days: int = DEFAULT_PLAN_DAYS,
+        executor: Optional[Executor] = None,
+    ) -> dict[str, SchedulePlanResponse]:
+        """
+        Build and store today's plans for many users, one job per user.
 
-        updated_schedule = ScheduleResponse(
-            start_date=schedule.start_date,
-            days=[updated_days.get(day.date, day) for day in schedule.days],
-            tasks=updated_tasks,
-            unscheduled_task_ids=schedule.unscheduled_task_ids,
-            excluded_tasks=schedule.excluded_tasks,
-        )
+        Each user is scheduled exactly like build_plan (same inputs and
+        plan_params), so the stored plans match POST /schedule/plan and later
+        incremental replans can reuse them.
 
-        snapshots = _build_task_snapshots(filtered_tasks)
-        pending_changes: list[PendingChange] = []
-        plan_group_id = uuid4()
-        generated_at = now_utc()
-        plan_params = {
-            "start_date": str(resolved_start),
-            "max_days": max_days,
-            "filter_by_assignee": filter_by_assignee,
-            "apply_plan_constraints": apply_plan_constraints,
-            "capacity_by_weekday": capacity_by_weekday,
-            "buffer_hours": settings.buffer_hours,
-            "break_after_task_minutes": settings.break_after_task_minutes,
-        }
+        Inputs are loaded first, then every job is computed by
+        compute_plan_job (in ``executor`` when given, e.g. a process pool) and
+        the results are written back per user. A failing user is logged and
+        skipped so that the others still get their plans.
 
-        plans: list[DailySchedulePlanCreate] = []
-        for day in updated_schedule.days:
-            plans.append(
-                DailySchedulePlanCreate(
-                    user_id=user_id,
-                    plan_date=day.date,
-                    timezone=timezone,
-                    plan_group_id=plan_group_id,
-                    schedule_day=day,
-                    tasks=updated_schedule.tasks,
-                    unscheduled_task_ids=updated_schedule.unscheduled_task_ids,
-                    excluded_tasks=updated_schedule.excluded_tasks,
-                    time_blocks=[block for block in time_blocks if block.start.astimezone(ZoneInfo(timezone)).date() == day.date],
-                    task_snapshots=snapshots,
-                    pinned_overflow_task_ids=pinned_overflow,
-                    plan_params=plan_params,
-                    generated_at=generated_at,
-                )
+        Returns:
+            Stored plan per user id (failed users are missing)
+        """
+        jobs: list[PlanComputeJob] = []
+        for user_id in dict.fromkeys(user_ids):
+            try:
+                jobs.append(PlanComputeJob(inputs=await self._load_plan_inputs(user_id), max_days=max_days))
+            except Exception as exc:
+                logger.error(f"Failed to load plan inputs for user {user_id}: {exc}")
+
+        if executor is None:
+            outcomes: list = []
+            for job in jobs:
+                try:
+                    outcomes.append(compute_plan_job(job, self._scheduler_service))
+                except Exception as exc:
+                    outcomes.append(exc)
+        else:
+            loop = asyncio.get_running_loop()
+            outcomes = await asyncio.gather(
+                *[loop.run_in_executor(executor, compute_plan_job, job) for job in jobs],
+                return_exceptions=True,
             )
 
-        await self._plan_repo.upsert_many(user_id, plans)
+        results: dict[str, SchedulePlanResponse] = {}
+        for job, outcome in zip(jobs, outcomes):
+            user_id = job.inputs.user_id
+            if isinstance(outcome, BaseException):
+                logger.error(f"Failed to generate daily plans for user {user_id}: {outcome}")
+                continue
+            try:
+                await self._save_computed_plans([outcome])
+            except Exception as exc:
+                logger.error(f"Failed to store daily plans for user {user_id}: {exc}")
+                continue
+            results[user_id] = outcome.response
+        return results
 
-        return SchedulePlanResponse(
-            start_date=updated_schedule.start_date,
-            days=updated_schedule.days,
-            tasks=updated_schedule.tasks,
-            unscheduled_task_ids=updated_schedule.unscheduled_task_ids,
-            excluded_tasks=updated_schedule.excluded_tasks,
-            plan_state="planned",
-            plan_group_id=plan_group_id,
-            plan_generated_at=generated_at,
-            pending_changes=pending_changes,
-            time_blocks=time_blocks,
-            pinned_overflow_task_ids=pinned_overflow,
+    async def _save_computed_plans(self, computed_plans: list[ComputedPlan]) -> None:
+        for computed in computed_plans:
+            _record_plan_stats(computed)
+            await self._plan_repo.upsert_many(computed.user_id, computed.plans)
+
+    async def _load_reusable_prefix(
+        self,
+        user_id: str,
+        start_date: date,
+        max_days: int,
+        plan_params: dict,
+        tasks: list[Task],
+        snapshots: list[TaskPlanSnapshot],
+        planned_windows: Optional[dict[UUID, tuple[Optional[date], Optional[date]]]],
+        timezone: str,
+    ) -> list[DailySchedulePlan]:
+        """Return the stored plan days that can be kept as-is (empty = full rebuild)."""
+        end_date = start_date + timedelta(days=max_days - 1)
+        stored = await self._plan_repo.list_by_range(user_id, start_date, end_date)
+        # The group may end early when every task fits; rows after it belong
+        # to older groups.
+        plans: list[DailySchedulePlan] = []
+        for offset, plan in enumerate(stored):
+            if plan.plan_date != start_date + timedelta(days=offset):
+                break
+            if plans and plan.plan_group_id != plans[0].plan_group_id:
+                break
+            plans.append(plan)
+        if not plans:
+            _record_replan_fallback("no_plan_group")
+            return []
+        if json.dumps(plans[0].plan_params, sort_keys=True) != json.dumps(plan_params, sort_keys=True):
+            _record_replan_fallback("params_changed")
+            return []
+
+        effective_start = self._scheduler_service.get_effective_start_dates(
+            tasks,
+            planned_window_by_task=planned_windows,
+            reference_today=get_user_today(timezone),
         )
+        replan_start = _find_replan_start(
+            plans, tasks, snapshots, effective_start, start_date, timezone,
+        )
+        reusable = [
+            plan for plan in plans
+            if replan_start is None or plan.plan_date < replan_start
+        ]
+        if not reusable:
+            _record_replan_fallback("first_day_affected")
+        return reusable
 
     async def _get_past_days_from_plans(
         self,
@@ -1103,6 +1600,7 @@ class DailySchedulePlanService:
                         task_id=updated_task.id,
                         title=updated_task.title,
                         fingerprint=_task_fingerprint(updated_task),
+                        state=_task_state(updated_task),
                     ),
                 )
 
@@ -9,6 +9,7 @@ from typing import Any
 
 from app.core.config import get_settings
 from app.core.logger import setup_logger
+from app.core.tracing import traced
 from app.interfaces.agent_task_repository import IAgentTaskRepository
 from app.models.agent_task import AgentTask
 from app.models.enums import ActionType
@@ -64,6 +65,7 @@ class HeartbeatService:
         """
         return self.quiet_hours_start <= current_time < self.quiet_hours_end
 
+    @traced("heartbeat.process_heartbeat")
     async def process_heartbeat(self, user_id: str) -> dict[str, Any]:
         """
         Process pending agent tasks for a user.
@@ -0,0 +1,376 @@
+"""
+LLM usage ledger.
+
+Every LLM call (or agent turn) is recorded with its model, feature, user,
+tokens, latency, retries and estimated cost. The feature and user come from
+a scope held in a context variable, so call sites deep inside services do
+not need extra parameters:
+
+    with llm_usage_scope("project_summary", user_id=user_id):
+        generate_text(...)
+
+    async with llm_usage_scope("heartbeat", user_id=user_id, background=True) as usage:
+        ...  # usage.throttled: the daily budget is spent
+
+Records are buffered in memory and written in batches by a flush loop
+started with the application, so recording never waits on the database.
+
+Background scopes entered with ``async with`` check the user's spend of the
+current UTC day against LLM_USER_DAILY_BUDGET_USD and the feature's entry in
+LLM_FEATURE_DAILY_BUDGETS_USD. In a throttled scope generate_text returns
+None without calling the model, and callers fall back to their non-LLM
+behaviour.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dt_time, timezone
+from typing import Any, Callable, Optional
+
+from app.core.config import get_settings
+from app.core.logger import logger
+from app.interfaces.llm_usage_repository import ILlmUsageRepository
+from app.models.llm_usage import LlmBudgetStatus, LlmUsageRecord
+from app.services.cost_utils import calculate_cost
+from app.utils.datetime_utils import now_utc
+
+UNSCOPED_FEATURE = "unscoped"
+
+_current_scope: ContextVar[Optional["LlmUsageScope"]] = ContextVar("llm_usage_scope", default=None)
+
+
+@dataclass
+class LlmUsageScope:
+    """Attribution (and budget state) of the LLM calls made within a block."""
+
+    feature: str
+    user_id: Optional[str] = None
+    background: bool = False
+    throttled: bool = False
+    # Earlier attempts of the request the next call belongs to.
+    retries: int = 0
+
+
+def current_llm_usage_scope() -> Optional[LlmUsageScope]:
+    return _current_scope.get()
+
+
+class llm_usage_scope:
+    """
+    Attribute the LLM calls of a block to a feature (``with`` / ``async with``).
+
+    Nested scopes inherit the user, background flag and throttling of the
+    enclosing scope. Only ``async with`` on a background scope checks the
+    budgets.
+    """
+
+    def __init__(
+        self,
+        feature: str,
+        user_id: Optional[str] = None,
+        background: bool = False,
+    ) -> None:
+        parent = _current_scope.get()
+        self.scope = LlmUsageScope(
+            feature=feature,
+            user_id=user_id if user_id is not None else (parent.user_id if parent else None),
+            background=background or bool(parent and parent.background),
+            throttled=bool(parent and parent.throttled),
+        )
+        self._parent = parent
+        self._token = None
+
+    def __enter__(self) -> LlmUsageScope:
+        self._token = _current_scope.set(self.scope)
+        return self.scope
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            _current_scope.reset(self._token)
+        except ValueError:
+            _current_scope.set(self._parent)
+        return False
+
+    async def __aenter__(self) -> LlmUsageScope:
+        scope = self.scope
+        if scope.background and not scope.throttled:
+            scope.throttled = not await llm_usage_ledger.allows(scope.user_id, scope.feature)
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return self.__exit__(exc_type, exc, tb)
+
+
+def _start_of_day(day: date) -> datetime:
+    return datetime.combine(day, dt_time.min, tzinfo=timezone.utc)
+
+
+@dataclass
+class _DailySpend:
+    """A user's spend per feature on one UTC day (stored + recorded since)."""
+
+    day: date
+    loaded_at: float
+    by_feature: dict[str, float] = field(default_factory=dict)
+
+    def add(self, feature: str, cost: float) -> None:
+        self.by_feature[feature] = self.by_feature.get(feature, 0.0) + cost
+
+
+def _default_repository() -> Optional[ILlmUsageRepository]:
+    from app.api.deps import get_llm_usage_repository
+
+    try:
+        return get_llm_usage_repository()
+    except NotImplementedError:
+        return None
+
+
+class LlmUsageLedger:
+    """
+    Process-wide buffer of usage records with batched writes and budgets.
+
+    ``record`` is thread-safe (generate_text also runs in worker threads).
+    """
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], Optional[ILlmUsageRepository]] = _default_repository,
+    ) -> None:
+        self._repository_factory = repository_factory
+        self._repository: Optional[ILlmUsageRepository] = None
+        self._lock = threading.Lock()
+        self._pending: deque[LlmUsageRecord] = deque()
+        self._in_flight: list[LlmUsageRecord] = []
+        self._spend: dict[str, _DailySpend] = {}
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._written = 0
+        self._dropped = 0
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        model: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        latency_ms: float = 0.0,
+        success: bool = True,
+        feature: Optional[str] = None,
+        user_id: Optional[str] = None,
+        retries: Optional[int] = None,
+    ) -> Optional[LlmUsageRecord]:
+        """
+        Buffer one usage record; feature/user/retries default to the scope's.
+
+        Returns:
+            The record, or None when the ledger is disabled
+        """
+        settings = get_settings()
+        if not settings.LLM_USAGE_ENABLED:
+            return None
+        scope = _current_scope.get()
+        record = LlmUsageRecord(
+            user_id=user_id if user_id is not None else (scope.user_id if scope else None),
+            feature=feature or (scope.feature if scope else UNSCOPED_FEATURE),
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            latency_ms=round(max(latency_ms, 0.0), 1),
+            retries=retries if retries is not None else (scope.retries if scope else 0),
+            success=success,
+            cost_usd=calculate_cost(model, input_tokens, output_tokens),
+        )
+        with self._lock:
+            self._pending.append(record)
+            while len(self._pending) > settings.LLM_USAGE_BUFFER_LIMIT:
+                self._pending.popleft()
+                self._dropped += 1
+            spend = self._spend.get(record.user_id) if record.user_id else None
+            if spend is not None and record.cost_usd and spend.day == record.created_at.date():
+                spend.add(record.feature, record.cost_usd)
+            batch_ready = len(self._pending) >= settings.LLM_USAGE_BATCH_SIZE
+        if batch_ready:
+            self._wake_flusher()
+        return record
+
+    # ------------------------------------------------------------------
+    # Batched writes
+    # ------------------------------------------------------------------
+
+    def _get_repository(self) -> Optional[ILlmUsageRepository]:
+        if self._repository is None:
+            self._repository = self._repository_factory()
+        return self._repository
+
+    async def flush(self) -> int:
+        """Write all buffered records in batches; returns the number written."""
+        repository = self._get_repository()
+        if repository is None:
+            return 0
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        batch_size = max(1, get_settings().LLM_USAGE_BATCH_SIZE)
+        written = 0
+        async with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [self._pending.popleft() for _ in range(min(batch_size, len(self._pending)))]
+                    self._in_flight = batch
+                if not batch:
+                    break
+                try:
+                    await repository.add_many(batch)
+                except Exception as exc:
+                    logger.warning(f"Failed to write {len(batch)} LLM usage records: {exc}")
+                    with self._lock:
+                        self._pending.extendleft(reversed(batch))
+                        self._in_flight = []
+                    break
+                with self._lock:
+                    self._in_flight = []
+                    self._written += len(batch)
+                written += len(batch)
+        return written
+
+    def _wake_flusher(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wake.set()
+        else:
+            loop.call_soon_threadsafe(wake.set)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(),
+                    timeout=get_settings().LLM_USAGE_FLUSH_INTERVAL_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def start(self) -> None:
+        """Start the periodic flush loop (idempotent)."""
+        settings = get_settings()
+        if self._task is not None or not settings.LLM_USAGE_ENABLED:
+            return
+        if settings.ENVIRONMENT == "test":
+            return
+        if self._get_repository() is None:
+            logger.info("LLM usage ledger has no repository in this environment; not persisting")
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write what is still buffered."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        self._loop = self._wake = None
+        await self.flush()
+
+    # ------------------------------------------------------------------
+    # Budgets
+    # ------------------------------------------------------------------
+
+    async def spend_today(self, user_id: str) -> dict[str, float]:
+        """A user's spend per feature on the current UTC day (USD)."""
+        today = now_utc().date()
+        ttl = get_settings().LLM_BUDGET_CACHE_SECONDS
+        with self._lock:
+            cached = self._spend.get(user_id)
+            if cached is not None and cached.day == today and time.monotonic() - cached.loaded_at < ttl:
+                return dict(cached.by_feature)
+
+        repository = self._get_repository()
+        stored = await repository.spend_by_feature(user_id, _start_of_day(today)) if repository else {}
+        spend = _DailySpend(day=today, loaded_at=time.monotonic(), by_feature=dict(stored))
+        with self._lock:
+            # Records not yet committed are missing from the stored totals.
+            for record in (*self._in_flight, *self._pending):
+                if record.user_id == user_id and record.cost_usd and record.created_at.date() == today:
+                    spend.add(record.feature, record.cost_usd)
+            self._spend[user_id] = spend
+        return dict(spend.by_feature)
+
+    async def allows(self, user_id: Optional[str], feature: str) -> bool:
+        """Whether a background feature may still call the LLM for a user today."""
+        settings = get_settings()
+        user_budget = settings.LLM_USER_DAILY_BUDGET_USD
+        feature_budget = settings.llm_feature_daily_budgets.get(feature)
+        if not user_id or (user_budget is None and feature_budget is None):
+            return True
+        try:
+            spent = await self.spend_today(user_id)
+        except Exception as exc:
+            logger.warning(f"LLM budget check failed for user {user_id}: {exc}")
+            return True
+        if user_budget is not None and sum(spent.values()) >= user_budget:
+            logger.info(f"LLM daily budget reached for user {user_id}; throttling {feature}")
+            return False
+        if feature_budget is not None and spent.get(feature, 0.0) >= feature_budget:
+            logger.info(f"LLM daily {feature} budget reached for user {user_id}; throttling")
+            return False
+        return True
+
+    async def budget_status(self, user_id: str) -> LlmBudgetStatus:
+        settings = get_settings()
+        spent = await self.spend_today(user_id)
+        return LlmBudgetStatus(
+            user_id=user_id,
+            spent_today_usd=round(sum(spent.values()), 6),
+            daily_budget_usd=settings.LLM_USER_DAILY_BUDGET_USD,
+            feature_spent_today_usd={name: round(cost, 6) for name, cost in spent.items()},
+            feature_daily_budgets_usd=settings.llm_feature_daily_budgets,
+        )
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": len(self._pending) + len(self._in_flight),
+                "written": self._written,
+                "dropped": self._dropped,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._in_flight = []
+            self._spend.clear()
+            self._flush_lock = None
+            self._written = 0
+            self._dropped = 0
+
+
+llm_usage_ledger = LlmUsageLedger()
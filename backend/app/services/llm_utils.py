@@ -5,11 +5,14 @@ Shared LLM invocation utilities for text generation.
 from __future__ import annotations
 
 import json
-from typing import Optional
+import time
+from typing import Any, Optional
 
 from app.core.config import get_settings
 from app.core.logger import logger
+from app.core.tracing import traced
 from app.interfaces.llm_provider import ILLMProvider
+from app.services.llm_usage_service import current_llm_usage_scope, llm_usage_ledger
 
 
 def _is_litellm_provider(llm_provider: ILLMProvider) -> bool:
@@ -23,6 +26,32 @@ def _is_litellm_provider(llm_provider: ILLMProvider) -> bool:
     return isinstance(llm_provider, LiteLLMProvider)
 
 
+def _is_throttled() -> bool:
+    scope = current_llm_usage_scope()
+    return bool(scope and scope.throttled)
+
+
+def _record_usage(model: str, started: float, response: Any, success: bool) -> None:
+    """Record one provider call (token counts from Gemini or LiteLLM responses)."""
+    input_tokens = output_tokens = 0
+    metadata = getattr(response, "usage_metadata", None)
+    usage = getattr(response, "usage", None)
+    if metadata is not None:
+        input_tokens = getattr(metadata, "prompt_token_count", None) or 0
+        output_tokens = getattr(metadata, "candidates_token_count", None) or 0
+    elif usage is not None:
+        input_tokens = getattr(usage, "prompt_tokens", None) or 0
+        output_tokens = getattr(usage, "completion_tokens", None) or 0
+    llm_usage_ledger.record(
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        latency_ms=(time.perf_counter() - started) * 1000,
+        success=success,
+    )
+
+
+@traced("llm.generate_text")
 def generate_text(
     llm_provider: ILLMProvider,
     prompt: str,
@@ -35,9 +64,10 @@ def generate_text(
     """
     Generate text from the configured LLM provider.
 
-    Returns None when the provider is unavailable or the call fails.
+    Returns None when the provider is unavailable, the call fails or the
+    current background LLM usage scope is over budget.
     """
-    if not prompt:
+    if not prompt or _is_throttled():
         return None
 
     if _is_litellm_provider(llm_provider):
@@ -73,6 +103,9 @@ def generate_text(
     if system_instruction:
         config_kwargs["system_instruction"] = system_instruction
 
+    model_id = llm_provider.get_model_id()
+    started = time.perf_counter()
+    response = None
     try:
         client = genai.Client(api_key=api_key)
         model_name = llm_provider.get_model()
@@ -81,13 +114,17 @@ def generate_text(
             contents=[Content(role="user", parts=[Part(text=prompt)])],
             config=GenerateContentConfig(**config_kwargs),
         )
+        _record_usage(model_id, started, response, success=True)
         text = (response.text or "").strip()
         return text or None
     except Exception as exc:
+        if response is None:
+            _record_usage(model_id, started, None, success=False)
         logger.warning(f"GenAI request failed: {exc}")
     return None
 
 
+@traced("llm.generate_text")
 def generate_text_with_status(
     llm_provider: ILLMProvider,
     prompt: str,
@@ -104,6 +141,8 @@ def generate_text_with_status(
     """
     if not prompt:
         return None, "empty_prompt", None
+    if _is_throttled():
+        return None, "llm_budget_exceeded", None
 
     if _is_litellm_provider(llm_provider):
         return _generate_text_litellm_with_status(
@@ -138,6 +177,9 @@ def generate_text_with_status(
     if system_instruction:
         config_kwargs["system_instruction"] = system_instruction
 
+    model_id = llm_provider.get_model_id()
+    started = time.perf_counter()
+    response = None
     try:
         client = genai.Client(api_key=api_key)
         model_name = llm_provider.get_model()
@@ -146,11 +188,14 @@ def generate_text_with_status(
             contents=[Content(role="user", parts=[Part(text=prompt)])],
             config=GenerateContentConfig(**config_kwargs),
         )
+        _record_usage(model_id, started, response, success=True)
         text = (response.text or "").strip()
         if not text:
             return None, "genai_empty_response", None
         return text, None, None
     except Exception as exc:
+        if response is None:
+            _record_usage(model_id, started, None, success=False)
         logger.warning(f"GenAI request failed: {exc}")
         return None, "genai_request_failed", _maybe_detail(exc)
 
@@ -199,12 +244,17 @@ def _generate_text_litellm(
     if llm_provider.get_api_key():
         kwargs["api_key"] = llm_provider.get_api_key()
 
+    started = time.perf_counter()
+    response = None
     try:
         response = litellm.completion(**kwargs)
+        _record_usage(kwargs["model"], started, response, success=True)
         content = response.choices[0].message.content
         text = (content or "").strip()
         return text or None
     except Exception as exc:
+        if response is None:
+            _record_usage(kwargs["model"], started, None, success=False)
         logger.warning(f"LiteLLM request failed: {exc}")
         return None
 
@@ -253,14 +303,19 @@ def _generate_text_litellm_with_status(
     if llm_provider.get_api_key():
         kwargs["api_key"] = llm_provider.get_api_key()
 
+    started = time.perf_counter()
+    response = None
     try:
         response = litellm.completion(**kwargs)
+        _record_usage(kwargs["model"], started, response, success=True)
         content = response.choices[0].message.content if response.choices else ""
         text = (content or "").strip()
         if not text:
             return None, "litellm_empty_response", None
         return text, None, None
     except Exception as exc:
+        if response is None:
+            _record_usage(kwargs["model"], started, None, success=False)
         logger.warning(f"LiteLLM request failed: {exc}")
         return None, "litellm_request_failed", _maybe_detail(exc)
 
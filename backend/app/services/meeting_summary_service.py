@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import re
+import time
 from typing import Optional
 from uuid import UUID
 
@@ -27,6 +28,7 @@ from app.models.meeting_summary import (
     NextAction,
 )
 from app.models.task import Task
+from app.services.llm_usage_service import llm_usage_ledger
 
 
 class MeetingSummaryService:
@@ -271,12 +273,17 @@ class MeetingSummaryService:
                 # Run agent
                 message = Content(role="user", parts=[Part(text=prompt)])
                 response_parts: list[str] = []
+                input_tokens = output_tokens = 0
+                started = time.perf_counter()
 
                 async for event in runner.run_async(
                     user_id="system",
                     session_id=run_session_id,
                     new_message=message,
                 ):
+                    if getattr(event, "usage_metadata", None):
+                        input_tokens += event.usage_metadata.prompt_token_count or 0
+                        output_tokens += event.usage_metadata.candidates_token_count or 0
                     if event.content and getattr(event.content, "parts", None):
                         for part in event.content.parts or []:
                             text = getattr(part, "text", None)
@@ -284,6 +291,14 @@ class MeetingSummaryService:
                                 response_parts.append(text)
 
                 raw_output = "".join(response_parts)
+                llm_usage_ledger.record(
+                    model=self._llm_provider.get_model_id(),
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    latency_ms=(time.perf_counter() - started) * 1000,
+                    feature="meeting_summary",
+                    retries=attempt - 1,
+                )
 
                 # Parse and validate
                 summary = self._parse_summary(session_id, raw_output)
@@ -25,6 +25,8 @@ from app.models.achievement import MemberContribution, ProjectAchievement
 from app.models.enums import GenerationType
 from app.models.notification import NotificationCreate, NotificationType
 from app.models.task import Task
+from app.services.achievement_prompt_builder import PromptTaskGroup, build_budgeted_task_section
+from app.services.llm_usage_service import llm_usage_scope
 from app.services.llm_utils import generate_text
 
 # JSON schema for AI response
@@ -85,6 +87,25 @@ def _build_tasks_by_member_prompt(
     return "\n".join(lines)
 
 
+def _build_member_task_groups(
+    tasks_by_member: dict[str, list[Task]],
+    member_names: dict[str, str],
+) -> list[PromptTaskGroup]:
+    """Build one prompt task group per member."""
+    groups = []
+    for user_id, tasks in tasks_by_member.items():
+        entries = []
+        for task in tasks:
+            entry = f"- {task.title}"
+            if task.completion_note:
+                entry += f"\n  - メモ: {task.completion_note[:200]}"
+            entries.append(entry)
+        groups.append(
+            PromptTaskGroup(key=user_id, label=member_names.get(user_id, user_id), entries=entries)
+        )
+    return groups
+
+
 def _build_member_contributions_prompt(contributions: list[MemberContribution]) -> str:
     lines = ["## メンバー別の貢献", ""]
 
@@ -131,6 +152,7 @@ def _generate_project_achievement_prompt(
     period_start: datetime,
     period_end: datetime,
     period_label: Optional[str] = None,
+    tasks_section: Optional[str] = None,
 ) -> str:
     """Generate the prompt for project achievement generation."""
     period_str = period_label or f"{period_start.strftime('%Y/%m/%d')} - {period_end.strftime('%Y/%m/%d')}"
@@ -145,7 +167,7 @@ def _generate_project_achievement_prompt(
 - 残タスク数: {remaining_tasks_count}件
 - メンバー数: {len(tasks_by_member)}人
 
-{_build_tasks_by_member_prompt(tasks_by_member, member_names)}
+{tasks_section or _build_tasks_by_member_prompt(tasks_by_member, member_names)}
 
 ## 分析の指示
 
@@ -330,6 +352,17 @@ async def generate_project_achievement(
     remaining_tasks_count = len(remaining_tasks)
 
     # Generate AI analysis
+    tasks_section, budget_usage = await build_budgeted_task_section(
+        _build_member_task_groups(tasks_by_member, member_names),
+        title="メンバー別の完了タスク",
+        llm_provider=llm_provider,
+    )
+    logger.info(
+        f"Project achievement prompt budget for {project_id}: "
+        f"{budget_usage.used_tokens}/{budget_usage.budget_tokens} tokens "
+        f"(full {budget_usage.full_tokens}), summarized={budget_usage.summarized_groups}, "
+        f"truncated={budget_usage.fallback_groups}"
+    )
     prompt = _generate_project_achievement_prompt(
         project_name=project.name,
         tasks_by_member=tasks_by_member,
@@ -338,15 +371,17 @@ async def generate_project_achievement(
         period_start=period_start,
         period_end=period_end,
         period_label=period_label,
+        tasks_section=tasks_section,
     )
 
-    response_text = generate_text(
-        llm_provider=llm_provider,
-        prompt=prompt,
-        temperature=0.3,
-        max_output_tokens=2000,
-        response_mime_type="application/json",
-    )
+    with llm_usage_scope("project_achievement"):
+        response_text = generate_text(
+            llm_provider=llm_provider,
+            prompt=prompt,
+            temperature=0.3,
+            max_output_tokens=2000,
+            response_mime_type="application/json",
+        )
 
     # Parse AI response
     ai_result = _parse_ai_response(response_text)
@@ -407,13 +442,14 @@ async def summarize_project_achievement_with_edits(
 ) -> ProjectAchievement:
     prompt = _generate_project_achievement_prompt_with_edits(achievement)
 
-    response_text = generate_text(
-        llm_provider=llm_provider,
-        prompt=prompt,
-        temperature=0.3,
-        max_output_tokens=2000,
-        response_mime_type="application/json",
-    )
+    with llm_usage_scope("project_achievement"):
+        response_text = generate_text(
+            llm_provider=llm_provider,
+            prompt=prompt,
+            temperature=0.3,
+            max_output_tokens=2000,
+            response_mime_type="application/json",
+        )
 
     ai_result = _parse_ai_response(response_text)
 
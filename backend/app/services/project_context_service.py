@@ -0,0 +1,129 @@
+"""
+Project context shared by the agent's meeting and check-in tools.
+
+A context bundle holds what those tools load for every call on a project:
+the project itself and a display name for each member. Bundles are cached
+per project for PROJECT_CONTEXT_TTL_SECONDS (at most
+PROJECT_CONTEXT_CACHE_MAX_ENTRIES projects), so the agenda, check-in and
+meeting tools an agent calls during one turn load them once. Committed
+writes to projects, members or member names drop the affected bundles.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Iterable, Optional
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.revisions import DataChange, add_commit_listener
+from app.core.ttl_cache import TTLCache
+from app.interfaces.project_member_repository import IProjectMemberRepository
+from app.interfaces.project_repository import IProjectRepository
+from app.interfaces.user_repository import IUserRepository
+from app.models.project import Project
+from app.models.user import UserAccount
+
+
+def member_display_name(user_account: Optional[UserAccount]) -> Optional[str]:
+    """Display name of a member account (email is never used, for privacy)."""
+    if not user_account:
+        return None
+    return user_account.display_name or user_account.username
+
+
+async def resolve_member_display_names(
+    user_repo: Optional[IUserRepository],
+    member_user_ids: Iterable[str],
+) -> dict[str, str]:
+    """
+    Resolve display names for project member IDs with one user lookup.
+
+    Returns:
+        Mapping of member_user_id to display name (members without an
+        account or a name are omitted)
+    """
+    member_user_ids = list(member_user_ids)
+    if not user_repo or not member_user_ids:
+        return {}
+    accounts = await user_repo.get_many(member_user_ids)
+    names: dict[str, str] = {}
+    for member_user_id, account in accounts.items():
+        display_name = member_display_name(account)
+        if display_name:
+            names[member_user_id] = display_name
+    return names
+
+
+@dataclass
+class ProjectContext:
+    """Project info and member display names of one project."""
+
+    project_id: UUID
+    project: Optional[Project]
+    member_names: dict[str, str]
+
+    def display_name(self, member_user_id: str) -> str:
+        return self.member_names.get(member_user_id, member_user_id)
+
+
+project_context_cache: TTLCache[UUID, ProjectContext] = TTLCache(
+    ttl_seconds=lambda: get_settings().PROJECT_CONTEXT_TTL_SECONDS,
+    max_entries=lambda: get_settings().PROJECT_CONTEXT_CACHE_MAX_ENTRIES,
+)
+
+# User columns member names are resolved from (see resolve_member_display_names).
+_MEMBER_NAME_FIELDS = frozenset({"display_name", "username", "email"})
+
+
+def _invalidate_on_project_writes(changes: list[DataChange]) -> None:
+    """Drop the bundles of projects whose row, members or member names a commit changed."""
+    for change in changes:
+        if change.table in ("projects", "project_members"):
+            if change.project_id:
+                project_context_cache.invalidate(UUID(change.project_id))
+            else:
+                # Bulk statement without a project: drop every bundle.
+                project_context_cache.clear()
+        elif change.table == "users":
+            if change.entity_id and change.op == "updated" and not _MEMBER_NAME_FIELDS.intersection(
+                change.fields
+            ):
+                continue
+            # Bundles are not indexed by member, and names change rarely.
+            project_context_cache.clear()
+
+
+add_commit_listener(_invalidate_on_project_writes)
+
+
+async def load_project_context(
+    owner_id: str,
+    project_id: UUID,
+    project_repo: IProjectRepository,
+    member_repo: IProjectMemberRepository,
+    user_repo: Optional[IUserRepository] = None,
+) -> ProjectContext:
+    """
+    Load (or reuse) the context bundle of a project.
+
+    The caller must have checked access to the project. The project and its
+    members are loaded concurrently and member names are resolved in one
+    batched user lookup.
+    """
+    cached = project_context_cache.get(project_id)
+    if cached:
+        return cached
+
+    project, members = await asyncio.gather(
+        project_repo.get(owner_id, project_id),
+        member_repo.list_by_project(project_id),
+    )
+    member_names = await resolve_member_display_names(
+        user_repo,
+        [member.member_user_id for member in members],
+    )
+    context = ProjectContext(project_id=project_id, project=project, member_names=member_names)
+    project_context_cache.set(project_id, context)
+    return context
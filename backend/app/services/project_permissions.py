@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Iterable
+from typing import Iterable, Optional
 from uuid import UUID
 
 from app.core.exceptions import ForbiddenError, NotFoundError
+from app.core.revisions import DataChange, add_commit_listener
 from app.interfaces.project_member_repository import IProjectMemberRepository
 from app.interfaces.project_repository import IProjectRepository
+from app.interfaces.task_repository import ITaskRepository
 from app.models.enums import ProjectRole
 from app.models.project import Project
+from app.models.task import Task
 
 
 class ProjectAction(str, Enum):
@@ -83,12 +87,160 @@ def ensure_project_action(access: ProjectAccess, action: ProjectAction) -> Proje
     return access
 
 
+@dataclass(frozen=True)
+class AccessContext:
+    """All projects a user can access, with the user's role in each."""
+
+    user_id: str
+    projects: dict[UUID, ProjectAccess] = field(default_factory=dict)
+
+    def get(self, project_id: UUID) -> Optional[ProjectAccess]:
+        return self.projects.get(project_id)
+
+
+# Access contexts loaded within the current access_scope, by user ID.
+_scoped_contexts: ContextVar[Optional[dict[str, AccessContext]]] = ContextVar(
+    "access_contexts", default=None
+)
+_ACCESS_TABLES = frozenset({"projects", "project_members"})
+
+
+class access_scope:
+    """
+    Memoize access contexts within a block (``with`` or ``async with``).
+
+    One HTTP request or agent turn runs in a scope, so its authorization
+    checks share one load per user. Nothing outlives the scope: a membership
+    change committed elsewhere applies from the next request or turn, and a
+    change committed inside the scope drops its contexts.
+    """
+
+    def __init__(self) -> None:
+        self._token = None
+
+    def __enter__(self) -> dict[str, AccessContext]:
+        contexts: dict[str, AccessContext] = {}
+        self._token = _scoped_contexts.set(contexts)
+        return contexts
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            _scoped_contexts.reset(self._token)
+        except ValueError:
+            _scoped_contexts.set(None)
+        return False
+
+    async def __aenter__(self) -> dict[str, AccessContext]:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return self.__exit__(exc_type, exc, tb)
+
+
+def _forget_scoped_access(changes: list[DataChange]) -> None:
+    """Drop the current scope's contexts when a commit changed projects or members."""
+    contexts = _scoped_contexts.get()
+    if contexts and any(change.table in _ACCESS_TABLES for change in changes):
+        contexts.clear()
+
+
+add_commit_listener(_forget_scoped_access)
+
+
+async def load_access_context(
+    user_id: str,
+    project_repo: IProjectRepository,
+    member_repo: IProjectMemberRepository,
+) -> AccessContext:
+    """
+    Load the access context for a user.
+
+    Two queries resolve every accessible project and the user's role in it.
+    Within an access_scope the context is loaded once per user; it is never
+    cached across requests, so a membership change takes effect on every
+    worker from the next request.
+    """
+    contexts = _scoped_contexts.get()
+    if contexts is not None and user_id in contexts:
+        return contexts[user_id]
+    projects = await project_repo.list(user_id, limit=1000)
+    memberships = await member_repo.list_by_member_user_id(user_id)
+    roles = {member.project_id: member.role for member in memberships}
+
+    accesses: dict[UUID, ProjectAccess] = {}
+    for project in projects:
+        if project.user_id == user_id:
+            role = ProjectRole.OWNER
+        elif project.id in roles:
+            role = roles[project.id]
+        else:
+            continue
+        accesses[project.id] = ProjectAccess(project=project, role=role, owner_id=project.user_id)
+
+    context = AccessContext(user_id=user_id, projects=accesses)
+    if contexts is not None:
+        contexts[user_id] = context
+    return context
+
+
+async def resolve_task_access(
+    user_id: str,
+    task_id: UUID,
+    task_repo: ITaskRepository,
+    project_repo: IProjectRepository,
+    member_repo: IProjectMemberRepository,
+) -> tuple[Task, Optional[ProjectAccess]]:
+    """
+    Resolve a task and the caller's project access in a constant number of queries.
+
+    Returns:
+        Tuple of (task, project access); access is None for personal tasks
+
+    Raises:
+        NotFoundError: If the task does not exist or is not visible to the user
+    """
+    info = await task_repo.get_owner_info(task_id)
+    if not info:
+        raise NotFoundError(f"Task {task_id} not found")
+    project_id, owner_id = info
+
+    if not project_id:
+        if owner_id != user_id:
+            raise NotFoundError(f"Task {task_id} not found")
+        task = await task_repo.get(user_id, task_id)
+        if not task:
+            raise NotFoundError(f"Task {task_id} not found")
+        return task, None
+
+    try:
+        access = await get_project_access(user_id, project_id, project_repo, member_repo)
+    except (ForbiddenError, NotFoundError):
+        raise NotFoundError(f"Task {task_id} not found") from None
+    task = await task_repo.get(user_id, task_id, project_id=project_id)
+    if not task:
+        raise NotFoundError(f"Task {task_id} not found")
+    return task, access
+
+
 async def get_project_access(
     user_id: str,
     project_id: UUID,
     project_repo: IProjectRepository,
     member_repo: IProjectMemberRepository,
 ) -> ProjectAccess:
+    """
+    Resolve the user's access to a project.
+
+    Inside an access_scope the scope's context answers for the projects it
+    holds; other projects (and every call outside a scope) read the
+    repositories, which also tell a missing project from a non-member.
+    """
+    if _scoped_contexts.get() is not None:
+        context = await load_access_context(user_id, project_repo, member_repo)
+        access = context.get(project_id if isinstance(project_id, UUID) else UUID(str(project_id)))
+        if access:
+            return access
+
     project = await project_repo.get(user_id, project_id)
     if not project:
         raise NotFoundError(f"Project {project_id} not found")
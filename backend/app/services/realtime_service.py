@@ -1,44 +1,435 @@
+"""
+Realtime (SSE) event delivery.
+
+Committed writes reach the change feed as DataChanges (see
+app.core.revisions); the feed maps each one to a typed RealtimeEvent
+(entity kind, ID, project, changed fields) and publishes it to the users
+who can see it: the members and owner of the row's project, or the users
+the row names when it belongs to no project.
+
+Each connection owns a bounded Subscription. Queued events for the same
+entity are coalesced into one, and a connection that falls REALTIME_QUEUE_SIZE
+events behind has its queue replaced by a single ``resync`` event, so a slow
+client costs a fixed amount of memory and refetches once. Subscriptions can
+be narrowed to entity kinds and projects.
+
+Delivery goes through a broker (app.interfaces.realtime_broker), so with
+REALTIME_BROKER=sqlite an event published by one worker reaches the
+connections of every worker. The feed also relays the revision scopes of
+every tracked commit as a ``revision`` event, which the other workers apply
+to their data revisions (conditional GET ETags) and never deliver.
+"""
+
+from __future__ import annotations
+
 import asyncio
-import json
-from typing import Any
+import os
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Iterable, Optional, Union
+
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.core.logger import logger
+from app.core.revisions import (
+    DataChange,
+    Scope,
+    add_commit_listener,
+    add_revision_listener,
+    data_revisions,
+    remove_commit_listener,
+    remove_revision_listener,
+)
+from app.interfaces.realtime_broker import IRealtimeBroker
+from app.models.realtime import RealtimeEvent
+
+# Entity kind of each published table; writes to other tables are not published.
+TABLE_KINDS = {
+    "tasks": "task",
+    "projects": "project",
+    "phases": "phase",
+    "milestones": "milestone",
+    "project_members": "project_member",
+    "project_invitations": "project_invitation",
+    "task_assignments": "task_assignment",
+    "blockers": "blocker",
+    "checkins": "checkin",
+    "recurring_meetings": "recurring_meeting",
+    "recurring_tasks": "recurring_task",
+    "meeting_agenda_items": "agenda_item",
+    "meeting_sessions": "meeting_session",
+    "schedule_settings": "schedule_settings",
+    "daily_schedule_plans": "schedule_plan",
+    "schedule_snapshots": "schedule_snapshot",
+    "achievements": "achievement",
+    "project_achievements": "project_achievement",
+    "notifications": "notification",
+    "heartbeat_settings": "heartbeat_settings",
+    "captures": "capture",
+    "users": "user",
+}
+# Kinds only the users named by the row see, even when it carries a project_id.
+PERSONAL_KINDS = frozenset({"notification", "schedule_settings", "heartbeat_settings", "capture"})
+
+EventLike = Union[RealtimeEvent, dict[str, Any]]
+
+
+def _as_event(event: EventLike) -> RealtimeEvent:
+    return event if isinstance(event, RealtimeEvent) else RealtimeEvent.model_validate(event)
+
+
+class Subscription:
+    """Bounded, coalescing event queue of one connection."""
+
+    def __init__(
+        self,
+        user_id: str,
+        kinds: Optional[Iterable[str]] = None,
+        project_ids: Optional[Iterable[Any]] = None,
+        max_size: Optional[int] = None,
+    ) -> None:
+        self.user_id = user_id
+        self.kinds = frozenset(kinds) if kinds else None
+        self.project_ids = frozenset(str(project_id) for project_id in project_ids) if project_ids else None
+        self.max_size = max_size if max_size is not None else get_settings().REALTIME_QUEUE_SIZE
+        self._queue: OrderedDict[Any, RealtimeEvent] = OrderedDict()
+        self._sequence = count()
+        self._ready = asyncio.Event()
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.resyncs = 0
+
+    def wants(self, event: RealtimeEvent) -> bool:
+        """Filters apply to change events; project filters only to project-bound ones."""
+        if event.type != "change":
+            return True
+        if self.kinds is not None and event.kind not in self.kinds:
+            return False
+        if self.project_ids is not None and event.project_id and event.project_id not in self.project_ids:
+            return False
+        return True
+
+    def put(self, event: RealtimeEvent) -> None:
+        if not self.wants(event):
+            return
+        key = event.coalesce_key
+        if key is not None and key in self._queue:
+            self._queue[key] = self._queue[key].merge(event)
+            self.coalesced += 1
+        elif len(self._queue) >= self.max_size:
+            # Too far behind: replace the backlog with one resync.
+            self.dropped += len(self._queue) + 1
+            self.resyncs += 1
+            self._queue.clear()
+            self._queue[("resync",)] = RealtimeEvent(type="resync")
+        else:
+            self._queue[key if key is not None else next(self._sequence)] = event
+        self._ready.set()
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[RealtimeEvent]:
+        """Next event, or None when nothing arrives within ``timeout`` seconds."""
+        if not self._queue:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+        _, event = self._queue.popitem(last=False)
+        self.delivered += 1
+        return event
+
+
+def revision_event(scopes: Iterable[Scope]) -> RealtimeEvent:
+    """Event relaying the revision scopes a commit bumped."""
+    return RealtimeEvent(type="revision", scopes=sorted(f"{kind}:{value}" for kind, value in scopes))
+
+
+def _revision_scopes(event: RealtimeEvent) -> set[Scope]:
+    scopes: set[Scope] = set()
+    for scope in event.scopes or ():
+        kind, _, value = scope.partition(":")
+        scopes.add((kind, value))
+    return scopes
 
 
 class RealtimeManager:
-    def __init__(self) -> None:
-        self._connections: dict[str, set[asyncio.Queue[str]]] = {}
-        self._lock = asyncio.Lock()
-
-    async def connect(self, user_id: str) -> asyncio.Queue[str]:
-        queue: asyncio.Queue[str] = asyncio.Queue()
-        async with self._lock:
-            self._connections.setdefault(user_id, set()).add(queue)
-        return queue
-
-    async def disconnect(self, user_id: str, queue: asyncio.Queue[str]) -> None:
-        async with self._lock:
-            queues = self._connections.get(user_id)
-            if not queues:
-                return
-            queues.discard(queue)
-            if not queues:
-                self._connections.pop(user_id, None)
-
-    async def publish(self, user_id: str, payload: dict[str, Any]) -> None:
-        message = json.dumps(payload, separators=(",", ":"))
-        async with self._lock:
-            queues = list(self._connections.get(user_id, set()))
-        for queue in queues:
-            queue.put_nowait(message)
-
-    async def publish_many(self, user_ids: set[str], payload: dict[str, Any]) -> None:
-        if not user_ids:
+    """
+    Connections of this process, by user.
+
+    Events are published through the realtime broker (REALTIME_BROKER), which
+    hands them back to the manager of every process for local delivery.
+    """
+
+    def __init__(self, broker: Optional[IRealtimeBroker] = None) -> None:
+        self._connections: dict[str, set[Subscription]] = {}
+        self._broker = broker
+        if broker is not None:
+            broker.subscribe(self._deliver)
+        self._closed_delivered = 0
+        self._closed_coalesced = 0
+        self._closed_dropped = 0
+
+    @property
+    def broker(self) -> IRealtimeBroker:
+        if self._broker is None:
+            from app.api.deps import get_realtime_broker
+
+            self._broker = get_realtime_broker()
+            self._broker.subscribe(self._deliver)
+        return self._broker
+
+    async def start(self) -> None:
+        await self.broker.start()
+
+    async def stop(self) -> None:
+        if self._broker is not None:
+            await self._broker.stop()
+
+    async def connect(
+        self,
+        user_id: str,
+        kinds: Optional[Iterable[str]] = None,
+        project_ids: Optional[Iterable[Any]] = None,
+    ) -> Subscription:
+        subscription = Subscription(user_id, kinds=kinds, project_ids=project_ids)
+        self._connections.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    async def disconnect(self, subscription: Subscription) -> None:
+        subscriptions = self._connections.get(subscription.user_id)
+        if not subscriptions or subscription not in subscriptions:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            self._connections.pop(subscription.user_id, None)
+        self._closed_delivered += subscription.delivered
+        self._closed_coalesced += subscription.coalesced
+        self._closed_dropped += subscription.dropped
+
+    async def publish(self, user_id: str, event: EventLike) -> None:
+        await self.publish_many({user_id}, event)
+
+    async def publish_many(self, user_ids: Iterable[str], event: EventLike) -> None:
+        user_ids = set(user_ids)
+        if user_ids:
+            await self.broker.publish(user_ids, _as_event(event))
+
+    async def publish_all(self, event: EventLike) -> None:
+        """Publish to every connection of every process."""
+        await self.broker.publish(None, _as_event(event))
+
+    def _deliver(
+        self,
+        user_ids: Optional[frozenset[str]],
+        event: RealtimeEvent,
+        published_at: float,
+        remote: bool,
+    ) -> None:
+        if event.type == "revision":
+            if remote:
+                # Another worker committed the write; this process's revisions
+                # (and the conditional GET caches built on them) must move too.
+                data_revisions.bump(_revision_scopes(event))
             return
-        message = json.dumps(payload, separators=(",", ":"))
-        async with self._lock:
-            queues = [list(self._connections.get(user_id, set())) for user_id in user_ids]
-        for queue_list in queues:
-            for queue in queue_list:
-                queue.put_nowait(message)
+        targets = list(self._connections) if user_ids is None else user_ids
+        for user_id in targets:
+            for subscription in list(self._connections.get(user_id, ())):
+                subscription.put(event)
+
+    def connection_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._connections.values())
+
+    def stats(self) -> dict[str, Any]:
+        subscriptions = [sub for subs in self._connections.values() for sub in subs]
+        return {
+            "pid": os.getpid(),
+            "connections": len(subscriptions),
+            "users": len(self._connections),
+            "pending": sum(sub.pending() for sub in subscriptions),
+            "delivered": self._closed_delivered + sum(sub.delivered for sub in subscriptions),
+            "coalesced": self._closed_coalesced + sum(sub.coalesced for sub in subscriptions),
+            "dropped": self._closed_dropped + sum(sub.dropped for sub in subscriptions),
+            **(self._broker.stats() if self._broker is not None else {}),
+        }
+
+    def clear(self) -> None:
+        self._connections.clear()
+        self._closed_delivered = self._closed_coalesced = self._closed_dropped = 0
 
 
 realtime_manager = RealtimeManager()
+
+
+def change_to_event(change: DataChange, project_id: Optional[str] = None) -> Optional[RealtimeEvent]:
+    """Realtime event of a committed change (None for unpublished tables)."""
+    kind = TABLE_KINDS.get(change.table)
+    if kind is None:
+        return None
+    return RealtimeEvent(
+        kind=kind,
+        op=change.op,
+        id=change.entity_id,
+        project_id=project_id or change.project_id,
+        task_id=change.task_id,
+        fields=list(change.fields),
+    )
+
+
+class RealtimeChangeFeed:
+    """
+    Publishes committed DataChanges as realtime events (started with the app).
+
+    Bulk statements that name no user or project (e.g. clearing milestone_id
+    on every task of a deleted milestone) go to the audience of the other
+    changes of their transaction; when there is none they are dropped, never
+    broadcast to every user.
+    """
+
+    def __init__(self, manager: RealtimeManager, session_factory=None) -> None:
+        self._manager = manager
+        self._session_factory = session_factory
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._failed = 0
+        self._unscoped_dropped = 0
+
+    def _sessions(self):
+        if self._session_factory is None:
+            from app.infrastructure.local.database import get_session_factory
+
+            # One engine for the feed's lifetime; its lookups are not echoed.
+            self._session_factory = get_session_factory(echo=False)
+        return self._session_factory
+
+    async def start(self) -> None:
+        if self._loop is not None:
+            return
+        self._sessions()
+        self._loop = asyncio.get_running_loop()
+        add_commit_listener(self._on_commit)
+        add_revision_listener(self._on_revisions)
+
+    async def stop(self) -> None:
+        remove_commit_listener(self._on_commit)
+        remove_revision_listener(self._on_revisions)
+        self._loop = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _on_commit(self, changes: list[DataChange]) -> None:
+        loop = self._loop
+        if loop is None or not any(change.table in TABLE_KINDS for change in changes):
+            return
+        loop.call_soon_threadsafe(self._spawn, list(changes))
+
+    def _on_revisions(self, scopes: set[Scope]) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(self._spawn_relay, revision_event(scopes))
+
+    def _spawn(self, changes: list[DataChange]) -> None:
+        self._track(asyncio.create_task(self.dispatch(changes)))
+
+    def _spawn_relay(self, event: RealtimeEvent) -> None:
+        self._track(asyncio.create_task(self.relay(event)))
+
+    def _track(self, task: asyncio.Task) -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def relay(self, event: RealtimeEvent) -> None:
+        """Hand a commit's revision scopes to the other workers."""
+        try:
+            await self._manager.publish_all(event)
+        except Exception as exc:
+            self._failed += 1
+            logger.warning(f"Revision relay failed: {exc}")
+
+    async def dispatch(self, changes: list[DataChange]) -> None:
+        """Publish one transaction's changes to the users who can see them."""
+        changes = [change for change in changes if change.table in TABLE_KINDS]
+        if not changes:
+            return
+        try:
+            parents = await self._load_parents(changes)
+            audiences: dict[str, set[str]] = {}
+            transaction_users: set[str] = set()
+            unscoped: list[RealtimeEvent] = []
+            for change in changes:
+                kind = TABLE_KINDS[change.table]
+                parent = parents.get(("task", change.task_id)) or parents.get(("meeting", change.meeting_id))
+                project_id = change.project_id
+                users = set(change.user_ids)
+                if parent and kind not in PERSONAL_KINDS:
+                    project_id = project_id or parent[0]
+                    users.add(parent[1])
+                event = change_to_event(change, project_id)
+                if kind not in PERSONAL_KINDS and project_id:
+                    if project_id not in audiences:
+                        audiences[project_id] = await self._project_audience(project_id)
+                    users |= audiences[project_id]
+                if users:
+                    transaction_users |= users
+                    await self._manager.publish_many(users, event)
+                else:
+                    unscoped.append(event)
+            for event in unscoped:
+                if transaction_users:
+                    await self._manager.publish_many(transaction_users, event)
+                else:
+                    self._unscoped_dropped += 1
+        except Exception as exc:
+            self._failed += 1
+            logger.warning(f"Realtime dispatch failed: {exc}")
+
+    async def _load_parents(self, changes: list[DataChange]) -> dict[tuple[str, Optional[str]], tuple[Optional[str], str]]:
+        """(project_id, owner) of the tasks and recurring meetings rows belong to."""
+        from app.infrastructure.local.database import RecurringMeetingORM, TaskORM
+
+        task_ids = {change.task_id for change in changes if change.task_id and not change.project_id}
+        meeting_ids = {change.meeting_id for change in changes if change.meeting_id and not change.project_id}
+        parents: dict[tuple[str, Optional[str]], tuple[Optional[str], str]] = {}
+        if not task_ids and not meeting_ids:
+            return parents
+        async with self._sessions()() as session:
+            for name, orm, ids in (("task", TaskORM, task_ids), ("meeting", RecurringMeetingORM, meeting_ids)):
+                if not ids:
+                    continue
+                result = await session.execute(
+                    select(orm.id, orm.project_id, orm.user_id).where(orm.id.in_(ids))
+                )
+                for row in result:
+                    parents[(name, row.id)] = (row.project_id, row.user_id)
+        return parents
+
+    async def _project_audience(self, project_id: str) -> set[str]:
+        from uuid import UUID
+
+        from app.api.deps import get_project_member_repository, get_project_repository
+
+        try:
+            project_uuid = UUID(project_id)
+        except ValueError:
+            return set()
+        members = await get_project_member_repository().list_by_project(project_uuid)
+        users = {member.member_user_id for member in members}
+        project = await get_project_repository().get_by_id(project_uuid)
+        if project:
+            users.add(project.user_id)
+        return users
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": len(self._tasks),
+            "failed": self._failed,
+            "unscoped_dropped": self._unscoped_dropped,
+        }
+
+
+realtime_change_feed = RealtimeChangeFeed(realtime_manager)
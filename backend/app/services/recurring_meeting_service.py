@@ -21,7 +21,6 @@ from app.models.recurring_meeting import (
     RecurringMeeting,
     RecurringMeetingUpdate,
 )
-from app.tools.task_tools import CreateMeetingInput, create_meeting
 
 
 class RecurringMeetingService:
@@ -92,6 +91,8 @@ class RecurringMeetingService:
                 duration = timedelta(minutes=meeting.duration_minutes)
                 end_time = next_start + duration
 
+                from app.tools.task_tools import CreateMeetingInput, create_meeting
+
                 created_task = await create_meeting(
                     user_id,
                     self.task_repo,
@@ -4,13 +4,16 @@ Scheduler service for capacity-aware task scheduling.
 Handles task scheduling with capacity constraints and dependency resolution.
 """
 
+import heapq
+import itertools
 import math
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
 from app.core.logger import setup_logger
+from app.core.tracing import traced
 from app.models.collaboration import ProjectMember, TaskAssignment
 from app.models.enums import EnergyLevel, Priority, TaskStatus
 from app.models.schedule import (
@@ -33,6 +36,100 @@ from app.services.task_utils import (
 logger = setup_logger(__name__)
 
 
+class _CandidateQueues:
+    """
+    Indexed priority queues of schedulable candidates for one day.
+
+    Candidates are bucketed by pool (in-progress / ready), energy level and
+    assignee. Each bucket is a heap ordered by (-day score, due date,
+    created_at) with pool insertion order as the final tie-breaker, which is
+    the order a stable sort of the pool lists produces.
+
+    Entries are invalidated lazily: an entry whose task left its pool or can no
+    longer be scheduled today is dropped when it reaches the top, and buckets
+    of assignees without remaining capacity are skipped as a whole. Both
+    conditions only tighten during a day, so dropped entries never become
+    valid again before the queues are rebuilt for the next day.
+    """
+
+    IN_PROGRESS = 0
+    READY = 1
+
+    def __init__(
+        self,
+        pools: tuple[dict[UUID, None], dict[UUID, None]],
+        scores: dict[UUID, float],
+        task_map: dict[UUID, Task],
+        assignee_of: Callable[[UUID], str],
+        capacities: dict[str, int],
+        can_schedule: Callable[[UUID], bool],
+    ):
+        self._pools = pools
+        self._scores = scores
+        self._task_map = task_map
+        self._assignee_of = assignee_of
+        self._capacities = capacities
+        self._can_schedule = can_schedule
+        self._seq = (itertools.count(), itertools.count())
+        self._heaps: tuple[dict, dict] = ({}, {})
+
+    def push(self, pool: int, task_id: UUID) -> None:
+        task = self._task_map[task_id]
+        entry = (
+            -self._scores.get(task_id, 0.0),
+            task.due_date or datetime.max,
+            task.created_at,
+            next(self._seq[pool]),
+            task_id,
+        )
+        buckets = self._heaps[pool].setdefault(task.energy_level, {})
+        heapq.heappush(buckets.setdefault(self._assignee_of(task_id), []), entry)
+
+    def _top(self, pool: int, energy: Optional[EnergyLevel]) -> Optional[tuple]:
+        members = self._pools[pool]
+        best = None
+        for assignee, heap in self._heaps[pool].get(energy, {}).items():
+            if self._capacities.get(assignee, 0) <= 0:
+                continue
+            while heap:
+                task_id = heap[0][-1]
+                if task_id in members and self._can_schedule(task_id):
+                    break
+                heapq.heappop(heap)
+            if heap and (best is None or heap[0] < best):
+                best = heap[0]
+        return best
+
+    def select(
+        self,
+        prefer_low: bool,
+        preferred_energy: Optional[EnergyLevel],
+    ) -> Optional[UUID]:
+        """
+        Return the next task to schedule, or None when nothing fits today.
+
+        In-progress candidates win over ready ones. ``prefer_low`` restricts
+        the pool to LOW energy tasks (warmup / cooldown) and
+        ``preferred_energy`` then narrows it to the balancing energy level,
+        each only when the restricted pool is non-empty.
+        """
+        tops: dict[Optional[EnergyLevel], tuple] = {}
+        for pool in (self.IN_PROGRESS, self.READY):
+            for energy in self._heaps[pool]:
+                top = self._top(pool, energy)
+                if top is not None:
+                    tops[energy] = top
+            if tops:
+                break
+        if not tops:
+            return None
+        if prefer_low and EnergyLevel.LOW in tops:
+            tops = {EnergyLevel.LOW: tops[EnergyLevel.LOW]}
+        if preferred_energy and preferred_energy in tops:
+            tops = {preferred_energy: tops[preferred_energy]}
+        return min(tops.values())[-1]
+
+
 class SchedulerService:
     """
     Service for capacity-aware task scheduling.
@@ -328,6 +425,7 @@ class SchedulerService:
 
         return result
 
+    @traced("scheduler.build_schedule")
     def build_schedule(
         self,
         tasks: list[Task],
@@ -344,6 +442,7 @@ class SchedulerService:
         planned_window_by_task: Optional[dict[UUID, tuple[Optional[date], Optional[date]]]] = None,
         user_timezone: str = "Asia/Tokyo",
         team_project_ids: Optional[set[UUID]] = None,
+        prefix_days: Optional[list[ScheduleDay]] = None,
     ) -> ScheduleResponse:
         """
         Build a capacity-aware schedule across multiple days.
@@ -351,6 +450,9 @@ class SchedulerService:
         - Tasks can span multiple days.
         - Dependencies are respected.
         - Supports multi-user capacity if members and assignments are provided.
+        - prefix_days (consecutive days from start_date) are kept as planned:
+          their allocations are replayed into the scheduling state and
+          scheduling resumes on the day after the prefix.
         """
         local_today = datetime.now(ZoneInfo(user_timezone)).date()
         if not tasks:
@@ -605,8 +707,12 @@ class SchedulerService:
                 dependents[dep_id].append(task.id)
                 indegree[task.id] += 1
 
-        ready = [task_id for task_id, count in indegree.items() if count == 0]
-        in_progress: list[UUID] = []
+        # Insertion-ordered sets: membership/removal are O(1) and iteration
+        # keeps the order in which tasks became ready / started.
+        ready: dict[UUID, None] = {
+            task_id: None for task_id, count in indegree.items() if count == 0
+        }
+        in_progress: dict[UUID, None] = {}
 
         task_start: dict[UUID, date] = {}
         task_end: dict[UUID, date] = {}
@@ -619,6 +725,34 @@ class SchedulerService:
         ended_due_to_limit = False
         ended_due_to_cycle = False
 
+        for prefix_day in prefix_days or []:
+            if prefix_day.date != day_cursor or safety_limit <= 0:
+                break
+            for allocation in prefix_day.task_allocations:
+                tid = allocation.task_id
+                planned_task = all_task_map.get(tid)
+                if planned_task and planned_task.is_fixed_time:
+                    task_start[tid] = day_cursor
+                    task_end[tid] = day_cursor
+                if tid not in remaining_task_ids:
+                    continue
+                task_start.setdefault(tid, day_cursor)
+                task_end[tid] = day_cursor
+                last_scheduled_day_by_task[tid] = day_cursor
+                remaining_minutes[tid] = max(0, remaining_minutes[tid] - allocation.minutes)
+                if remaining_minutes[tid] <= 0:
+                    remaining_task_ids.discard(tid)
+                    in_progress.pop(tid, None)
+                    ready.pop(tid, None)
+                    self._release_dependents(tid, indegree, dependents, ready)
+                else:
+                    ready.pop(tid, None)
+                    in_progress.setdefault(tid)
+            days.append(prefix_day)
+            day_cursor += timedelta(days=1)
+            safety_limit -= 1
+        prefix_dates = {day.date for day in days}
+
         while remaining_task_ids and safety_limit > 0:
             # --- Per-Day scheduling ---
 
@@ -718,17 +852,13 @@ class SchedulerService:
                 if remaining_minutes[tid] <= 0:
                     task_end[tid] = day_cursor
                     remaining_task_ids.discard(tid)
-                    if tid in in_progress:
-                        in_progress.remove(tid)
-                    if tid in ready:
-                        ready.remove(tid)
+                    in_progress.pop(tid, None)
+                    ready.pop(tid, None)
                     self._release_dependents(tid, indegree, dependents, ready)
                 else:
                     task_end[tid] = day_cursor
-                    if tid in ready:
-                        ready.remove(tid)
-                    if tid not in in_progress:
-                        in_progress.append(tid)
+                    ready.pop(tid, None)
+                    in_progress.setdefault(tid)
                 if warmup_pending:
                     warmup_pending = False
                 if task and task.energy_level == EnergyLevel.HIGH:
@@ -777,55 +907,43 @@ class SchedulerService:
                             return False
                 return True
 
+            queues = _CandidateQueues(
+                (in_progress, ready),
+                day_scores,
+                task_map,
+                lambda tid: assignment_map.get(tid, default_assignee),
+                user_capacities,
+                can_schedule_today,
+            )
+            for tid in in_progress:
+                if is_available(tid, day_cursor):
+                    queues.push(queues.IN_PROGRESS, tid)
+            for tid in ready:
+                if is_available(tid, day_cursor):
+                    queues.push(queues.READY, tid)
+
+            def release(task_id: UUID) -> None:
+                for released_id in self._release_dependents(task_id, indegree, dependents, ready):
+                    if is_available(released_id, day_cursor):
+                        queues.push(queues.READY, released_id)
+
             while True:
-                # Find available tasks
-                available_in_progress = [tid for tid in in_progress if is_available(tid, day_cursor)]
-                available_ready = [tid for tid in ready if is_available(tid, day_cursor)]
-
-                # Filter by capacity availability
-                # A task is candidate ONLY if its assignee has capacity > 0
-                def has_capacity(tid: UUID) -> bool:
-                    assignee = assignment_map.get(tid, default_assignee)
-                    return user_capacities.get(assignee, 0) > 0
-
-                candidates_ip = [
-                    t for t in available_in_progress if has_capacity(t) and can_schedule_today(t)
-                ]
-                candidates_rd = [
-                    t for t in available_ready if has_capacity(t) and can_schedule_today(t)
-                ]
-
-                if not candidates_ip and not candidates_rd:
+                # In-progress work first; warmup/cooldown favour LOW energy
+                next_id = queues.select(
+                    prefer_low=warmup_pending or cooldown_for_high,
+                    preferred_energy=self._preferred_energy(energy_minutes),
+                )
+                if next_id is None:
                     break
 
-                # Pick best task
-                candidate_pool = candidates_ip if candidates_ip else candidates_rd
-                if warmup_pending:
-                    low_candidates = [
-                        tid for tid in candidate_pool
-                        if task_map[tid].energy_level == EnergyLevel.LOW
-                    ]
-                    if low_candidates:
-                        candidate_pool = low_candidates
-                if cooldown_for_high:
-                    low_candidates = [
-                        tid for tid in candidate_pool
-                        if task_map[tid].energy_level == EnergyLevel.LOW
-                    ]
-                    if low_candidates:
-                        candidate_pool = low_candidates
-                next_id = self._pick_next_task(candidate_pool, day_scores, task_map, energy_minutes)
-
                 minutes_left = remaining_minutes.get(next_id, 0)
                 if minutes_left <= 0:
                     # Cleanup zero duration tasks
                     remaining_minutes[next_id] = 0
                     remaining_task_ids.discard(next_id)
-                    if next_id in in_progress:
-                        in_progress.remove(next_id)
-                    if next_id in ready:
-                        ready.remove(next_id)
-                    self._release_dependents(next_id, indegree, dependents, ready)
+                    in_progress.pop(next_id, None)
+                    ready.pop(next_id, None)
+                    release(next_id)
                     continue
 
                 assignee = assignment_map.get(next_id, default_assignee)
@@ -863,16 +981,14 @@ class SchedulerService:
                 if remaining_minutes[next_id] <= 0:
                     task_end[next_id] = day_cursor
                     remaining_task_ids.discard(next_id)
-                    if next_id in in_progress:
-                        in_progress.remove(next_id)
-                    if next_id in ready:
-                        ready.remove(next_id)
-                    self._release_dependents(next_id, indegree, dependents, ready)
+                    in_progress.pop(next_id, None)
+                    ready.pop(next_id, None)
+                    release(next_id)
                 else:
-                    if next_id in ready:
-                        ready.remove(next_id)
+                    ready.pop(next_id, None)
                     if next_id not in in_progress:
-                        in_progress.append(next_id)
+                        in_progress[next_id] = None
+                        queues.push(queues.IN_PROGRESS, next_id)
 
             # Force-schedule tasks that would exceed their due date if pushed to tomorrow
             # These tasks get scheduled even if over capacity, BUT respect
@@ -910,10 +1026,8 @@ class SchedulerService:
                     task_end[tid] = day_cursor
                     remaining_minutes[tid] = 0
                     remaining_task_ids.discard(tid)
-                    if tid in in_progress:
-                        in_progress.remove(tid)
-                    if tid in ready:
-                        ready.remove(tid)
+                    in_progress.pop(tid, None)
+                    ready.pop(tid, None)
                     self._release_dependents(tid, indegree, dependents, ready)
 
             # End of Day Processing
@@ -999,7 +1113,7 @@ class SchedulerService:
                 completed_dt = completed_dt.replace(tzinfo=ZoneInfo("UTC"))
             completed_date = completed_dt.astimezone(tz).date()
             day = day_map.get(completed_date)
-            if day is None:
+            if day is None or completed_date in prefix_dates:
                 continue
             task_mins = get_effective_estimated_minutes(task, tasks)
             if task_mins <= 0:
@@ -1242,6 +1356,20 @@ class SchedulerService:
         score *= 1 + (project_priority * self.project_priority_weight)
         return score
 
+    def get_effective_start_dates(
+        self,
+        tasks: list[Task],
+        planned_window_by_task: Optional[dict[UUID, tuple[Optional[date], Optional[date]]]] = None,
+        reference_today: Optional[date] = None,
+    ) -> dict[UUID, date]:
+        """Return the first day each task may be scheduled (tasks without a bound are omitted)."""
+        effective_start_by_task, _ = self._get_effective_constraints(
+            tasks,
+            planned_window_by_task=planned_window_by_task,
+            reference_today=reference_today,
+        )
+        return effective_start_by_task
+
     @staticmethod
     def _get_effective_constraints(
         tasks: list[Task],
@@ -1342,6 +1470,17 @@ class SchedulerService:
             reference_date,
         )
 
+    def _preferred_energy(self, energy_minutes: dict[EnergyLevel, int]) -> Optional[EnergyLevel]:
+        """Return the energy level that rebalances the day, if it is lopsided."""
+        total_minutes = energy_minutes[EnergyLevel.HIGH] + energy_minutes[EnergyLevel.LOW]
+        if total_minutes <= 0:
+            return None
+        if energy_minutes[EnergyLevel.HIGH] / total_minutes > self.energy_high_ratio:
+            return EnergyLevel.LOW
+        if energy_minutes[EnergyLevel.LOW] / total_minutes > self.energy_low_ratio:
+            return EnergyLevel.HIGH
+        return None
+
     @staticmethod
     def _sort_task_ids(
         task_ids: list[UUID],
@@ -1364,20 +1503,11 @@ class SchedulerService:
         task_map: dict[UUID, Task],
         energy_minutes: dict[EnergyLevel, int],
     ) -> UUID:
+        """List-based equivalent of _CandidateQueues.select for a single pool."""
         if not task_ids:
             raise ValueError("No task IDs available for scheduling")
 
-        total_minutes = energy_minutes[EnergyLevel.HIGH] + energy_minutes[EnergyLevel.LOW]
-        preferred_energy: Optional[EnergyLevel] = None
-
-        if total_minutes > 0:
-            high_ratio = energy_minutes[EnergyLevel.HIGH] / total_minutes
-            low_ratio = energy_minutes[EnergyLevel.LOW] / total_minutes
-            if high_ratio > self.energy_high_ratio:
-                preferred_energy = EnergyLevel.LOW
-            elif low_ratio > self.energy_low_ratio:
-                preferred_energy = EnergyLevel.HIGH
-
+        preferred_energy = self._preferred_energy(energy_minutes)
         if preferred_energy:
             preferred_ids = [
                 task_id
@@ -1394,9 +1524,12 @@ class SchedulerService:
         task_id: UUID,
         indegree: dict[UUID, int],
         dependents: dict[UUID, list[UUID]],
-        ready: list[UUID],
-    ) -> None:
+        ready: dict[UUID, None],
+    ) -> list[UUID]:
+        released: list[UUID] = []
         for dependent_id in dependents.get(task_id, []):
             indegree[dependent_id] -= 1
             if indegree[dependent_id] <= 0 and dependent_id not in ready:
-                ready.append(dependent_id)
+                ready[dependent_id] = None
+                released.append(dependent_id)
+        return released
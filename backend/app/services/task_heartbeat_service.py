@@ -11,6 +11,7 @@ from zoneinfo import ZoneInfo
 from pydantic import BaseModel, Field, ValidationError
 
 from app.core.logger import logger
+from app.core.tracing import traced
 from app.interfaces.heartbeat_event_repository import IHeartbeatEventRepository
 from app.interfaces.heartbeat_settings_repository import IHeartbeatSettingsRepository
 from app.interfaces.chat_session_repository import IChatSessionRepository
@@ -29,6 +30,7 @@ from app.models.heartbeat import (
 )
 from app.models.project import Project
 from app.models.task import Task
+from app.services.llm_usage_service import llm_usage_scope
 from app.services.llm_utils import generate_text
 from app.services.task_utils import get_effective_estimated_minutes, is_parent_task
 from app.utils.datetime_utils import UTC, ensure_utc, now_utc
@@ -76,6 +78,7 @@ class TaskHeartbeatService:
         self._llm_provider = llm_provider
         self._task_assignment_repo = task_assignment_repo
 
+    @traced("task_heartbeat.run")
     async def run(self, user_id: str, now: Optional[datetime] = None) -> dict:
         now_utc_value = ensure_utc(now) or now_utc()
         settings = await self._get_or_create_settings(user_id)
@@ -762,25 +765,27 @@ class TaskHeartbeatService:
         response_schema = HeartbeatLLMMessage.model_json_schema()
 
         last_error: Optional[ValidationError] = None
-        for attempt in range(LLM_MAX_RETRIES):
-            output = generate_text(
-                llm_provider=self._llm_provider,
-                prompt=prompt,
-                temperature=LLM_TEMPERATURE,
-                max_output_tokens=600,
-                response_schema=response_schema,
-                response_mime_type="application/json",
-            )
-            if not output:
-                return None
-            try:
-                return self._parse_llm_message(output, reasons, item, project)
-            except ValidationError as exc:
-                last_error = exc
-                logger.warning(
-                    f"Heartbeat LLM validation failed (attempt {attempt + 1}): {exc}"
+        with llm_usage_scope("heartbeat") as usage:
+            for attempt in range(LLM_MAX_RETRIES):
+                usage.retries = attempt
+                output = generate_text(
+                    llm_provider=self._llm_provider,
+                    prompt=prompt,
+                    temperature=LLM_TEMPERATURE,
+                    max_output_tokens=600,
+                    response_schema=response_schema,
+                    response_mime_type="application/json",
                 )
-                prompt = self._build_retry_prompt(prompt, exc)
+                if not output:
+                    return None
+                try:
+                    return self._parse_llm_message(output, reasons, item, project)
+                except ValidationError as exc:
+                    last_error = exc
+                    logger.warning(
+                        f"Heartbeat LLM validation failed (attempt {attempt + 1}): {exc}"
+                    )
+                    prompt = self._build_retry_prompt(prompt, exc)
 
         if last_error:
             logger.warning(f"Heartbeat LLM failed after {LLM_MAX_RETRIES} attempts")
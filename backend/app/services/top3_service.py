@@ -150,13 +150,14 @@ class Top3Service:
         # Fetch missing dependency tasks
         missing_dep_ids = all_dependency_ids - set(task_status_map.keys())
         if missing_dep_ids:
-            for dep_id in missing_dep_ids:
-                try:
-                    dep_task = await self.task_repo.get(user_id, dep_id)
-                    if dep_task:
-                        task_status_map[dep_task.id] = dep_task.status
-                except Exception as e:
-                    logger.warning(f"Failed to fetch dependency task {dep_id}: {e}")
+            try:
+                dep_tasks = await self.task_repo.get_many(list(missing_dep_ids))
+            except Exception as e:
+                logger.warning(f"Failed to fetch dependency tasks {missing_dep_ids}: {e}")
+                dep_tasks = []
+            for dep_task in dep_tasks:
+                if dep_task.user_id == user_id:
+                    task_status_map[dep_task.id] = dep_task.status
 
         # Filter actionable tasks
         actionable = []
@@ -7,16 +7,27 @@ This service provides:
 - Generating a compact work-memory index for system prompts
 - Loading full work-memory content
 - Selecting relevant work memories for dynamic prompt injection
+
+Each user's parsed WORK/RULE memories are cached as a WorkMemoryLibrary
+(with a BM25 inverted index for relevance ranking). Committed writes to the
+memories table drop the writer's library (a commit listener, so every write
+path is covered); entries also expire after WORK_MEMORY_CACHE_TTL_SECONDS so
+writes from other processes show up.
 """
 
 from __future__ import annotations
 
+import math
 import re
+from collections import Counter
 from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.core.config import get_settings
+from app.core.revisions import DataChange, add_commit_listener
+from app.core.ttl_cache import TTLCache
 from app.interfaces.memory_repository import IMemoryRepository
 from app.models.enums import MemoryScope, MemoryType
 from app.models.memory import Memory
@@ -25,6 +36,12 @@ _RELEVANCE_TOKEN_PATTERN = re.compile(
     r"[a-z0-9]+|[\u3041-\u3093\u30a1-\u30f3\u4e00-\u9fff]{2,}",
     re.IGNORECASE,
 )
+_ASCII_TOKEN_PATTERN = re.compile(r"[a-z0-9]+", re.IGNORECASE)
+
+# BM25 parameters (standard defaults) and the library size cap.
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+_LIBRARY_MEMORY_LIMIT = 1000
 
 
 class WorkMemoryIndexItem(BaseModel):
@@ -81,17 +98,20 @@ def parse_work_memory(memory: Memory) -> WorkMemoryIndexItem:
     if not when_to_use:
         when_to_use = _extract_first_paragraph(content)
 
-    if len(when_to_use) > 200:
-        when_to_use = when_to_use[:197] + "..."
-
     return WorkMemoryIndexItem(
         id=str(memory.id),
         title=title,
-        when_to_use=when_to_use,
+        when_to_use=_truncate_when_to_use(when_to_use),
         tags=memory.tags,
     )
 
 
+def _truncate_when_to_use(when_to_use: str) -> str:
+    if len(when_to_use) > 200:
+        return when_to_use[:197] + "..."
+    return when_to_use
+
+
 def parse_work_memory_full(memory: Memory) -> WorkMemoryContent:
     """Parse a WORK/RULE memory to get full work-memory content."""
     content = (memory.content or "").strip()
@@ -169,19 +189,168 @@ def _extract_first_paragraph(content: str) -> str:
     return "No description"
 
 
-async def get_work_memory_index(
+def _relevance_terms(text: str) -> list[str]:
+    """
+    Tokenize for BM25: ASCII words as-is, Japanese runs as character bigrams.
+
+    Runs are found with _RELEVANCE_TOKEN_PATTERN, so single kana/kanji are
+    ignored just like in the overlap scoring.
+    """
+    terms: list[str] = []
+    for token in _RELEVANCE_TOKEN_PATTERN.findall((text or "").lower()):
+        if _ASCII_TOKEN_PATTERN.fullmatch(token):
+            terms.append(token)
+        else:
+            terms.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return terms
+
+
+class _Bm25Index:
+    """Inverted index over term lists with BM25 scoring."""
+
+    def __init__(self, documents: list[list[str]]):
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._lengths = [len(terms) for terms in documents]
+        self._average_length = (sum(self._lengths) / len(documents)) if documents else 0.0
+        for doc_index, terms in enumerate(documents):
+            for term, frequency in Counter(terms).items():
+                self._postings.setdefault(term, []).append((doc_index, frequency))
+
+    def score(self, query: str) -> dict[int, float]:
+        """BM25 score of every document matching at least one query term."""
+        document_count = len(self._lengths)
+        scores: dict[int, float] = {}
+        for term in set(_relevance_terms(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_index, frequency in postings:
+                length_ratio = self._lengths[doc_index] / (self._average_length or 1.0)
+                scores[doc_index] = scores.get(doc_index, 0.0) + idf * (
+                    frequency * (_BM25_K1 + 1)
+                    / (frequency + _BM25_K1 * (1 - _BM25_B + _BM25_B * length_ratio))
+                )
+        return scores
+
+
+def _phrase_bonus(work_memory: WorkMemoryIndexItem, normalized_query: str) -> float:
+    """Bonus for a title or tag that appears verbatim in the query."""
+    bonus = 0.0
+    title = work_memory.title.lower()
+    if title and title in normalized_query:
+        bonus += 2.0
+    for tag in work_memory.tags:
+        normalized_tag = tag.strip().lower()
+        if normalized_tag and normalized_tag in normalized_query:
+            bonus += 1.5
+    return bonus
+
+
+def _rank(
+    work_memories: list[WorkMemoryIndexItem],
+    index: _Bm25Index,
+    query: str,
+    limit: int,
+) -> list[WorkMemoryIndexItem]:
+    normalized_query = (query or "").strip().lower()
+    if not normalized_query or limit <= 0:
+        return []
+    scores = index.score(normalized_query)
+    for doc_index, work_memory in enumerate(work_memories):
+        bonus = _phrase_bonus(work_memory, normalized_query)
+        if bonus:
+            scores[doc_index] = scores.get(doc_index, 0.0) + bonus
+    ranked = sorted(
+        (doc_index for doc_index, score in scores.items() if score > 0),
+        key=lambda doc_index: (-scores[doc_index], doc_index),
+    )
+    return [work_memories[doc_index] for doc_index in ranked[:limit]]
+
+
+def _index_terms(work_memory: WorkMemoryIndexItem, content: str = "") -> list[str]:
+    # The title is repeated to weigh it above the body text.
+    fields = [work_memory.title, work_memory.title, *work_memory.tags, work_memory.when_to_use, content]
+    return _relevance_terms(" ".join(fields))
+
+
+class WorkMemoryLibrary:
+    """Parsed WORK/RULE memories of one user, newest first, with a BM25 index."""
+
+    def __init__(self, user_id: str, memories: list[Memory]):
+        self.user_id = user_id
+        self.items: list[WorkMemoryIndexItem] = []
+        self._contents: dict[str, WorkMemoryContent] = {}
+        documents: list[list[str]] = []
+        for memory in memories:
+            full = parse_work_memory_full(memory)
+            item = WorkMemoryIndexItem(
+                id=full.id,
+                title=full.title,
+                when_to_use=_truncate_when_to_use(full.when_to_use),
+                tags=full.tags,
+            )
+            self.items.append(item)
+            self._contents[full.id] = full
+            documents.append(_index_terms(item, full.content))
+        self._index = _Bm25Index(documents)
+
+    def get(self, work_memory_id: str) -> Optional[WorkMemoryContent]:
+        return self._contents.get(work_memory_id)
+
+    def select_relevant(self, query: str, limit: int = 2) -> list[WorkMemoryIndexItem]:
+        """Rank every memory of the library against the query."""
+        return _rank(self.items, self._index, query, limit)
+
+
+work_memory_library_cache: TTLCache[str, WorkMemoryLibrary] = TTLCache(
+    ttl_seconds=lambda: get_settings().WORK_MEMORY_CACHE_TTL_SECONDS,
+    max_entries=lambda: get_settings().WORK_MEMORY_CACHE_MAX_ENTRIES,
+)
+
+
+def _invalidate_on_memory_writes(changes: list[DataChange]) -> None:
+    """Drop the libraries of users whose memories a committed write touched."""
+    for change in changes:
+        if change.table != "memories":
+            continue
+        if change.user_ids:
+            work_memory_library_cache.invalidate(*change.user_ids)
+        else:
+            # Bulk statement without a user: drop every library.
+            work_memory_library_cache.clear()
+
+
+add_commit_listener(_invalidate_on_memory_writes)
+
+
+async def load_work_memory_library(
     user_id: str,
     memory_repo: IMemoryRepository,
-    limit: int = 100,
-) -> list[WorkMemoryIndexItem]:
-    """Get compact work-memory index from WORK/RULE memories."""
+) -> WorkMemoryLibrary:
+    """Get the user's parsed WORK/RULE memories, from cache when fresh."""
+    cached = work_memory_library_cache.get(user_id)
+    if cached:
+        return cached
     memories = await memory_repo.list(
         user_id,
         scope=MemoryScope.WORK,
         memory_type=MemoryType.RULE,
-        limit=limit,
+        limit=_LIBRARY_MEMORY_LIMIT,
     )
-    return [parse_work_memory(memory) for memory in memories]
+    library = WorkMemoryLibrary(user_id, memories)
+    work_memory_library_cache.set(user_id, library)
+    return library
+
+
+async def get_work_memory_index(
+    user_id: str,
+    memory_repo: IMemoryRepository,
+    limit: int = 100,
+) -> list[WorkMemoryIndexItem]:
+    """Get compact work-memory index from WORK/RULE memories."""
+    library = await load_work_memory_library(user_id, memory_repo)
+    return library.items[:limit]
 
 
 async def get_work_memory_by_id(
@@ -190,6 +359,10 @@ async def get_work_memory_by_id(
     work_memory_id: str,
 ) -> Optional[WorkMemoryContent]:
     """Get full work-memory content by ID."""
+    library = work_memory_library_cache.get(user_id)
+    cached = library.get(work_memory_id) if library else None
+    if cached:
+        return cached
     try:
         memory = await memory_repo.get(user_id, UUID(work_memory_id))
         if memory and memory.scope == MemoryScope.WORK:
@@ -245,15 +418,11 @@ def select_relevant_work_memories(
     query: str,
     limit: int = 2,
 ) -> list[WorkMemoryIndexItem]:
+    """Rank index items by BM25 over title, tags and when_to_use."""
     if not work_memories or limit <= 0:
         return []
-
-    ranked: list[tuple[float, int, WorkMemoryIndexItem]] = []
-    for index, work_memory in enumerate(work_memories):
-        ranked.append((score_work_memory_relevance(work_memory, query), index, work_memory))
-
-    ranked.sort(key=lambda item: (-item[0], item[1]))
-    return [item for score, _, item in ranked if score > 0][:limit]
+    index = _Bm25Index([_index_terms(work_memory) for work_memory in work_memories])
+    return _rank(work_memories, index, query, limit)
 
 
 def format_work_memory_index_for_prompt(
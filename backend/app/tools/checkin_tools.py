@@ -18,8 +18,10 @@ from app.interfaces.checkin_repository import ICheckinRepository
 from app.interfaces.project_member_repository import IProjectMemberRepository
 from app.interfaces.project_repository import IProjectRepository
 from app.interfaces.proposal_repository import IProposalRepository
+from app.interfaces.user_repository import IUserRepository
 from app.models.collaboration import CheckinCreateV2, CheckinItem
 from app.models.enums import CheckinItemCategory, CheckinItemUrgency, CheckinMood
+from app.services.project_context_service import load_project_context
 from app.services.project_permissions import ProjectAction
 from app.tools.approval_tools import create_tool_action_proposal
 from app.tools.permissions import require_project_action
@@ -168,8 +170,9 @@ async def list_checkins(
     project_repo: IProjectRepository,
     member_repo: IProjectMemberRepository,
     input_data: ListCheckinsInput,
+    user_repo: Optional[IUserRepository] = None,
 ) -> dict:
-    """List V2 structured check-ins for a project."""
+    """List V2 structured check-ins for a project (with member names when user_repo is given)."""
 
     try:
         project_id = UUID(input_data.project_id)
@@ -204,8 +207,16 @@ async def list_checkins(
         end_date=end_date,
     )
 
+    results = [c.model_dump(mode="json") for c in checkins]
+    if user_repo and checkins:
+        context = await load_project_context(
+            access.owner_id, project_id, project_repo, member_repo, user_repo
+        )
+        for result in results:
+            result["member_name"] = context.display_name(result["member_user_id"])
+
     return {
-        "checkins": [c.model_dump(mode="json") for c in checkins],
+        "checkins": results,
         "count": len(checkins),
     }
 
@@ -289,6 +300,7 @@ def list_checkins_tool(
     project_repo: IProjectRepository,
     member_repo: IProjectMemberRepository,
     user_id: str,
+    user_repo: Optional[IUserRepository] = None,
 ) -> FunctionTool:
     """Create ADK tool for listing V2 check-ins."""
 
@@ -302,7 +314,7 @@ def list_checkins_tool(
             end_date (str, optional): 終了日 (YYYY-MM-DD)
 
         Returns:
-            dict: checkins (list), count (int)
+            dict: checkins (list, 各要素に member_name を含む), count (int)
         """
         if not isinstance(input_data, dict):
             return {"error": f"input_data must be dict, got {type(input_data)}"}
@@ -310,6 +322,7 @@ def list_checkins_tool(
         return await list_checkins(
             user_id, checkin_repo, project_repo, member_repo,
             ListCheckinsInput(**input_data),
+            user_repo=user_repo,
         )
 
     _tool.__name__ = "list_checkins"
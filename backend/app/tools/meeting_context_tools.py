@@ -7,6 +7,7 @@ to propose a meeting agenda.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date, timedelta
 from typing import Optional
 from uuid import UUID
@@ -21,6 +22,7 @@ from app.interfaces.project_repository import IProjectRepository
 from app.interfaces.recurring_meeting_repository import IRecurringMeetingRepository
 from app.interfaces.task_repository import ITaskRepository
 from app.interfaces.user_repository import IUserRepository
+from app.services.project_context_service import load_project_context
 from app.services.project_permissions import ProjectAction
 from app.tools.permissions import require_project_action
 
@@ -40,31 +42,6 @@ class FetchMeetingContextInput(BaseModel):
     end_date: date = Field(..., description="対象期間の終了日 (YYYY-MM-DD)")
 
 
-async def _build_member_name_map(
-    member_repo: IProjectMemberRepository,
-    user_repo: Optional[IUserRepository],
-    project_id: UUID,
-) -> dict[str, str]:
-    """Build a mapping from member_user_id to display name."""
-    members = await member_repo.list_by_project(project_id)
-    name_map: dict[str, str] = {}
-    for member in members:
-        display_name = None
-        if user_repo:
-            try:
-                user_account = await user_repo.get(UUID(member.member_user_id))
-            except (ValueError, TypeError):
-                user_account = None
-            if not user_account and "@" in member.member_user_id:
-                user_account = await user_repo.get_by_email(member.member_user_id)
-            if not user_account:
-                user_account = await user_repo.get_by_username(member.member_user_id)
-            if user_account:
-                display_name = user_account.display_name or user_account.username
-        name_map[member.member_user_id] = display_name or member.member_user_id
-    return name_map
-
-
 async def fetch_meeting_context(
     user_id: str,
     checkin_repo: ICheckinRepository,
@@ -91,8 +68,46 @@ async def fetch_meeting_context(
     if isinstance(access, dict):
         return access
 
-    # 1. Fetch Project info
-    project = await project_repo.get(access.owner_id, project_id)
+    meeting_id = None
+    if input_data.meeting_id:
+        try:
+            meeting_id = UUID(input_data.meeting_id)
+        except ValueError:
+            pass  # Invalid meeting_id, skip
+
+    async def _get_meeting():
+        if not meeting_id:
+            return None
+        return await recurring_meeting_repo.get(
+            access.owner_id,
+            meeting_id,
+            project_id=project_id,
+        )
+
+    # The loads are independent: issue them concurrently. Project info and
+    # member display names come from the shared project context bundle.
+    context, meeting, checkins, agenda_items, all_tasks = await asyncio.gather(
+        load_project_context(access.owner_id, project_id, project_repo, member_repo, user_repo),
+        _get_meeting(),
+        # Check-ins (V1 for backward compatibility)
+        checkin_repo.list(
+            user_id=access.owner_id,
+            project_id=project_id,
+            start_date=input_data.start_date,
+            end_date=input_data.end_date,
+        ),
+        # Structured check-in data (V2)
+        checkin_repo.get_agenda_items(
+            user_id=access.owner_id,
+            project_id=project_id,
+            start_date=input_data.start_date,
+            end_date=input_data.end_date,
+        ),
+        task_repo.list(access.owner_id, project_id=project_id),
+    )
+
+    # 1. Project info
+    project = context.project
     project_info = None
     if project:
         project_info = {
@@ -103,42 +118,20 @@ async def fetch_meeting_context(
             "key_points": project.key_points,
         }
 
-    # 2. Fetch Meeting info (if meeting_id provided)
+    # 2. Meeting info (if meeting_id provided)
     meeting_info = None
-    if input_data.meeting_id:
-        try:
-            meeting_id = UUID(input_data.meeting_id)
-            meeting = await recurring_meeting_repo.get(
-                access.owner_id,
-                meeting_id,
-                project_id=project_id,
-            )
-            if meeting:
-                meeting_info = {
-                    "title": meeting.title,
-                    "duration_minutes": meeting.duration_minutes,
-                    "location": meeting.location,
-                    "attendees": meeting.attendees,
-                    "frequency": meeting.frequency.value if meeting.frequency else None,
-                }
-        except ValueError:
-            pass  # Invalid meeting_id, skip
-
-    # Build member name map for display names
-    name_map = await _build_member_name_map(member_repo, user_repo, project_id)
-
-    def _resolve_name(member_user_id: str) -> str:
-        return name_map.get(member_user_id, member_user_id)
+    if meeting:
+        meeting_info = {
+            "title": meeting.title,
+            "duration_minutes": meeting.duration_minutes,
+            "location": meeting.location,
+            "attendees": meeting.attendees,
+            "frequency": meeting.frequency.value if meeting.frequency else None,
+        }
 
-    # 3. Fetch Check-ins (V1 for backward compatibility)
-    checkins = await checkin_repo.list(
-        user_id=access.owner_id,
-        project_id=project_id,
-        start_date=input_data.start_date,
-        end_date=input_data.end_date,
-    )
+    _resolve_name = context.display_name
 
-    # Format check-ins (legacy format)
+    # 3. Format check-ins (legacy format)
     checkin_summaries = []
     for c in checkins:
         checkin_summaries.append({
@@ -148,14 +141,6 @@ async def fetch_meeting_context(
             "type": c.checkin_type
         })
 
-    # 3b. Fetch structured check-in data (V2)
-    agenda_items = await checkin_repo.get_agenda_items(
-        user_id=access.owner_id,
-        project_id=project_id,
-        start_date=input_data.start_date,
-        end_date=input_data.end_date,
-    )
-
     # Resolve member names in agenda items
     def _resolve_items(items: list[dict]) -> list[dict]:
         for item in items:
@@ -169,9 +154,7 @@ async def fetch_meeting_context(
     _resolve_items(agenda_items.updates)
     _resolve_items(agenda_items.must_discuss_items)
 
-    # 4. Fetch Tasks (Active ones)
-    all_tasks = await task_repo.list(access.owner_id, project_id=project_id)
-
+    # 4. Tasks (Active ones)
     active_tasks = [
         t for t in all_tasks
         if t.status != "DONE"
@@ -306,15 +289,19 @@ async def list_recurring_meetings(
         meetings = await recurring_meeting_repo.list(user_id, project_id=None)
         owner_id = user_id
 
+    # Load each referenced project once (concurrently), not once per meeting
+    project_ids = list(dict.fromkeys(m.project_id for m in meetings if m.project_id))
+    projects = await asyncio.gather(
+        *(project_repo.get(owner_id, pid) for pid in project_ids)
+    )
+    project_names = {
+        pid: project.name for pid, project in zip(project_ids, projects) if project
+    }
+
     today = date.today()
     result = []
     for meeting in meetings:
-        # Get project name if project_id exists
-        project_name = None
-        if meeting.project_id:
-            project = await project_repo.get(owner_id, meeting.project_id)
-            if project:
-                project_name = project.name
+        project_name = project_names.get(meeting.project_id) if meeting.project_id else None
 
         # Calculate next occurrence
         next_date = _calculate_next_occurrence(meeting, today)
@@ -19,6 +19,7 @@ from app.interfaces.proposal_repository import IProposalRepository
 from app.models.enums import MemoryScope, MemoryType
 from app.models.memory import MemoryCreate, MemorySearchResult, MemoryUpdate
 from app.models.proposal import Proposal, ProposalType
+from app.services.llm_usage_service import llm_usage_scope
 from app.services.llm_utils import generate_text
 from app.services.work_memory_service import (
     get_work_memory_by_id,
@@ -255,12 +256,13 @@ async def refresh_user_profile(
         prompt_lines.append(f"- {memory.content}")
     prompt = "\n".join(prompt_lines)
 
-    summary_text = generate_text(
-        llm_provider,
-        prompt,
-        temperature=0.2,
-        max_output_tokens=400,
-    )
+    with llm_usage_scope("user_profile", user_id=user_id):
+        summary_text = generate_text(
+            llm_provider,
+            prompt,
+            temperature=0.2,
+            max_output_tokens=400,
+        )
     if not summary_text:
         summary_text = "\n".join([f"- {memory.content}" for memory in base_memories[:10]])
 
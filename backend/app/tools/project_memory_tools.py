@@ -24,6 +24,7 @@ from app.interfaces.task_repository import ITaskRepository
 from app.models.enums import MemoryScope, MemoryType, TaskStatus
 from app.models.memory import MemoryCreate
 from app.services.kpi_calculator import apply_project_kpis
+from app.services.llm_usage_service import llm_usage_scope
 from app.services.llm_utils import generate_text
 from app.services.project_permissions import ProjectAction
 from app.tools.approval_tools import create_tool_action_proposal
@@ -97,12 +98,13 @@ async def _generate_summary_text(
     prompt: str,
 ) -> Optional[str]:
     try:
-        return generate_text(
-            llm_provider,
-            prompt,
-            temperature=0.2,
-            max_output_tokens=600,
-        )
+        with llm_usage_scope("project_summary"):
+            return generate_text(
+                llm_provider,
+                prompt,
+                temperature=0.2,
+                max_output_tokens=600,
+            )
     except Exception as exc:
         logger.warning(f"Project summary generation failed: {exc}")
         return None
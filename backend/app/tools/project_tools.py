@@ -23,6 +23,7 @@ from app.models.project_kpi import ProjectKpiConfig, ProjectKpiMetric
 from app.models.proposal import Proposal, ProposalType
 from app.services.assignee_utils import make_invitation_assignee_id
 from app.services.kpi_templates import get_kpi_templates
+from app.services.llm_usage_service import llm_usage_scope
 from app.services.llm_utils import generate_text
 from app.services.project_permissions import ProjectAction
 from app.tools.approval_tools import create_tool_action_proposal
@@ -204,14 +205,15 @@ def _select_kpis_via_llm(
         },
         "required": ["strategy"],
     }
-    response_text = generate_text(
-        llm_provider,
-        prompt,
-        temperature=0.2,
-        max_output_tokens=400,
-        response_schema=schema,
-        response_mime_type="application/json",
-    )
+    with llm_usage_scope("project_kpi"):
+        response_text = generate_text(
+            llm_provider,
+            prompt,
+            temperature=0.2,
+            max_output_tokens=400,
+            response_schema=schema,
+            response_mime_type="application/json",
+        )
     if not response_text:
         return {}
     try:
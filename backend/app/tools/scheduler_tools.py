@@ -14,20 +14,24 @@ from uuid import UUID
 from google.adk.tools import FunctionTool
 from pydantic import BaseModel, Field
 
+from app.core.logger import logger
 from app.interfaces.agent_task_repository import IAgentTaskRepository
 from app.interfaces.postpone_repository import IPostponeRepository
 from app.interfaces.project_repository import IProjectRepository
 from app.interfaces.proposal_repository import IProposalRepository
-from app.interfaces.task_assignment_repository import ITaskAssignmentRepository
 from app.interfaces.task_repository import ITaskRepository
 from app.interfaces.user_repository import IUserRepository
 from app.models.agent_task import AgentTaskCreate, AgentTaskPayload
-from app.models.enums import ActionType, ProjectVisibility, TaskStatus
+from app.models.enums import ActionType, TaskStatus
 from app.models.task import Task, TaskUpdate
-from app.services.task_utils import is_parent_task
 from app.tools.approval_tools import create_tool_action_proposal
 from app.utils.datetime_utils import get_user_today
 
+# Max keyword-search candidates loaded per schedule request (the bound the
+# old full scan of owned tasks had).
+_SEARCH_CANDIDATE_LIMIT = 5000
+
+
 # ===========================================
 # Tool Input Models
 # ===========================================
@@ -151,12 +155,14 @@ def _derive_keywords_from_request(request: str) -> list[str]:
     return [trimmed] if trimmed else []
 
 
-def _task_search_text(task: Task) -> str:
+def _task_search_text(task: Task, project_name: Optional[str] = None) -> str:
     parts = [task.title]
     if task.description:
         parts.append(task.description)
     if task.purpose:
         parts.append(task.purpose)
+    if project_name:
+        parts.append(project_name)
     return " ".join(parts).lower()
 
 
@@ -189,51 +195,38 @@ async def _resolve_user_timezone(
     return "Asia/Tokyo"
 
 
-async def _list_owned_tasks(
+async def _search_tasks(
     user_id: str,
     task_repo: ITaskRepository,
+    keywords: list[str],
     *,
+    project_id: Optional[UUID],
     include_done: bool,
+    leaf_only: bool,
 ) -> list[Task]:
-    batch_size = 500
-    hard_limit = 5000
-    offset = 0
-    tasks: list[Task] = []
-    while len(tasks) < hard_limit:
-        batch = await task_repo.list(
-            user_id=user_id,
-            include_done=include_done,
-            limit=batch_size,
-            offset=offset,
-        )
-        if not batch:
-            break
-        tasks.extend(batch)
-        if len(batch) < batch_size:
-            break
-        offset += batch_size
-    return tasks[:hard_limit]
-
-
-async def _load_assigned_tasks(
-    task_repo: ITaskRepository,
-    task_ids: set[UUID],
-) -> list[Task]:
-    if not task_ids:
-        return []
-    get_many = getattr(task_repo, "get_many", None)
-    if not callable(get_many):
+    """Load the indexed keyword-search candidates, in search rank order."""
+    if not keywords:
         return []
-    result = await get_many(list(task_ids))
-    if not isinstance(result, list):
-        return []
-    return [task for task in result if isinstance(task, Task)]
+    task_ids = await task_repo.search_by_keywords(
+        user_id,
+        keywords,
+        project_id=project_id,
+        include_done=include_done,
+        leaf_only=leaf_only,
+        limit=_SEARCH_CANDIDATE_LIMIT,
+    )
+    if len(task_ids) >= _SEARCH_CANDIDATE_LIMIT:
+        logger.warning(
+            f"Schedule request search for {user_id} hit the {_SEARCH_CANDIDATE_LIMIT} candidate limit; "
+            "lower-ranked matches are ignored"
+        )
+    tasks_by_id = {task.id: task for task in await task_repo.get_many(task_ids)}
+    return [tasks_by_id[task_id] for task_id in task_ids if task_id in tasks_by_id]
 
 
 async def apply_schedule_request(
     user_id: str,
     task_repo: ITaskRepository,
-    assignment_repo: ITaskAssignmentRepository,
     project_repo: IProjectRepository,
     input_data: ApplyScheduleRequestInput,
     user_repo: Optional[IUserRepository] = None,
@@ -247,51 +240,44 @@ async def apply_schedule_request(
         focus_keywords = _derive_keywords_from_request(input_data.request)
     avoid_keywords = _normalize_keywords(input_data.avoid_keywords)
 
-    owned_tasks = await _list_owned_tasks(user_id, task_repo, include_done=True)
-    assignments = await assignment_repo.list_for_assignee(user_id)
-    assigned_task_ids = {assignment.task_id for assignment in assignments}
-    assigned_tasks = await _load_assigned_tasks(task_repo, assigned_task_ids)
-    projects = await project_repo.list(user_id, limit=1000)
-    team_project_ids = {
-        project.id for project in projects if project.visibility == ProjectVisibility.TEAM
-    }
-
-    def should_include(task: Task) -> bool:
-        if not task.project_id:
-            return True
-        if task.project_id not in team_project_ids:
-            return True
-        return task.id in assigned_task_ids
-
-    merged_by_id: dict[UUID, Task] = {}
-    for task in owned_tasks:
-        if should_include(task):
-            merged_by_id[task.id] = task
-    for task in assigned_tasks:
-        if task.id not in merged_by_id and should_include(task):
-            merged_by_id[task.id] = task
-
-    scoped_tasks = list(merged_by_id.values())
-
+    project_id: Optional[UUID] = None
     if input_data.project_id:
         try:
             project_id = UUID(input_data.project_id)
         except (TypeError, ValueError):
             raise ValueError(f"Invalid project_id: {input_data.project_id}")
-        scoped_tasks = [task for task in scoped_tasks if task.project_id == project_id]
 
+    project_names: dict[UUID, str] = {}
+
+    async def load_project_names(tasks: list[Task]) -> None:
+        missing = {task.project_id for task in tasks if task.project_id} - project_names.keys()
+        if missing:
+            for project in await project_repo.get_many(list(missing)):
+                project_names[project.id] = project.name
+
+    def search_text(task: Task) -> str:
+        return _task_search_text(task, project_names.get(task.project_id))
+
+    # The index narrows the search to possible matches; keywords are then
+    # checked as substrings on the loaded candidates.
     candidate_tasks = [
         task
-        for task in scoped_tasks
-        if task.status != TaskStatus.DONE
-        and (task.status != TaskStatus.WAITING or task.requires_all_completion)
+        for task in await _search_tasks(
+            user_id,
+            task_repo,
+            focus_keywords,
+            project_id=project_id,
+            include_done=False,
+            leaf_only=True,
+        )
+        if (task.status != TaskStatus.WAITING or task.requires_all_completion)
         and not task.is_fixed_time
-        and not is_parent_task(task, scoped_tasks)
     ]
+    await load_project_names(candidate_tasks)
 
     scored: list[tuple[Task, int]] = []
     for task in candidate_tasks:
-        text = _task_search_text(task)
+        text = search_text(task)
         focus_score = _match_score(text, focus_keywords)
         avoid_score = _match_score(text, avoid_keywords)
         if focus_score <= 0:
@@ -334,12 +320,21 @@ async def apply_schedule_request(
 
     unpinned_task_ids: list[str] = []
     if input_data.unpin_avoided_today and avoid_keywords:
-        for task in scoped_tasks:
+        avoided_tasks = await _search_tasks(
+            user_id,
+            task_repo,
+            avoid_keywords,
+            project_id=project_id,
+            include_done=True,
+            leaf_only=False,
+        )
+        await load_project_names(avoided_tasks)
+        for task in avoided_tasks:
             if task.id in selected_ids:
                 continue
             if not task.pinned_date or task.pinned_date.date() != today:
                 continue
-            if _match_score(_task_search_text(task), avoid_keywords) <= 0:
+            if _match_score(search_text(task), avoid_keywords) <= 0:
                 continue
             await task_repo.update(
                 user_id=user_id,
@@ -432,7 +427,6 @@ def schedule_agent_task_tool(
 
 def apply_schedule_request_tool(
     task_repo: ITaskRepository,
-    assignment_repo: ITaskAssignmentRepository,
     project_repo: IProjectRepository,
     user_id: str,
     proposal_repo: Optional[IProposalRepository] = None,
@@ -477,7 +471,6 @@ def apply_schedule_request_tool(
         return await apply_schedule_request(
             user_id=user_id,
             task_repo=task_repo,
-            assignment_repo=assignment_repo,
             project_repo=project_repo,
             input_data=ApplyScheduleRequestInput(**payload),
             user_repo=user_repo,
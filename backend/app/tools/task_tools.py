@@ -14,6 +14,7 @@ from google.adk.tools import FunctionTool
 from pydantic import BaseModel, Field, field_validator
 
 from app.core.config import get_settings
+from app.core.exceptions import NotFoundError
 from app.interfaces.project_member_repository import IProjectMemberRepository
 from app.interfaces.project_repository import IProjectRepository
 from app.interfaces.proposal_repository import IProposalRepository
@@ -23,7 +24,7 @@ from app.models.collaboration import TaskAssignmentCreate, TaskAssignmentsCreate
 from app.models.enums import CreatedBy, EnergyLevel, Priority
 from app.models.proposal import Proposal, ProposalType
 from app.models.task import Task, TaskCreate, TaskUpdate, TouchpointStep
-from app.services.project_permissions import ProjectAction
+from app.services.project_permissions import ProjectAction, resolve_task_access
 from app.services.task_utils import renumber_siblings
 from app.tools.approval_tools import create_tool_action_proposal
 from app.tools.permissions import require_project_action, require_project_member
@@ -356,39 +357,32 @@ async def _resolve_task_access(
     member_repo: Optional[IProjectMemberRepository],
 ) -> tuple[Optional[Task], Optional[str], Optional[UUID], Optional[dict]]:
     task = await task_repo.get(user_id, task_id)
-    if task:
-        if task.project_id:
-            if not project_repo or not member_repo:
-                return None, None, None, {"error": "Project access check unavailable"}
-            access = await require_project_member(
-                user_id,
-                task.project_id,
-                project_repo,
-                member_repo,
-            )
-            if isinstance(access, dict):
-                return None, None, None, access
-            return task, access.owner_id, task.project_id, None
-        return task, user_id, task.project_id, None
+    if task and not task.project_id:
+        return task, user_id, None, None
 
     if not project_repo or not member_repo:
         return None, None, None, {"error": "Project access check unavailable"}
 
-    projects = await project_repo.list(user_id, limit=1000)
-    for project in projects:
-        task = await task_repo.get(user_id, task_id, project_id=project.id)
-        if task:
-            access = await require_project_member(
-                user_id,
-                project.id,
-                project_repo,
-                member_repo,
-            )
-            if isinstance(access, dict):
-                return None, None, None, access
-            return task, access.owner_id, project.id, None
+    if task:
+        access = await require_project_member(
+            user_id,
+            task.project_id,
+            project_repo,
+            member_repo,
+        )
+        if isinstance(access, dict):
+            return None, None, None, access
+        return task, access.owner_id, task.project_id, None
 
-    return None, None, None, {"error": "Task not found"}
+    try:
+        task, access = await resolve_task_access(
+            user_id, task_id, task_repo, project_repo, member_repo
+        )
+    except NotFoundError:
+        return None, None, None, {"error": "Task not found"}
+    if access is None:
+        return task, user_id, None, None
+    return task, access.owner_id, task.project_id, None
 
 
 async def _resolve_project_access(
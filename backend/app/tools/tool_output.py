@@ -0,0 +1,443 @@
+"""
+Compact serialization of agent tool outputs.
+
+Tool results go straight into the LLM context, and read tools used to return
+full ``model_dump`` payloads (every field, long notes, full UUIDs). Read tools
+listed in TOOL_OUTPUT_PROJECTIONS are compacted before they reach the model:
+
+- per-tool field projections for record lists and bookkeeping fields dropped
+- empty values (None, "", [], {}) removed and long strings truncated
+- UUIDs shortened to per-session aliases, stored with the chat session so
+  they resolve on any worker and after restarts; aliases in ID arguments
+  (``id``, ``*_id``, ``*_ids``) of every tool are expanded back to full UUIDs
+- a token budget per call, enforced by dropping trailing list items
+
+Write tools are never compacted: their payloads (proposal ids etc.) are also
+consumed by the frontend.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from google.adk.tools import FunctionTool
+
+from app.core.config import get_settings
+from app.core.exceptions import InfrastructureError
+from app.core.tracing import span
+from app.interfaces.chat_session_repository import IChatSessionRepository
+from app.utils.token_utils import estimate_tokens
+
+_UUID_PATTERN = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+_MIN_ALIAS_LENGTH = 8
+_ALIAS_SAVE_ATTEMPTS = 3
+_TRUNCATION_MARK = "…"
+
+# Bookkeeping fields that never help the model decide anything.
+DROP_FIELDS = frozenset({
+    "user_id",
+    "created_at",
+    "updated_at",
+    "created_by",
+    "source_capture_id",
+    "completed_by",
+})
+
+TASK_LIST_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "importance",
+    "urgency",
+    "energy_level",
+    "estimated_minutes",
+    "progress",
+    "due_date",
+    "start_not_before",
+    "pinned_date",
+    "project_id",
+    "phase_id",
+    "parent_id",
+    "dependency_ids",
+    "is_fixed_time",
+    "start_time",
+    "end_time",
+)
+PHASE_LIST_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "status",
+    "order_in_project",
+    "start_date",
+    "end_date",
+)
+MILESTONE_LIST_FIELDS = (
+    "id",
+    "phase_id",
+    "title",
+    "description",
+    "status",
+    "order_in_phase",
+    "due_date",
+)
+
+
+@dataclass(frozen=True)
+class ToolProjection:
+    """
+    Compaction settings for one tool.
+
+    ``fields`` maps a result key holding a record (or list of records) to the
+    record fields that are kept; other keys are only cleaned and truncated.
+    """
+
+    fields: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    text_limit: Optional[int] = None
+    budget_tokens: Optional[int] = None
+
+
+TOOL_OUTPUT_PROJECTIONS: dict[str, ToolProjection] = {
+    "list_tasks": ToolProjection({"tasks": TASK_LIST_FIELDS}),
+    "search_similar_tasks": ToolProjection({"task": TASK_LIST_FIELDS}),
+    "get_task": ToolProjection(text_limit=2000),
+    "list_task_assignments": ToolProjection(),
+    "list_project_assignments": ToolProjection(),
+    "list_phases": ToolProjection({"phases": PHASE_LIST_FIELDS}),
+    "get_phase": ToolProjection(text_limit=2000),
+    "list_milestones": ToolProjection({"milestones": MILESTONE_LIST_FIELDS}),
+    "list_agenda_items": ToolProjection(),
+    "list_projects": ToolProjection(),
+    "list_project_members": ToolProjection(),
+    "list_checkins": ToolProjection(),
+    "list_recurring_meetings": ToolProjection(),
+    "list_recurring_tasks": ToolProjection(),
+}
+
+# Process-wide token counters per tool, exposed for monitoring.
+_tool_output_stats: dict[str, dict[str, int]] = {}
+
+
+def get_tool_output_stats() -> dict[str, dict[str, int]]:
+    """Return a snapshot of per-tool output token counters (raw vs compact)."""
+    return {name: dict(stats) for name, stats in _tool_output_stats.items()}
+
+
+def _is_id_param(name: Optional[str]) -> bool:
+    return bool(name) and (name == "id" or name.endswith("_id") or name.endswith("_ids"))
+
+
+class IdAliasMap:
+    """Reversible map between UUIDs and their shortest unique prefixes."""
+
+    def __init__(self, aliases: Optional[dict[str, str]] = None) -> None:
+        self._id_by_alias: dict[str, str] = {}
+        self._alias_by_id: dict[str, str] = {}
+        self._new: dict[str, str] = {}
+        self.update(aliases or {})
+
+    def update(self, aliases: dict[str, str]) -> None:
+        """Add known aliases (e.g. loaded from the chat session)."""
+        for alias, entity_id in aliases.items():
+            self._id_by_alias[alias] = entity_id
+            self._alias_by_id.setdefault(entity_id, alias)
+
+    def shorten(self, value: str) -> str:
+        key = value.lower()
+        alias = self._alias_by_id.get(key)
+        if alias:
+            return alias
+        compact = key.replace("-", "")
+        length = _MIN_ALIAS_LENGTH
+        while compact[:length] in self._id_by_alias:
+            length += 4
+        alias = compact[:length]
+        self._alias_by_id[key] = alias
+        self._id_by_alias[alias] = key
+        self._new[alias] = key
+        return alias
+
+    def reassign(self, stored: dict[str, str]) -> dict[str, str]:
+        """
+        Adopt aliases stored for other IDs and re-alias the IDs that lost them.
+
+        Args:
+            stored: Stored entity ID per alias (see save_id_aliases)
+
+        Returns:
+            Mapping of each lost alias to the ID's new, longer alias
+        """
+        renamed: dict[str, str] = {}
+        for alias, entity_id in stored.items():
+            lost_id = self._id_by_alias.get(alias)
+            if lost_id is None or lost_id == entity_id:
+                continue
+            self._id_by_alias[alias] = entity_id
+            self._alias_by_id.setdefault(entity_id, alias)
+            self._new.pop(alias, None)
+            if self._alias_by_id.get(lost_id) == alias:
+                del self._alias_by_id[lost_id]
+            renamed[alias] = self.shorten(lost_id)
+        return renamed
+
+    def expand(self, value: str) -> Optional[str]:
+        return self._id_by_alias.get(value.lower())
+
+    def pop_new(self) -> dict[str, str]:
+        """Return aliases created since the last call (to be stored)."""
+        new, self._new = self._new, {}
+        return new
+
+    def expand_args(self, value: Any, name: Optional[str] = None) -> Any:
+        """
+        Replace aliases in ID arguments with full UUIDs.
+
+        Only values of ID parameters (``id``, ``*_id``, ``*_ids``, at any depth)
+        are expanded; free text that happens to equal an alias is kept.
+        """
+        if isinstance(value, str):
+            return (self.expand(value) or value) if _is_id_param(name) else value
+        if isinstance(value, list):
+            return [self.expand_args(item, name) for item in value]
+        if isinstance(value, dict):
+            return {key: self.expand_args(item, key) for key, item in value.items()}
+        return value
+
+
+class SessionIdAliases:
+    """
+    Alias map of one chat session, stored with the session.
+
+    Aliases end up in the chat history (assistant replies quote them), so they
+    must resolve on every worker and after restarts: the map is reloaded from
+    the chat session repository before each tool call and new aliases are
+    stored right after the call. Without a repository or session the map only
+    lives as long as the agent.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        session_id: Optional[str],
+        chat_repo: Optional[IChatSessionRepository] = None,
+    ) -> None:
+        self._user_id = user_id
+        self._session_id = session_id
+        self._chat_repo = chat_repo if session_id else None
+        self.aliases = IdAliasMap()
+
+    async def load(self) -> IdAliasMap:
+        if self._chat_repo:
+            self.aliases.update(await self._chat_repo.get_id_aliases(self._user_id, self._session_id))
+        return self.aliases
+
+    async def save(self) -> dict[str, str]:
+        """
+        Store the aliases created since the last save.
+
+        Another worker may have stored one of them for a different ID first
+        (same prefix); the stored alias wins and the ID here is re-aliased
+        with a longer prefix and stored in turn.
+
+        Returns:
+            Mapping of each alias handed out that lost to its replacement
+
+        Raises:
+            InfrastructureError: If the aliases could not be stored
+        """
+        renamed: dict[str, str] = {}
+        if not self._chat_repo:
+            self.aliases.pop_new()
+            return renamed
+        for _ in range(_ALIAS_SAVE_ATTEMPTS):
+            new = self.aliases.pop_new()
+            if not new:
+                return renamed
+            stored = await self._chat_repo.save_id_aliases(self._user_id, self._session_id, new)
+            if any(alias not in stored for alias in new):
+                raise InfrastructureError("Chat ID aliases were not stored")
+            for lost, replacement in self.aliases.reassign(stored).items():
+                handed_out = [alias for alias, current in renamed.items() if current == lost]
+                for alias in handed_out or [lost]:
+                    renamed[alias] = replacement
+        if self.aliases.pop_new():
+            raise InfrastructureError("Chat ID aliases kept colliding with stored aliases")
+        return renamed
+
+
+def _truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}{_TRUNCATION_MARK}(+{len(text) - limit})"
+
+
+def _compact_value(value: Any, aliases: IdAliasMap, text_limit: int) -> Any:
+    if isinstance(value, dict):
+        compacted = {}
+        for key, item in value.items():
+            if key in DROP_FIELDS:
+                continue
+            item = _compact_value(item, aliases, text_limit)
+            if item is None or item == "" or item == [] or item == {}:
+                continue
+            compacted[key] = item
+        return compacted
+    if isinstance(value, list):
+        return [_compact_value(item, aliases, text_limit) for item in value]
+    if isinstance(value, str):
+        if _UUID_PATTERN.match(value):
+            return aliases.shorten(value)
+        return _truncate(value, text_limit)
+    return value
+
+
+def _project(value: Any, fields: tuple[str, ...]) -> Any:
+    if isinstance(value, list):
+        return [_project(item, fields) for item in value]
+    if isinstance(value, dict):
+        return {key: value[key] for key in fields if key in value}
+    return value
+
+
+def _apply_projections(value: Any, projections: dict[str, tuple[str, ...]]) -> Any:
+    """Project records under the configured keys at any depth of the result."""
+    if isinstance(value, list):
+        return [_apply_projections(item, projections) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected = {}
+    for key, item in value.items():
+        if key in projections:
+            projected[key] = _project(item, projections[key])
+        else:
+            projected[key] = _apply_projections(item, projections)
+    return projected
+
+
+def _count_tokens(value: Any) -> int:
+    return estimate_tokens(json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str))
+
+
+def _fit_budget(result: dict, budget: int) -> dict:
+    """Drop trailing items of the largest lists until the result fits the budget."""
+    omitted: dict[str, int] = {}
+    while _count_tokens(result) > budget:
+        lists = [(key, item) for key, item in result.items() if isinstance(item, list) and item]
+        if not lists:
+            break
+        key, items = max(lists, key=lambda entry: _count_tokens(entry[1]))
+        keep = max(0, len(items) - max(1, len(items) // 4))
+        result[key] = items[:keep]
+        omitted[key] = omitted.get(key, 0) + len(items) - keep
+    if omitted:
+        result["omitted_items"] = omitted
+    return result
+
+
+def compact_tool_result(
+    tool_name: str,
+    result: Any,
+    aliases: IdAliasMap,
+    projection: Optional[ToolProjection] = None,
+) -> Any:
+    """
+    Compact a tool result for the LLM context.
+
+    Args:
+        tool_name: Tool name (selects the projection and the stats bucket)
+        result: Raw tool result
+        aliases: Session alias map used to shorten UUIDs
+        projection: Overrides TOOL_OUTPUT_PROJECTIONS[tool_name]
+
+    Returns:
+        The compacted result (unchanged if the tool has no projection)
+    """
+    projection = projection or TOOL_OUTPUT_PROJECTIONS.get(tool_name)
+    if projection is None or not isinstance(result, dict) or "error" in result:
+        return result
+    settings = get_settings()
+    text_limit = projection.text_limit or settings.TOOL_OUTPUT_TEXT_LIMIT
+    budget = projection.budget_tokens or settings.TOOL_OUTPUT_TOKEN_BUDGET
+
+    compacted = _compact_value(_apply_projections(result, projection.fields), aliases, text_limit)
+    compacted = _fit_budget(compacted, budget)
+
+    stats = _tool_output_stats.setdefault(
+        tool_name, {"calls": 0, "raw_tokens": 0, "compact_tokens": 0}
+    )
+    stats["calls"] += 1
+    stats["raw_tokens"] += _count_tokens(result)
+    stats["compact_tokens"] += _count_tokens(compacted)
+    return compacted
+
+
+def compact_tool_outputs(
+    tools: list,
+    user_id: str,
+    session_id: Optional[str],
+    chat_repo: Optional[IChatSessionRepository] = None,
+) -> list:
+    """
+    Add alias expansion and output compaction to the session's function tools.
+
+    ID arguments of every FunctionTool get session aliases expanded; results
+    of tools in TOOL_OUTPUT_PROJECTIONS are compacted. The tools' functions are
+    wrapped in place, so their other settings (confirmation etc.) are kept.
+    Other tool types are returned unchanged.
+    """
+    aliases = SessionIdAliases(user_id, session_id, chat_repo)
+    for tool in tools:
+        if isinstance(tool, FunctionTool):
+            tool.func = _wrap_tool_func(tool.func, tool.name, aliases)
+    return tools
+
+
+def _has_id_args(value: Any, name: Optional[str] = None) -> bool:
+    if isinstance(value, str):
+        return _is_id_param(name) and not _UUID_PATTERN.match(value)
+    if isinstance(value, list):
+        return any(_has_id_args(item, name) for item in value)
+    if isinstance(value, dict):
+        return any(_has_id_args(item, key) for key, item in value.items())
+    return False
+
+
+def _rename_aliases(value: Any, renamed: dict[str, str]) -> Any:
+    if isinstance(value, dict):
+        return {key: _rename_aliases(item, renamed) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_rename_aliases(item, renamed) for item in value]
+    if isinstance(value, str):
+        return renamed.get(value, value)
+    return value
+
+
+def _wrap_tool_func(func, tool_name: str, aliases: SessionIdAliases):
+    compacted = tool_name in TOOL_OUTPUT_PROJECTIONS
+
+    @functools.wraps(func)
+    async def _wrapped(*args, **kwargs):
+        alias_map = aliases.aliases
+        if compacted or _has_id_args(list(args)) or _has_id_args(kwargs):
+            alias_map = await aliases.load()
+            args = tuple(alias_map.expand_args(arg) for arg in args)
+            kwargs = {key: alias_map.expand_args(value, key) for key, value in kwargs.items()}
+        with span(f"tool.{tool_name}"):
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+        if not compacted:
+            return result
+        result = compact_tool_result(tool_name, result, alias_map)
+        renamed = await aliases.save()
+        return _rename_aliases(result, renamed) if renamed else result
+
+    return _wrapped
@@ -8,6 +8,7 @@ from typing import Optional
 from uuid import UUID
 
 from app.core.exceptions import BusinessLogicError
+from app.models.task import Task
 
 
 class DependencyValidator:
@@ -21,6 +22,8 @@ class DependencyValidator:
             task_repo: Task repository for fetching task data
         """
         self.task_repo = task_repo
+        # Tasks resolved during one validation, keyed by ID (None = not visible)
+        self._task_cache: dict[UUID, Optional[Task]] = {}
 
     async def validate_dependencies(
         self,
@@ -55,12 +58,11 @@ class DependencyValidator:
             raise BusinessLogicError("依存関係に重複があります")
 
         # 3. Fetch all dependency tasks
+        self._task_cache = {}
+        await self._prefetch_tasks(dependency_ids, user_id, project_id)
         dep_tasks = []
         for dep_id in dependency_ids:
-            # Try personal access first, then project-based
-            dep_task = await self.task_repo.get(user_id, dep_id)
-            if not dep_task and project_id:
-                dep_task = await self.task_repo.get(user_id, dep_id, project_id=project_id)
+            dep_task = await self._get_task(dep_id, user_id, project_id)
             if not dep_task:
                 raise BusinessLogicError(f"依存先タスク {dep_id} が見つかりません")
             dep_tasks.append(dep_task)
@@ -74,6 +76,39 @@ class DependencyValidator:
         # 5. Check for circular dependencies
         await self._check_circular_dependency(task_id, dependency_ids, user_id, project_id=project_id)
 
+    async def _prefetch_tasks(
+        self,
+        task_ids: list[UUID],
+        user_id: str,
+        project_id: Optional[UUID],
+    ) -> None:
+        """Load uncached tasks in one query when the repository supports it."""
+        missing = [tid for tid in task_ids if tid not in self._task_cache]
+        if not missing or not hasattr(self.task_repo, "get_many"):
+            return
+        found = {task.id: task for task in await self.task_repo.get_many(missing)}
+        for tid in missing:
+            task = found.get(tid)
+            visible = task is not None and (
+                task.user_id == user_id or (project_id is not None and task.project_id == project_id)
+            )
+            self._task_cache[tid] = task if visible else None
+
+    async def _get_task(
+        self,
+        task_id: UUID,
+        user_id: str,
+        project_id: Optional[UUID],
+    ) -> Optional[Task]:
+        """Get a task visible to the user (personal first, then project-based)."""
+        if task_id in self._task_cache:
+            return self._task_cache[task_id]
+        task = await self.task_repo.get(user_id, task_id)
+        if not task and project_id:
+            task = await self.task_repo.get(user_id, task_id, project_id=project_id)
+        self._task_cache[task_id] = task
+        return task
+
     async def _validate_subtask_dependencies(
         self,
         subtask_id: UUID,
@@ -140,6 +175,7 @@ class DependencyValidator:
         if visited is None:
             visited = {task_id}
 
+        await self._prefetch_tasks(dependency_ids, user_id, project_id)
         for dep_id in dependency_ids:
             # If we've seen this task before, it's a circular dependency
             if dep_id in visited:
@@ -147,10 +183,7 @@ class DependencyValidator:
                     f"循環依存が検出されました: タスク {dep_id} はすでに依存チェーン内に存在します"
                 )
 
-            # Fetch the dependency task (try personal access first, then project-based)
-            dep_task = await self.task_repo.get(user_id, dep_id)
-            if not dep_task and project_id:
-                dep_task = await self.task_repo.get(user_id, dep_id, project_id=project_id)
+            dep_task = await self._get_task(dep_id, user_id, project_id)
             if not dep_task:
                 continue
 
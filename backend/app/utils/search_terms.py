@@ -0,0 +1,79 @@
+"""
+Search term extraction for keyword indexes.
+
+Text is NFKC-normalized and lowercased, then split into runs of Latin
+letters/digits and of Japanese (kana/kanji) characters.
+
+The index is built so that a keyword can be found as a substring:
+
+- Latin words are indexed with all their suffixes ("redesign" ->
+  "redesign", "edesign", ..., "n"), so a keyword word matching the
+  start of an indexed term means it occurs anywhere in a word. Each suffix
+  is cut to MAX_TERM_LENGTH characters (and words to MAX_WORD_LENGTH), so a
+  word costs at most MAX_WORD_LENGTH short terms instead of growing with the
+  square of its length; keyword words are cut the same way.
+- Japanese runs have no word separators and are indexed as character
+  bigrams plus the run's last character, so every character starts a term.
+
+Keywords are split the same way (Latin words, Japanese bigrams or a single
+character). A keyword can match a document when each of its query terms is
+a prefix of one of the document's terms. That is a superset of substring
+matching (the terms may come from different places of the text); callers
+that need exact substring semantics re-check the loaded candidates.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Iterable, Optional
+
+# Latin words (incl. accented letters) and kana/kanji runs.
+_RUN_PATTERN = re.compile(
+    r"(?P<word>[0-9a-z\u00c0-\u024f]+)|(?P<cjk>[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff]+)"
+)
+MAX_TERM_LENGTH = 16
+MAX_WORD_LENGTH = 64
+
+
+def _runs(text: Optional[str]) -> Iterable[tuple[bool, str]]:
+    if not text:
+        return
+    normalized = unicodedata.normalize("NFKC", text).lower()
+    for match in _RUN_PATTERN.finditer(normalized):
+        yield bool(match.group("word")), match.group()
+
+
+def extract_search_terms(text: Optional[str]) -> set[str]:
+    """
+    Extract the query terms of a keyword.
+
+    Args:
+        text: Keyword
+
+    Returns:
+        Set of terms (empty for a keyword without letters, digits or kana/kanji)
+    """
+    terms: set[str] = set()
+    for is_word, run in _runs(text):
+        if is_word:
+            terms.add(run[:MAX_TERM_LENGTH])
+        elif len(run) == 1:
+            terms.add(run)
+        else:
+            terms.update(run[i:i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def extract_document_terms(texts: Iterable[Optional[str]]) -> set[str]:
+    """Extract the index terms of a document made of several text fields."""
+    terms: set[str] = set()
+    for text in texts:
+        for is_word, run in _runs(text):
+            if is_word:
+                word = run[:MAX_WORD_LENGTH]
+                terms.update(word[i:i + MAX_TERM_LENGTH] for i in range(len(word)))
+            else:
+                terms.update(run[i:i + 2] for i in range(len(run) - 1))
+                terms.add(run[-1])
+    return terms
@@ -0,0 +1,50 @@
+"""
+Chunked byte streams for streaming uploads.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import re
+from typing import AsyncIterator
+
+_BASE64_PATTERN = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+_WHITESPACE = re.compile(r"\s+")
+
+
+async def iter_chunks(data: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    """Yield bytes in chunks of at most chunk_size."""
+    view = memoryview(data)
+    for offset in range(0, len(view), chunk_size):
+        yield bytes(view[offset:offset + chunk_size])
+
+
+def decode_base64_chunks(encoded: str, chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    Decode base64 text chunk by chunk instead of into one buffer.
+
+    The text is validated up front, so a malformed payload raises ValueError
+    before anything is streamed.
+
+    Args:
+        encoded: Base64 text (whitespace is ignored)
+        chunk_size: Approximate decoded chunk size in bytes
+
+    Returns:
+        Async iterator of decoded chunks
+
+    Raises:
+        ValueError: If the text is not valid base64
+    """
+    text = _WHITESPACE.sub("", encoded)
+    if len(text) % 4 or not _BASE64_PATTERN.fullmatch(text):
+        raise binascii.Error("Invalid base64 payload")
+    # 4 characters decode to 3 bytes; keep slices on quantum boundaries.
+    step = max(4, chunk_size // 3 * 4)
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        for offset in range(0, len(text), step):
+            yield base64.b64decode(text[offset:offset + step])
+
+    return _chunks()
@@ -0,0 +1,63 @@
+"""
+Token estimation utilities.
+
+Provides a cheap, provider-independent token estimate used for prompt
+budgeting. The estimate is intentionally conservative for Japanese text,
+where tokenizers typically spend about one token per character.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Hiragana, katakana, CJK ideographs and full-width forms.
+_CJK_PATTERN = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uff00-\uffef]")
+_ASCII_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str | None) -> int:
+    """
+    Estimate the number of LLM tokens for a text.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Estimated token count (0 for empty text)
+    """
+    if not text:
+        return 0
+    cjk_count = len(_CJK_PATTERN.findall(text))
+    other_count = len(text) - cjk_count
+    return cjk_count + -(-other_count // _ASCII_CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str | None, max_tokens: int, suffix: str = "...") -> str:
+    """
+    Truncate text so that its estimated token count fits in max_tokens.
+
+    Args:
+        text: Input text
+        max_tokens: Token budget for the returned text
+        suffix: Marker appended when the text is truncated
+
+    Returns:
+        Original text if it fits, otherwise a truncated copy ending with suffix
+    """
+    if not text:
+        return ""
+    if max_tokens <= 0:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    budget = max_tokens - estimate_tokens(suffix)
+    used = 0
+    end = 0
+    for index, char in enumerate(text):
+        cost = 1.0 if _CJK_PATTERN.match(char) else 1.0 / _ASCII_CHARS_PER_TOKEN
+        if used + cost > budget:
+            break
+        used += cost
+        end = index + 1
+    return text[:end].rstrip() + suffix
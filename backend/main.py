@@ -4,16 +4,25 @@ nagi - Main Application Entry Point
 自律型秘書AI nagi
 """
 
-import json
-import os
-from contextlib import asynccontextmanager
-from uuid import UUID
+import time
+from contextlib import asynccontextmanager, contextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
 from app.core.config import get_settings
+from app.core.profiling import PROFILE_HEADER, SamplingProfiler, should_profile
+from app.core.query_counter import QUERY_COUNT_HEADER, count_queries
+from app.core.tracing import span
+from app.services.project_permissions import access_scope
+
+
+@contextmanager
+def _startup_phase(app: FastAPI, name: str):
+    """Time one startup phase into app.state.startup_phases (milliseconds)."""
+    with span(f"startup.{name}") as phase:
+        yield phase
+    app.state.startup_phases[name] = round(phase.duration_ms, 1)
 
 
 @asynccontextmanager
@@ -27,7 +36,10 @@ async def lifespan(app: FastAPI):
     if settings.ENVIRONMENT == "local":
         from app.infrastructure.local.database import init_db
 
-        await init_db()  # This also runs migrations
+        with _startup_phase(app, "init_db") as phase:
+            migrated = await init_db()  # This also runs migrations
+            phase.set(migrated=migrated)
+        print("Database schema " + ("migrated" if migrated else "up to date (migrations skipped)"))
 
     # Start background scheduler for periodic jobs
     from app.services.background_scheduler import (
@@ -35,17 +47,59 @@ async def lifespan(app: FastAPI):
         stop_background_scheduler,
     )
 
-    await start_background_scheduler()
+    with _startup_phase(app, "background_scheduler"):
+        await start_background_scheduler()
+
+    # Batched writes of the LLM usage ledger
+    from app.services.llm_usage_service import llm_usage_ledger
+
+    await llm_usage_ledger.start()
+
+    # Realtime events of committed writes
+    from app.services.realtime_service import realtime_change_feed, realtime_manager
+
+    await realtime_manager.start()
+    await realtime_change_feed.start()
+
+    # Interpreter start and module imports are only visible as CPU time.
+    app.state.startup_phases["process_cpu"] = round(time.process_time() * 1000, 1)
+    print(
+        "Startup timing: "
+        + ", ".join(f"{name}={ms:.0f}ms" for name, ms in app.state.startup_phases.items())
+    )
 
     yield
 
     # Shutdown
     print("Shutting down nagi...")
     await stop_background_scheduler()
+    await llm_usage_ledger.stop()
+    await realtime_change_feed.stop()
+    await realtime_manager.stop()
+
+
+def _route_template(request: Request) -> str:
+    """Path template of the matched route (e.g. /api/tasks/{task_id})."""
+    route = request.scope.get("route")
+    if route is None:
+        return "unmatched"
+    # Routes of included routers carry the path relative to their prefix.
+    template = getattr(route, "path", "")
+    path = request.url.path
+    try:
+        concrete = route.path_format.format(
+            **{name: str(value) for name, value in request.path_params.items()}
+        )
+    except (AttributeError, KeyError, ValueError):
+        return template
+    if path.endswith(concrete):
+        return path[: len(path) - len(concrete)] + template
+    return template
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    started = time.perf_counter()
     settings = get_settings()
 
     app = FastAPI(
@@ -57,198 +111,23 @@ def create_app() -> FastAPI:
         redoc_url="/redoc" if settings.DEBUG else None,
     )
 
-    from app.api.deps import (
-        get_blocker_repository,
-        get_meeting_agenda_repository,
-        get_milestone_repository,
-        get_phase_repository,
-        get_project_member_repository,
-        get_project_repository,
-        get_recurring_meeting_repository,
-        get_task_assignment_repository,
-        get_task_repository,
-    )
-    from app.services.realtime_service import realtime_manager
-
-    async def resolve_task_project_id(user_id: str, task_id: UUID) -> UUID | None:
-        task_repo = get_task_repository()
-        task = await task_repo.get(user_id, task_id)
-        if task:
-            return task.project_id
-        project_repo = get_project_repository()
-        projects = await project_repo.list(user_id, limit=1000)
-        for project in projects:
-            task = await task_repo.get(user_id, task_id, project_id=project.id)
-            if task:
-                return task.project_id
-        return None
-
-    async def resolve_recurring_meeting_project_id(
-        user_id: str,
-        meeting_id: UUID,
-    ) -> UUID | None:
-        meeting_repo = get_recurring_meeting_repository()
-        meeting = await meeting_repo.get(user_id, meeting_id)
-        if meeting:
-            return meeting.project_id
-        project_repo = get_project_repository()
-        projects = await project_repo.list(user_id, limit=1000)
-        for project in projects:
-            meeting = await meeting_repo.get(user_id, meeting_id, project_id=project.id)
-            if meeting:
-                return meeting.project_id
-        return None
-
-    async def resolve_project_id(path: str, body: dict | None, user_id: str) -> UUID | None:
-        if isinstance(body, dict):
-            project_value = body.get("project_id")
-            if project_value:
-                try:
-                    return UUID(str(project_value))
-                except ValueError:
-                    pass
-
-        parts = path.strip("/").split("/")
-        if len(parts) < 2 or parts[0] != "api":
-            return None
-
-        resource = parts[1]
-
-        if resource == "projects" and len(parts) >= 3:
-            try:
-                return UUID(parts[2])
-            except ValueError:
-                return None
-
-        if resource == "phases":
-            if len(parts) >= 4 and parts[2] == "project":
-                try:
-                    return UUID(parts[3])
-                except ValueError:
-                    return None
-            if len(parts) >= 3:
-                try:
-                    phase_id = UUID(parts[2])
-                except ValueError:
-                    return None
-                phase_repo = get_phase_repository()
-                if hasattr(phase_repo, "get_project_id"):
-                    return await phase_repo.get_project_id(phase_id)
-
-        if resource == "milestones":
-            if len(parts) >= 4 and parts[2] == "project":
-                try:
-                    return UUID(parts[3])
-                except ValueError:
-                    return None
-            if len(parts) >= 3:
-                try:
-                    milestone_id = UUID(parts[2])
-                except ValueError:
-                    return None
-                milestone_repo = get_milestone_repository()
-                if hasattr(milestone_repo, "get_project_id"):
-                    return await milestone_repo.get_project_id(milestone_id)
-
-        if resource == "tasks":
-            if len(parts) >= 4 and parts[2] == "assignments":
-                try:
-                    assignment_id = UUID(parts[3])
-                except ValueError:
-                    return None
-                assignment_repo = get_task_assignment_repository()
-                assignment = await assignment_repo.get_by_id(assignment_id)
-                if assignment:
-                    return await resolve_task_project_id(user_id, assignment.task_id)
-                return None
-            if len(parts) >= 4 and parts[2] == "blockers":
-                try:
-                    blocker_id = UUID(parts[3])
-                except ValueError:
-                    return None
-                blocker_repo = get_blocker_repository()
-                blocker = await blocker_repo.get_by_id(blocker_id)
-                if blocker:
-                    return await resolve_task_project_id(user_id, blocker.task_id)
-                return None
-            if len(parts) >= 3:
-                try:
-                    task_id = UUID(parts[2])
-                except ValueError:
-                    return None
-                return await resolve_task_project_id(user_id, task_id)
-
-        if resource == "meeting-agendas":
-            if len(parts) >= 4 and parts[2] == "tasks":
-                try:
-                    task_id = UUID(parts[3])
-                except ValueError:
-                    return None
-                return await resolve_task_project_id(user_id, task_id)
-
-            if len(parts) >= 4 and parts[2] == "items":
-                try:
-                    agenda_item_id = UUID(parts[3])
-                except ValueError:
-                    return None
-                agenda_repo = get_meeting_agenda_repository()
-                agenda_item = await agenda_repo.get_by_id(agenda_item_id)
-                if not agenda_item:
-                    return None
-                if agenda_item.task_id:
-                    return await resolve_task_project_id(user_id, agenda_item.task_id)
-                if agenda_item.meeting_id:
-                    return await resolve_recurring_meeting_project_id(user_id, agenda_item.meeting_id)
-                return None
-
-            if len(parts) >= 3:
-                try:
-                    meeting_id = UUID(parts[2])
-                except ValueError:
-                    return None
-                return await resolve_recurring_meeting_project_id(user_id, meeting_id)
-
-        return None
-
-    async def resolve_recipients(user_id: str, project_id: UUID | None) -> set[str]:
-        if not project_id:
-            return {user_id}
-        member_repo = get_project_member_repository()
-        project_repo = get_project_repository()
-        members = await member_repo.list_by_project(project_id)
-        member_ids = {member.member_user_id for member in members}
-        project = await project_repo.get_by_id(project_id)
-        if project:
-            member_ids.add(project.user_id)
-        member_ids.add(user_id)
-        return member_ids
-
     @app.middleware("http")
-    async def realtime_middleware(request: Request, call_next):
-        body_json = None
-        if request.method in {"POST", "PUT", "PATCH", "DELETE"}:
-            body_bytes = await request.body()
-            if body_bytes:
-                try:
-                    body_json = json.loads(body_bytes)
-                except json.JSONDecodeError:
-                    body_json = None
-        response = await call_next(request)
-        if request.method in {"POST", "PUT", "PATCH", "DELETE"} and response.status_code < 400:
-            if request.url.path.endswith("/stream"):
-                return response
-            user = getattr(request.state, "user", None)
-            if user:
-                project_id = await resolve_project_id(request.url.path, body_json, user.id)
-                recipients = await resolve_recipients(user.id, project_id)
-                await realtime_manager.publish_many(
-                    recipients,
-                    {
-                        "type": "refresh",
-                        "path": request.url.path,
-                        "method": request.method,
-                    },
-                )
+    async def tracing_middleware(request: Request, call_next):
+        profiler = None
+        if should_profile(request.headers.get(PROFILE_HEADER)):
+            profiler = SamplingProfiler(f"{request.method} {request.url.path}").start()
+        try:
+            with span("http.request", method=request.method) as request_span, count_queries(
+                f"{request.method} {request.url.path}"
+            ) as queries, access_scope():
+                response = await call_next(request)
+                request_span.name = f"{request.method} {_route_template(request)}"
+                request_span.set(status=response.status_code, queries=queries.total)
+            if settings.DEBUG:
+                response.headers[QUERY_COUNT_HEADER] = str(queries.total)
+        finally:
+            if profiler:
+                profiler.stop()
         return response
 
     # CORS middleware
@@ -258,6 +137,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "X-Query-Count", "ETag"],
     )
 
     # Include routers
@@ -267,8 +147,10 @@ def create_app() -> FastAPI:
         auth,
         captures,
         chat,
+        debug,
         heartbeat,
         issues,
+        llm_usage,
         meeting_agendas,
         meeting_sessions,
         memories,
@@ -284,6 +166,7 @@ def create_app() -> FastAPI:
         recurring_tasks,
         schedule_settings,
         shared_achievements,
+        storage,
         tasks,
         today,
         users,
@@ -315,14 +198,12 @@ def create_app() -> FastAPI:
     app.include_router(notifications.router, prefix="/api/notifications", tags=["notifications"])
     app.include_router(realtime.router, prefix="/api/realtime", tags=["realtime"])
     app.include_router(models.router, prefix="/api/models", tags=["models"])
+    app.include_router(llm_usage.router, prefix="/api/llm-usage", tags=["llm_usage"])
+    app.include_router(debug.router, prefix="/api/debug", tags=["debug"])
 
-    # Mount storage for local development
-    storage_path = settings.STORAGE_BASE_PATH
-    if not os.path.isabs(storage_path):
-        storage_path = os.path.join(os.getcwd(), storage_path)
-
-    if os.path.exists(storage_path):
-        app.mount("/storage", StaticFiles(directory=storage_path), name="storage")
+    # Serve local storage (streamed, with range support)
+    if not settings.is_gcp:
+        app.include_router(storage.router, prefix="/storage", tags=["storage"])
 
     @app.get("/health")
     async def health_check():
@@ -333,6 +214,7 @@ def create_app() -> FastAPI:
             "version": "0.1.0"
         }
 
+    app.state.startup_phases = {"create_app": round((time.perf_counter() - started) * 1000, 1)}
     return app
 
 
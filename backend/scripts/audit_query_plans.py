@@ -0,0 +1,223 @@
+"""
+Audit repository query plans with EXPLAIN QUERY PLAN.
+
+Builds the current schema (create_all + migrations incl. composite indexes)
+in a scratch SQLite database, seeds synthetic rows, runs ANALYZE and prints
+the plan of every SELECT the catalog's repository calls issue (as user-0).
+Full table scans are flagged and make the command exit with status 1.
+
+Usage:
+    cd backend
+    python -m scripts.audit_query_plans                  # Seeded scratch DB
+    python -m scripts.audit_query_plans --rows 20000     # Larger seed
+    python -m scripts.audit_query_plans --database ./secretary.db  # Existing DB (read-only audit)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+# Ensure backend root is on sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.local.database import (
+    Base,
+    ChatMessageORM,
+    ChatSessionORM,
+    DailySchedulePlanORM,
+    HeartbeatEventORM,
+    NotificationORM,
+    ProjectMemberORM,
+    ProjectORM,
+    TaskAssignmentORM,
+    TaskORM,
+)
+from app.infrastructure.local.migrations import ensure_composite_indexes
+from app.infrastructure.local.query_plan_audit import audit_query_plans
+
+_STATUSES = ("TODO", "IN_PROGRESS", "WAITING", "DONE")
+
+
+async def _seed(conn, rows: int, users: int) -> None:
+    """Insert synthetic rows so ANALYZE produces realistic statistics."""
+    base = datetime(2026, 1, 1)
+    user_ids = [f"user-{i}" for i in range(users)]
+    project_ids = [str(uuid4()) for _ in range(max(users, rows // 20))]
+
+    await conn.execute(
+        insert(ProjectORM),
+        [
+            {"id": pid, "user_id": user_ids[i % users], "name": f"Project {i}", "visibility": "TEAM"}
+            for i, pid in enumerate(project_ids)
+        ],
+    )
+    await conn.execute(
+        insert(ProjectMemberORM),
+        [
+            {
+                "id": str(uuid4()),
+                "user_id": user_ids[i % users],
+                "project_id": pid,
+                "member_user_id": user_ids[(i + 1) % users],
+                "role": "MEMBER",
+            }
+            for i, pid in enumerate(project_ids)
+        ],
+    )
+
+    tasks = []
+    for i in range(rows):
+        status = _STATUSES[i % len(_STATUSES)]
+        created = base + timedelta(minutes=i)
+        # Every fourth task is a subtask of the task created just before it.
+        parent = tasks[-1] if i % 4 == 3 else None
+        tasks.append(
+            {
+                "id": str(uuid4()),
+                "user_id": user_ids[i % users],
+                "project_id": project_ids[i % len(project_ids)] if i % 3 else None,
+                "parent_id": parent["id"] if parent else None,
+                "title": f"Task {i}",
+                "status": status,
+                "created_at": created,
+                "completed_at": created + timedelta(days=1) if status == "DONE" else None,
+            }
+        )
+    await conn.execute(insert(TaskORM), tasks)
+    await conn.execute(
+        insert(TaskAssignmentORM),
+        [
+            {
+                "id": str(uuid4()),
+                "user_id": task["user_id"],
+                "task_id": task["id"],
+                "assignee_id": user_ids[(i + 1) % users],
+            }
+            for i, task in enumerate(tasks[::5])
+        ],
+    )
+
+    sessions = [(f"session-{i}", user_ids[i % users]) for i in range(users * 2)]
+    await conn.execute(
+        insert(ChatSessionORM),
+        [{"session_id": sid, "user_id": uid} for sid, uid in sessions],
+    )
+    await conn.execute(
+        insert(ChatMessageORM),
+        [
+            {
+                "id": str(uuid4()),
+                "session_id": sessions[i % len(sessions)][0],
+                "user_id": sessions[i % len(sessions)][1],
+                "role": "user" if i % 2 else "assistant",
+                "content": f"message {i}",
+                "created_at": base + timedelta(seconds=i),
+            }
+            for i in range(rows)
+        ],
+    )
+    await conn.execute(
+        insert(HeartbeatEventORM),
+        [
+            {
+                "id": str(uuid4()),
+                "user_id": user_ids[i % users],
+                "severity": "low",
+                "created_at": base + timedelta(hours=i),
+            }
+            for i in range(rows // 4)
+        ],
+    )
+    await conn.execute(
+        insert(NotificationORM),
+        [
+            {
+                "id": str(uuid4()),
+                "user_id": user_ids[i % users],
+                "type": "task_assigned",
+                "title": "Notice",
+                "message": f"notification {i}",
+                "created_at": base + timedelta(hours=i),
+            }
+            for i in range(rows // 4)
+        ],
+    )
+    await conn.execute(
+        insert(DailySchedulePlanORM),
+        [
+            {
+                "id": str(uuid4()),
+                "user_id": user_ids[i % users],
+                "plan_date": date(2026, 1, 1) + timedelta(days=i // users),
+                "timezone": "Asia/Tokyo",
+                "plan_group_id": str(uuid4()),
+                "schedule_day_json": {},
+                "generated_at": base + timedelta(days=i // users, minutes=i),
+            }
+            for i in range(rows // 10)
+        ],
+    )
+    await conn.execute(text("ANALYZE"))
+
+
+async def run(database: str | None, rows: int, users: int) -> int:
+    if database:
+        url = f"sqlite+aiosqlite:///{Path(database).resolve()}"
+        scratch = None
+    else:
+        scratch = tempfile.TemporaryDirectory()
+        url = f"sqlite+aiosqlite:///{Path(scratch.name) / 'audit.db'}"
+
+    engine = create_async_engine(url, echo=False)
+    try:
+        if scratch:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                await ensure_composite_indexes(conn)
+                await _seed(conn, rows, users)
+
+        reports = await audit_query_plans(engine)
+    finally:
+        await engine.dispose()
+        if scratch:
+            scratch.cleanup()
+
+    failures = 0
+    for report in reports:
+        marker = "OK  " if report.ok else "SCAN"
+        sort_note = "  (temp sort)" if report.temp_sorts else ""
+        print(f"[{marker}] {report.name}{sort_note}")
+        for line in report.plan:
+            print(f"         {line}")
+        if not report.ok:
+            failures += 1
+
+    print(f"\n{len(reports)} queries audited, {failures} with full table scans")
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Audit repository query plans")
+    parser.add_argument(
+        "--database",
+        help="Audit an existing SQLite file instead of a seeded scratch database",
+    )
+    parser.add_argument("--rows", type=int, default=5000, help="Seeded tasks/messages (default: 5000)")
+    parser.add_argument("--users", type=int, default=20, help="Seeded users (default: 20)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.database, args.rows, args.users)))
+
+
+if __name__ == "__main__":
+    main()
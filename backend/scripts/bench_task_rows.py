@@ -0,0 +1,155 @@
+"""
+Micro-benchmark task row -> model construction.
+
+Seeds a scratch SQLite database with synthetic tasks (a mix of plain tasks,
+meetings and subtasks with dependencies) and reports the per-row cost of:
+
+- validated:   ``SqliteTaskRepository._orm_to_model`` (full Pydantic validation)
+- trusted:     ``TrustedModelBuilder`` (validation-free, used by bulk reads)
+
+for conversion alone, and end to end (query + conversion) for ORM entity
+selects versus plain column rows.
+
+Usage:
+    cd backend
+    python -m scripts.bench_task_rows               # 1000 tasks
+    python -m scripts.bench_task_rows --rows 5000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+# Ensure backend root is on sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.local.database import Base, TaskORM
+from app.infrastructure.local.task_repository import (
+    SqliteTaskRepository,
+    _select_task_rows,
+    _task_builder,
+)
+
+_USER_ID = "bench-user"
+
+
+def _task_rows(rows: int) -> list[dict]:
+    base = datetime(2026, 1, 1, 9, 0)
+    parent_ids = [str(uuid4()) for _ in range(max(1, rows // 10))]
+    tasks = []
+    for i in range(rows):
+        task = {
+            "id": parent_ids[i] if i < len(parent_ids) else str(uuid4()),
+            "user_id": _USER_ID,
+            "title": f"Task {i}",
+            "description": "Synthetic benchmark task " * 4,
+            "status": ("TODO", "IN_PROGRESS", "WAITING")[i % 3],
+            "importance": ("HIGH", "MEDIUM", "LOW")[i % 3],
+            "urgency": "MEDIUM",
+            "energy_level": "LOW",
+            "estimated_minutes": 30,
+            "due_date": base + timedelta(days=i % 30),
+            "parent_id": None,
+            "order_in_parent": None,
+            "dependency_ids": [],
+            "start_time": None,
+            "end_time": None,
+            "is_fixed_time": False,
+            "attendees": [],
+            "touchpoint_steps": [],
+            "created_by": "USER",
+            "created_at": base - timedelta(minutes=i),
+            "updated_at": base,
+        }
+        if i % 5 == 0:
+            task.update(
+                is_fixed_time=True,
+                start_time=base + timedelta(days=i % 7),
+                end_time=base + timedelta(days=i % 7, hours=1),
+                attendees=["alice", "bob"],
+            )
+        elif i >= len(parent_ids):
+            task.update(
+                parent_id=parent_ids[i % len(parent_ids)],
+                order_in_parent=1 + i // len(parent_ids),
+                dependency_ids=[parent_ids[(i + 1) % len(parent_ids)]],
+            )
+        tasks.append(task)
+    return tasks
+
+
+def _per_row_us(convert_all, items, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        convert_all(items)
+        best = min(best, time.perf_counter() - started)
+    return best / len(items) * 1_000_000
+
+
+async def _best_ms(coro_factory, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await coro_factory()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+async def run(rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(insert(TaskORM), _task_rows(rows))
+        session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        repo = SqliteTaskRepository(session_factory=session_factory)
+
+        async with session_factory() as session:
+            column_rows = (await session.execute(_select_task_rows())).all()
+            orm_rows = (await session.execute(select(TaskORM))).scalars().all()
+
+        validated_us = _per_row_us(lambda rows: [repo._orm_to_model(row) for row in rows], column_rows)
+        trusted_us = _per_row_us(_task_builder.build_many, column_rows)
+        print(f"Conversion per row ({rows} rows)")
+        print(f"  validated  {validated_us:8.2f} us")
+        print(f"  trusted    {trusted_us:8.2f} us   ({validated_us / trusted_us:.1f}x faster)")
+
+        async def _orm_validated():
+            async with session_factory() as session:
+                result = await session.execute(select(TaskORM))
+                return [repo._orm_to_model(orm) for orm in result.scalars().all()]
+
+        async def _rows_trusted():
+            return await repo.list(_USER_ID, include_done=True, limit=rows)
+
+        before_ms = await _best_ms(_orm_validated)
+        after_ms = await _best_ms(_rows_trusted)
+        print(f"Load all tasks (query + conversion, {len(orm_rows)} rows)")
+        print(f"  ORM entities + validated  {before_ms:8.1f} ms")
+        print(f"  column rows + trusted     {after_ms:8.1f} ms   ({before_ms / after_ms:.1f}x faster)")
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark task row construction")
+    parser.add_argument("--rows", type=int, default=1000, help="Synthetic tasks to seed")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""
+In-process HTTP load test (pre-release capacity check).
+
+Seeds a scratch SQLite database with ``scripts.synthetic_data``, builds the
+FastAPI app and drives it through httpx's ASGI transport, so no server or
+network is involved. The LLM provider is replaced by a stub without
+credentials (LLM helpers return their non-LLM fallbacks), and requests are
+authenticated as synthetic users through an ``X-Load-User`` header.
+
+Each endpoint is exercised in its own phase with a pool of concurrent
+workers; the report lists throughput, latency percentiles and the number of
+SQL statements per request:
+
+- GET /api/tasks                (personal and per-project listings)
+- GET /api/tasks/schedule
+- GET /api/today/top3
+- GET /api/projects
+- GET /api/realtime/stream      (time to the "connected" event)
+
+With --max-p95-ms / --max-error-rate the script exits with status 1 when an
+endpoint exceeds the limit.
+
+Usage:
+    cd backend
+    python -m scripts.load_test                          # medium preset
+    python -m scripts.load_test --preset large --requests 500 --concurrency 32
+    python -m scripts.load_test --database ./load.db     # reuse a seeded DB
+    python -m scripts.load_test --max-p95-ms 250 --max-error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+# Ensure backend root is on sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scripts.synthetic_data import (  # noqa: E402
+    SyntheticDataset,
+    add_scale_arguments,
+    scale_from_args,
+    seed_database,
+)
+
+USER_HEADER = "X-Load-User"
+ENDPOINTS = ("tasks", "tasks_project", "schedule", "top3", "projects", "realtime")
+_STREAM_TIMEOUT_SECONDS = 10.0
+
+
+@dataclass
+class EndpointStats:
+    """Samples collected for one endpoint."""
+
+    name: str
+    latencies_ms: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_ms)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _stub_llm_provider():
+    from app.interfaces.llm_provider import ILLMProvider
+
+    class LoadTestLLMProvider(ILLMProvider):
+        """LLM provider stub: no credentials, so generate_text returns None."""
+
+        def get_model(self) -> str:
+            return "load-test-model"
+
+        def get_model_name(self) -> str:
+            return "load-test-model"
+
+        def get_model_id(self) -> str:
+            return "load-test-model"
+
+        def supports_vision(self) -> bool:
+            return False
+
+        def supports_function_calling(self) -> bool:
+            return False
+
+        def get_available_models(self) -> list[str]:
+            return ["load-test-model"]
+
+    return LoadTestLLMProvider()
+
+
+def build_app():
+    """The application with load-test auth and the stub LLM provider."""
+    from fastapi import HTTPException, Request
+
+    from app.api.deps import get_current_user, get_llm_provider
+    from app.interfaces.auth_provider import User
+    from main import create_app
+
+    app = create_app()
+
+    async def load_test_user(request: Request) -> User:
+        user_id = request.headers.get(USER_HEADER)
+        if not user_id:
+            raise HTTPException(status_code=401, detail=f"{USER_HEADER} header required")
+        user = User(id=user_id, email=f"{user_id}@load.example.com")
+        request.state.user = user
+        return user
+
+    provider = _stub_llm_provider()
+    app.dependency_overrides[get_current_user] = load_test_user
+    app.dependency_overrides[get_llm_provider] = lambda: provider
+    return app
+
+
+async def load_dataset() -> SyntheticDataset:
+    """Read the user and project ids of an already seeded database."""
+    from sqlalchemy import select
+
+    from app.infrastructure.local.database import ProjectMemberORM, UserORM, get_engine
+
+    engine = get_engine()
+    dataset = SyntheticDataset()
+    async with engine.connect() as conn:
+        dataset.user_ids = list((await conn.execute(select(UserORM.id))).scalars())
+        members = await conn.execute(select(ProjectMemberORM.project_id, ProjectMemberORM.member_user_id))
+        for project_id, member_id in members:
+            dataset.members_by_project.setdefault(project_id, []).append(member_id)
+    await engine.dispose()
+    dataset.project_ids = list(dataset.members_by_project)
+    return dataset
+
+
+def _request_factories(dataset: SyntheticDataset, rng: random.Random) -> dict[str, Callable[[], tuple[str, str]]]:
+    """Per endpoint: a function returning (user_id, url) for the next request."""
+    projects_by_user: dict[str, list[str]] = {}
+    for project_id, members in dataset.members_by_project.items():
+        for member_id in members:
+            projects_by_user.setdefault(member_id, []).append(project_id)
+    members = [user_id for user_id in dataset.user_ids if user_id in projects_by_user]
+
+    def _user() -> str:
+        return rng.choice(dataset.user_ids)
+
+    def _project_request() -> tuple[str, str]:
+        user_id = rng.choice(members)
+        return user_id, f"/api/tasks?project_id={rng.choice(projects_by_user[user_id])}&limit=200"
+
+    return {
+        "tasks": lambda: (_user(), "/api/tasks?limit=100"),
+        "tasks_project": _project_request,
+        "schedule": lambda: (_user(), "/api/tasks/schedule"),
+        "top3": lambda: (_user(), "/api/today/top3"),
+        "projects": lambda: (_user(), "/api/projects"),
+        "realtime": lambda: (_user(), "/api/realtime/stream"),
+    }
+
+
+async def _open_stream(app, user_id: str, path: str) -> bool:
+    """Open an SSE stream, wait for the connected event and disconnect."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"load-test"), (USER_HEADER.lower().encode(), user_id.encode())],
+        "client": ("127.0.0.1", 0),
+        "server": ("load-test", 80),
+    }
+    answered = asyncio.Event()
+    disconnect = asyncio.Event()
+    result = {"ok": False}
+    request_sent = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start" and message["status"] >= 400:
+            answered.set()
+        elif message["type"] == "http.response.body" and b'"connected"' in message.get("body", b""):
+            result["ok"] = True
+            answered.set()
+
+    task = asyncio.create_task(app(scope, receive, send))
+    try:
+        await asyncio.wait_for(answered.wait(), timeout=_STREAM_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        pass
+    disconnect.set()
+    try:
+        await asyncio.wait_for(task, timeout=_STREAM_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        task.cancel()
+    except Exception:
+        return False
+    return result["ok"]
+
+
+async def run_phase(
+    name: str,
+    send_one: Callable[[], Awaitable[bool]],
+    requests: int,
+    concurrency: int,
+) -> EndpointStats:
+    """Send ``requests`` requests through ``concurrency`` workers."""
+    from app.core.query_counter import count_queries
+
+    stats = EndpointStats(name=name)
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            # The request's own query scope propagates its counts to this one.
+            async with count_queries(f"load_test.{name}", warn=False) as queries:
+                try:
+                    ok = await send_one()
+                except Exception:
+                    ok = False
+            stats.latencies_ms.append((time.perf_counter() - started) * 1000)
+            stats.queries.append(queries.total)
+            if not ok:
+                stats.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    stats.elapsed_s = time.perf_counter() - started
+    return stats
+
+
+async def run(args: argparse.Namespace, dataset: Optional[SyntheticDataset]) -> list[EndpointStats]:
+    from httpx import ASGITransport, AsyncClient
+
+    if dataset is None:
+        dataset = await load_dataset()
+    if not dataset.user_ids:
+        raise SystemExit("The database has no users")
+    app = build_app()
+    rng = random.Random(args.seed)
+    factories = _request_factories(dataset, rng)
+    endpoints = args.endpoints or list(ENDPOINTS)
+
+    results = []
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://load-test") as client:
+        for name in endpoints:
+            next_request = factories[name]
+
+            if name == "realtime":
+                async def send_one() -> bool:
+                    user_id, path = next_request()
+                    return await _open_stream(app, user_id, path)
+            else:
+                async def send_one() -> bool:
+                    user_id, url = next_request()
+                    response = await client.get(url, headers={USER_HEADER: user_id})
+                    return response.status_code < 400
+
+            if args.warmup:
+                await run_phase(name, send_one, args.warmup, args.concurrency)
+            stats = await run_phase(name, send_one, args.requests, args.concurrency)
+            results.append(stats)
+            print(f"  {name:<14} done ({stats.requests} requests, {stats.elapsed_s:.1f}s)", flush=True)
+    return results
+
+
+def print_report(results: list[EndpointStats]) -> None:
+    header = (
+        f"{'endpoint':<14} {'reqs':>6} {'err':>5} {'rps':>8} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'q/avg':>6} {'q/max':>6}"
+    )
+    print(header)
+    print("-" * len(header))
+    for stats in results:
+        rps = stats.requests / stats.elapsed_s if stats.elapsed_s else 0.0
+        avg_queries = sum(stats.queries) / len(stats.queries) if stats.queries else 0.0
+        print(
+            f"{stats.name:<14} {stats.requests:>6} {stats.errors:>5} {rps:>8.1f} "
+            f"{stats.percentile(0.50):>8.1f} {stats.percentile(0.95):>8.1f} "
+            f"{stats.percentile(0.99):>8.1f} {max(stats.latencies_ms, default=0.0):>8.1f} "
+            f"{avg_queries:>6.1f} {max(stats.queries, default=0):>6}"
+        )
+
+
+def capacity_failures(
+    results: list[EndpointStats],
+    max_p95_ms: Optional[float],
+    max_error_rate: Optional[float],
+) -> list[str]:
+    failures = []
+    for stats in results:
+        p95 = stats.percentile(0.95)
+        if max_p95_ms is not None and p95 > max_p95_ms:
+            failures.append(f"{stats.name}: p95 {p95:.1f} ms > {max_p95_ms:.1f} ms")
+        if max_error_rate is not None and stats.error_rate > max_error_rate:
+            failures.append(f"{stats.name}: error rate {stats.error_rate:.2%} > {max_error_rate:.2%}")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="In-process HTTP load test")
+    parser.add_argument("--database", help="SQLite file (seeded when missing; default: temporary)")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent workers per endpoint")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per endpoint")
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, help="Endpoints to test (default: all)")
+    parser.add_argument("--max-p95-ms", type=float, help="Fail when an endpoint's p95 exceeds this")
+    parser.add_argument("--max-error-rate", type=float, help="Fail when an endpoint's error rate exceeds this")
+    parser.add_argument("--verbose", action="store_true", help="Keep application logging")
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(args.database or Path(tmp) / "load.db").resolve()
+        reuse = database.exists()
+        # Settings are read on first import of the app, so configure first.
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{database}"
+        os.environ["DEBUG"] = "false"
+        os.environ["AUTH_PROVIDER"] = "mock"
+        os.environ["LLM_USAGE_ENABLED"] = "false"
+        if not args.verbose:
+            from app.core.logger import logger as app_logger
+
+            app_logger.setLevel(logging.WARNING)
+
+        async def _main() -> list[EndpointStats]:
+            dataset = None
+            if reuse:
+                print(f"Using seeded database {database}")
+            else:
+                scale = scale_from_args(args)
+                started = time.perf_counter()
+                dataset = await seed_database(scale, args.seed)
+                rows = sum(dataset.row_counts.values())
+                print(f"Seeded {rows} rows in {time.perf_counter() - started:.1f}s ({args.preset} preset)")
+            print(f"Load: {args.requests} requests x {args.concurrency} workers per endpoint")
+            return await run(args, dataset)
+
+        results = asyncio.run(_main())
+
+    print()
+    print_report(results)
+    failures = capacity_failures(results, args.max_p95_ms, args.max_error_rate)
+    if failures:
+        print("\nCapacity check failed:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
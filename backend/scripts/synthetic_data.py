@@ -0,0 +1,499 @@
+"""
+Generate a synthetic, production-shaped dataset at a chosen scale.
+
+Unlike ``seed_demo_data`` (a small hand-written demo), every entity count is
+a parameter and the data is generated deterministically from a seed:
+
+- users, each with personal tasks and chat history
+- projects (a share of them TEAM projects with several members)
+- task trees per project (parents with ordered subtasks), dependencies
+  between sibling tasks and assignments to project members
+- weekly recurring meetings with their generated meeting tasks
+- check-ins (with structured items) from project members
+- daily schedule plans built by DailySchedulePlanService
+
+Rows are bulk-inserted through SQLAlchemy Core in chunks, so large scales
+seed in seconds. Used by ``scripts.load_test``; can also seed a database on
+its own.
+
+Usage:
+    cd backend
+    python -m scripts.synthetic_data --database ./load.db --users 200
+    python -m scripts.synthetic_data --database ./load.db --preset large
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+# Ensure backend root is on sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+_INSERT_CHUNK = 500
+_STATUS_WEIGHTS = (("TODO", 5), ("IN_PROGRESS", 3), ("WAITING", 1), ("DONE", 3))
+_PRIORITIES = ("HIGH", "MEDIUM", "LOW")
+_ENERGY = ("HIGH", "LOW")
+_CHECKIN_CATEGORIES = ("update", "blocker", "discussion", "request")
+
+
+@dataclass(frozen=True)
+class SyntheticScale:
+    """Entity counts of a synthetic dataset (per user / project where noted)."""
+
+    users: int = 20
+    projects_per_user: float = 2.0
+    team_project_ratio: float = 0.6
+    members_per_team_project: int = 4
+    tasks_per_project: int = 40
+    subtasks_per_parent: int = 3
+    parent_ratio: float = 0.25
+    dependency_ratio: float = 0.2
+    personal_tasks_per_user: int = 15
+    recurring_meetings_per_team_project: int = 1
+    meeting_weeks: int = 4
+    checkin_weeks: int = 4
+    chat_sessions_per_user: int = 3
+    messages_per_session: int = 20
+    plans: bool = True
+
+
+PRESETS: dict[str, SyntheticScale] = {
+    "small": SyntheticScale(users=10, tasks_per_project=20, checkin_weeks=2),
+    "medium": SyntheticScale(),
+    "large": SyntheticScale(
+        users=200,
+        projects_per_user=3.0,
+        members_per_team_project=8,
+        tasks_per_project=120,
+        personal_tasks_per_user=40,
+        meeting_weeks=8,
+        checkin_weeks=8,
+        chat_sessions_per_user=10,
+        messages_per_session=40,
+    ),
+}
+
+
+@dataclass
+class SyntheticDataset:
+    """Identifiers of the generated entities (for building requests)."""
+
+    user_ids: list[str] = field(default_factory=list)
+    project_ids: list[str] = field(default_factory=list)
+    members_by_project: dict[str, list[str]] = field(default_factory=dict)
+    row_counts: dict[str, int] = field(default_factory=dict)
+    plan_count: int = 0
+
+
+class _Rows:
+    """Collects rows per table and inserts them in chunks."""
+
+    def __init__(self) -> None:
+        self.tables: dict = {}
+
+    def add(self, orm, **values) -> None:
+        self.tables.setdefault(orm, []).append(values)
+
+    async def insert_all(self, conn) -> dict[str, int]:
+        from sqlalchemy import insert
+
+        counts: dict[str, int] = {}
+        for orm, rows in self.tables.items():
+            # executemany needs every row to carry the same keys
+            keys = sorted({key for row in rows for key in row})
+            rows = [{key: row.get(key) for key in keys} for row in rows]
+            for start in range(0, len(rows), _INSERT_CHUNK):
+                await conn.execute(insert(orm), rows[start : start + _INSERT_CHUNK])
+            counts[orm.__tablename__] = len(rows)
+        return counts
+
+
+def _weighted_status(rng: random.Random) -> str:
+    statuses, weights = zip(*_STATUS_WEIGHTS)
+    return rng.choices(statuses, weights=weights)[0]
+
+
+def _task_row(
+    rng: random.Random,
+    now: datetime,
+    owner_id: str,
+    title: str,
+    project_id: str | None = None,
+    **overrides,
+) -> dict:
+    status = _weighted_status(rng)
+    row = {
+        "id": str(uuid4()),
+        "user_id": owner_id,
+        "project_id": project_id,
+        "title": title,
+        "description": f"{title} の詳細。" * rng.randint(1, 4),
+        "status": status,
+        "importance": rng.choice(_PRIORITIES),
+        "urgency": rng.choice(_PRIORITIES),
+        "energy_level": rng.choice(_ENERGY),
+        "estimated_minutes": rng.choice((15, 30, 45, 60, 90, 120, 180)),
+        "due_date": now + timedelta(days=rng.randint(-3, 30)) if rng.random() < 0.7 else None,
+        "progress": 100 if status == "DONE" else rng.choice((0, 0, 10, 30, 50, 80)),
+        "dependency_ids": [],
+        "attendees": [],
+        "touchpoint_steps": [],
+        "created_by": "USER",
+        "created_at": now - timedelta(days=rng.randint(1, 60)),
+        "updated_at": now - timedelta(days=rng.randint(0, 5)),
+        "completed_at": now - timedelta(days=rng.randint(0, 14)) if status == "DONE" else None,
+    }
+    row.update(overrides)
+    return row
+
+
+def build_rows(scale: SyntheticScale, seed: int = 0) -> tuple[_Rows, SyntheticDataset]:
+    """Generate all rows for a scale (deterministic per seed)."""
+    from app.infrastructure.local.database import (
+        ChatMessageORM,
+        ChatSessionORM,
+        CheckinItemORM,
+        CheckinORM,
+        ProjectMemberORM,
+        ProjectORM,
+        RecurringMeetingORM,
+        TaskAssignmentORM,
+        TaskORM,
+        UserORM,
+    )
+
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    today = now.date()
+    rows = _Rows()
+    dataset = SyntheticDataset()
+
+    for index in range(scale.users):
+        user_id = str(uuid4())
+        dataset.user_ids.append(user_id)
+        rows.add(
+            UserORM,
+            id=user_id,
+            provider_issuer="synthetic",
+            provider_sub=f"user-{index}",
+            email=f"user{index}@load.example.com",
+            display_name=f"User {index}",
+            username=f"user{index}",
+            timezone="Asia/Tokyo",
+            enable_weekly_meeting_reminder=False,
+            created_at=now,
+            updated_at=now,
+        )
+
+    # Projects and memberships
+    project_count = round(scale.users * scale.projects_per_user)
+    for index in range(project_count):
+        owner_id = dataset.user_ids[index % scale.users]
+        project_id = str(uuid4())
+        is_team = rng.random() < scale.team_project_ratio and scale.users > 1
+        members = [owner_id]
+        if is_team:
+            others = [uid for uid in dataset.user_ids if uid != owner_id]
+            members += rng.sample(others, min(len(others), scale.members_per_team_project - 1))
+        dataset.project_ids.append(project_id)
+        dataset.members_by_project[project_id] = members
+        rows.add(
+            ProjectORM,
+            id=project_id,
+            user_id=owner_id,
+            name=f"Project {index}",
+            description=f"Synthetic project {index}",
+            status="ACTIVE",
+            visibility="TEAM" if is_team else "PRIVATE",
+            priority=rng.randint(1, 5),
+            goals=[f"Goal {n}" for n in range(rng.randint(1, 3))],
+            key_points=[],
+            created_at=now - timedelta(days=90),
+            updated_at=now,
+        )
+        for member_id in members:
+            rows.add(
+                ProjectMemberORM,
+                id=str(uuid4()),
+                user_id=owner_id,
+                project_id=project_id,
+                member_user_id=member_id,
+                role="OWNER" if member_id == owner_id else "MEMBER",
+                capacity_hours=rng.choice((None, 20.0, 32.0, 40.0)),
+                created_at=now,
+                updated_at=now,
+            )
+
+        # Task trees: parents with ordered subtasks, sibling dependencies
+        top_level: list[dict] = []
+        created = 0
+        while created < scale.tasks_per_project:
+            task = _task_row(rng, now, owner_id, f"P{index} task {created}", project_id)
+            rows.add(TaskORM, **task)
+            top_level.append(task)
+            created += 1
+            if rng.random() < scale.parent_ratio:
+                previous: dict | None = None
+                for order in range(1, scale.subtasks_per_parent + 1):
+                    if created >= scale.tasks_per_project:
+                        break
+                    subtask = _task_row(
+                        rng,
+                        now,
+                        owner_id,
+                        f"P{index} task {task['title']} step {order}",
+                        project_id,
+                        parent_id=task["id"],
+                        order_in_parent=order,
+                    )
+                    if previous is not None and rng.random() < 0.5:
+                        subtask["dependency_ids"] = [previous["id"]]
+                    rows.add(TaskORM, **subtask)
+                    previous = subtask
+                    created += 1
+                    if is_team:
+                        _assign(rows, TaskAssignmentORM, rng, owner_id, subtask, members, now)
+            if is_team:
+                _assign(rows, TaskAssignmentORM, rng, owner_id, task, members, now)
+        for task in top_level[1:]:
+            if rng.random() < scale.dependency_ratio:
+                candidates = [t for t in top_level if t is not task and t["id"] not in task["dependency_ids"]]
+                dependency = rng.choice(candidates)
+                if task["id"] not in dependency["dependency_ids"]:
+                    task["dependency_ids"].append(dependency["id"])
+
+        if not is_team:
+            continue
+
+        # Recurring meetings and their meeting tasks
+        for meeting_index in range(scale.recurring_meetings_per_team_project):
+            meeting_id = str(uuid4())
+            weekday = rng.randint(0, 4)
+            hour = rng.choice((10, 13, 15, 17))
+            rows.add(
+                RecurringMeetingORM,
+                id=meeting_id,
+                user_id=owner_id,
+                project_id=project_id,
+                title=f"P{index} weekly sync {meeting_index}",
+                frequency="weekly",
+                weekday=weekday,
+                start_time=f"{hour:02d}:00",
+                duration_minutes=60,
+                attendees=members,
+                agenda_window_days=7,
+                anchor_date=today - timedelta(days=28),
+                is_active=True,
+                created_at=now,
+                updated_at=now,
+            )
+            first = today + timedelta(days=(weekday - today.weekday()) % 7)
+            for week in range(-scale.meeting_weeks // 2, scale.meeting_weeks - scale.meeting_weeks // 2):
+                start = datetime.combine(
+                    first + timedelta(weeks=week), datetime.min.time(), tzinfo=timezone.utc
+                ) + timedelta(hours=hour - 9)
+                rows.add(
+                    TaskORM,
+                    **_task_row(
+                        rng,
+                        now,
+                        owner_id,
+                        f"P{index} weekly sync {meeting_index}",
+                        project_id,
+                        status="DONE" if start < now else "TODO",
+                        progress=100 if start < now else 0,
+                        completed_at=start if start < now else None,
+                        due_date=None,
+                        estimated_minutes=60,
+                        is_fixed_time=True,
+                        start_time=start,
+                        end_time=start + timedelta(hours=1),
+                        attendees=members,
+                        recurring_meeting_id=meeting_id,
+                    ),
+                )
+
+        # Check-ins with structured items
+        for week in range(scale.checkin_weeks):
+            checkin_date = today - timedelta(weeks=week)
+            for member_id in members:
+                checkin_id = str(uuid4())
+                rows.add(
+                    CheckinORM,
+                    id=checkin_id,
+                    user_id=owner_id,
+                    project_id=project_id,
+                    member_user_id=member_id,
+                    checkin_date=checkin_date,
+                    checkin_type="weekly",
+                    raw_text=f"Week {week} progress from {member_id[:8]}",
+                    mood=rng.choice(("good", "okay", "struggling")),
+                    created_at=now - timedelta(weeks=week),
+                )
+                for order in range(rng.randint(1, 3)):
+                    rows.add(
+                        CheckinItemORM,
+                        id=str(uuid4()),
+                        checkin_id=checkin_id,
+                        user_id=member_id,
+                        category=rng.choice(_CHECKIN_CATEGORIES),
+                        content=f"Item {order} of week {week}",
+                        urgency=rng.choice(("high", "medium", "low")),
+                        order_index=order,
+                        created_at=now - timedelta(weeks=week),
+                    )
+
+    # Personal tasks and chat history
+    for user_index, user_id in enumerate(dataset.user_ids):
+        for n in range(scale.personal_tasks_per_user):
+            rows.add(TaskORM, **_task_row(rng, now, user_id, f"U{user_index} personal {n}"))
+        for s in range(scale.chat_sessions_per_user):
+            session_id = str(uuid4())
+            started = now - timedelta(days=s + 1)
+            rows.add(
+                ChatSessionORM,
+                session_id=session_id,
+                user_id=user_id,
+                title=f"Chat {s}",
+                created_at=started,
+                updated_at=started,
+            )
+            for m in range(scale.messages_per_session):
+                rows.add(
+                    ChatMessageORM,
+                    id=str(uuid4()),
+                    session_id=session_id,
+                    user_id=user_id,
+                    role="user" if m % 2 == 0 else "assistant",
+                    content=f"Message {m} " + "lorem ipsum " * rng.randint(2, 30),
+                    created_at=started + timedelta(minutes=m),
+                )
+
+    return rows, dataset
+
+
+def _assign(rows: _Rows, orm, rng: random.Random, owner_id: str, task: dict, members: list[str], now) -> None:
+    if rng.random() < 0.8:
+        rows.add(
+            orm,
+            id=str(uuid4()),
+            user_id=owner_id,
+            task_id=task["id"],
+            assignee_id=rng.choice(members),
+            status=task["status"],
+            progress=task["progress"],
+            created_at=now,
+            updated_at=now,
+        )
+
+
+async def generate(engine, scale: SyntheticScale, seed: int = 0) -> SyntheticDataset:
+    """Insert a synthetic dataset through an async engine (schema must exist)."""
+    rows, dataset = build_rows(scale, seed)
+    async with engine.begin() as conn:
+        dataset.row_counts = await rows.insert_all(conn)
+    return dataset
+
+
+async def build_plans(dataset: SyntheticDataset) -> int:
+    """Build today's schedule plans for every user with the real plan service."""
+    from app.api.deps import (
+        get_daily_schedule_plan_repository,
+        get_project_repository,
+        get_schedule_settings_repository,
+        get_schedule_snapshot_repository,
+        get_task_assignment_repository,
+        get_task_repository,
+        get_user_repository,
+    )
+    from app.services.daily_schedule_plan_service import DailySchedulePlanService
+
+    plan_service = DailySchedulePlanService(
+        task_repo=get_task_repository(),
+        project_repo=get_project_repository(),
+        assignment_repo=get_task_assignment_repository(),
+        snapshot_repo=get_schedule_snapshot_repository(),
+        user_repo=get_user_repository(),
+        settings_repo=get_schedule_settings_repository(),
+        plan_repo=get_daily_schedule_plan_repository(),
+    )
+    plans = await plan_service.build_plans(dataset.user_ids)
+    dataset.plan_count = len(plans)
+    return dataset.plan_count
+
+
+async def seed_database(scale: SyntheticScale, seed: int = 0) -> SyntheticDataset:
+    """
+    Create the schema in the configured DATABASE_URL and seed it.
+
+    The database should be empty; settings must already point at it.
+    """
+    from app.infrastructure.local.database import get_engine, init_db
+
+    await init_db()
+    engine = get_engine()
+    try:
+        dataset = await generate(engine, scale, seed)
+    finally:
+        await engine.dispose()
+    if scale.plans:
+        await build_plans(dataset)
+    return dataset
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="medium", help="Base scale")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    for item in fields(SyntheticScale):
+        flag = "--" + item.name.replace("_", "-")
+        if item.type == "bool":
+            parser.add_argument(flag, dest=item.name, action=argparse.BooleanOptionalAction, default=None)
+        else:
+            kind = float if item.type == "float" else int
+            parser.add_argument(flag, dest=item.name, type=kind, default=None, help=f"Override {item.name}")
+
+
+def scale_from_args(args: argparse.Namespace) -> SyntheticScale:
+    base = PRESETS[args.preset]
+    overrides = {
+        item.name: getattr(args, item.name)
+        for item in fields(SyntheticScale)
+        if getattr(args, item.name, None) is not None
+    }
+    return SyntheticScale(**{**base.__dict__, **overrides})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed a synthetic dataset")
+    parser.add_argument("--database", required=True, help="SQLite file to create (must not exist)")
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+
+    database = Path(args.database).resolve()
+    if database.exists():
+        parser.error(f"{database} already exists")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{database}"
+    os.environ.setdefault("DEBUG", "false")
+
+    scale = scale_from_args(args)
+    started = time.perf_counter()
+    dataset = asyncio.run(seed_database(scale, args.seed))
+    print(f"Seeded {database} in {time.perf_counter() - started:.1f}s ({scale})")
+    for table, count in sorted(dataset.row_counts.items()):
+        print(f"  {table:<24} {count:>8}")
+    print(f"  {'daily plans':<24} {dataset.plan_count:>8}")
+
+
+if __name__ == "__main__":
+    main()
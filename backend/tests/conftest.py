@@ -2,6 +2,8 @@
 Pytest configuration and shared fixtures.
 """
 
+from contextlib import contextmanager
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
@@ -9,6 +11,62 @@ from sqlalchemy.orm import sessionmaker
 from app.infrastructure.local.database import Base
 
 
+@pytest.fixture(autouse=True)
+def _clear_ttl_caches():
+    """Keep cached project contexts and work-memory libraries from leaking between tests."""
+    from app.core.ttl_cache import clear_all_caches
+
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
+@pytest.fixture(autouse=True)
+def _clear_llm_usage_ledger():
+    """Keep buffered LLM usage records and cached spend from leaking between tests."""
+    from app.services.llm_usage_service import llm_usage_ledger
+
+    llm_usage_ledger.clear()
+    yield
+    llm_usage_ledger.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    """Keep cached response bodies and data revisions from leaking between tests."""
+    from app.api.conditional import response_cache
+    from app.core.revisions import data_revisions
+
+    response_cache.clear()
+    data_revisions.clear()
+    yield
+    response_cache.clear()
+    data_revisions.clear()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Assert that a block executes at most a given number of SQL statements.
+
+    Usage:
+        with query_budget(3):
+            await repo.list_with_task_count(user_id)
+    """
+    from app.core.query_counter import count_queries
+
+    @contextmanager
+    def _budget(max_queries: int):
+        with count_queries("query_budget", warn=False) as stats:
+            yield stats
+        shapes = "\n".join(f"  {count}x {shape}" for shape, count in stats.shapes.most_common())
+        assert stats.total <= max_queries, (
+            f"{stats.total} statements executed (budget {max_queries}):\n{shapes}"
+        )
+
+    return _budget
+
+
 @pytest.fixture
 async def db_session():
     """
@@ -178,3 +178,70 @@ async def test_top3_api_less_than_3_tasks(task_repo, top3_service):
 
     # Should return only 2 tasks
     assert len(top3) == 2
+
+
+@pytest.mark.asyncio
+async def test_top3_endpoint_reads_personal_tasks(task_repo, monkeypatch):
+    """GET /api/today/top3 keeps personal tasks completed today visible."""
+    from uuid import uuid4
+
+    from fastapi import FastAPI
+    from httpx import ASGITransport, AsyncClient
+
+    from app.api import conditional, today
+    from app.api.deps import (
+        get_current_user,
+        get_project_member_repository,
+        get_project_repository,
+        get_task_assignment_repository,
+        get_task_repository,
+        get_user_repository,
+    )
+    from app.infrastructure.local.project_repository import SqliteProjectRepository
+    from app.infrastructure.local.task_assignment_repository import SqliteTaskAssignmentRepository
+    from app.infrastructure.local.user_repository import SqliteUserRepository
+    from app.interfaces.auth_provider import User
+    from app.models.enums import TaskStatus
+    from app.models.task import TaskUpdate
+    from app.services.project_permissions import AccessContext
+
+    async def _access_context(user_id, project_repo, member_repo):
+        return AccessContext(user_id=user_id)
+
+    monkeypatch.setattr(conditional, "load_access_context", _access_context)
+    user_id = str(uuid4())
+    factory = task_repo._session_factory
+    active = await task_repo.create(
+        user_id, TaskCreate(title="Active task", importance=Priority.HIGH, urgency=Priority.HIGH)
+    )
+    done = await task_repo.create(user_id, TaskCreate(title="Done task"))
+    await task_repo.update(user_id, done.id, TaskUpdate(status=TaskStatus.DONE))
+
+    personal_calls = []
+    list_personal_tasks = task_repo.list_personal_tasks
+
+    async def _list_personal_tasks(*args, **kwargs):
+        personal_calls.append(kwargs)
+        return await list_personal_tasks(*args, **kwargs)
+
+    monkeypatch.setattr(task_repo, "list_personal_tasks", _list_personal_tasks)
+
+    app = FastAPI()
+    app.include_router(today.router, prefix="/api/today")
+    app.dependency_overrides[get_current_user] = lambda: User(id=user_id)
+    app.dependency_overrides[get_task_repository] = lambda: task_repo
+    app.dependency_overrides[get_user_repository] = lambda: SqliteUserRepository(factory)
+    app.dependency_overrides[get_project_repository] = lambda: SqliteProjectRepository(factory)
+    app.dependency_overrides[get_task_assignment_repository] = lambda: SqliteTaskAssignmentRepository(factory)
+    app.dependency_overrides[get_project_member_repository] = lambda: None
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/today/top3")
+
+    assert response.status_code == 200
+    assert {task["id"] for task in response.json()["tasks"]} == {str(active.id), str(done.id)}
+    assert personal_calls and personal_calls[0]["include_done"] is True
+
+    # The repository honours include_done for personal (project-less) tasks.
+    assert {task.id for task in await list_personal_tasks(user_id)} == {active.id, done.id}
+    assert [task.id for task in await list_personal_tasks(user_id, include_done=False)] == [active.id]
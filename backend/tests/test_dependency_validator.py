@@ -321,3 +321,42 @@ class TestDependencyValidator:
             await validator.validate_parent_child_consistency(
                 child.id, parent.id, user_id
             )
+
+
+class BatchTaskRepository(MockTaskRepository):
+    """Mock repository that supports batched lookups and counts queries."""
+
+    def __init__(self):
+        super().__init__()
+        self.get_calls = 0
+        self.get_many_calls = 0
+
+    async def get(self, user_id: str, task_id: UUID, project_id: Optional[UUID] = None):
+        self.get_calls += 1
+        return await super().get(user_id, task_id)
+
+    async def get_many(self, task_ids: list[UUID]):
+        self.get_many_calls += 1
+        return [self.tasks[tid] for tid in task_ids if tid in self.tasks]
+
+
+@pytest.mark.asyncio
+async def test_dependency_chain_is_fetched_in_batches(user_id):
+    """Each dependency level is loaded with one batched query."""
+    repo = BatchTaskRepository()
+    shared = create_test_task("Shared", user_id)
+    left = create_test_task("Left", user_id, dependency_ids=[shared.id])
+    right = create_test_task("Right", user_id, dependency_ids=[shared.id])
+    other_user = create_test_task("Hidden", "someone-else")
+    for task in (shared, left, right, other_user):
+        repo.add_task(task)
+
+    validator = DependencyValidator(repo)
+    await validator.validate_dependencies(uuid4(), [left.id, right.id], user_id)
+
+    assert repo.get_calls == 0
+    # [left, right] once, then [shared] once despite being reached twice
+    assert repo.get_many_calls == 2
+
+    with pytest.raises(BusinessLogicError, match="が見つかりません"):
+        await validator.validate_dependencies(uuid4(), [other_user.id], user_id)
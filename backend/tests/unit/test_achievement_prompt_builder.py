@@ -0,0 +1,121 @@
+"""
+Unit tests for the token-budgeted achievement prompt builder.
+"""
+
+import pytest
+
+from app.services import llm_utils
+from app.services.achievement_prompt_builder import (
+    PromptTaskGroup,
+    build_budgeted_task_section,
+)
+from app.utils.token_utils import estimate_tokens
+
+
+def _group(key: str, count: int, text_len: int = 40) -> PromptTaskGroup:
+    return PromptTaskGroup(
+        key=key,
+        label=f"Group {key}",
+        entries=[f"- task {key}-{i} " + "x" * text_len for i in range(count)],
+    )
+
+
+@pytest.mark.asyncio
+async def test_section_within_budget_is_rendered_in_detail():
+    groups = [_group("a", 2), _group("b", 3)]
+
+    text, usage = await build_budgeted_task_section(groups, "完了タスク一覧", budget_tokens=5000)
+
+    assert "task a-1" in text
+    assert "task b-2" in text
+    assert usage.detailed_groups == 2
+    assert usage.summarized_groups == 0
+    assert usage.task_count == 5
+    assert usage.used_tokens == usage.full_tokens
+
+
+@pytest.mark.asyncio
+async def test_overflow_groups_are_summarized_in_parallel(monkeypatch):
+    calls = []
+
+    def fake_generate_text(**kwargs):
+        calls.append(kwargs["prompt"])
+        return "- summarized work"
+
+    monkeypatch.setattr(llm_utils, "generate_text", fake_generate_text)
+    groups = [_group("small", 2), _group("big1", 60), _group("big2", 60)]
+
+    text, usage = await build_budgeted_task_section(
+        groups, "完了タスク一覧", llm_provider=object(), budget_tokens=600
+    )
+
+    assert "task small-1" in text
+    assert "task big1-0" not in text
+    assert text.count("（要約）") == 2
+    assert len(calls) == 2
+    assert usage.detailed_groups == 1
+    assert usage.summarized_groups == 2
+    assert usage.used_tokens <= 600
+    assert usage.full_tokens > 600
+    # Group order is preserved in the output.
+    assert text.index("Group small") < text.index("Group big1") < text.index("Group big2")
+
+
+@pytest.mark.asyncio
+async def test_overflow_without_llm_keeps_leading_entries_within_budget():
+    groups = [_group("big", 200)]
+
+    text, usage = await build_budgeted_task_section(groups, "完了タスク一覧", budget_tokens=400)
+
+    assert usage.fallback_groups == 1
+    assert "task big-0" in text
+    assert "...他" in text
+    assert estimate_tokens(text) <= 400
+
+
+@pytest.mark.asyncio
+async def test_task_groups_are_labelled_with_batch_loaded_names():
+    from datetime import datetime
+    from types import SimpleNamespace
+    from uuid import uuid4
+
+    from app.models.task import Task
+    from app.services.achievement_service import _build_budgeted_tasks_prompt
+
+    project_id, design, build = uuid4(), uuid4(), uuid4()
+
+    class _Repo:
+        def __init__(self, names):
+            self.names = names
+            self.calls = []
+
+        async def get_many(self, ids):
+            self.calls.append(list(ids))
+            return [SimpleNamespace(id=item, name=self.names[item]) for item in ids]
+
+        async def get_by_id(self, item_id):
+            raise AssertionError("names must be loaded in one batch")
+
+    projects = _Repo({project_id: "Nagi"})
+    phases = _Repo({design: "設計", build: "実装"})
+    now = datetime.now()
+    tasks = [
+        Task(
+            id=uuid4(),
+            user_id="u",
+            title=f"task {i}",
+            project_id=project_id,
+            phase_id=phase_id,
+            created_at=now,
+            updated_at=now,
+        )
+        for i, phase_id in enumerate([design, build, design])
+    ]
+
+    text, _ = await _build_budgeted_tasks_prompt(object(), tasks, projects, phases)
+
+    assert "Nagi / 設計" in text
+    assert "Nagi / 実装" in text
+    assert "フェーズ1" not in text
+    assert projects.calls == [[project_id]]
+    assert phases.calls == [[design, build]]
@@ -168,6 +168,10 @@ class MockProjectRepository:
 class MockProjectMemberRepository:
     """Minimal project member repository for permission checks in tool tests."""
 
+    async def list_by_member_user_id(self, member_user_id):
+        del member_user_id
+        return []
+
     async def get_by_project_and_member_user_id(self, project_id, member_user_id):
         del project_id, member_user_id
         return None
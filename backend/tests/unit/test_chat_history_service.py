@@ -0,0 +1,221 @@
+"""
+Unit tests for chat history compaction.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import update
+
+from app.infrastructure.local.chat_session_repository import SqliteChatSessionRepository
+from app.infrastructure.local.database import ChatMessageORM
+from app.services import chat_history_service
+from app.services.chat_history_service import ChatHistoryCompactionService
+from app.services.llm_usage_service import current_llm_usage_scope
+
+
+async def _add_turns(repo, user_id: str, session_id: str, count: int) -> None:
+    for idx in range(count):
+        await repo.add_message(user_id, session_id, "user", f"question {idx} " + "x" * 40)
+        await repo.add_message(user_id, session_id, "assistant", f"answer {idx} " + "y" * 40)
+
+
+@pytest.mark.asyncio
+async def test_list_recent_messages_returns_newest_in_order(session_factory, test_user_id):
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await _add_turns(repo, test_user_id, "s1", 5)
+
+    recent = await repo.list_recent_messages(test_user_id, "s1", limit=3)
+
+    assert [m.content.split()[0:2] for m in recent] == [
+        ["answer", "3"],
+        ["question", "4"],
+        ["answer", "4"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_build_seed_without_compaction_keeps_short_history(session_factory, test_user_id):
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await _add_turns(repo, test_user_id, "s1", 2)
+    service = ChatHistoryCompactionService(repo, llm_provider=None, recent_message_limit=10)
+
+    seed = await service.build_seed(test_user_id, "s1")
+
+    assert seed.summary is None
+    assert len(seed.messages) == 4
+    assert seed.tokens_saved == 0
+
+
+@pytest.mark.asyncio
+async def test_build_seed_compacts_older_turns_and_persists_summary(
+    session_factory, test_user_id, monkeypatch
+):
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await _add_turns(repo, test_user_id, "s1", 10)
+    calls = []
+
+    def fake_generate_text(llm_provider, prompt, **kwargs):
+        scope = current_llm_usage_scope()
+        calls.append((prompt, scope.feature, scope.user_id))
+        return "- summary of earlier turns"
+
+    monkeypatch.setattr(chat_history_service, "generate_text", fake_generate_text)
+    service = ChatHistoryCompactionService(
+        repo, llm_provider=MagicMock(), recent_message_limit=4, min_recent_messages=2
+    )
+
+    seed = await service.build_seed(test_user_id, "s1")
+
+    # Hydration seeds an extract right away; the LLM summary is built in the background.
+    assert "question 0" in seed.summary
+    assert len(seed.messages) == 4
+    assert seed.messages[0].role == "user"
+    assert seed.messages[0].content.startswith("question 8")
+    await service.wait_for_compactions()
+    assert len(calls) == 1
+    prompt, feature, user_id = calls[0]
+    assert "question 0" in prompt and "answer 7" in prompt and "question 8" not in prompt
+    assert (feature, user_id) == ("chat_compaction", test_user_id)
+
+    stored = await repo.get_history_summary(test_user_id, "s1")
+    assert stored is not None
+    assert stored.summarized_message_count == 16
+    assert stored.summarized_until_id is not None
+
+    # A second hydration reuses the persisted summary without another LLM call.
+    again = await service.build_seed(test_user_id, "s1")
+    await service.wait_for_compactions()
+    assert again.summary == "- summary of earlier turns"
+    assert len(again.messages) == 4
+    assert again.tokens_saved > 0
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_compaction_covers_messages_before_the_loaded_window(
+    session_factory, test_user_id, monkeypatch
+):
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await _add_turns(repo, test_user_id, "s1", 10)
+    prompts = []
+
+    def fake_generate_text(llm_provider, prompt, **kwargs):
+        prompts.append(prompt)
+        return f"- summary {len(prompts)}"
+
+    monkeypatch.setattr(chat_history_service, "generate_text", fake_generate_text)
+    monkeypatch.setattr(chat_history_service, "_COMPACTION_BATCH", 6)
+    service = ChatHistoryCompactionService(
+        repo, llm_provider=MagicMock(), recent_message_limit=2, min_recent_messages=2
+    )
+
+    # Only the newest 6 messages are loaded for the seed.
+    await service.build_seed(test_user_id, "s1", max_messages=6)
+    await service.wait_for_compactions()
+
+    transcript = "\n".join(prompts)
+    assert all(f"question {idx} " in transcript for idx in range(9))
+    assert "question 9" not in transcript
+    stored = await repo.get_history_summary(test_user_id, "s1")
+    assert stored.summarized_message_count == 18
+
+
+@pytest.mark.asyncio
+async def test_message_cursor_keeps_messages_sharing_a_timestamp(session_factory, test_user_id):
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await _add_turns(repo, test_user_id, "s1", 2)
+    async with session_factory() as session:
+        await session.execute(update(ChatMessageORM).values(created_at=datetime(2026, 1, 1)))
+        await session.commit()
+
+    ordered = await repo.list_messages_after(test_user_id, "s1")
+    cursor = ordered[1]
+    after = await repo.list_messages_after(
+        test_user_id, "s1", after=cursor.created_at, after_id=cursor.id
+    )
+    recent = await repo.list_recent_messages(
+        test_user_id, "s1", after=cursor.created_at, after_id=cursor.id
+    )
+
+    assert [m.id for m in after] == [m.id for m in ordered[2:]]
+    assert [m.id for m in recent] == [m.id for m in ordered[2:]]
+
+
+@pytest.mark.asyncio
+async def test_build_seed_falls_back_to_extract_when_llm_fails(
+    session_factory, test_user_id, monkeypatch
+):
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await _add_turns(repo, test_user_id, "s1", 4)
+    monkeypatch.setattr(chat_history_service, "generate_text", lambda *a, **k: None)
+    service = ChatHistoryCompactionService(
+        repo, llm_provider=MagicMock(), recent_message_limit=2, min_recent_messages=2
+    )
+
+    seed = await service.build_seed(test_user_id, "s1")
+    await service.wait_for_compactions()
+
+    assert seed.summary is not None
+    assert "question 0" in seed.summary
+    assert len(seed.messages) == 2
+    assert await repo.get_history_summary(test_user_id, "s1") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_compactions_never_double_count(session_factory, test_user_id, monkeypatch):
+    repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await _add_turns(repo, test_user_id, "s1", 10)
+    calls = []
+
+    def fake_generate_text(llm_provider, prompt, **kwargs):
+        calls.append(prompt)
+        return "- summary"
+
+    monkeypatch.setattr(chat_history_service, "generate_text", fake_generate_text)
+    # One service is built per request; the in-flight registry is shared.
+    services = [
+        ChatHistoryCompactionService(repo, llm_provider=MagicMock(), recent_message_limit=4, min_recent_messages=2)
+        for _ in range(2)
+    ]
+    for service in services:
+        await service.build_seed(test_user_id, "s1")
+    await services[0].wait_for_compactions()
+    assert len(calls) == 1
+    stored = await repo.get_history_summary(test_user_id, "s1")
+    assert stored.summarized_message_count == 16
+
+    # A compaction that started from an older cursor (e.g. on another worker) loses.
+    messages = await repo.list_messages_after(test_user_id, "s1")
+    lost = await repo.save_history_summary(
+        user_id=test_user_id,
+        session_id="s1",
+        summary="stale",
+        summarized_until=messages[3].created_at,
+        summarized_until_id=messages[3].id,
+        summarized_message_count=4,
+        source_tokens=1,
+        summary_tokens=1,
+        previous=None,
+    )
+    assert lost is None
+    stale = stored.model_copy(update={"summarized_until_id": messages[1].id})
+    assert await repo.save_history_summary(
+        user_id=test_user_id,
+        session_id="s1",
+        summary="stale",
+        summarized_until=messages[3].created_at,
+        summarized_until_id=messages[3].id,
+        summarized_message_count=20,
+        source_tokens=1,
+        summary_tokens=1,
+        previous=stale,
+    ) is None
+    # The service drops a summary whose save lost the race.
+    conflicts = chat_history_service.get_history_compaction_stats()["compaction_conflicts"]
+    assert await services[1]._compact(test_user_id, "s1", None, messages[:4], messages[3]) is None
+    assert chat_history_service.get_history_compaction_stats()["compaction_conflicts"] == conflicts + 1
+
+    after = await repo.get_history_summary(test_user_id, "s1")
+    assert (after.summarized_until_id, after.summarized_message_count) == (stored.summarized_until_id, 16)
@@ -0,0 +1,86 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete
+
+from app.core.revisions import GLOBAL_SCOPE, data_revisions, install_revision_tracking
+from app.infrastructure.local.database import ChatMessageORM, TaskAssignmentORM, TaskORM
+
+
+@pytest.mark.asyncio
+async def test_committed_writes_bump_their_scopes(db_session):
+    install_revision_tracking()
+    project_id = str(uuid4())
+
+    db_session.add(TaskORM(id=str(uuid4()), user_id="owner", project_id=project_id, title="t"))
+    db_session.add(ChatMessageORM(id=str(uuid4()), session_id="s", user_id="chatter", role="user"))
+    await db_session.flush()
+    # Nothing is bumped before the commit.
+    assert data_revisions.get(("project", project_id)) == 0
+    await db_session.commit()
+    assert data_revisions.get(("project", project_id)) == 1
+    assert data_revisions.get(("user", "owner")) == 1
+    assert data_revisions.get(("user", "chatter")) == 0
+
+    db_session.add(TaskORM(id=str(uuid4()), user_id="owner", title="rolled back"))
+    await db_session.flush()
+    await db_session.rollback()
+    assert data_revisions.get(("user", "owner")) == 1
+
+    await db_session.execute(
+        delete(TaskAssignmentORM).where(TaskAssignmentORM.user_id == "owner", TaskAssignmentORM.task_id == "t1")
+    )
+    await db_session.commit()
+    assert data_revisions.get(("user", "owner")) == 2
+    assert data_revisions.get(GLOBAL_SCOPE) == 0
+
+
+def test_conditional_get_answers_from_revisions(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api import conditional
+    from app.api.deps import get_current_user, get_project_member_repository, get_project_repository
+    from app.interfaces.auth_provider import User
+    from app.services.project_permissions import AccessContext
+
+    install_revision_tracking()
+
+    async def _access_context(user_id, project_repo, member_repo):
+        return AccessContext(user_id=user_id)
+
+    monkeypatch.setattr(conditional, "load_access_context", _access_context)
+    computed = []
+    app = FastAPI()
+
+    @app.get("/view", response_model=dict[str, int])
+    async def view(conditional_get: conditional.ConditionalGetDep):
+        if cached := await conditional_get.check():
+            return cached
+        computed.append(1)
+        return conditional_get.respond({"computed": len(computed)}, dict[str, int])
+
+    app.dependency_overrides[get_current_user] = lambda: User(id="user-1")
+    app.dependency_overrides[get_project_repository] = lambda: None
+    app.dependency_overrides[get_project_member_repository] = lambda: None
+    client = TestClient(app)
+
+    first = client.get("/view")
+    etag = first.headers["etag"]
+    assert first.json() == {"computed": 1}
+
+    not_modified = client.get("/view", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    # Without If-None-Match the last body is served while the ETag holds.
+    assert client.get("/view").json() == {"computed": 1}
+    assert len(computed) == 1
+
+    data_revisions.bump([("user", "other-user")])
+    assert client.get("/view", headers={"If-None-Match": etag}).status_code == 304
+
+    data_revisions.bump([("user", "user-1")])
+    changed = client.get("/view", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json() == {"computed": 2}
+    assert changed.headers["etag"] != etag
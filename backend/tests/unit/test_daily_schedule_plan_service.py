@@ -1,3 +1,6 @@
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -5,13 +8,19 @@ from uuid import UUID, uuid4
 
 import pytest
 
-from app.models.enums import CreatedBy, TaskStatus
-from app.models.schedule_plan import ScheduleTimeBlock, TimeBlockMoveRequest
+from app.models.collaboration import TaskAssignment
+from app.models.enums import CreatedBy, EnergyLevel, ProjectVisibility, TaskStatus
+from app.models.schedule import ScheduleDay, TaskAllocation
+from app.models.schedule_plan import DailySchedulePlan, ScheduleTimeBlock, TimeBlockMoveRequest
 from app.models.task import Task, TaskUpdate
 from app.services.daily_schedule_plan_service import (
     DailySchedulePlanService,
     _build_meeting_intervals,
+    _build_task_snapshots,
+    _find_replan_start,
+    get_replan_stats,
 )
+from app.utils.datetime_utils import get_user_today
 
 
 def _build_task(
@@ -238,3 +247,221 @@ def test_filter_tasks_for_plan_always_includes_fixed_time_meetings() -> None:
     # Fixed-time meetings are always included regardless of assignment
     # to prevent them from being auto-scheduled like regular tasks
     assert unassigned_team_meeting.id in filtered_ids
+
+
+class _InMemoryPlanRepo:
+    def __init__(self) -> None:
+        self.plans: dict[date, DailySchedulePlan] = {}
+
+    async def upsert_many(self, user_id, plans):
+        stored = []
+        for plan in plans:
+            self.plans[plan.plan_date] = DailySchedulePlan(
+                id=uuid4(),
+                updated_at=plan.generated_at,
+                **plan.model_dump(),
+            )
+            stored.append(self.plans[plan.plan_date])
+        return stored
+
+    async def list_by_range(self, user_id, start_date, end_date):
+        return [
+            plan for plan_date, plan in sorted(self.plans.items())
+            if start_date <= plan_date <= end_date
+        ]
+
+
+def _build_work_task(title: str, minutes: int, created_offset: int, **fields) -> Task:
+    created = datetime(2026, 1, 1, 9, 0) + timedelta(minutes=created_offset)
+    return Task(
+        id=uuid4(),
+        user_id="planner",
+        title=title,
+        status=TaskStatus.TODO,
+        estimated_minutes=minutes,
+        created_by=CreatedBy.USER,
+        created_at=created,
+        updated_at=created,
+        **fields,
+    )
+
+
+def _build_plan_service(tasks: list[Task], plan_repo: _InMemoryPlanRepo) -> DailySchedulePlanService:
+    task_repo = AsyncMock()
+    task_repo.list.side_effect = lambda *args, **kwargs: list(tasks)
+    project_repo = AsyncMock()
+    project_repo.list.return_value = []
+    assignment_repo = AsyncMock()
+    assignment_repo.list_for_assignee.return_value = []
+    user_repo = AsyncMock()
+    user_repo.get.return_value = None
+    settings_repo = AsyncMock()
+    settings_repo.get.return_value = None
+    return DailySchedulePlanService(
+        task_repo=task_repo,
+        project_repo=project_repo,
+        assignment_repo=assignment_repo,
+        snapshot_repo=AsyncMock(),
+        user_repo=user_repo,
+        settings_repo=settings_repo,
+        plan_repo=plan_repo,
+    )
+
+
+def _allocations(response) -> list[tuple[date, list[tuple[UUID, int]]]]:
+    return [
+        (day.date, [(a.task_id, a.minutes) for a in day.task_allocations])
+        for day in response.days
+    ]
+
+
+@pytest.mark.asyncio
+async def test_build_plan_reuses_days_before_first_affected_day() -> None:
+    start = get_user_today("Asia/Tokyo") + timedelta(days=1)
+    later = datetime.combine(start + timedelta(days=4), datetime.min.time())
+    tasks = [
+        _build_work_task(f"Task {i}", 240, i) for i in range(8)
+    ] + [_build_work_task("Later", 120, 100, start_not_before=later)]
+    plan_repo = _InMemoryPlanRepo()
+    service = _build_plan_service(tasks, plan_repo)
+
+    await service.build_plan("planner", start_date=start, max_days=10)
+    tasks[-1] = tasks[-1].model_copy(update={"estimated_minutes": 360})
+    before = get_replan_stats()
+    incremental = await service.build_plan("planner", start_date=start, max_days=10)
+    after = get_replan_stats()
+
+    assert after["incremental_builds"] == before["incremental_builds"] + 1
+    assert after["reused_days"] - before["reused_days"] == 4
+    full = await service.build_plan("planner", start_date=start, max_days=10, incremental=False)
+    assert _allocations(incremental) == _allocations(full)
+
+
+@pytest.mark.asyncio
+async def test_build_plan_falls_back_when_first_day_is_affected() -> None:
+    start = get_user_today("Asia/Tokyo") + timedelta(days=1)
+    tasks = [_build_work_task(f"Task {i}", 240, i) for i in range(6)]
+    plan_repo = _InMemoryPlanRepo()
+    service = _build_plan_service(tasks, plan_repo)
+
+    await service.build_plan("planner", start_date=start, max_days=5)
+    tasks.append(_build_work_task("Urgent", 60, 200))
+    before = get_replan_stats()
+    await service.build_plan("planner", start_date=start, max_days=5)
+    after = get_replan_stats()
+
+    assert after["incremental_builds"] == before["incremental_builds"]
+    assert after.get("fallback_first_day_affected", 0) == before.get("fallback_first_day_affected", 0) + 1
+
+
+def test_find_replan_start_uses_first_allocation_of_changed_task() -> None:
+    start = date(2026, 3, 2)
+    done_later = _build_work_task("Tail", 60, 1)
+    plan_days = [
+        ScheduleDay(date=start + timedelta(days=i), capacity_minutes=480, allocated_minutes=0)
+        for i in range(4)
+    ]
+    plan_days[2].task_allocations.append(TaskAllocation(task_id=done_later.id, minutes=60))
+    previous = _build_task_snapshots([done_later])
+    plans = [
+        DailySchedulePlan(
+            id=uuid4(),
+            user_id="planner",
+            plan_date=day.date,
+            timezone="Asia/Tokyo",
+            plan_group_id=uuid4(),
+            schedule_day=day,
+            tasks=[],
+            task_snapshots=previous,
+            generated_at=datetime(2026, 3, 1),
+            updated_at=datetime(2026, 3, 1),
+        )
+        for day in plan_days
+    ]
+    completed = done_later.model_copy(update={"progress": 50})
+
+    replan_start = _find_replan_start(
+        plans, [completed], _build_task_snapshots([completed]), {completed.id: start + timedelta(days=3)},
+        start, "Asia/Tokyo",
+    )
+    assert replan_start == start + timedelta(days=2)
+    assert _find_replan_start(plans, [done_later], previous, {}, start, "Asia/Tokyo") is None
+
+
+def _build_team_service(seed: int, members: list[str]) -> DailySchedulePlanService:
+    rng = random.Random(seed)
+    project = SimpleNamespace(id=uuid4(), priority=3, visibility=ProjectVisibility.TEAM)
+    energies = [EnergyLevel.HIGH, EnergyLevel.MEDIUM, EnergyLevel.LOW]
+    now = datetime(2026, 1, 1)
+    tasks_by_user: dict[str, list[Task]] = {}
+    assignments_by_user: dict[str, list[TaskAssignment]] = {member: [] for member in members}
+    for index, member in enumerate(members):
+        tasks = []
+        for offset in range(rng.randint(3, 8)):
+            task = _build_work_task(
+                f"{member} {offset}",
+                rng.choice([30, 60, 120, 240]),
+                index * 100 + offset,
+                energy_level=rng.choice(energies),
+                project_id=project.id if rng.random() < 0.5 else None,
+            ).model_copy(update={"user_id": member})
+            tasks.append(task)
+            if task.project_id:
+                for assignee in rng.sample(members, rng.randint(1, len(members))):
+                    assignments_by_user[assignee].append(
+                        TaskAssignment(
+                            id=uuid4(), user_id=member, task_id=task.id, assignee_id=assignee,
+                            created_at=now, updated_at=now,
+                        )
+                    )
+        tasks_by_user[member] = tasks
+
+    service = _build_plan_service([], _InMemoryPlanRepo())
+    service._task_repo.list.side_effect = lambda user_id, **kwargs: list(tasks_by_user[user_id])
+    service._assignment_repo.list_for_assignee.side_effect = lambda user_id: assignments_by_user[user_id]
+    service._project_repo.list.return_value = [project]
+    service._snapshot_repo.get_active.return_value = None
+    service._plan_repo = AsyncMock()
+    return service
+
+
+def _stored_params(plan_repo: AsyncMock) -> dict[str, dict]:
+    return {call.args[0]: call.args[1][0].plan_params for call in plan_repo.upsert_many.await_args_list}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("members", [["alice"], ["alice", "bob", "carol"]])
+@pytest.mark.parametrize("seed", range(5))
+async def test_build_plans_match_solo_plans(seed: int, members: list[str]) -> None:
+    service = _build_team_service(seed, members)
+
+    batch_plans = await service.build_plans(members, max_days=7)
+    batch_params = _stored_params(service._plan_repo)
+    service._plan_repo.reset_mock()
+    solo_plans = {
+        member: await service.build_plan(member, max_days=7, incremental=False) for member in members
+    }
+
+    assert set(batch_plans) == set(members)
+    for member in members:
+        assert _allocations(batch_plans[member]) == _allocations(solo_plans[member])
+        assert batch_plans[member].tasks == solo_plans[member].tasks
+        assert batch_plans[member].unscheduled_task_ids == solo_plans[member].unscheduled_task_ids
+    # Same plan_params, so a later incremental replan can reuse the plans.
+    assert batch_params == _stored_params(service._plan_repo)
+
+
+@pytest.mark.asyncio
+async def test_build_plans_computes_jobs_in_process_pool() -> None:
+    tasks = [_build_work_task(f"Task {i}", 120, i) for i in range(5)]
+    service = _build_plan_service(tasks, _InMemoryPlanRepo())
+    inline = await service.build_plans(["planner"], max_days=5)
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pooled = await service.build_plans(["planner"], max_days=5, executor=pool)
+
+    assert _allocations(pooled["planner"]) == _allocations(inline["planner"])
+    stored = await service._plan_repo.list_by_range(
+        "planner", pooled["planner"].start_date, pooled["planner"].start_date + timedelta(days=4)
+    )
+    assert {plan.plan_group_id for plan in stored} == {pooled["planner"].plan_group_id}
@@ -0,0 +1,130 @@
+"""
+Unit tests for the LLM usage ledger: attribution, batched writes and budgets.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import get_settings
+from app.infrastructure.local.llm_usage_repository import SqliteLlmUsageRepository
+from app.services import llm_usage_service
+from app.services.llm_usage_service import LlmUsageLedger, llm_usage_scope
+from app.services.llm_utils import generate_text, generate_text_with_status
+from app.utils.datetime_utils import now_utc
+
+
+class _RecordingRepo(SqliteLlmUsageRepository):
+    def __init__(self, session_factory):
+        super().__init__(session_factory=session_factory)
+        self.batches: list[int] = []
+
+    async def add_many(self, records):
+        self.batches.append(len(records))
+        return await super().add_many(records)
+
+
+@pytest.fixture
+def flat_cost(monkeypatch):
+    """Price every call at $0.01 regardless of model."""
+    monkeypatch.setattr(llm_usage_service, "calculate_cost", lambda model, i, o: 0.01)
+
+
+@pytest.mark.asyncio
+async def test_records_are_attributed_by_scope_and_written_in_batches(
+    session_factory, monkeypatch, flat_cost
+):
+    monkeypatch.setattr(get_settings(), "LLM_USAGE_BATCH_SIZE", 2)
+    repo = _RecordingRepo(session_factory)
+    ledger = LlmUsageLedger(repository_factory=lambda: repo)
+
+    with llm_usage_scope("heartbeat", user_id="u1"):
+        ledger.record(model="m1", input_tokens=100, output_tokens=20, latency_ms=120)
+        with llm_usage_scope("heartbeat_retry") as usage:
+            usage.retries = 1
+            ledger.record(model="m1", input_tokens=100, output_tokens=20, latency_ms=80)
+    ledger.record(model="m2", input_tokens=10, latency_ms=400, success=False, feature="chat", user_id="u2")
+
+    assert await ledger.flush() == 3
+    assert repo.batches == [2, 1]
+    assert ledger.stats() == {"pending": 0, "written": 3, "dropped": 0}
+
+    since = now_utc().replace(hour=0, minute=0, second=0, microsecond=0)
+    by_feature = {row.key: row for row in await repo.summarize(since=since)}
+    assert by_feature["heartbeat_retry"].retries == 1
+    assert by_feature["heartbeat"].input_tokens == 100
+    assert by_feature["chat"].errors == 1
+    assert by_feature["chat"].max_latency_ms == 400
+
+    by_user = {row.key: row for row in await repo.summarize(since=since, group_by="user_id")}
+    assert by_user["u1"].calls == 2
+    assert by_user["u1"].cost_usd == pytest.approx(0.02)
+    assert await repo.spend_by_feature("u1", since) == pytest.approx(
+        {"heartbeat": 0.01, "heartbeat_retry": 0.01}
+    )
+
+
+@pytest.mark.asyncio
+async def test_background_scope_over_budget_skips_llm_calls(session_factory, monkeypatch, flat_cost):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "LLM_USER_DAILY_BUDGET_USD", 1.0)
+    monkeypatch.setattr(settings, "LLM_FEATURE_DAILY_BUDGETS_USD", "heartbeat=0.02")
+    ledger = LlmUsageLedger(repository_factory=lambda: SqliteLlmUsageRepository(session_factory))
+    monkeypatch.setattr(llm_usage_service, "llm_usage_ledger", ledger)
+
+    ledger.record(model="m", input_tokens=1, feature="heartbeat", user_id="u1")
+    await ledger.flush()
+    async with llm_usage_scope("heartbeat", user_id="u1", background=True) as usage:
+        assert not usage.throttled
+    # Unflushed records count towards today's spend as well.
+    ledger.record(model="m", input_tokens=1, feature="heartbeat", user_id="u1")
+
+    unused_provider = SimpleNamespace()
+    async with llm_usage_scope("heartbeat", user_id="u1", background=True) as usage:
+        assert usage.throttled
+        with llm_usage_scope("heartbeat_message") as nested:
+            assert nested.throttled
+            assert generate_text(unused_provider, "prompt") is None
+            assert generate_text_with_status(unused_provider, "prompt")[1] == "llm_budget_exceeded"
+
+    # Other features and foreground scopes are not throttled.
+    async with llm_usage_scope("achievement", user_id="u1", background=True) as usage:
+        assert not usage.throttled
+    async with llm_usage_scope("heartbeat", user_id="u1") as usage:
+        assert not usage.throttled
+
+    status = await ledger.budget_status("u1")
+    assert status.spent_today_usd == pytest.approx(0.02)
+    assert status.feature_daily_budgets_usd == {"heartbeat": 0.02}
+
+
+@pytest.mark.parametrize("value", ["heartbeat=abc", "heartbeat", "=0.1", "heartbeat=-1"])
+def test_malformed_feature_budgets_fail_at_settings_load(value, monkeypatch):
+    from pydantic import ValidationError
+
+    from app.core.config import Settings
+
+    monkeypatch.setenv("LLM_FEATURE_DAILY_BUDGETS_USD", value)
+    with pytest.raises(ValidationError):
+        Settings()
+
+    monkeypatch.setenv("LLM_FEATURE_DAILY_BUDGETS_USD", " heartbeat=0.05, ,achievement=0.2")
+    assert Settings().llm_feature_daily_budgets == {"heartbeat": 0.05, "achievement": 0.2}
+
+
+@pytest.mark.asyncio
+async def test_agent_turns_attribute_tool_llm_calls_to_chat():
+    from app.services.agent_service import AgentService
+
+    seen = []
+
+    class _Runner:
+        async def run_async(self, user_id, session_id, new_message):
+            scope = llm_usage_service.current_llm_usage_scope()
+            seen.append((scope.feature, scope.user_id))
+            yield "event"
+
+    events = [event async for event in AgentService._run_agent(_Runner(), "u1", "s1", None)]
+    assert events == ["event"]
+    assert seen == [("chat", "u1")]
+    assert llm_usage_service.current_llm_usage_scope() is None
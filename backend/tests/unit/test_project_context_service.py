@@ -0,0 +1,118 @@
+"""
+Unit tests for batched member name resolution and project context bundles.
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.core.revisions import install_revision_tracking
+from app.infrastructure.local.project_member_repository import SqliteProjectMemberRepository
+from app.infrastructure.local.project_repository import SqliteProjectRepository
+from app.infrastructure.local.user_repository import SqliteUserRepository
+from app.models.collaboration import ProjectMemberCreate
+from app.models.project import ProjectCreate, ProjectUpdate
+from app.models.user import UserCreate, UserUpdate
+from app.services.project_context_service import (
+    load_project_context,
+    project_context_cache,
+    resolve_member_display_names,
+)
+
+
+def _user(index: int, **fields) -> UserCreate:
+    return UserCreate(
+        provider_issuer="local",
+        provider_sub=f"sub-{index}",
+        **fields,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_many_resolves_ids_emails_and_usernames_in_one_query(session_factory, query_budget):
+    repo = SqliteUserRepository(session_factory=session_factory)
+    by_id = await repo.create(_user(1, display_name="Aki"))
+    by_email = await repo.create(_user(2, email="ben@example.com", username="ben"))
+    by_username = await repo.create(_user(3, username="chika"))
+
+    identifiers = [str(by_id.id), "ben@example.com", "chika", "missing", str(uuid4())]
+    with query_budget(1):
+        resolved = await repo.get_many(identifiers)
+
+    assert {key: user.id for key, user in resolved.items()} == {
+        str(by_id.id): by_id.id,
+        "ben@example.com": by_email.id,
+        "chika": by_username.id,
+    }
+    with query_budget(1):
+        names = await resolve_member_display_names(repo, identifiers)
+    assert names == {str(by_id.id): "Aki", "ben@example.com": "ben", "chika": "chika"}
+
+
+class _CountingRepo:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    async def _call(self, *args, **kwargs):
+        self.calls += 1
+        return self.result
+
+
+@pytest.mark.asyncio
+async def test_project_context_is_shared_until_invalidated():
+    project_id = uuid4()
+    project = SimpleNamespace(id=project_id, name="Alpha")
+    projects = _CountingRepo(project)
+    members = _CountingRepo([SimpleNamespace(member_user_id="u1"), SimpleNamespace(member_user_id="u2")])
+    users = _CountingRepo({"u1": SimpleNamespace(display_name="Aki", username="aki")})
+    project_repo = SimpleNamespace(get=projects._call)
+    member_repo = SimpleNamespace(list_by_project=members._call)
+    user_repo = SimpleNamespace(get_many=users._call)
+
+    context = await load_project_context("owner", project_id, project_repo, member_repo, user_repo)
+    assert context.project is project
+    assert context.display_name("u1") == "Aki"
+    assert context.display_name("u2") == "u2"
+
+    assert await load_project_context("owner", project_id, project_repo, member_repo, user_repo) is context
+    assert (projects.calls, members.calls, users.calls) == (1, 1, 1)
+
+    project_context_cache.clear()
+    assert await load_project_context("owner", project_id, project_repo, member_repo, user_repo) is not context
+    assert (projects.calls, members.calls, users.calls) == (2, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_committed_writes_drop_the_cached_context(session_factory):
+    install_revision_tracking()
+    project_repo = SqliteProjectRepository(session_factory=session_factory)
+    member_repo = SqliteProjectMemberRepository(session_factory=session_factory)
+    user_repo = SqliteUserRepository(session_factory=session_factory)
+    member = await user_repo.create(_user(1, display_name="Aki"))
+    project = await project_repo.create("owner", ProjectCreate(name="Alpha"))
+    other = await project_repo.create("owner", ProjectCreate(name="Beta"))
+
+    async def load(project_id=project.id):
+        return await load_project_context("owner", project_id, project_repo, member_repo, user_repo)
+
+    context = await load()
+    other_context = await load(other.id)
+    assert context.member_names == {}
+
+    # Any committed write through the repositories invalidates, whoever calls it.
+    await member_repo.create("owner", project.id, ProjectMemberCreate(member_user_id=str(member.id)))
+    context = await load()
+    assert context.member_names == {str(member.id): "Aki"}
+    assert await load(other.id) is other_context
+
+    await project_repo.update("owner", project.id, ProjectUpdate(name="Alpha 2"))
+    context = await load()
+    assert context.project.name == "Alpha 2"
+
+    # Member names follow account renames; other account fields keep the bundles.
+    await user_repo.update(member.id, UserUpdate(timezone="UTC"))
+    assert await load() is context
+    await user_repo.update(member.id, UserUpdate(display_name="Aki N"))
+    assert (await load()).display_name(str(member.id)) == "Aki N"
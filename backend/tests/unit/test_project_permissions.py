@@ -4,26 +4,41 @@ from uuid import UUID, uuid4
 import pytest
 
 from app.core.exceptions import ForbiddenError, NotFoundError
+from app.core.revisions import DataChange
 from app.models.collaboration import ProjectMember
 from app.models.enums import ProjectRole, ProjectStatus, ProjectVisibility
+from app.models.enums import CreatedBy, TaskStatus
 from app.models.project import Project
+from app.models.task import Task
 from app.services.project_permissions import (
     ProjectAccess,
     ProjectAction,
+    _forget_scoped_access,
+    access_scope,
     ensure_project_action,
     get_project_access,
+    load_access_context,
+    resolve_task_access,
 )
 
 
 class FakeProjectRepo:
-    def __init__(self, project: Project | None):
+    def __init__(self, project: Project | None, *others: Project):
         self._project = project
+        self._projects = [p for p in (project, *others) if p]
+        self.list_calls = 0
+        self.get_calls = 0
 
     async def get(self, user_id: str, project_id: UUID) -> Project | None:
+        self.get_calls += 1
         if not self._project or self._project.id != project_id:
             return None
         return self._project
 
+    async def list(self, user_id: str, limit: int = 100) -> list[Project]:
+        self.list_calls += 1
+        return list(self._projects)
+
 
 class FakeProjectMemberRepo:
     def __init__(self, member: ProjectMember | None):
@@ -40,6 +55,28 @@ class FakeProjectMemberRepo:
             return None
         return self._member
 
+    async def list_by_member_user_id(self, member_user_id: str) -> list[ProjectMember]:
+        if self._member and self._member.member_user_id == member_user_id:
+            return [self._member]
+        return []
+
+
+class FakeTaskRepo:
+    def __init__(self, *tasks: Task):
+        self._tasks = {task.id: task for task in tasks}
+
+    async def get_owner_info(self, task_id: UUID):
+        task = self._tasks.get(task_id)
+        return (task.project_id, task.user_id) if task else None
+
+    async def get(self, user_id: str, task_id: UUID, project_id: UUID | None = None):
+        task = self._tasks.get(task_id)
+        if not task:
+            return None
+        if project_id:
+            return task if task.project_id == project_id else None
+        return task if task.user_id == user_id else None
+
 
 def _make_project(user_id: str) -> Project:
     now = datetime.utcnow()
@@ -130,3 +167,144 @@ def test_ensure_project_action_denies_member_update():
     access_wrapper = ProjectAccess(project=project, role=ProjectRole.MEMBER, owner_id=owner_id)
     with pytest.raises(ForbiddenError):
         ensure_project_action(access_wrapper, ProjectAction.PROJECT_UPDATE)
+
+
+def _make_task(user_id: str, project_id: UUID | None) -> Task:
+    now = datetime.utcnow()
+    return Task(
+        id=uuid4(),
+        user_id=user_id,
+        project_id=project_id,
+        title="Task",
+        status=TaskStatus.TODO,
+        created_by=CreatedBy.USER,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_access_context_resolves_roles_and_skips_non_members():
+    owner_id = "owner"
+    member_id = "member"
+    project = _make_project(owner_id)
+    unrelated = _make_project("someone-else")
+    member = _make_member(project.id, owner_id, member_id, ProjectRole.ADMIN)
+
+    context = await load_access_context(
+        member_id, FakeProjectRepo(project, unrelated), FakeProjectMemberRepo(member)
+    )
+
+    assert set(context.projects) == {project.id}
+    assert context.get(project.id).role == ProjectRole.ADMIN
+    assert context.get(project.id).owner_id == owner_id
+    assert context.get(unrelated.id) is None
+
+
+@pytest.mark.asyncio
+async def test_removed_member_loses_access_immediately():
+    owner_id = "owner"
+    member_id = "member"
+    project = _make_project(owner_id)
+    task = _make_task(owner_id, project.id)
+    project_repo = FakeProjectRepo(project)
+    member_repo = FakeProjectMemberRepo(_make_member(project.id, owner_id, member_id, ProjectRole.MEMBER))
+
+    await load_access_context(member_id, project_repo, member_repo)
+    assert (await get_project_access(member_id, project.id, project_repo, member_repo)).role == ProjectRole.MEMBER
+
+    # Membership removed (e.g. by a request served on another worker):
+    # nothing is reused from earlier loads.
+    member_repo._member = None
+    assert (await load_access_context(member_id, project_repo, member_repo)).get(project.id) is None
+    assert project_repo.list_calls == 2
+    with pytest.raises(ForbiddenError):
+        await get_project_access(member_id, project.id, project_repo, member_repo)
+    with pytest.raises(NotFoundError):
+        await resolve_task_access(member_id, task.id, FakeTaskRepo(task), project_repo, member_repo)
+
+
+@pytest.mark.asyncio
+async def test_resolve_task_access_for_member_project_task():
+    owner_id = "owner"
+    member_id = "member"
+    project = _make_project(owner_id)
+    member = _make_member(project.id, owner_id, member_id, ProjectRole.MEMBER)
+    task = _make_task(owner_id, project.id)
+
+    resolved, access = await resolve_task_access(
+        member_id,
+        task.id,
+        FakeTaskRepo(task),
+        FakeProjectRepo(project),
+        FakeProjectMemberRepo(member),
+    )
+
+    assert resolved.id == task.id
+    assert access.owner_id == owner_id
+
+
+@pytest.mark.asyncio
+async def test_resolve_task_access_hides_inaccessible_tasks():
+    project = _make_project("owner")
+    project_task = _make_task("owner", project.id)
+    personal_task = _make_task("owner", None)
+    task_repo = FakeTaskRepo(project_task, personal_task)
+
+    for task_id in (project_task.id, personal_task.id, uuid4()):
+        with pytest.raises(NotFoundError):
+            await resolve_task_access(
+                "outsider",
+                task_id,
+                task_repo,
+                FakeProjectRepo(project),
+                FakeProjectMemberRepo(None),
+            )
+
+
+@pytest.mark.asyncio
+async def test_access_scope_loads_the_context_once_per_user():
+    owner_id = "owner"
+    member_id = "member"
+    project = _make_project(owner_id)
+    task = _make_task(owner_id, project.id)
+    project_repo = FakeProjectRepo(project)
+    member_repo = FakeProjectMemberRepo(_make_member(project.id, owner_id, member_id, ProjectRole.MEMBER))
+
+    with access_scope():
+        for _ in range(3):
+            access = await get_project_access(member_id, project.id, project_repo, member_repo)
+            assert access.role == ProjectRole.MEMBER
+        await resolve_task_access(member_id, task.id, FakeTaskRepo(task), project_repo, member_repo)
+        await load_access_context(member_id, project_repo, member_repo)
+        # Projects outside the context still resolve through the repositories.
+        with pytest.raises(NotFoundError):
+            await get_project_access(member_id, uuid4(), project_repo, member_repo)
+
+    assert project_repo.list_calls == 1
+    assert project_repo.get_calls == 1
+
+    # Nothing outlives the scope.
+    member_repo._member = None
+    with pytest.raises(ForbiddenError):
+        await get_project_access(member_id, project.id, project_repo, member_repo)
+
+
+@pytest.mark.asyncio
+async def test_access_scope_drops_contexts_on_membership_commits():
+    owner_id = "owner"
+    member_id = "member"
+    project = _make_project(owner_id)
+    project_repo = FakeProjectRepo(project)
+    member_repo = FakeProjectMemberRepo(_make_member(project.id, owner_id, member_id, ProjectRole.MEMBER))
+
+    with access_scope() as contexts:
+        await get_project_access(member_id, project.id, project_repo, member_repo)
+        _forget_scoped_access([DataChange(table="tasks", op="updated")])
+        assert member_id in contexts
+
+        member_repo._member = None
+        _forget_scoped_access([DataChange(table="project_members", op="deleted")])
+        assert contexts == {}
+        with pytest.raises(ForbiddenError):
+            await get_project_access(member_id, project.id, project_repo, member_repo)
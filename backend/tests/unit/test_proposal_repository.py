@@ -0,0 +1,122 @@
+"""
+Unit tests for SQLite proposal repository.
+
+Tests persistence, expiry and atomic status transitions of proposals.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.infrastructure.local.proposal_repository import SqliteProposalRepository
+from app.models.proposal import Proposal, ProposalStatus, ProposalType
+
+
+@pytest.fixture
+def repository(db_session):
+    """Create repository with test session."""
+    def factory():
+        class SessionCtx:
+            async def __aenter__(self):
+                return db_session
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+        return SessionCtx()
+
+    return SqliteProposalRepository(session_factory=factory)
+
+
+def _make_proposal(user_id, session_id="session-1", **kwargs) -> Proposal:
+    return Proposal(
+        user_id=user_id,
+        session_id=session_id,
+        proposal_type=ProposalType.CREATE_TASK,
+        payload={"title": "提案タスク", "estimated_minutes": 30},
+        description="タスクを作成します",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_pending_skips_expired_and_decided(repository):
+    user_id = uuid4()
+    now = datetime.now()
+    older = await repository.create(_make_proposal(user_id, created_at=now - timedelta(minutes=5)))
+    newer = await repository.create(_make_proposal(user_id, session_id="session-2"))
+    expired = await repository.create(_make_proposal(user_id, expires_at=now - timedelta(minutes=1)))
+    decided = await repository.create(_make_proposal(user_id))
+    await repository.create(_make_proposal(uuid4()))
+    await repository.update_status(decided.id, ProposalStatus.REJECTED)
+
+    pending = await repository.list_pending(user_id)
+    assert [p.id for p in pending] == [newer.id, older.id]
+    assert pending[1].payload == {"title": "提案タスク", "estimated_minutes": 30}
+    assert [p.id for p in await repository.list_pending(user_id, "session-2")] == [newer.id]
+    # Expired proposals read as EXPIRED before the sweep stores it.
+    assert (await repository.get(expired.id)).status == ProposalStatus.EXPIRED
+
+
+@pytest.mark.asyncio
+async def test_status_transitions_are_conditional(repository):
+    user_id = uuid4()
+    proposal = await repository.create(_make_proposal(user_id))
+    expired = await repository.create(
+        _make_proposal(user_id, expires_at=datetime.now() - timedelta(minutes=1))
+    )
+
+    claimed = await repository.update_status(
+        proposal.id, ProposalStatus.APPROVED, expected_status=ProposalStatus.PENDING
+    )
+    assert claimed.status == ProposalStatus.APPROVED
+    # A second approval (e.g. on another worker) loses.
+    assert await repository.update_status(
+        proposal.id, ProposalStatus.APPROVED, expected_status=ProposalStatus.PENDING
+    ) is None
+    assert await repository.update_status(
+        expired.id, ProposalStatus.APPROVED, expected_status=ProposalStatus.PENDING
+    ) is None
+
+    others = [await repository.create(_make_proposal(user_id)) for _ in range(2)]
+    foreign = await repository.create(_make_proposal(uuid4()))
+    rejected = await repository.update_status_many(
+        user_id,
+        [proposal.id, expired.id, foreign.id, *(p.id for p in others)],
+        ProposalStatus.REJECTED,
+    )
+    assert sorted(rejected) == sorted(p.id for p in others)
+    assert (await repository.get(foreign.id)).status == ProposalStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_expiry_sweep(repository):
+    user_id = uuid4()
+    now = datetime.now()
+    stale = await repository.create(_make_proposal(user_id, expires_at=now - timedelta(hours=1)))
+    old = await repository.create(_make_proposal(user_id, expires_at=now - timedelta(days=10)))
+    fresh = await repository.create(_make_proposal(user_id))
+
+    assert await repository.expire_stale(now) == 2
+    assert await repository.purge(now - timedelta(days=7)) == 1
+    assert await repository.get(old.id) is None
+    assert (await repository.get(stale.id)).status == ProposalStatus.EXPIRED
+    assert (await repository.get(fresh.id)).status == ProposalStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_stale_executions_are_failed(repository):
+    user_id = uuid4()
+    stuck = await repository.create(_make_proposal(user_id))
+    running = await repository.create(_make_proposal(user_id))
+    for proposal in (stuck, running):
+        await repository.update_status(
+            proposal.id, ProposalStatus.EXECUTING, expected_status=ProposalStatus.PENDING
+        )
+    cutoff = datetime.now()
+    await repository.update_status(running.id, ProposalStatus.EXECUTING)
+
+    assert await repository.fail_stale_executions(cutoff) == 1
+    assert (await repository.get(stuck.id)).status == ProposalStatus.FAILED
+    assert (await repository.get(running.id)).status == ProposalStatus.EXECUTING
@@ -0,0 +1,164 @@
+"""
+Tests for the proposal approval API.
+
+Approvals claim a proposal (PENDING -> EXECUTING) before running its action
+and settle it as APPROVED or FAILED; rejections never touch other users'
+or processed proposals.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.api import deps, proposals
+from app.infrastructure.local.proposal_repository import SqliteProposalRepository
+from app.interfaces.auth_provider import User
+from app.models.proposal import ApprovalResult, Proposal, ProposalStatus, ProposalType
+
+USER_ID = str(uuid4())
+_REPO_DEPENDENCIES = (
+    deps.get_task_repository,
+    deps.get_task_assignment_repository,
+    deps.get_project_repository,
+    deps.get_phase_repository,
+    deps.get_milestone_repository,
+    deps.get_project_member_repository,
+    deps.get_project_invitation_repository,
+    deps.get_memory_repository,
+    deps.get_agent_task_repository,
+    deps.get_meeting_agenda_repository,
+    deps.get_recurring_meeting_repository,
+    deps.get_llm_provider,
+    deps.get_user_repository,
+)
+
+
+@pytest.fixture
+def repository(session_factory):
+    return SqliteProposalRepository(session_factory=session_factory)
+
+
+@pytest.fixture
+async def client(repository):
+    app = FastAPI()
+    app.include_router(proposals.router, prefix="/api/proposals")
+    app.dependency_overrides[deps.get_current_user] = lambda: User(id=USER_ID)
+    app.dependency_overrides[deps.get_proposal_repository] = lambda: repository
+    for dependency in _REPO_DEPENDENCIES:
+        app.dependency_overrides[dependency] = lambda: None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+async def _proposal(repository, user_id: str = USER_ID) -> Proposal:
+    return await repository.create(
+        Proposal(
+            user_id=user_id,
+            session_id="session-1",
+            proposal_type=ProposalType.CREATE_TASK,
+            payload={"title": "提案タスク"},
+            description="タスクを作成します",
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_approve_settles_executed_and_failed_proposals(client, repository, monkeypatch):
+    statuses = []
+
+    async def _execute(proposal, user, **repos):
+        statuses.append((await repository.get(proposal.id)).status)
+        if proposal.payload.get("fail"):
+            raise RuntimeError("boom")
+        return ApprovalResult(task_id="task-1")
+
+    monkeypatch.setattr(proposals, "_execute_proposal", _execute)
+    approved = await _proposal(repository)
+    failing = await repository.create(
+        (await _proposal(repository)).model_copy(update={"id": uuid4(), "payload": {"fail": True}})
+    )
+
+    response = await client.post(f"/api/proposals/{approved.id}/approve")
+    assert response.status_code == 200
+    assert response.json()["task_id"] == "task-1"
+    # The action runs while the proposal is claimed.
+    assert statuses == [ProposalStatus.EXECUTING]
+    assert (await repository.get(approved.id)).status == ProposalStatus.APPROVED
+    assert (await client.post(f"/api/proposals/{approved.id}/approve")).status_code == 400
+
+    with pytest.raises(RuntimeError):
+        await client.post(f"/api/proposals/{failing.id}/approve")
+    # A failed (possibly partial) execution is not re-approvable.
+    assert (await repository.get(failing.id)).status == ProposalStatus.FAILED
+    assert (await client.post(f"/api/proposals/{failing.id}/approve")).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_concurrent_approvals_execute_once(client, repository, monkeypatch):
+    started = asyncio.Event()
+    release = asyncio.Event()
+    executed = []
+
+    async def _execute(proposal, user, **repos):
+        executed.append(proposal.id)
+        started.set()
+        await release.wait()
+        return ApprovalResult()
+
+    monkeypatch.setattr(proposals, "_execute_proposal", _execute)
+    proposal = await _proposal(repository)
+
+    first = asyncio.create_task(client.post(f"/api/proposals/{proposal.id}/approve"))
+    await started.wait()
+    real_get = repository.get
+
+    async def _stale_get(proposal_id):
+        # The second request read the proposal before the first claimed it.
+        return (await real_get(proposal_id)).model_copy(update={"status": ProposalStatus.PENDING})
+
+    monkeypatch.setattr(repository, "get", _stale_get)
+    second = await client.post(f"/api/proposals/{proposal.id}/approve")
+    monkeypatch.setattr(repository, "get", real_get)
+    release.set()
+
+    assert second.status_code == 409
+    assert (await first).status_code == 200
+    assert executed == [proposal.id]
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_and_reject(client, repository, monkeypatch):
+    async def _execute(proposal, user, **repos):
+        if proposal.payload.get("fail"):
+            raise RuntimeError("boom")
+        return ApprovalResult(task_id=str(proposal.id))
+
+    monkeypatch.setattr(proposals, "_execute_proposal", _execute)
+    ok = await _proposal(repository)
+    failing = await repository.create(
+        (await _proposal(repository)).model_copy(update={"id": uuid4(), "payload": {"fail": True}})
+    )
+    missing = uuid4()
+
+    response = await client.post(
+        "/api/proposals/approve", json={"proposal_ids": [str(ok.id), str(failing.id), str(missing)]}
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["status"] for item in results] == ["approved", "failed", "failed"]
+    assert results[0]["result"]["task_id"] == str(ok.id)
+    assert results[2]["detail"] == "Proposal not found"
+    assert (await repository.get(failing.id)).status == ProposalStatus.FAILED
+
+    pending = await _proposal(repository)
+    foreign = await _proposal(repository, user_id=str(uuid4()))
+    response = await client.post(
+        "/api/proposals/reject",
+        json={"proposal_ids": [str(pending.id), str(ok.id), str(foreign.id)]},
+    )
+    assert response.json()["rejected"] == [str(pending.id)]
+    assert (await repository.get(foreign.id)).status == ProposalStatus.PENDING
+    assert (await repository.get(ok.id)).status == ProposalStatus.APPROVED
@@ -0,0 +1,81 @@
+"""
+Unit tests for SQL statement counting and query budgets.
+"""
+
+import pytest
+
+from app.core.query_counter import count_queries
+from app.infrastructure.local.issue_repository import SqliteIssueRepository
+from app.infrastructure.local.project_repository import SqliteProjectRepository
+from app.infrastructure.local.task_repository import SqliteTaskRepository
+from app.models.enums import CreatedBy, IssueCategory, TaskStatus
+from app.models.issue import IssueCreate
+from app.models.project import ProjectCreate
+from app.models.task import TaskCreate, TaskUpdate
+
+
+@pytest.mark.asyncio
+async def test_nested_scopes_count_and_flag_repeated_shapes(session_factory, test_user_id):
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    task = await repo.create(test_user_id, TaskCreate(title="Task", created_by=CreatedBy.USER))
+
+    with count_queries("outer", warn=False) as outer:
+        with count_queries("inner", warn=False) as inner:
+            for _ in range(3):
+                await repo.get(test_user_id, task.id)
+        await repo.get_many([task.id, task.id])
+
+    assert inner.total == 3
+    assert outer.total == 4
+    (shape, count), = inner.repeated(3)
+    assert count == 3 and shape.startswith("SELECT")
+    # Expanded IN lists collapse into one shape.
+    assert any("IN (?...)" in shape for shape in outer.shapes)
+
+
+@pytest.mark.asyncio
+async def test_project_task_counts_use_a_fixed_number_of_queries(
+    session_factory, test_user_id, query_budget
+):
+    project_repo = SqliteProjectRepository(session_factory=session_factory)
+    task_repo = SqliteTaskRepository(session_factory=session_factory)
+    projects = [
+        await project_repo.create(test_user_id, ProjectCreate(name=f"Project {i}"))
+        for i in range(5)
+    ]
+    for i, project in enumerate(projects):
+        for j in range(i):
+            task = await task_repo.create(
+                test_user_id,
+                TaskCreate(title=f"Task {i}-{j}", project_id=project.id, created_by=CreatedBy.USER),
+            )
+            if j == 0:
+                await task_repo.update(test_user_id, task.id, TaskUpdate(status=TaskStatus.DONE))
+
+    with query_budget(2):
+        counted = await project_repo.list_with_task_count(test_user_id)
+
+    by_name = {project.name: project for project in counted}
+    assert by_name["Project 0"].total_tasks == 0
+    assert by_name["Project 4"].total_tasks == 4
+    assert by_name["Project 4"].completed_tasks == 1
+    assert by_name["Project 4"].unassigned_tasks == 3
+
+
+@pytest.mark.asyncio
+async def test_issue_list_uses_a_fixed_number_of_queries(session_factory, query_budget):
+    repo = SqliteIssueRepository(session_factory=session_factory)
+    issues = [
+        await repo.create(
+            f"user-{i}",
+            IssueCreate(title=f"Issue {i}", content="content", category=IssueCategory.FEATURE_REQUEST),
+        )
+        for i in range(4)
+    ]
+    await repo.like(issues[1].id, "viewer")
+
+    with query_budget(4):
+        listed, total = await repo.list_all(current_user_id="viewer")
+
+    assert total == 4
+    assert {issue.title for issue in listed if issue.liked_by_me} == {"Issue 1"}
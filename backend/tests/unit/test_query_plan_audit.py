@@ -0,0 +1,92 @@
+"""
+Tests for composite index migrations and the query plan audit.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.local.database import Base
+from app.infrastructure.local.migrations import COMPOSITE_INDEXES, ensure_composite_indexes
+from app.infrastructure.local.query_plan_audit import audit_query_plans, find_full_scans
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_ensure_composite_indexes_is_idempotent(engine):
+    expected = [name for group in COMPOSITE_INDEXES.values() for name, _, _ in group]
+    async with engine.begin() as conn:
+        assert await ensure_composite_indexes(conn) == expected
+        assert await ensure_composite_indexes(conn) == []
+
+
+@pytest.mark.asyncio
+async def test_query_catalog_has_no_full_scans(engine):
+    async with engine.begin() as conn:
+        await ensure_composite_indexes(conn)
+    reports = await audit_query_plans(engine)
+
+    scans = {report.name: report.full_scans for report in reports if not report.ok}
+    assert scans == {}
+    # Plans come from the SQL the repositories actually issued.
+    assert all(report.statements for report in reports)
+    by_name = {report.name: report for report in reports}
+    assert any("search_terms" in statement for statement in by_name["tasks.search_by_keywords"].statements)
+    assert any("idx_tasks_user_status" in line for line in by_name["tasks.list_by_status"].plan)
+    assert not by_name["chat_messages.list_recent"].temp_sorts
+
+
+def test_find_full_scans_ignores_index_searches():
+    plan = [
+        "SEARCH tasks USING INDEX idx_tasks_user_status (user_id=? AND status=?)",
+        "SCAN projects",
+        "SCAN projects USING INDEX sqlite_autoindex_projects_1",
+        "SCAN CONSTANT ROW",
+    ]
+    assert find_full_scans(plan) == [
+        "SCAN projects",
+        "SCAN projects USING INDEX sqlite_autoindex_projects_1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_seeks_only_the_users_postings(engine):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from app.infrastructure.local.task_repository import SqliteTaskRepository
+    from app.models.task import TaskCreate
+    from app.utils.search_terms import MAX_TERM_LENGTH, extract_document_terms
+
+    async with engine.begin() as conn:
+        await ensure_composite_indexes(conn)
+    repo = SqliteTaskRepository(session_factory=async_sessionmaker(engine, expire_on_commit=False))
+    for index in range(30):
+        await repo.create(f"other-{index}", TaskCreate(title=f"alpha analysis architecture {index}"))
+    mine = await repo.create("me", TaskCreate(title="Data migration plan"))
+
+    found = []
+
+    async def _search(repos):
+        found.extend(await repos.tasks.search_by_keywords("me", ["a"]))
+
+    report = (await audit_query_plans(engine, {"search": _search}))[0]
+
+    assert found == [mine.id]
+    term_lines = [line for line in report.plan if "search_terms" in line]
+    assert term_lines and not report.full_scans
+    # Own terms are sought by (user_id, term); other drives start from entity IDs.
+    assert all(
+        "idx_search_terms_user_term (user_id=? AND term>? AND term<?)" in line
+        or "ix_search_terms_entity_id (entity_id=?)" in line
+        for line in term_lines
+    )
+    # Suffix expansion is capped: a long word costs a bounded number of short terms.
+    terms = extract_document_terms(["x" * 200 + "y"])
+    assert max(map(len, terms)) <= MAX_TERM_LENGTH
@@ -0,0 +1,189 @@
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.core.revisions import (
+    GLOBAL_SCOPE,
+    DataRevisions,
+    add_commit_listener,
+    data_revisions,
+    install_revision_tracking,
+    remove_commit_listener,
+)
+from app.infrastructure.local.database import (
+    AgentTaskORM,
+    ChatMessageORM,
+    TaskAssignmentORM,
+    TaskORM,
+)
+from app.infrastructure.local.realtime_broker import InProcessRealtimeBroker, SqliteRealtimeBroker
+from app.models.realtime import RealtimeEvent
+from app.services.realtime_service import RealtimeChangeFeed, RealtimeManager, Subscription
+
+
+def _change(entity_id: str, op: str = "updated", fields=(), **kwargs) -> RealtimeEvent:
+    return RealtimeEvent(kind="task", op=op, id=entity_id, fields=list(fields), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_subscription_coalesces_filters_and_resyncs():
+    subscription = Subscription("user-1", kinds=["task"], project_ids=["p1"], max_size=3)
+
+    subscription.put(_change("t1", op="created"))
+    subscription.put(_change("t1", fields=["title"]))
+    subscription.put(RealtimeEvent(kind="project", op="updated", id="p1"))
+    subscription.put(_change("t2", project_id="p2"))
+    assert subscription.pending() == 1
+    merged = await subscription.get(timeout=0.1)
+    assert (merged.op, merged.id) == ("created", "t1")
+
+    subscription.put(_change("t3", fields=["title"]))
+    subscription.put(_change("t3", fields=["status"]))
+    assert (await subscription.get()).fields == ["status", "title"]
+    assert await subscription.get(timeout=0.01) is None
+
+    for index in range(4):
+        subscription.put(_change(f"t{index + 10}"))
+    assert subscription.pending() == 1
+    assert (await subscription.get()).type == "resync"
+    assert subscription.dropped == 4
+
+
+@pytest.mark.asyncio
+async def test_committed_changes_reach_project_members(db_session, monkeypatch):
+    install_revision_tracking()
+    manager = RealtimeManager(InProcessRealtimeBroker())
+    feed = RealtimeChangeFeed(manager)
+    project_id, task_id = str(uuid4()), str(uuid4())
+
+    async def _audience(project):
+        return {"owner", "member"} if project == project_id else set()
+
+    async def _parents(changes):
+        return {("task", task_id): (project_id, "owner")}
+
+    monkeypatch.setattr(feed, "_project_audience", _audience)
+    monkeypatch.setattr(feed, "_load_parents", _parents)
+    member = await manager.connect("member")
+    outsider = await manager.connect("outsider")
+    committed = []
+    add_commit_listener(committed.extend)
+    try:
+        db_session.add(TaskORM(id=task_id, user_id="owner", project_id=project_id, title="t"))
+        db_session.add(ChatMessageORM(id=str(uuid4()), session_id="s", user_id="owner", role="user"))
+        await db_session.commit()
+        db_session.add(TaskAssignmentORM(id=str(uuid4()), user_id="owner", task_id=task_id, assignee_id="member"))
+        await db_session.commit()
+    finally:
+        remove_commit_listener(committed.extend)
+
+    await feed.dispatch(committed)
+    task_event = await asyncio.wait_for(member.get(), 1)
+    assignment_event = await asyncio.wait_for(member.get(), 1)
+    assert (task_event.kind, task_event.op, task_event.id) == ("task", "created", task_id)
+    assert (assignment_event.kind, assignment_event.project_id, assignment_event.task_id) == (
+        "task_assignment",
+        project_id,
+        task_id,
+    )
+    assert member.pending() == 0
+    assert outsider.pending() == 0
+    assert manager.stats()["connections"] == 2
+
+
+@pytest.mark.asyncio
+async def test_unscoped_bulk_changes_never_fan_out_globally(monkeypatch):
+    from app.core.revisions import DataChange
+
+    manager = RealtimeManager(InProcessRealtimeBroker())
+    feed = RealtimeChangeFeed(manager)
+
+    async def _audience(project):
+        return {"owner", "member"}
+
+    monkeypatch.setattr(feed, "_project_audience", _audience)
+    member = await manager.connect("member")
+    outsider = await manager.connect("outsider")
+    # e.g. a milestone delete clears milestone_id on its tasks in bulk.
+    bulk = DataChange(table="tasks", op="updated")
+
+    await feed.dispatch([bulk])
+    assert outsider.pending() == 0
+    assert feed.stats()["unscoped_dropped"] == 1
+
+    await feed.dispatch([DataChange(table="milestones", op="deleted", entity_id="m1", project_id="p1"), bulk])
+    assert [(await member.get()).kind for _ in range(2)] == ["milestone", "task"]
+    assert outsider.pending() == 0
+
+
+@pytest.mark.asyncio
+async def test_sqlite_broker_relays_events_between_processes(db_session):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    worker_a = RealtimeManager(SqliteRealtimeBroker(factory))
+    worker_b = RealtimeManager(SqliteRealtimeBroker(factory))
+    local = await worker_a.connect("user-1")
+    remote = await worker_b.connect("user-1")
+    other = await worker_b.connect("user-2")
+
+    await worker_a.publish("user-1", _change("t1"))
+    await worker_a.publish_all(_change("t2"))
+    assert local.pending() == 2
+    assert remote.pending() == 0
+
+    assert await worker_b.broker.poll() == 2
+    assert [(await remote.get()).id for _ in range(2)] == ["t1", "t2"]
+    assert (await other.get()).id == "t2"
+    # Events are relayed once, and never back to their publisher.
+    assert await worker_b.broker.poll() == 0
+    assert await worker_a.broker.poll() == 0
+    stats = worker_b.stats()
+    assert (stats["broker"], stats["received"], stats["connections"]) == ("sqlite", 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_revisions_of_every_tracked_write_reach_other_workers(db_session):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    install_revision_tracking()
+    factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    worker_a = RealtimeManager(SqliteRealtimeBroker(factory))
+    worker_b = RealtimeManager(SqliteRealtimeBroker(factory))
+    feed = RealtimeChangeFeed(worker_a, session_factory=factory)
+    local = await worker_a.connect("user-1")
+    remote = await worker_b.connect("user-1")
+    await feed.start()
+    try:
+        # agent_tasks is tracked but publishes no change event.
+        db_session.add(AgentTaskORM(user_id="user-1", trigger_time=datetime.now(), action_type="remind"))
+        await db_session.commit()
+    finally:
+        await feed.stop()
+
+    # Simulate worker B's own (untouched) revision table.
+    data_revisions.clear()
+    assert await worker_b.broker.poll() == 1
+    assert data_revisions.get(("user", "user-1")) == 1
+    assert data_revisions.get(GLOBAL_SCOPE) == 0
+    # Revision events are never delivered to connections.
+    assert local.pending() == 0
+    assert remote.pending() == 0
+
+
+def test_data_revisions_are_bounded_without_repeating_keys():
+    revisions = DataRevisions(max_scopes=3)
+    revisions.bump([("user", "a")])
+    key_a = revisions.key(users=["a"])
+    revisions.bump([("user", "b")])
+    revisions.bump([("user", "c"), ("project", "p")])
+
+    assert len(revisions) <= 3
+    assert revisions.get(("user", "a")) == 0
+    # The evicted scope restarts at 0, but the global epoch moved on.
+    assert revisions.get(GLOBAL_SCOPE) == 1
+    assert revisions.key(users=["a"]) != key_a
+    revisions.bump([("user", "d")])
+    assert revisions.get(GLOBAL_SCOPE) == 2
@@ -0,0 +1,94 @@
+"""
+Unit tests for schedule snapshot repository.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.infrastructure.local.schedule_snapshot_repository import (
+    SqliteScheduleSnapshotRepository,
+)
+from app.models.schedule_snapshot import (
+    ScheduleSnapshotCreate,
+    SnapshotDayAllocation,
+    SnapshotTaskScheduleInfo,
+)
+
+
+def _schedule_data() -> dict:
+    return {
+        "start_date": date(2025, 1, 6),
+        "tasks": [
+            SnapshotTaskScheduleInfo(task_id=uuid4(), title="Design", total_minutes=120),
+            SnapshotTaskScheduleInfo(task_id=uuid4(), title="Build", total_minutes=90),
+        ],
+        "days": [
+            SnapshotDayAllocation(date=date(2025, 1, 6), capacity_minutes=480, allocated_minutes=120),
+            SnapshotDayAllocation(date=date(2025, 1, 7), capacity_minutes=480, allocated_minutes=90),
+        ],
+        "phase_buffers": [],
+        "total_buffer_minutes": 60,
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_stores_summary_columns(session_factory, test_user_id):
+    repo = SqliteScheduleSnapshotRepository(session_factory=session_factory)
+    project_id = uuid4()
+
+    snapshot = await repo.create(
+        test_user_id, project_id, ScheduleSnapshotCreate(name="Base"), _schedule_data()
+    )
+
+    assert len(snapshot.tasks) == 2
+    assert len(snapshot.days) == 2
+
+    summaries = await repo.list_by_project(test_user_id, project_id)
+    assert len(summaries) == 1
+    summary = summaries[0]
+    assert summary.id == snapshot.id
+    assert summary.task_count == 2
+    assert summary.total_task_minutes == 210
+    assert summary.start_date == date(2025, 1, 6)
+    assert summary.end_date == date(2025, 1, 7)
+    assert summary.total_buffer_minutes == 60
+    assert summary.buffer_percentage == 100.0
+
+
+@pytest.mark.asyncio
+async def test_get_and_activate_load_payload(session_factory, test_user_id):
+    repo = SqliteScheduleSnapshotRepository(session_factory=session_factory)
+    project_id = uuid4()
+    first = await repo.create(
+        test_user_id, project_id, ScheduleSnapshotCreate(name="First"), _schedule_data()
+    )
+    await repo.create(
+        test_user_id, project_id, ScheduleSnapshotCreate(name="Second"), _schedule_data()
+    )
+
+    # A repository on its own sessions has nothing in an identity map: the
+    # payload columns must be loaded from the database.
+    fresh_repo = SqliteScheduleSnapshotRepository(
+        session_factory=async_sessionmaker(session_factory().bind, expire_on_commit=False)
+    )
+    fetched = await fresh_repo.get(test_user_id, first.id)
+    assert fetched is not None
+    assert [t.title for t in fetched.tasks] == ["Design", "Build"]
+    assert len(fetched.days) == 2
+    assert fetched.total_buffer_minutes == 60
+
+    activated = await repo.activate(test_user_id, first.id)
+    assert activated.is_active is True
+    assert len(activated.days) == 2
+
+    updated = await repo.update_consumed_buffer(test_user_id, first.id, 30)
+    assert updated.consumed_buffer_minutes == 30
+    assert len(updated.tasks) == 2
+
+    assert await repo.delete(test_user_id, first.id) is True
+    assert await repo.delete(test_user_id, first.id) is False
+    remaining = await repo.list_by_project(test_user_id, project_id)
+    assert [s.name for s in remaining] == ["Second"]
@@ -0,0 +1,207 @@
+"""
+Golden tests for SchedulerService.build_schedule.
+
+Randomised but seeded task sets (dependencies, subtasks, touchpoints, energy
+mixes, tied scores, multiple assignees, meetings, pins) are scheduled and the
+resulting day allocations are compared against digests recorded from the
+reference implementation, so changes to candidate selection must produce
+identical schedules.
+"""
+
+import hashlib
+import json
+import random
+from datetime import date, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.models.collaboration import ProjectMember, TaskAssignment
+from app.models.enums import CreatedBy, EnergyLevel, Priority, TaskStatus
+from app.models.task import Task
+from app.services.scheduler_service import SchedulerService
+
+START = date(2099, 1, 5)
+BASE_TIME = datetime(2098, 12, 1, 9, 0)
+MEMBERS = ("alice", "bob", "carol")
+
+
+def _task(rng: random.Random, index: int, **overrides) -> Task:
+    # Coarse created_at buckets make score/due/created ties common.
+    created = BASE_TIME + timedelta(hours=rng.randint(0, 5))
+    fields = dict(
+        id=UUID(int=index + 1),
+        user_id="golden_user",
+        title=f"T{index}",
+        status=rng.choice([TaskStatus.TODO] * 3 + [TaskStatus.IN_PROGRESS]),
+        importance=rng.choice(list(Priority)),
+        urgency=rng.choice(list(Priority)),
+        energy_level=rng.choice(list(EnergyLevel)),
+        estimated_minutes=rng.choice([None, 15, 30, 45, 60, 90, 120, 240]),
+        progress=rng.choice([0, 0, 0, 25, 50, 90]),
+        created_by=CreatedBy.USER,
+        created_at=created,
+        updated_at=created,
+    )
+    fields.update(overrides)
+    return Task(**fields)
+
+
+def _build_scenario(seed: int) -> dict:
+    rng = random.Random(seed)
+    count = rng.randint(8, 40)
+    tasks: list[Task] = []
+    parents: list[UUID] = []
+    for index in range(count):
+        overrides: dict = {}
+        roll = rng.random()
+        if roll < 0.3:
+            overrides["due_date"] = datetime.combine(
+                START + timedelta(days=rng.randint(-1, 12)), datetime.min.time()
+            )
+        if rng.random() < 0.15:
+            overrides["start_not_before"] = datetime.combine(
+                START + timedelta(days=rng.randint(1, 5)), datetime.min.time()
+            )
+        if tasks and rng.random() < 0.3:
+            overrides["dependency_ids"] = rng.sample(
+                [t.id for t in tasks], k=min(len(tasks), rng.randint(1, 2))
+            )
+        if parents and rng.random() < 0.3:
+            overrides["parent_id"] = rng.choice(parents)
+            overrides["same_day_allowed"] = rng.random() < 0.5
+            overrides["min_gap_days"] = rng.choice([0, 0, 1, 2])
+        elif rng.random() < 0.1:
+            parents.append(UUID(int=index + 1))
+        if rng.random() < 0.1:
+            overrides["touchpoint_count"] = rng.randint(2, 4)
+            overrides["touchpoint_gap_days"] = rng.choice([0, 1, 2])
+        if rng.random() < 0.05:
+            overrides["pinned_date"] = datetime.combine(
+                START + timedelta(days=rng.randint(0, 3)), datetime.min.time()
+            )
+        tasks.append(_task(rng, index, **overrides))
+
+    for day_offset in range(rng.randint(0, 3)):
+        day = START + timedelta(days=day_offset)
+        begin = datetime.combine(day, datetime.min.time()) + timedelta(hours=rng.randint(1, 6))
+        tasks.append(
+            _task(
+                rng,
+                count + day_offset,
+                is_fixed_time=True,
+                start_time=begin,
+                end_time=begin + timedelta(minutes=rng.choice([30, 60, 90])),
+            )
+        )
+
+    scenario: dict = {"tasks": tasks, "capacity_hours": rng.choice([2, 4, 6, 8])}
+    if seed % 3 == 0:
+        now = BASE_TIME
+        scenario["members"] = [
+            ProjectMember(
+                id=uuid4(),
+                user_id="golden_user",
+                project_id=UUID(int=999),
+                member_user_id=member,
+                capacity_hours=rng.choice([None, 3, 5]),
+                created_at=now,
+                updated_at=now,
+            )
+            for member in MEMBERS
+        ]
+        scenario["assignments"] = [
+            TaskAssignment(
+                id=uuid4(),
+                user_id="golden_user",
+                task_id=task.id,
+                assignee_id=rng.choice(MEMBERS),
+                created_at=now,
+                updated_at=now,
+            )
+            for task in tasks
+            if rng.random() < 0.8
+        ]
+        scenario["current_user_id"] = "alice"
+    return scenario
+
+
+def _build(scenario: dict, prefix_days=None):
+    return SchedulerService().build_schedule(
+        scenario["tasks"],
+        start_date=START,
+        capacity_hours=scenario["capacity_hours"],
+        max_days=30,
+        current_user_id=scenario.get("current_user_id"),
+        assignments=scenario.get("assignments"),
+        members=scenario.get("members"),
+        prefix_days=prefix_days,
+    )
+
+
+def _payload(scenario: dict, schedule) -> dict:
+    titles = {task.id: task.title for task in scenario["tasks"]}
+    return {
+        "days": [
+            [
+                day.date.isoformat(),
+                day.allocated_minutes,
+                day.overflow_minutes,
+                [[titles[a.task_id], a.minutes] for a in day.task_allocations],
+            ]
+            for day in schedule.days
+        ],
+        "unscheduled": [[titles[u.task_id], u.reason] for u in schedule.unscheduled_task_ids],
+    }
+
+
+def _schedule_digest(seed: int) -> str:
+    scenario = _build_scenario(seed)
+    encoded = json.dumps(_payload(scenario, _build(scenario)), separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+# Recorded from the list-based candidate selection (pre heap refactor).
+GOLDEN_DIGESTS = {
+    1: "ad574db8e6e64d1a",
+    2: "8fb42ad4a5b80bfb",
+    3: "d1c96d415bceb149",
+    4: "5f8350095d0a4093",
+    5: "334a2fb78afcdd5f",
+    6: "c7cf90d15b666be6",
+    7: "b3e621583aefabd1",
+    8: "1c367b4ac883b07f",
+    9: "245d2e65bbafabd6",
+    10: "481453e6c5c4a2a7",
+    11: "ef28d5c5e4e29e39",
+    12: "2159f5e071005fb8",
+    13: "8996db6868c8f054",
+    14: "94e6f14c5f42f63e",
+    15: "5aff4bb7e3de49c1",
+    16: "471eebe8485ed2fa",
+    17: "c1d06bfea67924a2",
+    18: "45d18425898f4ee4",
+    19: "6e7c23cc940224b4",
+    20: "c649ea2907a7dd61",
+    21: "4eecb3e9e0453772",
+    22: "9378cd0ab6735dff",
+    23: "55ccbceffb7fa19d",
+    24: "47c964f45bf0b3cc",
+}
+
+
+@pytest.mark.parametrize("seed", sorted(GOLDEN_DIGESTS))
+def test_schedule_matches_golden(seed: int):
+    assert _schedule_digest(seed) == GOLDEN_DIGESTS[seed]
+
+
+@pytest.mark.parametrize("seed", [1, 3, 6, 8, 12, 21])
+def test_resuming_after_prefix_reproduces_full_schedule(seed: int):
+    scenario = _build_scenario(seed)
+    full = _payload(scenario, _build(scenario))
+    for prefix_length in (1, 3, 7):
+        prefix = _build(scenario).days[:prefix_length]
+        resumed = _build(scenario, prefix_days=prefix)
+        assert _payload(scenario, resumed) == full
+        planned_start = {info.task_id: info.planned_start for info in _build(scenario).tasks}
+        assert {info.task_id: info.planned_start for info in resumed.tasks} == planned_start
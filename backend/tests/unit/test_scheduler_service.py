@@ -816,3 +816,4 @@ def test_warmup_prefers_low_energy_first():
     )
 
     assert first_allocation.task_id == low_task.id
+
@@ -81,24 +81,42 @@ def _make_assignment(*, task_id: UUID, assignee_id: str, owner_id: str) -> TaskA
 class MockTaskRepository:
     """Mock task repository with methods used by apply_schedule_request."""
 
-    def __init__(self, tasks: list[Task]):
+    def __init__(
+        self,
+        tasks: list[Task],
+        assignments: list[TaskAssignment] | None = None,
+        projects: list[Project] | None = None,
+    ):
         self.tasks = {task.id: task for task in tasks}
+        self.assignments = assignments or []
+        self.team_project_ids = {
+            project.id for project in projects or [] if project.visibility == ProjectVisibility.TEAM
+        }
 
-    async def list(
+    async def search_by_keywords(
         self,
         user_id: str,
+        keywords: list[str],
         project_id: UUID | None = None,
-        status: str | None = None,
-        parent_id: UUID | None = None,
         include_done: bool = False,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> list[Task]:
-        del project_id, status, parent_id
-        tasks = [task for task in self.tasks.values() if task.user_id == user_id]
-        if not include_done:
-            tasks = [task for task in tasks if task.status != TaskStatus.DONE]
-        return tasks[offset:offset + limit]
+        leaf_only: bool = False,
+        limit: int = 50,
+    ) -> list[UUID]:
+        assigned_ids = {a.task_id for a in self.assignments if a.assignee_id == user_id}
+        matches = []
+        for task in self.tasks.values():
+            in_scope = task.id in assigned_ids or (
+                task.user_id == user_id and task.project_id not in self.team_project_ids
+            )
+            if not in_scope or (project_id and task.project_id != project_id):
+                continue
+            if not include_done and task.status == TaskStatus.DONE:
+                continue
+            if leaf_only and any(t.parent_id == task.id for t in self.tasks.values()):
+                continue
+            if any(keyword.lower() in task.title.lower() for keyword in keywords):
+                matches.append(task.id)
+        return matches[:limit]
 
     async def update(
         self,
@@ -117,32 +135,14 @@ class MockTaskRepository:
         return [self.tasks[task_id] for task_id in task_ids if task_id in self.tasks]
 
 
-class MockTaskAssignmentRepository:
-    """Mock assignment repository with list_for_assignee support."""
-
-    def __init__(self, assignments: list[TaskAssignment]):
-        self.assignments = assignments
-
-    async def list_for_assignee(self, user_id: str) -> list[TaskAssignment]:
-        return [assignment for assignment in self.assignments if assignment.assignee_id == user_id]
-
-
 class MockProjectRepository:
-    """Mock project repository with list support."""
+    """Mock project repository with get_many support."""
 
     def __init__(self, projects: list[Project]):
         self.projects = projects
 
-    async def list(
-        self,
-        user_id: str,
-        status: str | None = None,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> list[Project]:
-        del status
-        projects = [project for project in self.projects if project.user_id == user_id]
-        return projects[offset:offset + limit]
+    async def get_many(self, project_ids: list[UUID]) -> list[Project]:
+        return [project for project in self.projects if project.id in project_ids]
 
 
 @pytest.mark.asyncio
@@ -151,13 +151,11 @@ async def test_apply_schedule_request_pins_focus_task_for_today() -> None:
     focus_task = _make_task(title="Prepare design proposal", user_id=user_id)
     other_task = _make_task(title="Clean inbox", user_id=user_id)
     task_repo = MockTaskRepository([focus_task, other_task])
-    assignment_repo = MockTaskAssignmentRepository([])
     project_repo = MockProjectRepository([])
 
     result = await apply_schedule_request(
         user_id=user_id,
         task_repo=task_repo,
-        assignment_repo=assignment_repo,
         project_repo=project_repo,
         input_data=ApplyScheduleRequestInput(
             request="I want to focus on design today",
@@ -180,18 +178,21 @@ async def test_apply_schedule_request_excludes_unassigned_team_tasks() -> None:
     team_project_id = uuid4()
     assigned_task = _make_task(title="API refactor", user_id=user_id, project_id=team_project_id)
     unassigned_task = _make_task(title="API docs", user_id=user_id, project_id=team_project_id)
-    task_repo = MockTaskRepository([assigned_task, unassigned_task])
-    assignment_repo = MockTaskAssignmentRepository(
-        [_make_assignment(task_id=assigned_task.id, assignee_id=user_id, owner_id=user_id)]
-    )
-    project_repo = MockProjectRepository(
-        [_make_project(project_id=team_project_id, user_id=user_id, visibility=ProjectVisibility.TEAM)]
+    projects = [
+        _make_project(project_id=team_project_id, user_id=user_id, visibility=ProjectVisibility.TEAM)
+    ]
+    task_repo = MockTaskRepository(
+        [assigned_task, unassigned_task],
+        assignments=[
+            _make_assignment(task_id=assigned_task.id, assignee_id=user_id, owner_id=user_id)
+        ],
+        projects=projects,
     )
+    project_repo = MockProjectRepository(projects)
 
     result = await apply_schedule_request(
         user_id=user_id,
         task_repo=task_repo,
-        assignment_repo=assignment_repo,
         project_repo=project_repo,
         input_data=ApplyScheduleRequestInput(
             request="Prioritize API work",
@@ -213,13 +214,11 @@ async def test_apply_schedule_request_unpins_avoided_tasks_for_today() -> None:
     focus_task = _make_task(title="Design review", user_id=user_id)
     avoided_task = _make_task(title="Legacy bugfix", user_id=user_id, pinned_date=today_datetime)
     task_repo = MockTaskRepository([focus_task, avoided_task])
-    assignment_repo = MockTaskAssignmentRepository([])
     project_repo = MockProjectRepository([])
 
     result = await apply_schedule_request(
         user_id=user_id,
         task_repo=task_repo,
-        assignment_repo=assignment_repo,
         project_repo=project_repo,
         input_data=ApplyScheduleRequestInput(
             request="Focus design today",
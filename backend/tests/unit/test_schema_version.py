@@ -0,0 +1,39 @@
+"""
+Unit tests for the schema version check that skips migrations at startup.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.infrastructure.local import database, migrations
+
+
+@pytest.mark.asyncio
+async def test_init_db_skips_migrations_once_stamped(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        get_settings(), "DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}"
+    )
+    runs = []
+    original = migrations.run_migrations
+
+    async def _counting_run_migrations():
+        runs.append(1)
+        await original()
+
+    monkeypatch.setattr(migrations, "run_migrations", _counting_run_migrations)
+
+    assert await database.init_db() is True
+    assert await database.init_db() is False
+    assert len(runs) == 1
+
+    # A changed schema fingerprint (e.g. a new migration step) re-runs them.
+    monkeypatch.setattr(migrations, "MIGRATIONS_REVISION", migrations.MIGRATIONS_REVISION + 1)
+    assert await database.init_db() is True
+    assert len(runs) == 2
+
+    engine = database.get_engine()
+    async with engine.connect() as conn:
+        stamped = await conn.execute(text("SELECT fingerprint FROM schema_version"))
+        assert stamped.scalar() == migrations.schema_fingerprint()
+    await engine.dispose()
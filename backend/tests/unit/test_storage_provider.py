@@ -2,6 +2,7 @@
 Unit tests for Storage Provider.
 """
 
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -11,6 +12,7 @@ import pytest
 from app.core.config import get_settings
 from app.core.exceptions import NotFoundError
 from app.infrastructure.local.storage_provider import LocalStorageProvider
+from app.utils.stream_utils import decode_base64_chunks
 
 
 @pytest.fixture
@@ -94,3 +96,120 @@ async def test_get_public_url(temp_storage):
     settings = get_settings()
     assert public_url.startswith(settings.BASE_URL)
     assert "public.txt" in public_url
+
+
+@pytest.mark.asyncio
+async def test_identical_uploads_share_one_blob_until_last_delete(temp_storage):
+    """Identical content is stored once and reference counted."""
+    data = b"same bytes" * 100
+
+    first = Path(await temp_storage.upload("a/one.bin", data))
+    second = Path(await temp_storage.upload("b/two.bin", data))
+
+    blobs = [p for p in temp_storage.blob_path.rglob("*") if p.is_file()]
+    assert len(blobs) == 1
+    assert first.samefile(second) and first.samefile(blobs[0])
+
+    assert await temp_storage.delete("a/one.bin")
+    assert blobs[0].exists()
+    assert await temp_storage.download("b/two.bin") == data
+
+    # Overwriting the last reference with new content releases the old blob.
+    await temp_storage.upload("b/two.bin", b"new content")
+    assert not blobs[0].exists()
+    assert await temp_storage.download("b/two.bin") == b"new content"
+    assert await temp_storage.delete("b/two.bin")
+    assert [p for p in temp_storage.blob_path.rglob("*") if p.is_file()] == []
+
+
+@pytest.mark.asyncio
+async def test_blob_dropped_by_another_process_is_rewritten(temp_storage, monkeypatch):
+    """A blob removed after it was seen (e.g. by another worker) is written again."""
+    data = b"shared bytes" * 50
+    await temp_storage.upload("a/one.bin", data)
+    (blob,) = [p for p in temp_storage.blob_path.rglob("*") if p.is_file()]
+
+    real_link = os.link
+
+    def _link_after_foreign_delete(src, dst):
+        if Path(src) == blob and blob.exists():
+            blob.unlink()
+        return real_link(src, dst)
+
+    monkeypatch.setattr(os, "link", _link_after_foreign_delete)
+    second = Path(await temp_storage.upload("b/two.bin", data))
+
+    assert second.read_bytes() == data
+    assert blob.exists() and second.samefile(blob)
+    assert await temp_storage.download("a/one.bin") == data
+    assert [p for p in (temp_storage.blob_path / "tmp").iterdir()] == []
+
+
+@pytest.mark.asyncio
+async def test_base64_payloads_are_decoded_in_chunks():
+    import base64
+
+    data = bytes(range(256)) * 10
+    chunks = [c async for c in decode_base64_chunks(base64.b64encode(data).decode(), 100)]
+    assert b"".join(chunks) == data
+    assert max(len(c) for c in chunks) <= 100
+    with pytest.raises(ValueError):
+        decode_base64_chunks("not base64!", 100)
+
+
+@pytest.mark.asyncio
+async def test_streaming_upload_and_range_reads():
+    """Chunked uploads and reads, including byte ranges."""
+    temp_dir = tempfile.mkdtemp()
+    provider = LocalStorageProvider(base_path=temp_dir, chunk_size=4)
+    data = bytes(range(50))
+
+    async def chunks():
+        for offset in range(0, len(data), 7):
+            yield data[offset:offset + 7]
+
+    try:
+        await provider.upload_stream("media/clip.bin", chunks())
+        assert await provider.size("media/clip.bin") == len(data)
+        assert b"".join([c async for c in provider.stream("media/clip.bin")]) == data
+        ranged = [c async for c in provider.stream("media/clip.bin", start=10, end=20)]
+        assert b"".join(ranged) == data[10:21]
+        assert max(len(c) for c in ranged) == 4
+        with pytest.raises(NotFoundError):
+            await provider.size("media/missing.bin")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_storage_route_serves_ranges(temp_storage):
+    """The storage endpoint streams files and honours Range headers."""
+    import asyncio
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api import storage as storage_api
+    from app.api.deps import get_storage_provider
+
+    asyncio.run(temp_storage.upload("captures/audio.wav", b"0123456789"))
+    app = FastAPI()
+    app.include_router(storage_api.router, prefix="/storage")
+    app.dependency_overrides[get_storage_provider] = lambda: temp_storage
+    client = TestClient(app)
+
+    full = client.get("/storage/captures/audio.wav")
+    assert full.status_code == 200
+    assert full.content == b"0123456789"
+    assert full.headers["accept-ranges"] == "bytes"
+
+    partial = client.get("/storage/captures/audio.wav", headers={"Range": "bytes=2-5"})
+    assert partial.status_code == 206
+    assert partial.content == b"2345"
+    assert partial.headers["content-range"] == "bytes 2-5/10"
+
+    suffix = client.get("/storage/captures/audio.wav", headers={"Range": "bytes=-3"})
+    assert suffix.content == b"789"
+
+    assert client.get("/storage/captures/audio.wav", headers={"Range": "bytes=20-"}).status_code == 416
+    assert client.get("/storage/.blobs/tmp").status_code == 404
+    assert client.get("/storage/captures/missing.wav").status_code == 404
@@ -3,6 +3,8 @@ Unit tests for Task repository.
 """
 
 
+from uuid import UUID
+
 import pytest
 
 from app.infrastructure.local.task_repository import SqliteTaskRepository
@@ -171,3 +173,238 @@ async def test_find_similar_tasks(session_factory, test_user_id):
     assert len(similar) >= 1
     assert similar[0].similarity_score >= 0.8
 
+
+
+@pytest.mark.asyncio
+async def test_get_owner_info(session_factory, test_user_id):
+    """Test resolving a task's project and owner without loading the task."""
+    from uuid import uuid4
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    project_id = uuid4()
+
+    personal = await repo.create(test_user_id, TaskCreate(title="Personal", created_by=CreatedBy.USER))
+    project_task = await repo.create(
+        test_user_id,
+        TaskCreate(title="Project", project_id=project_id, created_by=CreatedBy.USER),
+    )
+
+    assert await repo.get_owner_info(personal.id) == (None, test_user_id)
+    assert await repo.get_owner_info(project_task.id) == (project_id, test_user_id)
+    assert await repo.get_owner_info(uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_search_by_keywords_uses_index_scope_and_ranking(session_factory, test_user_id):
+    """Test indexed keyword search over task text and project names."""
+    from app.infrastructure.local.project_repository import SqliteProjectRepository
+    from app.infrastructure.local.task_assignment_repository import SqliteTaskAssignmentRepository
+    from app.models.collaboration import TaskAssignmentCreate
+    from app.models.enums import ProjectVisibility
+    from app.models.project import ProjectCreate, ProjectUpdate
+    from app.models.task import TaskUpdate
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    project_repo = SqliteProjectRepository(session_factory=session_factory)
+    assignment_repo = SqliteTaskAssignmentRepository(session_factory=session_factory)
+
+    team = await project_repo.create(
+        test_user_id, ProjectCreate(name="新サービス", visibility=ProjectVisibility.TEAM)
+    )
+    review = await repo.create(
+        test_user_id, TaskCreate(title="デザインレビューの準備", created_by=CreatedBy.USER)
+    )
+    both = await repo.create(
+        test_user_id,
+        TaskCreate(title="Design review", description="デザイン資料", created_by=CreatedBy.USER),
+    )
+    unassigned_team = await repo.create(
+        test_user_id,
+        TaskCreate(title="レビュー会", project_id=team.id, created_by=CreatedBy.USER),
+    )
+    assigned_team = await repo.create(
+        "other-user",
+        TaskCreate(title="API設計", project_id=team.id, created_by=CreatedBy.USER),
+    )
+    await assignment_repo.assign(
+        "other-user", assigned_team.id, TaskAssignmentCreate(assignee_id=test_user_id)
+    )
+    await repo.create("other-user", TaskCreate(title="デザイン確認", created_by=CreatedBy.USER))
+
+    # Japanese bigrams match inside longer runs; more matched keywords rank first.
+    assert await repo.search_by_keywords(test_user_id, ["デザイン", "review"]) == [
+        both.id,
+        review.id,
+    ]
+    # Unassigned tasks of TEAM projects are out of scope; assigned ones match via project name.
+    assert await repo.search_by_keywords(test_user_id, ["レビュー"]) == [review.id]
+    assert await repo.search_by_keywords(test_user_id, ["サービス"]) == [assigned_team.id]
+    assert unassigned_team.id not in await repo.search_by_keywords(test_user_id, ["レビュー会"])
+
+    await project_repo.update(test_user_id, team.id, ProjectUpdate(name="基盤刷新"))
+    assert await repo.search_by_keywords(test_user_id, ["サービス"]) == []
+    assert await repo.search_by_keywords(test_user_id, ["刷新"]) == [assigned_team.id]
+
+    await repo.update(test_user_id, review.id, TaskUpdate(title="議事録の整理"))
+    assert await repo.search_by_keywords(test_user_id, ["議事録"]) == [review.id]
+    assert review.id not in await repo.search_by_keywords(test_user_id, ["レビュー"])
+
+    await repo.create(
+        test_user_id,
+        TaskCreate(title="議事録 下書き", parent_id=review.id, created_by=CreatedBy.USER),
+    )
+    leaf_ids = await repo.search_by_keywords(test_user_id, ["議事録"], leaf_only=True)
+    assert review.id not in leaf_ids and len(leaf_ids) == 1
+
+    await repo.update(test_user_id, both.id, TaskUpdate(status=TaskStatus.DONE))
+    assert await repo.search_by_keywords(test_user_id, ["design"]) == []
+    assert await repo.search_by_keywords(test_user_id, ["design"], include_done=True) == [both.id]
+
+
+@pytest.mark.asyncio
+async def test_search_by_keywords_matches_substrings(db_session, session_factory, test_user_id):
+    """Keywords match inside words and Japanese runs, like a substring search."""
+    from sqlalchemy import text
+
+    from app.infrastructure.local.search_index import backfill_search_terms
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    redesign = await repo.create(test_user_id, TaskCreate(title="Redesign onboarding"))
+    reviews = await repo.create(test_user_id, TaskCreate(title="Code reviews", description="週次の会議"))
+
+    assert await repo.search_by_keywords(test_user_id, ["design"]) == [redesign.id]
+    assert await repo.search_by_keywords(test_user_id, ["review"]) == [reviews.id]
+    assert await repo.search_by_keywords(test_user_id, ["会"]) == [reviews.id]
+    assert await repo.search_by_keywords(test_user_id, ["議"]) == [reviews.id]
+    assert await repo.search_by_keywords(test_user_id, ["sign board"]) == [redesign.id]
+    assert await repo.search_by_keywords(test_user_id, ["会議室"]) == []
+
+    # An index built by an older term extraction is rebuilt on startup.
+    await db_session.execute(text("DELETE FROM search_terms WHERE term != 'redesign'"))
+    await db_session.commit()
+    async with db_session.bind.begin() as conn:
+        assert await backfill_search_terms(conn) == 2
+        assert await backfill_search_terms(conn) == 0
+    assert await repo.search_by_keywords(test_user_id, ["design"]) == [redesign.id]
+
+
+@pytest.mark.asyncio
+async def test_bulk_reads_match_validated_construction(session_factory, test_user_id, monkeypatch, caplog):
+    """Trusted (validation-free) list rows equal fully validated models."""
+    from datetime import datetime
+    from uuid import uuid4
+
+    from app.core.config import get_settings
+    from app.models.task import TouchpointStep
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    parent = await repo.create(test_user_id, TaskCreate(title="Parent", created_by=CreatedBy.USER))
+    await repo.create(
+        test_user_id,
+        TaskCreate(
+            title="Meeting",
+            start_time=datetime(2026, 3, 1, 10, 0),
+            end_time=datetime(2026, 3, 1, 11, 30),
+            is_fixed_time=True,
+            attendees=["a", "b"],
+            created_by=CreatedBy.AGENT,
+        ),
+    )
+    await repo.create(test_user_id, TaskCreate(title="Holiday", is_all_day=True, due_date=datetime(2026, 3, 2)))
+    await repo.create(
+        test_user_id,
+        TaskCreate(
+            title="Multi-day",
+            parent_id=parent.id,
+            order_in_parent=1,
+            dependency_ids=[uuid4()],
+            importance=Priority.HIGH,
+            touchpoint_steps=[TouchpointStep(title="step 1"), TouchpointStep(title="step 2")],
+        ),
+    )
+
+    trusted = await repo.list(test_user_id, limit=10)
+    validated = {task.id: await repo.get(test_user_id, task.id) for task in trusted}
+    assert len(trusted) == 4
+    for task in trusted:
+        assert task.model_dump() == validated[task.id].model_dump()
+    meeting = next(task for task in trusted if task.title == "Meeting")
+    assert meeting.estimated_minutes == 90
+    assert isinstance(meeting.importance, Priority)
+
+    monkeypatch.setattr(get_settings(), "TRUSTED_ROW_CHECK", True)
+    with caplog.at_level("WARNING"):
+        page = await repo.list_page(test_user_id, limit=10)
+    assert len(page.tasks) == 4
+    assert "differs" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_trusted_rows_match_orm_conversion_field_by_field(db_session, session_factory, test_user_id):
+    """Every TaskORM column reads back the same through get() and list()."""
+    from datetime import datetime
+    from uuid import uuid4
+
+    from app.infrastructure.local.database import TaskORM
+    from app.models.task import Task
+
+    orm = TaskORM(
+        id=str(uuid4()),
+        user_id=test_user_id,
+        project_id=str(uuid4()),
+        phase_id=str(uuid4()),
+        title="Fully populated",
+        description="description",
+        purpose="purpose",
+        status=TaskStatus.IN_PROGRESS.value,
+        importance=Priority.HIGH.value,
+        urgency=Priority.LOW.value,
+        energy_level=EnergyLevel.HIGH.value,
+        estimated_minutes=90,
+        due_date=datetime(2026, 3, 5, 18, 0),
+        start_not_before=datetime(2026, 3, 1, 9, 0),
+        pinned_date=datetime(2026, 3, 2),
+        parent_id=str(uuid4()),
+        order_in_parent=2,
+        dependency_ids=[str(uuid4())],
+        same_day_allowed=False,
+        min_gap_days=1,
+        progress=40,
+        source_capture_id=str(uuid4()),
+        created_by=CreatedBy.AGENT.value,
+        created_at=datetime(2026, 2, 1, 9, 0),
+        updated_at=datetime(2026, 2, 2, 9, 0),
+        start_time=datetime(2026, 3, 2, 10, 0),
+        end_time=datetime(2026, 3, 2, 11, 30),
+        is_fixed_time=True,
+        is_all_day=False,
+        location="Room A",
+        attendees=["a", "b"],
+        meeting_notes="notes",
+        recurring_meeting_id=str(uuid4()),
+        recurring_task_id=str(uuid4()),
+        milestone_id=str(uuid4()),
+        touchpoint_count=3,
+        touchpoint_minutes=15,
+        touchpoint_gap_days=2,
+        touchpoint_steps=[
+            {"title": f"step {index}", "guide": "guide", "estimated_minutes": 15} for index in range(3)
+        ],
+        completion_note="done note",
+        completed_at=datetime(2026, 3, 3, 12, 0),
+        completed_by="someone",
+        guide="guide",
+        requires_all_completion=True,
+    )
+    unset = [column.name for column in TaskORM.__table__.columns if getattr(orm, column.name) is None]
+    assert unset == []
+    db_session.add(orm)
+    await db_session.commit()
+
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    validated = await repo.get(test_user_id, UUID(orm.id))
+    (trusted,) = await repo.list(test_user_id, include_done=True, limit=10)
+
+    for name in Task.model_fields:
+        assert getattr(trusted, name) == getattr(validated, name), name
+    assert validated.pinned_date == datetime(2026, 3, 2)
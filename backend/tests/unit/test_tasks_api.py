@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock
 from uuid import UUID, uuid4
 
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 
 from app.api import tasks as tasks_api
 from app.api.tasks import create_task, get_subtasks, list_tasks, update_task
@@ -41,25 +41,43 @@ def _make_task(
     )
 
 
+async def _seed_task(session_factory, user_id: str, index: int, **fields: Any) -> Task:
+    from app.infrastructure.local.database import TaskORM
+    from app.infrastructure.local.task_repository import SqliteTaskRepository
+
+    created_at = datetime(2026, 2, 8, 12, 0) - timedelta(minutes=index)
+    if fields.get("is_fixed_time"):
+        fields.update(start_time=created_at, end_time=created_at + timedelta(minutes=30))
+    task = await SqliteTaskRepository(session_factory=session_factory).create(
+        user_id, TaskCreate(title=f"Task {index}", created_by=CreatedBy.USER, **fields)
+    )
+    # Deterministic creation order (newest = lowest index).
+    async with session_factory() as session:
+        orm = await session.get(TaskORM, str(task.id))
+        orm.created_at = created_at
+        await session.commit()
+    return task
+
+
 @pytest.mark.asyncio
-async def test_list_tasks_exclude_meetings_filters_before_pagination() -> None:
+async def test_list_tasks_exclude_meetings_filters_before_pagination(session_factory) -> None:
+    from app.infrastructure.local.task_repository import SqliteTaskRepository
+
     user = SimpleNamespace(id="owner-user")
-    repo = AsyncMock()
+    repo = SqliteTaskRepository(session_factory=session_factory)
     project_repo = AsyncMock()
-    assignment_repo = AsyncMock()
 
     # Meetings dominate the newest items. Pagination should still return a full page
     # of non-meeting tasks when enough exist.
-    repo.list.return_value = [_make_task(i, is_fixed_time=i < 50) for i in range(180)]
-    repo.get_many.return_value = []
-    project_repo.list.return_value = []
-    assignment_repo.list_for_assignee.return_value = []
+    for i in range(180):
+        await _seed_task(session_factory, user.id, i, is_fixed_time=i < 50)
 
+    response = Response()
     result = await list_tasks(
         user=user,
         repo=repo,
         project_repo=project_repo,
-        assignment_repo=assignment_repo,
+        response=response,
         project_id=None,
         status=None,
         include_done=True,
@@ -67,10 +85,77 @@ async def test_list_tasks_exclude_meetings_filters_before_pagination() -> None:
         exclude_meetings=True,
         limit=100,
         offset=0,
+        cursor=None,
     )
 
     assert len(result) == 100
     assert all(not task.is_fixed_time for task in result)
+    assert tasks_api.NEXT_CURSOR_HEADER in response.headers
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_keyset_pages_parents_with_subtasks_and_team_scope(session_factory) -> None:
+    from app.infrastructure.local.project_repository import SqliteProjectRepository
+    from app.infrastructure.local.task_assignment_repository import SqliteTaskAssignmentRepository
+    from app.infrastructure.local.task_repository import SqliteTaskRepository
+    from app.models.collaboration import TaskAssignmentCreate
+    from app.models.project import ProjectCreate
+
+    user = SimpleNamespace(id="owner-user")
+    repo = SqliteTaskRepository(session_factory=session_factory)
+    project_repo = SqliteProjectRepository(session_factory=session_factory)
+    assignment_repo = SqliteTaskAssignmentRepository(session_factory=session_factory)
+    team = await project_repo.create(
+        user.id, ProjectCreate(name="Team", visibility=ProjectVisibility.TEAM)
+    )
+
+    parents = [await _seed_task(session_factory, user.id, i) for i in range(5)]
+    subtask = await _seed_task(session_factory, user.id, 10, parent_id=parents[1].id)
+    hidden = await _seed_task(session_factory, user.id, 11, project_id=team.id)
+    shared = await _seed_task(session_factory, "other-user", 12, project_id=team.id)
+    await assignment_repo.assign("other-user", shared.id, TaskAssignmentCreate(assignee_id=user.id))
+
+    async def _page(cursor: str | None) -> tuple[list[Task], str | None]:
+        response = Response()
+        tasks = await list_tasks(
+            user=user,
+            repo=repo,
+            project_repo=project_repo,
+            response=response,
+            project_id=None,
+            status=None,
+            include_done=False,
+            only_meetings=False,
+            exclude_meetings=False,
+            limit=2,
+            offset=0,
+            cursor=cursor,
+        )
+        return tasks, response.headers.get(tasks_api.NEXT_CURSOR_HEADER)
+
+    seen: list[UUID] = []
+    pages = 0
+    cursor = None
+    while True:
+        tasks, cursor = await _page(cursor)
+        pages += 1
+        seen.extend(task.id for task in tasks)
+        if parents[1].id in {task.id for task in tasks}:
+            assert tasks[-1].id == subtask.id
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert seen == [
+        parents[0].id, parents[1].id, subtask.id,
+        parents[2].id, parents[3].id,
+        parents[4].id, shared.id,
+    ]
+    assert hidden.id not in seen
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _page("not-a-cursor")
+    assert exc_info.value.status_code == 400
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,193 @@
+"""
+Unit tests for compact agent tool output serialization.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from google.adk.tools import FunctionTool
+
+from app.infrastructure.local.chat_session_repository import SqliteChatSessionRepository
+from app.models.enums import CreatedBy
+from app.models.task import Task
+from app.tools.tool_output import (
+    IdAliasMap,
+    ToolProjection,
+    compact_tool_outputs,
+    compact_tool_result,
+    get_tool_output_stats,
+)
+
+
+def _task(index: int, **overrides) -> Task:
+    now = datetime(2026, 1, 1, 9, 0)
+    fields = dict(
+        id=uuid4(),
+        user_id="user-1",
+        project_id=uuid4(),
+        title=f"Task {index}",
+        description="詳細な説明 " * 80,
+        created_by=CreatedBy.AGENT,
+        created_at=now,
+        updated_at=now,
+    )
+    fields.update(overrides)
+    return Task(**fields)
+
+
+def test_list_tasks_result_is_projected_and_smaller():
+    before = get_tool_output_stats().get("list_tasks", {"raw_tokens": 0, "compact_tokens": 0})
+    tasks = [_task(i) for i in range(5)]
+    raw = {"tasks": [task.model_dump(mode="json") for task in tasks], "count": len(tasks)}
+
+    aliases = IdAliasMap()
+    compacted = compact_tool_result("list_tasks", raw, aliases)
+
+    first = compacted["tasks"][0]
+    assert "user_id" not in first and "created_at" not in first and "purpose" not in first
+    assert first["title"] == "Task 0"
+    assert len(first["id"]) == 8
+    assert aliases.expand(first["id"]) == str(tasks[0].id)
+    assert first["description"].endswith(")")
+    assert compacted["count"] == 5
+
+    after = get_tool_output_stats()["list_tasks"]
+    raw_tokens = after["raw_tokens"] - before["raw_tokens"]
+    compact_tokens = after["compact_tokens"] - before["compact_tokens"]
+    assert compact_tokens < raw_tokens / 2
+
+
+def test_budget_drops_trailing_items_and_reports_them():
+    raw = {"tasks": [{"id": str(uuid4()), "title": "x" * 200} for _ in range(40)]}
+    compacted = compact_tool_result(
+        "list_tasks", raw, IdAliasMap(), ToolProjection({"tasks": ("id", "title")}, budget_tokens=500)
+    )
+    kept = len(compacted["tasks"])
+    assert 0 < kept < 40
+    assert compacted["omitted_items"] == {"tasks": 40 - kept}
+    assert compacted["tasks"][0]["id"] == IdAliasMap().shorten(raw["tasks"][0]["id"])
+
+
+def test_error_and_unlisted_results_pass_through():
+    aliases = IdAliasMap()
+    error = {"error": "not found", "task_id": str(uuid4())}
+    assert compact_tool_result("get_task", error, aliases) is error
+    created = {"id": str(uuid4()), "created_at": "2026-01-01"}
+    assert compact_tool_result("create_task", created, aliases) is created
+
+
+def test_alias_collisions_extend_prefix():
+    aliases = IdAliasMap()
+    first = aliases.shorten("12345678-aaaa-4000-8000-000000000001")
+    second = aliases.shorten("12345678-bbbb-4000-8000-000000000002")
+    assert first == "12345678"
+    assert second == "12345678bbbb"
+    assert aliases.expand(second) == "12345678-bbbb-4000-8000-000000000002"
+
+
+@pytest.mark.asyncio
+async def test_wrapped_tools_expand_aliases_in_arguments():
+    task_id = str(uuid4())
+    seen = {}
+
+    async def list_tasks(input_data: dict) -> dict:
+        return {"tasks": [{"id": task_id, "title": "A", "user_id": "user-1"}]}
+
+    async def update_task(input_data: dict) -> dict:
+        seen.update(input_data)
+        return {"id": input_data["task_id"], "updated_at": "2026-01-01"}
+
+    session_id = f"session-{uuid4()}"
+    confirmed_update = FunctionTool(update_task, require_confirmation=True)
+    wrapped = compact_tool_outputs(
+        [FunctionTool(list_tasks), confirmed_update], "user-1", session_id
+    )
+    assert [tool.name for tool in wrapped] == ["list_tasks", "update_task"]
+    assert wrapped[1] is confirmed_update
+    assert await wrapped[1].check_require_confirmation({}, None) is True
+
+    listed = await wrapped[0].func(input_data={})
+    alias = listed["tasks"][0]["id"]
+    assert listed["tasks"][0] == {"id": alias, "title": "A"}
+
+    updated = await wrapped[1].func(
+        input_data={"task_id": alias, "dependency_ids": [alias], "title": alias}
+    )
+    # Only ID parameters are expanded; free text equal to an alias is kept.
+    assert seen == {"task_id": task_id, "dependency_ids": [task_id], "title": alias}
+    assert updated == {"id": task_id, "updated_at": "2026-01-01"}
+
+
+@pytest.mark.asyncio
+async def test_aliases_are_stored_with_the_chat_session(session_factory):
+    chat_repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await chat_repo.touch_session("user-1", "session-1")
+    task_id = str(uuid4())
+    seen = {}
+
+    async def list_tasks(input_data: dict) -> dict:
+        return {"tasks": [{"id": task_id, "title": "A"}]}
+
+    async def get_task(input_data: dict) -> dict:
+        seen.update(input_data)
+        return {"id": input_data["task_id"]}
+
+    listed = await compact_tool_outputs(
+        [FunctionTool(list_tasks)], "user-1", "session-1", chat_repo=chat_repo
+    )[0].func(input_data={})
+    alias = listed["tasks"][0]["id"]
+    assert await chat_repo.get_id_aliases("user-1", "session-1") == {alias: task_id}
+
+    # Another worker (or a restart) resolves the alias quoted in the history.
+    other_worker = compact_tool_outputs(
+        [FunctionTool(get_task)], "user-1", "session-1", chat_repo=chat_repo
+    )
+    await other_worker[0].func(input_data={"task_id": alias})
+    assert seen == {"task_id": task_id}
+    assert await chat_repo.get_id_aliases("user-1", "session-2") == {}
+
+
+@pytest.mark.asyncio
+async def test_alias_stored_first_by_another_worker_is_not_reused(session_factory):
+    chat_repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await chat_repo.touch_session("user-1", "session-1")
+    first_id = "12345678-aaaa-4000-8000-000000000001"
+    second_id = "12345678-bbbb-4000-8000-000000000002"
+
+    async def list_tasks(input_data: dict) -> dict:
+        return {"tasks": [{"id": first_id, "title": "A"}]}
+
+    other_worker = compact_tool_outputs(
+        [FunctionTool(list_tasks)], "user-1", "session-1", chat_repo=chat_repo
+    )[0]
+
+    async def list_tasks(input_data: dict) -> dict:
+        # Another worker stores the same prefix for a different task while
+        # this call runs (after this worker loaded the session's aliases).
+        await other_worker.func(input_data={})
+        return {"tasks": [{"id": second_id, "title": "B", "parent_id": second_id}]}
+
+    tool = compact_tool_outputs(
+        [FunctionTool(list_tasks)], "user-1", "session-1", chat_repo=chat_repo
+    )[0]
+    listed = await tool.func(input_data={})
+
+    assert listed["tasks"][0] == {"id": "12345678bbbb", "title": "B", "parent_id": "12345678bbbb"}
+    assert await chat_repo.get_id_aliases("user-1", "session-1") == {
+        "12345678": first_id,
+        "12345678bbbb": second_id,
+    }
+
+
+@pytest.mark.asyncio
+async def test_save_id_aliases_returns_the_stored_rows(session_factory):
+    chat_repo = SqliteChatSessionRepository(session_factory=session_factory)
+    await chat_repo.touch_session("user-1", "session-1")
+    await chat_repo.save_id_aliases("user-1", "session-1", {"aaaa1111": "first"})
+
+    stored = await chat_repo.save_id_aliases(
+        "user-1", "session-1", {"aaaa1111": "second", "bbbb2222": "third"}
+    )
+
+    assert stored == {"aaaa1111": "first", "bbbb2222": "third"}
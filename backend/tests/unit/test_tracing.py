@@ -0,0 +1,113 @@
+"""
+Unit tests for in-process tracing.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.tracing import (
+    current_span,
+    get_trace_stats,
+    instrument_class,
+    recorder,
+    span,
+    traced,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_recorder():
+    recorder.reset()
+    yield
+    recorder.reset()
+
+
+class _Repository:
+    async def get(self, key: str) -> str:
+        return key
+
+    async def get_twice(self, key: str) -> list[str]:
+        return [await self.get(key), await self.get(key)]
+
+    async def _private(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_through_awaits_and_aggregate():
+    @traced("service.run")
+    async def run():
+        async with span("step") as step:
+            assert current_span() is step
+            await asyncio.sleep(0)
+        return current_span()
+
+    with span("root") as root:
+        inner = await run()
+    assert inner.parent_id == root.span_id
+    assert inner.trace_id == root.trace_id
+    assert current_span() is None
+
+    stats = get_trace_stats()
+    assert set(stats["spans"]) == {"root", "service.run", "step"}
+    summary = stats["spans"]["step"]
+    assert summary["count"] == 1
+    assert summary["p50_ms"] <= summary["p99_ms"] <= summary["max_ms"]
+    assert stats["slowest"][0]["name"] == "root"
+
+
+@pytest.mark.asyncio
+async def test_async_generators_and_errors_are_traced():
+    @traced("stream")
+    async def stream():
+        for i in range(3):
+            yield i
+
+    assert [item async for item in stream()] == [0, 1, 2]
+
+    with pytest.raises(ValueError):
+        with span("failing"):
+            raise ValueError("boom")
+
+    spans = get_trace_stats()["spans"]
+    assert spans["stream"]["count"] == 1
+    assert spans["failing"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_instrument_class_traces_public_coroutines_once():
+    instrument_class(_Repository, "Repository")
+    instrument_class(_Repository, "Repository")
+
+    assert await _Repository().get_twice("a") == ["a", "a"]
+
+    spans = get_trace_stats()["spans"]
+    assert spans["Repository.get"]["count"] == 2
+    assert spans["Repository.get_twice"]["count"] == 1
+    assert "Repository._private" not in spans
+
+
+def test_disabled_tracing_records_nothing(monkeypatch):
+    from app.core.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "TRACING_ENABLED", False)
+    with span("ignored") as ignored:
+        ignored.set(rows=1)
+    assert get_trace_stats()["spans"] == {}
+
+
+def test_agent_model_call_spans_keep_their_start_in_invocation_state():
+    from types import SimpleNamespace
+
+    from app.agents import secretary_agent
+
+    context = SimpleNamespace(invocation_id="inv-1", state={})
+    secretary_agent._start_model_span(context, llm_request=None)
+    secretary_agent._end_model_span(context, SimpleNamespace(partial=True))
+    secretary_agent._end_model_span(context, SimpleNamespace(partial=False, usage_metadata=None))
+    # A second end (or an error after the end) records nothing more.
+    secretary_agent._fail_model_span(context, None, RuntimeError("late"))
+
+    assert get_trace_stats()["spans"]["llm.agent_model_call"]["count"] == 1
+    assert all(key.startswith("temp:") for key in context.state)
@@ -0,0 +1,44 @@
+"""
+Unit tests for the bounded TTL cache.
+"""
+
+from app.core import ttl_cache
+from app.core.ttl_cache import TTLCache, clear_all_caches
+
+
+def test_entries_expire_and_least_recently_used_are_evicted(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(ttl_seconds=10, max_entries=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    # "b" was the least recently used entry.
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    now[0] += 11
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+    cache.set("d", 4)
+    cache.invalidate("d", "missing")
+    assert cache.get("d") is None
+
+
+def test_zero_ttl_disables_caching_and_limits_follow_callables():
+    limits = {"ttl": 0.0, "size": 1}
+    cache: TTLCache[str, int] = TTLCache(
+        ttl_seconds=lambda: limits["ttl"], max_entries=lambda: limits["size"]
+    )
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+    limits.update(ttl=60.0, size=3)
+    for key in "abcd":
+        cache.set(key, 0)
+    assert len(cache) == 3
+
+    clear_all_caches()
+    assert len(cache) == 0
@@ -1,12 +1,52 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.revisions import install_revision_tracking
+from app.infrastructure.local.memory_repository import SqliteMemoryRepository
+from app.models.enums import MemoryScope, MemoryType
+from app.models.memory import Memory, MemoryCreate
 from app.services.work_memory_service import (
     WorkMemoryContent,
     WorkMemoryIndexItem,
     format_loaded_work_memories_for_prompt,
     format_work_memory_index_for_prompt,
+    get_work_memory_by_id,
+    load_work_memory_library,
     select_relevant_work_memories,
 )
 
 
+class _CountingMemoryRepo:
+    def __init__(self, memories: list[Memory]):
+        self.memories = memories
+        self.list_calls = 0
+        self.get_calls = 0
+
+    async def list(self, user_id, scope=None, memory_type=None, project_id=None, limit=100, offset=0):
+        self.list_calls += 1
+        return self.memories[:limit]
+
+    async def get(self, user_id, memory_id):
+        self.get_calls += 1
+        return next((memory for memory in self.memories if memory.id == memory_id), None)
+
+
+def _rule(content: str, tags: list[str] | None = None) -> Memory:
+    now = datetime(2026, 1, 1)
+    return Memory(
+        id=uuid4(),
+        user_id="user-1",
+        content=content,
+        scope=MemoryScope.WORK,
+        memory_type=MemoryType.RULE,
+        tags=tags or [],
+        created_at=now,
+        updated_at=now,
+    )
+
+
 def test_select_relevant_work_memories_prefers_matching_title_and_tags() -> None:
     work_memories = [
         WorkMemoryIndexItem(
@@ -53,3 +93,63 @@ def test_format_loaded_work_memories_for_prompt_header() -> None:
     )
     assert "Loaded Work Memories" in section
     assert "..." in section
+
+
+@pytest.mark.asyncio
+async def test_library_ranks_all_memories_and_serves_content_from_cache() -> None:
+    fillers = [_rule(f"# Routine {i}\n\n## When to use\nweekly report number {i}") for i in range(40)]
+    # Oldest memory (beyond the first 30) and matched only through its body.
+    expense = _rule(
+        "# 月末処理\n\n## When to use\n月末に使う\n\n## Content\n経費精算は領収書を添付して申請する",
+        tags=["finance"],
+    )
+    repo = _CountingMemoryRepo([*fillers, expense])
+
+    library = await load_work_memory_library("user-1", repo)
+    selected = library.select_relevant("経費精算のやり方を教えて", limit=2)
+    assert [item.id for item in selected] == [str(expense.id)]
+    assert library.get(str(expense.id)).content.startswith("経費精算")
+
+    # Cached: no further repository reads for the index or loaded content.
+    assert await load_work_memory_library("user-1", repo) is library
+    loaded = await get_work_memory_by_id("user-1", repo, str(expense.id))
+    assert loaded.title == "月末処理"
+    assert (repo.list_calls, repo.get_calls) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_memory_writes_drop_the_cached_library(session_factory):
+    install_revision_tracking()
+    repo = SqliteMemoryRepository(session_factory=session_factory)
+    library = await load_work_memory_library("user-1", repo)
+    assert library.items == []
+    assert await load_work_memory_library("user-1", repo) is library
+
+    # Any committed write through the repository invalidates, whoever calls it.
+    await repo.create(
+        "user-1",
+        MemoryCreate(
+            content="# 月末処理\n\n## When to use\n月末に使う\n\n## Content\n経費精算",
+            scope=MemoryScope.WORK,
+            memory_type=MemoryType.RULE,
+        ),
+    )
+    reloaded = await load_work_memory_library("user-1", repo)
+    assert [item.title for item in reloaded.items] == ["月末処理"]
+
+    other = await load_work_memory_library("user-2", repo)
+    await repo.delete("user-1", UUID(reloaded.items[0].id))
+    assert (await load_work_memory_library("user-1", repo)).items == []
+    assert await load_work_memory_library("user-2", repo) is other
+
+
+def test_bm25_prefers_rarer_matching_terms() -> None:
+    work_memories = [
+        WorkMemoryIndexItem(id="common", title="report", when_to_use="report weekly", tags=[]),
+        WorkMemoryIndexItem(id="other", title="report", when_to_use="report daily", tags=[]),
+        WorkMemoryIndexItem(id="rare", title="invoice", when_to_use="report invoice", tags=[]),
+    ]
+
+    selected = select_relevant_work_memories(work_memories, "invoice report", limit=3)
+    assert [item.id for item in selected][0] == "rare"
+    assert select_relevant_work_memories(work_memories, "", limit=3) == []
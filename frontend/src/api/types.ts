@@ -1001,7 +1001,7 @@ export interface ToolActionProposalPayload {
   args: Record<string, unknown>;
 }
 
-export type ProposalStatus = 'pending' | 'approved' | 'rejected' | 'expired';
+export type ProposalStatus = 'pending' | 'executing' | 'approved' | 'failed' | 'rejected' | 'expired';
 
 export interface Proposal {
   id: string;
@@ -4,15 +4,46 @@ import { getAuthToken } from '../api/auth';
 import { getBaseUrl } from '../api/client';
 
 type RealtimeEvent = {
-  type: string;
-  path?: string;
-  method?: string;
+  type: 'connected' | 'change' | 'resync';
+  kind?: string;
+  op?: 'created' | 'updated' | 'deleted';
+  id?: string;
+  project_id?: string;
+  task_id?: string;
+  fields?: string[];
+};
+
+// Query key prefixes that read each entity kind. Unknown kinds refetch everything.
+const KIND_QUERY_KEYS: Record<string, string[]> = {
+  task: ['tasks', 'subtasks', 'today-tasks', 'top3', 'schedule', 'task-detail', 'projects', 'project', 'meetings'],
+  task_assignment: ['task-assignments', 'project-assignments', 'tasks', 'today-tasks', 'top3', 'schedule'],
+  blocker: ['task-detail', 'tasks'],
+  project: ['projects', 'project'],
+  project_member: ['project-members', 'projects', 'project'],
+  project_invitation: ['project-members'],
+  phase: ['phases', 'project', 'tasks'],
+  milestone: ['phases', 'project'],
+  checkin: ['project'],
+  recurring_meeting: ['meetings', 'tasks'],
+  recurring_task: ['recurring-tasks', 'tasks'],
+  agenda_item: ['agenda-items', 'task-agendas'],
+  meeting_session: ['meeting-session', 'meeting-sessions'],
+  schedule_settings: ['schedule-settings', 'schedule', 'today-tasks', 'top3'],
+  schedule_plan: ['schedule', 'today-tasks', 'top3'],
+  schedule_snapshot: ['project'],
+  achievement: ['achievements'],
+  project_achievement: ['project-achievements'],
+  notification: ['notifications'],
+  heartbeat_settings: ['heartbeat-settings', 'heartbeat', 'heartbeat-status'],
+  capture: ['captures'],
+  user: ['current-user', 'project-members'],
 };
 
 export function useRealtimeSync() {
   const queryClient = useQueryClient();
   const [token, setToken] = useState(() => getAuthToken().token);
   const debounceRef = useRef<number | null>(null);
+  const pendingKeysRef = useRef<Set<string> | null>(new Set());
   const abortRef = useRef<AbortController | null>(null);
 
   useEffect(() => {
@@ -30,11 +61,25 @@ export function useRealtimeSync() {
     let isActive = true;
     let retryDelay = 1000;
 
-    const scheduleInvalidate = () => {
+    // Collect the query key prefixes to refetch; null refetches everything.
+    const scheduleInvalidate = (keys: string[] | null) => {
+      if (keys === null) {
+        pendingKeysRef.current = null;
+      } else if (pendingKeysRef.current) {
+        keys.forEach(key => pendingKeysRef.current?.add(key));
+      }
       if (debounceRef.current) return;
       debounceRef.current = window.setTimeout(() => {
         debounceRef.current = null;
-        queryClient.invalidateQueries();
+        const pending = pendingKeysRef.current;
+        pendingKeysRef.current = new Set();
+        if (pending === null) {
+          queryClient.invalidateQueries();
+          return;
+        }
+        pending.forEach(key => {
+          queryClient.invalidateQueries({ queryKey: [key] });
+        });
       }, 200);
     };
 
@@ -76,8 +121,10 @@ export function useRealtimeSync() {
               if (!raw) continue;
               try {
                 const event = JSON.parse(raw) as RealtimeEvent;
-                if (event.type === 'refresh') {
-                  scheduleInvalidate();
+                if (event.type === 'resync') {
+                  scheduleInvalidate(null);
+                } else if (event.type === 'change') {
+                  scheduleInvalidate(KIND_QUERY_KEYS[event.kind ?? ''] ?? null);
                 }
               } catch (err) {
                 console.error('Failed to parse realtime event:', raw, err);
@@ -107,6 +154,7 @@ export function useRealtimeSync() {
         window.clearTimeout(debounceRef.current);
         debounceRef.current = null;
       }
+      pendingKeysRef.current = new Set();
     };
   }, [queryClient, token]);
 }